@@ -0,0 +1,121 @@
+"""
+These are internal functions of the framework.
+Not intended to be used outside compas* packages.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import importlib
+import sys
+
+
+__all__ = ['LAZY', 'lazy_import', 'lazy_modules']
+
+
+# module attributes are resolved with a module-level __getattr__ (PEP 562)
+LAZY = sys.version_info >= (3, 7)
+
+
+def _getattr(namespace):
+    def __getattr__(name):
+        try:
+            module = namespace['__lazy__'][name]
+        except KeyError:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(namespace['__name__'], name))
+        value = namespace[name] = getattr(importlib.import_module(module), name)
+        return value
+
+    return __getattr__
+
+
+def _dir(namespace):
+    def __dir__():
+        return sorted(set(namespace) | set(namespace['__lazy__']))
+
+    return __dir__
+
+
+def lazy_import(namespace, modules):
+    """Make the names of modules available as attributes of a package, and import the modules on first access.
+
+    Parameters
+    ----------
+    namespace : dict
+        The globals of the package.
+    modules : dict
+        The names of the modules, absolute or relative to the package,
+        mapped to the names that should be available in the package.
+
+    Returns
+    -------
+    list
+        The names that were not yet available in the package.
+
+    Notes
+    -----
+    The names and the modules they belong to are stored in the ``__lazy__`` attribute of the package,
+    such that they can be made available in a parent package as well.
+
+    Without support for module-level ``__getattr__``, e.g. on Python 2 and IronPython,
+    the modules are imported immediately.
+    In a subpackage, call this function before computing ``__all__``,
+    such that the names are included in ``__all__`` if the modules are imported immediately,
+    and are not imported by the star imports of the parent package otherwise.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        # mypackage/__init__.py
+
+        import compas._lazy
+
+        from .core import *  # noqa: F401 F403
+
+        compas._lazy.lazy_import(globals(), {'.core_numpy': ['core_numpy']})
+
+        __all__ = [name for name in dir() if not name.startswith('_')]
+
+    """
+    package = namespace['__name__']
+    index = namespace.setdefault('__lazy__', {})
+    names = []
+    for module, attributes in modules.items():
+        if module.startswith('.'):
+            module = package + module
+        for name in attributes:
+            index[name] = module
+            if name not in namespace:
+                names.append(name)
+    if not LAZY:
+        for name in names:
+            namespace[name] = getattr(importlib.import_module(index[name]), name)
+        return names
+    if '__getattr__' not in namespace:
+        namespace['__getattr__'] = _getattr(namespace)
+        namespace['__dir__'] = _dir(namespace)
+    return names
+
+
+def lazy_modules(package, subpackages):
+    """Collect the lazily imported names of subpackages.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package.
+    subpackages : list of str
+        The names of the subpackages, relative to the package.
+
+    Returns
+    -------
+    dict
+        The names of the modules mapped to the names, for :func:`lazy_import`.
+    """
+    modules = {}
+    for name in subpackages:
+        subpackage = sys.modules['{}.{}'.format(package, name)]
+        for attribute, module in getattr(subpackage, '__lazy__', {}).items():
+            modules.setdefault(module, []).append(attribute)
+    return modules
@@ -325,6 +325,21 @@ def rename(src, dst):
         _run_command_as_admin('move', [src, dst])
 
 
+def replace(src, dst):
+    """Replace a file by another file.
+
+    Where available (Python 3), the destination is replaced atomically,
+    such that other processes see either the old or the new file, and never no file.
+    On Python 2 and IronPython, the destination is removed before the source is renamed.
+    """
+    try:
+        os.replace(src, dst)
+    except AttributeError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
 def remove(path):
     """Remove path."""
     try:
@@ -588,6 +603,7 @@ __all__ = [
     'copy',
     'remove',
     'rename',
+    'replace',
     'user_data_dir',
     'select_python',
     'prepare_environment',
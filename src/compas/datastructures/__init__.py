@@ -195,6 +195,7 @@ be used for the representation of subdivided/partitioned polyhedra.
 
 from __future__ import absolute_import
 
+import compas._lazy
 
 from .datastructure import *  # noqa: F401 E402 F403
 
@@ -204,3 +205,6 @@ from .volmesh import *  # noqa: F401 E402 F403
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
+
+if not compas.IPY:
+    __all__ += compas._lazy.lazy_import(globals(), compas._lazy.lazy_modules(__name__, ['network', 'mesh']))
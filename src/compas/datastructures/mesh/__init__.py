@@ -4,6 +4,8 @@ from __future__ import print_function
 
 from compas import IPY
 
+import compas._lazy
+
 from .core import *  # noqa: F401 F403
 from ._mesh import *  # noqa: F401 F403
 
@@ -28,13 +30,33 @@ from .triangulation import *  # noqa: F401 F403
 from .trimming import *  # noqa: F401 F403
 
 if not IPY:
-    from .bbox_numpy import *  # noqa: F401 F403
-    from .contours_numpy import *  # noqa: F401 F403
-    from .descent_numpy import *  # noqa: F401 F403
-    from .geodesics_numpy import *  # noqa: F401 F403
-    from .pull_numpy import *  # noqa: F401 F403
-    from .smoothing_numpy import *  # noqa: F401 F403
-    from .transformations_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), compas._lazy.lazy_modules(__name__, ['core']))
+    compas._lazy.lazy_import(globals(), {
+        '.bbox_numpy': [
+            'mesh_oriented_bounding_box_numpy',
+            'mesh_oriented_bounding_box_xy_numpy',
+        ],
+        '.contours_numpy': [
+            'mesh_isolines_numpy',
+            'mesh_contours_numpy',
+        ],
+        '.descent_numpy': [
+            'trimesh_descent',
+        ],
+        '.geodesics_numpy': [
+            'mesh_geodesic_distances_numpy',
+        ],
+        '.pull_numpy': [
+            'trimesh_pull_points_numpy',
+        ],
+        '.smoothing_numpy': [
+            'trimesh_smooth_laplacian_cotangent',
+        ],
+        '.transformations_numpy': [
+            'mesh_transform_numpy',
+            'mesh_transformed_numpy',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
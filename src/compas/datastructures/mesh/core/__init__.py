@@ -4,12 +4,25 @@ from __future__ import print_function
 
 from compas import IPY
 
+import compas._lazy
+
 from .halfedge import HalfEdge  # noqa: F401
 from .mesh import BaseMesh  # noqa: F401
 from .operations import *  # noqa: F401 F403
 from .clean import *  # noqa: F401 F403
 
 if not IPY:
-    from .matrices import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.matrices': [
+            'mesh_adjacency_matrix',
+            'mesh_connectivity_matrix',
+            'mesh_degree_matrix',
+            'mesh_face_matrix',
+            'mesh_laplacian_matrix',
+            'trimesh_cotangent_laplacian_matrix',
+            'trimesh_vertexarea_matrix',
+        ],
+    })
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -6,7 +6,6 @@ from collections import OrderedDict
 from ast import literal_eval
 from random import sample
 from random import choice
-from distutils.version import LooseVersion
 
 import compas
 
@@ -50,6 +49,7 @@ class HalfEdge(Datastructure):
     @property
     def DATASCHEMA(self):
         import schema
+        from distutils.version import LooseVersion
         if LooseVersion(compas.__version__) < LooseVersion('0.16.5'):
             return schema.Schema({
                 "attributes": dict,
@@ -108,6 +108,7 @@ class HalfEdge(Datastructure):
 
     @property
     def JSONSCHEMA(self):
+        from distutils.version import LooseVersion
         version = LooseVersion(compas.__version__)
         schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -184,6 +185,7 @@ class HalfEdge(Datastructure):
     def data(self):
         """dict : A data dict representing the mesh data structure for serialisation.
         """
+        from distutils.version import LooseVersion
         data = {
             'attributes': self.attributes,
             'dva': self.default_vertex_attributes,
@@ -210,6 +212,7 @@ class HalfEdge(Datastructure):
 
     @data.setter
     def data(self, data):
+        from distutils.version import LooseVersion
         if 'compas' in data:
             version = LooseVersion(compas.__version__)
             if version < LooseVersion('0.16.5'):
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas._lazy
+
 from .core import *  # noqa: F401 F403
 from ._network import *  # noqa: F401 F403
 
@@ -13,5 +15,8 @@ from .planarity import *  # noqa: F401 F403
 from .smoothing import *  # noqa: F401 F403
 from .transformations import *  # noqa: F401 F403
 
+if not compas.IPY:
+    compas._lazy.lazy_import(globals(), compas._lazy.lazy_modules(__name__, ['core']))
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
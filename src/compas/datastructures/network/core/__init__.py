@@ -4,11 +4,22 @@ from __future__ import division
 
 from compas import IPY
 
+import compas._lazy
+
 from .graph import Graph  # noqa: F401
 from .network import BaseNetwork  # noqa: F401
 
 from .operations import *  # noqa: F401 F403
+
 if not IPY:
-    from .matrices import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.matrices': [
+            'network_adjacency_matrix',
+            'network_degree_matrix',
+            'network_connectivity_matrix',
+            'network_laplacian_matrix',
+        ],
+    })
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
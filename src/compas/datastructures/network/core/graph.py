@@ -5,7 +5,6 @@ from __future__ import division
 from random import sample
 from random import choice
 from ast import literal_eval
-from distutils.version import LooseVersion
 
 import compas
 
@@ -54,6 +53,7 @@ class Graph(Datastructure):
     @property
     def DATASCHEMA(self):
         import schema
+        from distutils.version import LooseVersion
         version = LooseVersion(compas.__version__)
         meta = {
             "compas": str,
@@ -76,6 +76,7 @@ class Graph(Datastructure):
 
     @property
     def JSONSCHEMA(self):
+        from distutils.version import LooseVersion
         version = LooseVersion(compas.__version__)
         schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
@@ -145,6 +146,7 @@ class Graph(Datastructure):
     def data(self):
         """Return a data dict of this data structure for serialisation.
         """
+        from distutils.version import LooseVersion
         version = LooseVersion(compas.__version__)
         meta = {
             "compas": version.vstring.split('-')[0],
@@ -184,6 +186,7 @@ class Graph(Datastructure):
 
     @data.setter
     def data(self, data):
+        from distutils.version import LooseVersion
         if 'compas' in data:
             version = LooseVersion(compas.__version__)
             if version < LooseVersion('0.16.5'):
@@ -28,6 +28,7 @@ Classes
     Circle
     Ellipse
     Frame
+    LazyGeometry
     Line
     Plane
     Point
@@ -103,6 +104,33 @@ Classes
     Torus
 
 
+Collections
+===========
+
+Base Classes
+------------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    PrimitiveArray
+
+
+Classes
+-------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    FrameArray
+    LineArray
+    PlaneArray
+    PointArray
+    VectorArray
+
+
 Predicates 2D
 =============
 
@@ -157,6 +185,7 @@ Transformations
     Scale
     Shear
     Transformation
+    TransformationArray
     Translation
 
 **Functions**
@@ -273,6 +302,56 @@ Linear algebra
     vector_variance
     vector_standard_deviation
 
+**Arrays**
+
+The following functions have the same semantics as the functions above,
+but operate on arrays of vectors, with the components along the last axis.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    add_vectors_numpy
+    add_vectors_xy_numpy
+    cross_vectors_numpy
+    cross_vectors_xy_numpy
+    divide_vectors_numpy
+    divide_vectors_xy_numpy
+    dot_vectors_numpy
+    dot_vectors_xy_numpy
+    length_vector_numpy
+    length_vector_xy_numpy
+    length_vector_sqrd_numpy
+    length_vector_sqrd_xy_numpy
+    multiply_matrices_numpy
+    multiply_matrix_vector_numpy
+    multiply_vectors_numpy
+    multiply_vectors_xy_numpy
+    norm_vector_numpy
+    norm_vectors_numpy
+    normalize_vector_numpy
+    normalize_vector_xy_numpy
+    normalize_vectors_numpy
+    normalize_vectors_xy_numpy
+    orthonormalize_vectors_numpy
+    power_vector_numpy
+    power_vectors_numpy
+    scale_vector_numpy
+    scale_vector_xy_numpy
+    scale_vectors_numpy
+    scale_vectors_xy_numpy
+    square_vector_numpy
+    square_vectors_numpy
+    subtract_vectors_numpy
+    subtract_vectors_xy_numpy
+    sum_vectors_numpy
+    transpose_matrix_numpy
+    vector_component_numpy
+    vector_component_xy_numpy
+    vector_average_numpy
+    vector_variance_numpy
+    vector_standard_deviation_numpy
+
 
 Points, Vectors, Lines, Planes
 ==============================
@@ -498,7 +577,12 @@ Pointclouds
     :toctree: generated/
     :nosignatures:
 
+    ICP
     icp_numpy
+    voxel_downsample_numpy
+    statistical_outliers_numpy
+    estimate_normals_numpy
+    radius_graph_numpy
 
 
 Base Classes
@@ -516,6 +600,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas._lazy
+
 from ._core import *  # noqa: F401 F403
 
 from .predicates import *  # noqa: F401 F403
@@ -540,3 +626,7 @@ from .trimesh import *  # noqa: F401 F403
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
+
+if not compas.IPY:
+    __all__ += compas._lazy.lazy_import(globals(), compas._lazy.lazy_modules(__name__, [
+        '_core', 'bbox', 'bestfit', 'collections', 'hull', 'icp', 'pointclouds', 'transformations', 'triangulation']))
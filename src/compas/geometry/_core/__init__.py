@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas._lazy
+
 from ._algebra import *  # noqa: F401 F403
 
 from .constructors import *  # noqa: F401 F403
@@ -15,5 +17,57 @@ from .quaternions import *  # noqa: F401 F403
 from .tangent import *  # noqa: F401 F403
 from .kdtree import *  # noqa: F401 F403
 
+if not compas.IPY:
+    compas._lazy.lazy_import(globals(), {
+        '._algebra_numpy': [
+            'close_numpy',
+            'allclose_numpy',
+            'argmin_numpy',
+            'argmax_numpy',
+            'add_vectors_numpy',
+            'add_vectors_xy_numpy',
+            'sum_vectors_numpy',
+            'cross_vectors_numpy',
+            'cross_vectors_xy_numpy',
+            'divide_vectors_numpy',
+            'divide_vectors_xy_numpy',
+            'dot_vectors_numpy',
+            'dot_vectors_xy_numpy',
+            'length_vector_numpy',
+            'length_vector_xy_numpy',
+            'length_vector_sqrd_numpy',
+            'length_vector_sqrd_xy_numpy',
+            'multiply_matrices_numpy',
+            'multiply_matrix_vector_numpy',
+            'multiply_vectors_numpy',
+            'multiply_vectors_xy_numpy',
+            'norm_vector_numpy',
+            'norm_vectors_numpy',
+            'normalize_vector_numpy',
+            'normalize_vector_xy_numpy',
+            'normalize_vectors_numpy',
+            'normalize_vectors_xy_numpy',
+            'homogenize_vectors_numpy',
+            'dehomogenize_vectors_numpy',
+            'orthonormalize_vectors_numpy',
+            'power_vector_numpy',
+            'power_vectors_numpy',
+            'scale_vector_numpy',
+            'scale_vector_xy_numpy',
+            'scale_vectors_numpy',
+            'scale_vectors_xy_numpy',
+            'square_vector_numpy',
+            'square_vectors_numpy',
+            'subtract_vectors_numpy',
+            'subtract_vectors_xy_numpy',
+            'transpose_matrix_numpy',
+            'vector_component_numpy',
+            'vector_component_xy_numpy',
+            'vector_average_numpy',
+            'vector_variance_numpy',
+            'vector_standard_deviation_numpy',
+        ],
+    })
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
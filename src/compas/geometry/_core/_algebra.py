@@ -55,6 +55,11 @@ __all__ = [
 ]
 
 
+def _is_array(values):
+    # arrays are dispatched to the functions of ``_algebra_numpy``, without importing numpy here
+    return hasattr(values, 'ndim') and hasattr(values, 'dtype')
+
+
 def vector_average(vector):
     """Average of a vector.
 
@@ -687,7 +692,7 @@ def square_vectors(vectors):
     >>>
 
     """
-    return [square_vectors(vector) for vector in vectors]
+    return [square_vector(vector) for vector in vectors]
 
 
 # ==============================================================================
@@ -0,0 +1,1057 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import abs as _abs
+from numpy import asarray
+from numpy import concatenate
+from numpy import cross
+from numpy import einsum
+from numpy import matmul
+from numpy import sqrt
+from numpy import where
+from numpy import zeros
+
+
+__all__ = [
+    'close_numpy',
+    'allclose_numpy',
+    'argmin_numpy',
+    'argmax_numpy',
+    'add_vectors_numpy',
+    'add_vectors_xy_numpy',
+    'sum_vectors_numpy',
+    'cross_vectors_numpy',
+    'cross_vectors_xy_numpy',
+    'divide_vectors_numpy',
+    'divide_vectors_xy_numpy',
+    'dot_vectors_numpy',
+    'dot_vectors_xy_numpy',
+    'length_vector_numpy',
+    'length_vector_xy_numpy',
+    'length_vector_sqrd_numpy',
+    'length_vector_sqrd_xy_numpy',
+    'multiply_matrices_numpy',
+    'multiply_matrix_vector_numpy',
+    'multiply_vectors_numpy',
+    'multiply_vectors_xy_numpy',
+    'norm_vector_numpy',
+    'norm_vectors_numpy',
+    'normalize_vector_numpy',
+    'normalize_vector_xy_numpy',
+    'normalize_vectors_numpy',
+    'normalize_vectors_xy_numpy',
+    'homogenize_vectors_numpy',
+    'dehomogenize_vectors_numpy',
+    'orthonormalize_vectors_numpy',
+    'power_vector_numpy',
+    'power_vectors_numpy',
+    'scale_vector_numpy',
+    'scale_vector_xy_numpy',
+    'scale_vectors_numpy',
+    'scale_vectors_xy_numpy',
+    'square_vector_numpy',
+    'square_vectors_numpy',
+    'subtract_vectors_numpy',
+    'subtract_vectors_xy_numpy',
+    'transpose_matrix_numpy',
+    'vector_component_numpy',
+    'vector_component_xy_numpy',
+    'vector_average_numpy',
+    'vector_variance_numpy',
+    'vector_standard_deviation_numpy',
+]
+
+
+# ==============================================================================
+# These functions mirror the functions of ``_algebra.py``, with the same names
+# and semantics, but operate on arrays. Vectors are stored along the last axis,
+# such that a (3, ) array is a vector and a (N, 3) array is a list of vectors.
+# All leading axes are batch axes: a function of one vector is applied to every
+# vector of an (N, 3) array, and a function of two vectors broadcasts its
+# operands against each other, as numpy does.
+# ==============================================================================
+
+
+def _xy(values):
+    # the result of an "_xy" function, i.e. with the Z components set to zero
+    result = zeros(values.shape[:-1] + (3, ))
+    result[..., :2] = values[..., :2]
+    return result
+
+
+def _floats(values):
+    return asarray(values, dtype=float)
+
+
+def vector_average_numpy(vector):
+    """Average of the components of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        An array of values, with the components along the last axis.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.vector_average`
+    """
+    return _floats(vector).mean(axis=-1)
+
+
+def vector_variance_numpy(vector):
+    """Variance of the components of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        An array of values, with the components along the last axis.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.vector_variance`
+    """
+    return _floats(vector).std(axis=-1)
+
+
+def vector_standard_deviation_numpy(vector):
+    """Standard deviation of the components of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        An array of values, with the components along the last axis.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.vector_standard_deviation`
+    """
+    return vector_variance_numpy(vector) ** .5
+
+
+def close_numpy(value1, value2, tol=1e-05):
+    """Elementwise comparison of values, up to a tolerance.
+
+    Parameters
+    ----------
+    value1 : array-like
+    value2 : array-like
+    tol : float, optional
+
+    Returns
+    -------
+    bool or array of bool
+
+    See Also
+    --------
+    :func:`compas.geometry.close`
+    """
+    return _abs(_floats(value1) - _floats(value2)) < tol
+
+
+def allclose_numpy(l1, l2, tol=1e-05):
+    """Verify that all values of two arrays are equal, up to a tolerance.
+
+    Parameters
+    ----------
+    l1 : array-like
+    l2 : array-like
+    tol : float, optional
+
+    Returns
+    -------
+    bool
+
+    See Also
+    --------
+    :func:`compas.geometry.allclose`
+    """
+    return bool((_abs(_floats(l1) - _floats(l2)) <= tol).all())
+
+
+def argmax_numpy(values):
+    """Index of the largest value, along the last axis.
+
+    Parameters
+    ----------
+    values : array-like
+
+    Returns
+    -------
+    int or array of int
+
+    See Also
+    --------
+    :func:`compas.geometry.argmax`
+    """
+    return asarray(values).argmax(axis=-1)
+
+
+def argmin_numpy(values):
+    """Index of the smallest value, along the last axis.
+
+    Parameters
+    ----------
+    values : array-like
+
+    Returns
+    -------
+    int or array of int
+
+    See Also
+    --------
+    :func:`compas.geometry.argmin`
+    """
+    return asarray(values).argmin(axis=-1)
+
+
+# ==============================================================================
+# these return something of smaller dimension/length/...
+# ==============================================================================
+
+
+def sum_vectors_numpy(vectors, axis=0):
+    """Sum of vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors, with shape ``(..., N, 3)``.
+    axis : int, optional
+        If ``0``, sum the vectors, if ``1``, sum the components of every vector.
+        Default is ``0``.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.sum_vectors`
+    """
+    return _floats(vectors).sum(axis=-2 if axis == 0 else -1)
+
+
+def norm_vector_numpy(vector):
+    """Length of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.norm_vector`
+    """
+    return sqrt((_floats(vector) ** 2).sum(axis=-1))
+
+
+def norm_vectors_numpy(vectors):
+    """Lengths of vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.norm_vectors`
+    """
+    return norm_vector_numpy(vectors)
+
+
+def length_vector_numpy(vector):
+    """Length of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.length_vector`
+    """
+    return sqrt(length_vector_sqrd_numpy(vector))
+
+
+def length_vector_xy_numpy(vector):
+    """Length of vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.length_vector_xy`
+    """
+    return sqrt(length_vector_sqrd_xy_numpy(vector))
+
+
+def length_vector_sqrd_numpy(vector):
+    """Squared length of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.length_vector_sqrd`
+    """
+    vector = _floats(vector)
+    return (vector[..., :3] ** 2).sum(axis=-1)
+
+
+def length_vector_sqrd_xy_numpy(vector):
+    """Squared length of vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.length_vector_sqrd_xy`
+    """
+    vector = _floats(vector)
+    return (vector[..., :2] ** 2).sum(axis=-1)
+
+
+# ==============================================================================
+# these perform an operation on a vector and return a modified vector
+# ==============================================================================
+
+
+def scale_vector_numpy(vector, factor):
+    """Scale vectors by factors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+    factor : float or array-like
+        A scale factor, or one factor per vector.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.scale_vector`
+    """
+    factor = _floats(factor)
+    return _floats(vector) * factor[..., None]
+
+
+def scale_vector_xy_numpy(vector, factor):
+    """Scale vectors by factors, and project them to the XY plane.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+    factor : float or array-like
+        A scale factor, or one factor per vector.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.scale_vector_xy`
+    """
+    return _xy(scale_vector_numpy(_floats(vector)[..., :2], factor))
+
+
+def scale_vectors_numpy(vectors, factor):
+    """Scale vectors by a factor.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+    factor : float or array-like
+        A scale factor, or one factor per vector.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.scale_vectors`
+    """
+    return scale_vector_numpy(vectors, factor)
+
+
+def scale_vectors_xy_numpy(vectors, factor):
+    """Scale vectors by a factor, and project them to the XY plane.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+    factor : float or array-like
+        A scale factor, or one factor per vector.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.scale_vectors_xy`
+    """
+    return scale_vector_xy_numpy(vectors, factor)
+
+
+def normalize_vector_numpy(vector):
+    """Normalize vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    array
+        The unit vectors.
+        Vectors of zero length are returned unchanged.
+
+    See Also
+    --------
+    :func:`compas.geometry.normalize_vector`
+    """
+    vector = _floats(vector)
+    length = length_vector_numpy(vector)
+    return vector / where(length == 0, 1.0, length)[..., None]
+
+
+def normalize_vector_xy_numpy(vector):
+    """Normalize vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    array
+        The unit vectors.
+        Vectors of zero length are returned unchanged.
+
+    See Also
+    --------
+    :func:`compas.geometry.normalize_vector_xy`
+    """
+    vector = _floats(vector)
+    length = length_vector_xy_numpy(vector)
+    result = _xy(vector / where(length == 0, 1.0, length)[..., None])
+    # as with the pure Python version, zero vectors keep their Z component
+    zero = length == 0
+    result[zero] = vector[zero]
+    return result
+
+
+def normalize_vectors_numpy(vectors):
+    """Normalize vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.normalize_vectors`
+    """
+    return normalize_vector_numpy(vectors)
+
+
+def normalize_vectors_xy_numpy(vectors):
+    """Normalize vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.normalize_vectors_xy`
+    """
+    return normalize_vector_xy_numpy(vectors)
+
+
+def power_vector_numpy(vector, power):
+    """Raise the components of vectors to a power.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+    power : int or float
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.power_vector`
+    """
+    return _floats(vector) ** power
+
+
+def power_vectors_numpy(vectors, power):
+    """Raise the components of vectors to a power.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+    power : int or float
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.power_vectors`
+    """
+    return power_vector_numpy(vectors, power)
+
+
+def square_vector_numpy(vector):
+    """Square the components of vectors.
+
+    Parameters
+    ----------
+    vector : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.square_vector`
+    """
+    return power_vector_numpy(vector, 2)
+
+
+def square_vectors_numpy(vectors):
+    """Square the components of vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.square_vectors`
+    """
+    return power_vector_numpy(vectors, 2)
+
+
+# ==============================================================================
+# these perform an operation with corresponding elements of the (2) input vectors
+# ==============================================================================
+
+
+def add_vectors_numpy(u, v):
+    """Add vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.add_vectors`
+    """
+    return _floats(u) + _floats(v)
+
+
+def add_vectors_xy_numpy(u, v):
+    """Add vectors, and project the result to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.add_vectors_xy`
+    """
+    return _xy(_floats(u)[..., :2] + _floats(v)[..., :2])
+
+
+def subtract_vectors_numpy(u, v):
+    """Subtract vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.subtract_vectors`
+    """
+    return _floats(u) - _floats(v)
+
+
+def subtract_vectors_xy_numpy(u, v):
+    """Subtract vectors, and project the result to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.subtract_vectors_xy`
+    """
+    return _xy(_floats(u)[..., :2] - _floats(v)[..., :2])
+
+
+def multiply_vectors_numpy(u, v):
+    """Multiply the components of vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.multiply_vectors`
+    """
+    return _floats(u) * _floats(v)
+
+
+def multiply_vectors_xy_numpy(u, v):
+    """Multiply the components of vectors, and project the result to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.multiply_vectors_xy`
+    """
+    return _xy(_floats(u)[..., :2] * _floats(v)[..., :2])
+
+
+def divide_vectors_numpy(u, v):
+    """Divide the components of vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.divide_vectors`
+    """
+    return _floats(u) / _floats(v)
+
+
+def divide_vectors_xy_numpy(u, v):
+    """Divide the components of vectors, and project the result to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.divide_vectors_xy`
+    """
+    return _xy(_floats(u)[..., :2] / _floats(v)[..., :2])
+
+
+def cross_vectors_numpy(u, v):
+    """Cross products of vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.cross_vectors`
+    """
+    return cross(_floats(u), _floats(v))
+
+
+def cross_vectors_xy_numpy(u, v):
+    """Cross products of vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.cross_vectors_xy`
+    """
+    u = _floats(u)
+    v = _floats(v)
+    z = u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+    result = zeros(z.shape + (3, ))
+    result[..., 2] = z
+    return result
+
+
+def dot_vectors_numpy(u, v):
+    """Dot products of vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.dot_vectors`
+    """
+    return (_floats(u) * _floats(v)).sum(axis=-1)
+
+
+def dot_vectors_xy_numpy(u, v):
+    """Dot products of vectors, after projecting them to the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    float or array
+
+    See Also
+    --------
+    :func:`compas.geometry.dot_vectors_xy`
+    """
+    return (_floats(u)[..., :2] * _floats(v)[..., :2]).sum(axis=-1)
+
+
+def vector_component_numpy(u, v):
+    """Components of vectors in the directions of other vectors.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+        The projections of ``u`` onto ``v``,
+        or zero vectors where ``v`` has zero length.
+
+    See Also
+    --------
+    :func:`compas.geometry.vector_component`
+    """
+    u = _floats(u)
+    v = _floats(v)
+    l2 = length_vector_sqrd_numpy(v)
+    x = dot_vectors_numpy(u, v) / where(l2 == 0, 1.0, l2)
+    return scale_vector_numpy(v, x)
+
+
+def vector_component_xy_numpy(u, v):
+    """Components of vectors in the directions of other vectors, in the XY plane.
+
+    Parameters
+    ----------
+    u : array-like
+    v : array-like
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.vector_component_xy`
+    """
+    u = _floats(u)
+    v = _floats(v)
+    l2 = length_vector_sqrd_xy_numpy(v)
+    x = dot_vectors_xy_numpy(u, v) / where(l2 == 0, 1.0, l2)
+    return scale_vector_xy_numpy(v, x)
+
+
+# ==============================================================================
+# these involve vectors interpreted as matrices
+# ==============================================================================
+
+
+def transpose_matrix_numpy(M):
+    """Transpose matrices.
+
+    Parameters
+    ----------
+    M : array-like
+        A matrix, or a stack of matrices.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.transpose_matrix`
+    """
+    return _floats(M).swapaxes(-1, -2)
+
+
+def multiply_matrices_numpy(A, B):
+    """Multiply matrices.
+
+    Parameters
+    ----------
+    A : array-like
+        A matrix, or a stack of matrices.
+    B : array-like
+        A matrix, or a stack of matrices.
+
+    Returns
+    -------
+    array
+
+    Raises
+    ------
+    ValueError
+        If the shapes of the matrices are not compatible.
+
+    See Also
+    --------
+    :func:`compas.geometry.multiply_matrices`
+    """
+    return matmul(_floats(A), _floats(B))
+
+
+def multiply_matrix_vector_numpy(A, b):
+    """Multiply matrices with vectors.
+
+    Parameters
+    ----------
+    A : array-like
+        A matrix, or a stack of matrices.
+    b : array-like
+        A vector, or an array of vectors.
+
+    Returns
+    -------
+    array
+
+    See Also
+    --------
+    :func:`compas.geometry.multiply_matrix_vector`
+    """
+    return einsum('...ij,...j->...i', _floats(A), _floats(b))
+
+
+# ==============================================================================
+# linalg
+# ==============================================================================
+
+
+def homogenize_vectors_numpy(vectors, w=1.0):
+    """Homogenise vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors, with shape ``(..., 3)``.
+    w : float, optional
+
+    Returns
+    -------
+    array
+        An array with shape ``(..., 4)``.
+
+    See Also
+    --------
+    :func:`compas.geometry.homogenize_vectors`
+    """
+    vectors = _floats(vectors)
+    weights = zeros(vectors.shape[:-1] + (1, )) + w
+    return concatenate((vectors / w, weights), axis=-1)
+
+
+def dehomogenize_vectors_numpy(vectors):
+    """Dehomogenise vectors.
+
+    Parameters
+    ----------
+    vectors : array-like
+        An array of vectors, with shape ``(..., 4)``.
+
+    Returns
+    -------
+    array
+        An array with shape ``(..., 3)``.
+
+    See Also
+    --------
+    :func:`compas.geometry.dehomogenize_vectors`
+    """
+    vectors = _floats(vectors)
+    return vectors[..., :3] * vectors[..., 3:]
+
+
+def orthonormalize_vectors_numpy(vectors):
+    """Orthonormalize a set of vectors, with the same Gram-Schmidt process as the pure Python version.
+
+    Parameters
+    ----------
+    vectors : array-like
+        The vectors, with shape ``(N, 3)``.
+
+    Returns
+    -------
+    array
+        The orthonormal basis, with shape ``(M, 3)``, with ``M <= N``.
+
+    See Also
+    --------
+    :func:`compas.geometry.orthonormalize_vectors`
+    """
+    basis = []
+    for v in _floats(vectors):
+        e = v - vector_component_numpy(v, asarray(basis)).sum(axis=0) if basis else v
+        if (e > 1e-10).any():
+            basis.append(normalize_vector_numpy(e))
+    return asarray(basis).reshape((-1, _floats(vectors).shape[-1]))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod(globs=globals())
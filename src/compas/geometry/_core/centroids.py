@@ -16,6 +16,7 @@ from compas.geometry._core import cross_vectors
 from compas.geometry._core import cross_vectors_xy
 from compas.geometry._core import scale_vector
 from compas.geometry._core import sum_vectors
+from compas.geometry._core._algebra import _is_array
 
 
 __all__ = [
@@ -137,10 +138,18 @@ def centroid_points(points):
     list
         XYZ coordinates of the centroid.
 
+    Notes
+    -----
+    If ``points`` is an array of shape ``(..., N, 3)``, the centroids are computed with
+    array operations for all sets of points along the leading axes, and returned as an array.
+
     Examples
     --------
     >>>
     """
+    if _is_array(points):
+        from compas.geometry._core._algebra_numpy import sum_vectors_numpy
+        return sum_vectors_numpy(points) / points.shape[-2]
     p = len(points)
     x, y, z = zip(*points)
     return [sum(x) / p, sum(y) / p, sum(z) / p]
@@ -160,7 +169,18 @@ def centroid_points_weighted(points, weights):
     -------
     list
         The coordinates of the weighted centroid.
+
+    Notes
+    -----
+    If ``points`` is an array of shape ``(..., N, 3)``, the centroids are computed with
+    array operations for all sets of points along the leading axes, and returned as an array.
     """
+    if _is_array(points):
+        from compas.geometry._core._algebra_numpy import scale_vector_numpy
+        from compas.geometry._core._algebra_numpy import sum_vectors_numpy
+        from numpy import asarray
+        weights = asarray(weights, dtype=float)
+        return scale_vector_numpy(sum_vectors_numpy(scale_vector_numpy(points, weights)), 1. / weights.sum(axis=-1))
     vectors = [scale_vector(point, weight) for point, weight in zip(points, weights)]
     vector = scale_vector(sum_vectors(vectors), 1. / sum(weights))
     return vector
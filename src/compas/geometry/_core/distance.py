@@ -18,6 +18,7 @@ from compas.geometry._core import length_vector_xy
 from compas.geometry._core import length_vector_sqrd
 from compas.geometry._core import length_vector_sqrd_xy
 from compas.geometry._core import cross_vectors
+from compas.geometry._core._algebra import _is_array
 from compas.geometry._core import cross_vectors_xy
 from compas.geometry._core import dot_vectors
 from compas.geometry._core import vector_component
@@ -70,11 +71,20 @@ def distance_point_point(a, b):
     >>> distance_point_point([0.0, 0.0, 0.0], [2.0, 0.0, 0.0])
     2.0
 
+    Notes
+    -----
+    If ``a`` or ``b`` is an array of points, the distances are computed with
+    array operations for all pairs of points, and returned as an array.
+
     See Also
     --------
     distance_point_point_xy
 
     """
+    if _is_array(a) or _is_array(b):
+        from compas.geometry._core._algebra_numpy import length_vector_numpy
+        from compas.geometry._core._algebra_numpy import subtract_vectors_numpy
+        return length_vector_numpy(subtract_vectors_numpy(b, a))
     ab = subtract_vectors(b, a)
     return length_vector(ab)
 
@@ -130,11 +140,20 @@ def distance_point_point_sqrd(a, b):
     >>> distance_point_point_sqrd([0.0, 0.0, 0.0], [2.0, 0.0, 0.0])
     4.0
 
+    Notes
+    -----
+    If ``a`` or ``b`` is an array of points, the distances are computed with
+    array operations for all pairs of points, and returned as an array.
+
     See Also
     --------
     distance_point_point_sqrd_xy
 
     """
+    if _is_array(a) or _is_array(b):
+        from compas.geometry._core._algebra_numpy import length_vector_sqrd_numpy
+        from compas.geometry._core._algebra_numpy import subtract_vectors_numpy
+        return length_vector_sqrd_numpy(subtract_vectors_numpy(b, a))
     ab = subtract_vectors(b, a)
     return length_vector_sqrd(ab)
 
@@ -358,6 +377,9 @@ def distance_point_plane(point, plane):
     absolute value of the dot product of the vector from :math:`Q` to :math:`P`
     and the normal at :math:`Q`.
 
+    If ``point`` is an array of points, the distances are computed with
+    array operations for all points, and returned as an array.
+
     References
     ----------
     .. [1] Nykamp, D. *Distance from point to plane*.
@@ -368,7 +390,10 @@ def distance_point_plane(point, plane):
     >>>
 
     """
-    return fabs(distance_point_plane_signed(point, plane))
+    distance = distance_point_plane_signed(point, plane)
+    if _is_array(distance):
+        return abs(distance)
+    return fabs(distance)
 
 
 def distance_point_plane_signed(point, plane):
@@ -413,6 +438,9 @@ def distance_point_plane_signed(point, plane):
     value of the dot product of the vector from :math:`Q` to :math:`P`
     and the normal at :math:`Q`.
 
+    If ``point`` is an array of points, the distances are computed with
+    array operations for all points, and returned as an array.
+
     References
     ----------
     .. [1] Nykamp, D. *Distance from point to plane*.
@@ -424,6 +452,10 @@ def distance_point_plane_signed(point, plane):
 
     """
     base, normal = plane
+    if _is_array(point):
+        from compas.geometry._core._algebra_numpy import dot_vectors_numpy
+        from compas.geometry._core._algebra_numpy import subtract_vectors_numpy
+        return dot_vectors_numpy(subtract_vectors_numpy(point, base), normal)
     vector = subtract_vectors(point, base)
     return dot_vectors(vector, normal)
 
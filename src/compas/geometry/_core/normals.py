@@ -11,6 +11,7 @@ from compas.geometry._core import length_vector_xy
 from compas.geometry._core import normalize_vector
 
 from compas.geometry._core import centroid_points
+from compas.geometry._core._algebra import _is_array
 
 
 __all__ = [
@@ -43,7 +44,12 @@ def normal_polygon(polygon, unitized=True):
     The points in the list should be unique. For example, the first and last
     point in the list should not be the same.
 
+    If ``polygon`` is an array of shape ``(..., N, 3)``, the normals are computed with
+    array operations for all polygons along the leading axes, and returned as an array.
+
     """
+    if _is_array(polygon):
+        return _normal_polygon_numpy(polygon, unitized)
     p = len(polygon)
 
     assert p > 2, "At least three points required"
@@ -72,6 +78,20 @@ def normal_polygon(polygon, unitized=True):
     return normalize_vector([nx, ny, nz])
 
 
+def _normal_polygon_numpy(polygon, unitized):
+    from numpy import roll
+    from compas.geometry._core._algebra_numpy import cross_vectors_numpy
+    from compas.geometry._core._algebra_numpy import normalize_vector_numpy
+    from compas.geometry._core._algebra_numpy import sum_vectors_numpy
+    if polygon.shape[-2] < 3:
+        raise AssertionError("At least three points required")
+    o = centroid_points(polygon)
+    ob = polygon - o[..., None, :]
+    oa = roll(ob, 1, axis=-2)
+    n = sum_vectors_numpy(cross_vectors_numpy(oa, ob))
+    return normalize_vector_numpy(n) if unitized else n
+
+
 def normal_triangle(triangle, unitized=True):
     """Compute the normal vector of a triangle.
 
@@ -90,7 +110,18 @@ def normal_triangle(triangle, unitized=True):
     ValueError
         If the triangle does not have three vertices.
 
+    Notes
+    -----
+    If ``triangle`` is an array of shape ``(..., 3, 3)``, the normals are computed with
+    array operations for all triangles along the leading axes, and returned as an array.
+
     """
+    if _is_array(triangle):
+        from compas.geometry._core._algebra_numpy import cross_vectors_numpy
+        from compas.geometry._core._algebra_numpy import normalize_vector_numpy
+        a, b, c = triangle[..., 0, :], triangle[..., 1, :], triangle[..., 2, :]
+        n = cross_vectors_numpy(b - a, c - a)
+        return normalize_vector_numpy(n) if unitized else n
     assert len(triangle) == 3, "Three points are required."
     a, b, c = triangle
     ab = subtract_vectors(b, a)
@@ -121,7 +152,22 @@ def normal_triangle_xy(triangle, unitized=True):
     ValueError
         If the triangle does not have three vertices.
 
+    Notes
+    -----
+    If ``triangle`` is an array of shape ``(..., 3, 3)``, the normals are computed with
+    array operations for all triangles along the leading axes, and returned as an array.
+
     """
+    if _is_array(triangle):
+        from compas.geometry._core._algebra_numpy import cross_vectors_numpy
+        from compas.geometry._core._algebra_numpy import normalize_vector_numpy
+        a, b, c = triangle[..., 0, :], triangle[..., 1, :], triangle[..., 2, :]
+        ab = b - a
+        ac = c - a
+        ab[..., 2] = 0.0
+        ac[..., 2] = 0.0
+        n = cross_vectors_numpy(ab, ac)
+        return normalize_vector_numpy(n) if unitized else n
     a, b, c = triangle
     ab = subtract_vectors_xy(b, a)
     ac = subtract_vectors_xy(c, a)
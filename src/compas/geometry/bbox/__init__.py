@@ -2,12 +2,18 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 
 from .bbox import *  # noqa: F401 F403
 
 if not compas.IPY:
-    from .bbox_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.bbox_numpy': [
+            'oriented_bounding_box_numpy',
+            'oriented_bounding_box_xy_numpy',
+            'oabb_numpy',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
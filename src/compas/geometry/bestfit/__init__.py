@@ -2,12 +2,19 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 
 from .bestfit import *  # noqa: F401 F403
 
 if not compas.IPY:
-    from .bestfit_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.bestfit_numpy': [
+            'bestfit_plane_numpy',
+            'bestfit_frame_numpy',
+            'bestfit_circle_numpy',
+            'bestfit_sphere_numpy',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
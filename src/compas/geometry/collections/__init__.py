@@ -2,17 +2,38 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-import compas
+import compas._lazy
 
 from .collection import Collection  # noqa: F401
-
-if not compas.IPY:
-    from .collection_numpy import CollectionNumpy  # noqa: F401
-
 from .pointcollection import PointCollection  # noqa: F401
 
 if not compas.IPY:
-    from .pointcollection_numpy import PointCollectionNumpy  # noqa: F401
+    compas._lazy.lazy_import(globals(), {
+        '.collection_numpy': [
+            'CollectionNumpy',
+        ],
+        '.pointcollection_numpy': [
+            'PointCollectionNumpy',
+        ],
+        '.primitivearray_numpy': [
+            'PrimitiveArray',
+        ],
+        '.pointarray_numpy': [
+            'PointArray',
+        ],
+        '.vectorarray_numpy': [
+            'VectorArray',
+        ],
+        '.linearray_numpy': [
+            'LineArray',
+        ],
+        '.planearray_numpy': [
+            'PlaneArray',
+        ],
+        '.framearray_numpy': [
+            'FrameArray',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('__')]
@@ -15,6 +15,16 @@ class Collection(object):
     def transformed(self, X):
         raise NotImplementedError
 
+    def lazy(self):
+        """Returns a lazy view of this collection, for chains of transformations.
+
+        Returns
+        -------
+        :class:`compas.geometry.LazyGeometry`
+        """
+        from compas.geometry.primitives.lazy import LazyGeometry
+        return LazyGeometry(self)
+
 
 # ==============================================================================
 # Main
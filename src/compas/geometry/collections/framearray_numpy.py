@@ -0,0 +1,173 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import cross
+from numpy import einsum
+from numpy import eye
+from numpy import tile
+
+from compas.geometry.collections.primitivearray_numpy import PrimitiveArray
+from compas.geometry.collections.primitivearray_numpy import _transform
+from compas.geometry.collections.primitivearray_numpy import _unitized
+from compas.geometry.collections.pointarray_numpy import PointArray
+from compas.geometry.collections.vectorarray_numpy import VectorArray
+
+
+__all__ = ['FrameArray']
+
+
+def _orthonormalize(array):
+    xaxes = _unitized(array[:, 1])
+    zaxes = _unitized(cross(xaxes, array[:, 2]))
+    array[:, 1] = xaxes
+    array[:, 2] = cross(zaxes, xaxes)
+
+
+class FrameArray(PrimitiveArray):
+    """A collection of frames stored in a single array of shape ``(N, 3, 3)``.
+
+    Parameters
+    ----------
+    frames : array-like
+        The frames, as triplets of origin, X axis and Y axis.
+        As with :class:`compas.geometry.Frame`, the axes are orthonormalized.
+
+    Examples
+    --------
+    >>> frames = FrameArray([[[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[1, 2, 3], [0, 1, 0], [-1, 0, 0]]])
+    >>> frames.to_local_coordinates([[1, 2, 4], [1, 2, 4]]).tolist()
+    [[1.0, 2.0, 4.0], [0.0, 0.0, 1.0]]
+
+    """
+
+    __slots__ = []
+
+    SHAPE = (3, 3)
+
+    def __init__(self, frames):
+        super(FrameArray, self).__init__(frames)
+        _orthonormalize(self.array)
+
+    @classmethod
+    def from_transformations(cls, transformations):
+        """Construct the frames to which transformations map the world XY frame.
+
+        Parameters
+        ----------
+        transformations : :class:`compas.geometry.TransformationArray` or list of :class:`compas.geometry.Transformation`
+            The transformations.
+
+        Returns
+        -------
+        :class:`FrameArray`
+        """
+        M = getattr(transformations, 'matrices', None)
+        if M is None:
+            M = asarray([getattr(T, 'matrix', T) for T in transformations], dtype=float)
+        return cls(M[:, :3, [3, 0, 1]].transpose((0, 2, 1)))
+
+    @property
+    def points(self):
+        """:class:`PointArray` : The origins, as a view on the array of the collection."""
+        return PointArray._view(self.array[:, 0])
+
+    @property
+    def xaxes(self):
+        """:class:`VectorArray` : The X axes, as a view on the array of the collection."""
+        return VectorArray._view(self.array[:, 1])
+
+    @property
+    def yaxes(self):
+        """:class:`VectorArray` : The Y axes, as a view on the array of the collection."""
+        return VectorArray._view(self.array[:, 2])
+
+    @property
+    def zaxes(self):
+        """:class:`VectorArray` : The Z axes."""
+        return VectorArray(cross(self.array[:, 1], self.array[:, 2]))
+
+    def _points(self):
+        return self.array[:, 0]
+
+    def _matrices(self):
+        M = tile(eye(4), (len(self.array), 1, 1))
+        M[:, :3, 0] = self.array[:, 1]
+        M[:, :3, 1] = self.array[:, 2]
+        M[:, :3, 2] = cross(self.array[:, 1], self.array[:, 2])
+        M[:, :3, 3] = self.array[:, 0]
+        return M
+
+    def to_frames(self):
+        """Convert the collection to a list of frames.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Frame`
+        """
+        from compas.geometry import Frame
+        return [Frame(point, xaxis, yaxis) for point, xaxis, yaxis in self.array.tolist()]
+
+    def to_transformations(self):
+        """Convert the collection to the transformations from the world XY frame to the frames.
+
+        Returns
+        -------
+        :class:`compas.geometry.TransformationArray`
+        """
+        from compas.geometry import TransformationArray
+        return TransformationArray(self._matrices())
+
+    def to_local_coordinates(self, points):
+        """Convert points from world coordinates to the coordinates of the frames, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per frame.
+
+        Returns
+        -------
+        array
+            The local coordinates, with shape ``(N, 3)``.
+        """
+        xyz = points.array if isinstance(points, PrimitiveArray) else asarray(points, dtype=float)
+        R = self._matrices()[:, :3, :3]
+        return einsum('nji,nj->ni', R, xyz - self.array[:, 0])
+
+    def to_world_coordinates(self, points):
+        """Convert points from the coordinates of the frames to world coordinates, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per frame, in local coordinates.
+
+        Returns
+        -------
+        array
+            The world coordinates, with shape ``(N, 3)``.
+        """
+        xyz = points.array if isinstance(points, PrimitiveArray) else asarray(points, dtype=float)
+        R = self._matrices()[:, :3, :3]
+        xyz = broadcast_to(xyz, self.array[:, 0].shape)
+        return einsum('nij,nj->ni', R, xyz) + self.array[:, 0]
+
+    def transform(self, X):
+        _transform(self.array[:, 0], X, 1.0)
+        axes = self.array[:, 1:].copy()
+        _transform(axes, X, 0.0)
+        self.array[:, 1:] = axes
+        _orthonormalize(self.array)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
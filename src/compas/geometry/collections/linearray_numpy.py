@@ -0,0 +1,146 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+
+from compas.geometry.collections.primitivearray_numpy import PrimitiveArray
+from compas.geometry.collections.primitivearray_numpy import _transform
+from compas.geometry.collections.pointarray_numpy import PointArray
+from compas.geometry.collections.vectorarray_numpy import VectorArray
+
+
+__all__ = ['LineArray']
+
+
+class LineArray(PrimitiveArray):
+    """A collection of lines stored in a single array of shape ``(N, 2, 3)``.
+
+    Parameters
+    ----------
+    lines : array-like
+        The lines, as pairs of start and end points.
+
+    Examples
+    --------
+    >>> lines = LineArray([[[0, 0, 0], [1, 0, 0]], [[0, 0, 0], [0, 0, 2]]])
+    >>> lines.lengths().tolist()
+    [1.0, 2.0]
+    >>> lines.end[1].tolist()
+    [0.0, 0.0, 2.0]
+
+    """
+
+    __slots__ = []
+
+    SHAPE = (2, 3)
+
+    @property
+    def start(self):
+        """:class:`PointArray` : The start points, as a view on the array of the collection."""
+        return PointArray._view(self.array[:, 0])
+
+    @property
+    def end(self):
+        """:class:`PointArray` : The end points, as a view on the array of the collection."""
+        return PointArray._view(self.array[:, 1])
+
+    def to_lines(self):
+        """Convert the collection to a list of lines.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Line`
+        """
+        from compas.geometry import Line
+        return [Line(a, b) for a, b in self.array.tolist()]
+
+    def vectors(self):
+        """Compute the vectors from start to end.
+
+        Returns
+        -------
+        :class:`VectorArray`
+        """
+        return VectorArray(self.array[:, 1] - self.array[:, 0])
+
+    def directions(self):
+        """Compute the unit vectors from start to end.
+
+        Returns
+        -------
+        :class:`VectorArray`
+        """
+        return self.vectors().unitized()
+
+    def lengths(self):
+        """Compute the lengths of the lines.
+
+        Returns
+        -------
+        array
+            The lengths, with shape ``(N, )``.
+        """
+        return ((self.array[:, 1] - self.array[:, 0]) ** 2).sum(axis=1) ** 0.5
+
+    def midpoints(self):
+        """Compute the midpoints of the lines.
+
+        Returns
+        -------
+        :class:`PointArray`
+        """
+        return self.points(0.5)
+
+    def points(self, t):
+        """Compute points on the lines at a parameter.
+
+        Parameters
+        ----------
+        t : float or array-like
+            The parameter, or one parameter per line.
+            The parameter is 0 at the start and 1 at the end of a line.
+
+        Returns
+        -------
+        :class:`PointArray`
+        """
+        t = asarray(t, dtype=float).reshape((-1, 1))
+        return PointArray(self.array[:, 0] + t * (self.array[:, 1] - self.array[:, 0]))
+
+    def closest_points(self, points, segment=False):
+        """Compute the closest points on the lines to other points, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per line.
+        segment : bool, optional
+            If ``True``, the closest points are restricted to the segments between start and end.
+            Default is ``False``.
+
+        Returns
+        -------
+        :class:`PointArray`
+        """
+        xyz = points.array if isinstance(points, PrimitiveArray) else asarray(points, dtype=float)
+        a = self.array[:, 0]
+        ab = self.array[:, 1] - a
+        l2 = (ab ** 2).sum(axis=1)
+        t = ((xyz - a) * ab).sum(axis=1) / (l2 + (l2 == 0))
+        if segment:
+            t = t.clip(0.0, 1.0)
+        return PointArray(a + t[:, None] * ab)
+
+    def transform(self, X):
+        _transform(self.array, X, 1.0)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -0,0 +1,126 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+
+from compas.geometry.collections.primitivearray_numpy import PrimitiveArray
+from compas.geometry.collections.primitivearray_numpy import _transform
+from compas.geometry.collections.primitivearray_numpy import _unitized
+from compas.geometry.collections.pointarray_numpy import PointArray
+from compas.geometry.collections.vectorarray_numpy import VectorArray
+
+
+__all__ = ['PlaneArray']
+
+
+class PlaneArray(PrimitiveArray):
+    """A collection of planes stored in a single array of shape ``(N, 2, 3)``.
+
+    Parameters
+    ----------
+    planes : array-like
+        The planes, as pairs of base points and normals.
+        The normals are unitized.
+
+    Examples
+    --------
+    >>> planes = PlaneArray([[[0, 0, 0], [0, 0, 2]], [[0, 0, 1], [0, 0, 1]]])
+    >>> planes.distances_to_points([0, 0, 3]).tolist()
+    [3.0, 2.0]
+
+    """
+
+    __slots__ = []
+
+    SHAPE = (2, 3)
+
+    def __init__(self, planes):
+        super(PlaneArray, self).__init__(planes)
+        self.array[:, 1] = _unitized(self.array[:, 1])
+
+    @property
+    def points(self):
+        """:class:`PointArray` : The base points, as a view on the array of the collection."""
+        return PointArray._view(self.array[:, 0])
+
+    @property
+    def normals(self):
+        """:class:`VectorArray` : The normals, as a view on the array of the collection."""
+        return VectorArray._view(self.array[:, 1])
+
+    def _points(self):
+        return self.array[:, 0]
+
+    def to_planes(self):
+        """Convert the collection to a list of planes.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Plane`
+        """
+        from compas.geometry import Plane
+        return [Plane(point, normal) for point, normal in self.array.tolist()]
+
+    def signed_distances_to_points(self, points):
+        """Compute the signed distances to other points, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per plane.
+
+        Returns
+        -------
+        array
+            The distances, with shape ``(N, )``, positive in the direction of the normals.
+        """
+        xyz = points.array if isinstance(points, PrimitiveArray) else asarray(points, dtype=float)
+        return ((xyz - self.array[:, 0]) * self.array[:, 1]).sum(axis=1)
+
+    def distances_to_points(self, points):
+        """Compute the distances to other points, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per plane.
+
+        Returns
+        -------
+        array
+            The distances, with shape ``(N, )``.
+        """
+        return abs(self.signed_distances_to_points(points))
+
+    def project_points(self, points):
+        """Project other points onto the planes, element by element.
+
+        Parameters
+        ----------
+        points : array-like or :class:`PointArray`
+            One point, or one point per plane.
+
+        Returns
+        -------
+        :class:`PointArray`
+        """
+        xyz = points.array if isinstance(points, PrimitiveArray) else asarray(points, dtype=float)
+        d = self.signed_distances_to_points(xyz)
+        return PointArray(xyz - d[:, None] * self.array[:, 1])
+
+    def transform(self, X):
+        _transform(self.array[:, 0], X, 1.0)
+        normals = self.array[:, 1].copy()
+        _transform(normals, X, 0.0)
+        self.array[:, 1] = _unitized(normals)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -0,0 +1,142 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+
+from scipy.spatial.distance import cdist
+
+from compas.geometry.collections.primitivearray_numpy import PrimitiveArray
+from compas.geometry.collections.primitivearray_numpy import _transform
+
+
+__all__ = ['PointArray']
+
+
+def _xyz(other):
+    return other.array if isinstance(other, PrimitiveArray) else asarray(other, dtype=float)
+
+
+class PointArray(PrimitiveArray):
+    """A collection of points stored in a single array of shape ``(N, 3)``.
+
+    Parameters
+    ----------
+    points : array-like
+        The points.
+
+    Examples
+    --------
+    >>> from compas.geometry import Translation
+    >>> points = PointArray([[0, 0, 0], [1, 0, 0], [0, 2, 0]])
+    >>> points.transform(Translation.from_vector([0, 0, 1]))
+    >>> points[1].tolist()
+    [1.0, 0.0, 1.0]
+    >>> (points - points[0]).lengths().tolist()
+    [0.0, 1.0, 2.0]
+
+    """
+
+    __slots__ = []
+
+    SHAPE = (3, )
+
+    def __add__(self, vectors):
+        return PointArray(self.array + _xyz(vectors))
+
+    def __sub__(self, other):
+        from compas.geometry.collections.vectorarray_numpy import VectorArray
+        if isinstance(other, PointArray) or not isinstance(other, PrimitiveArray):
+            return VectorArray(self.array - _xyz(other))
+        return PointArray(self.array - _xyz(other))
+
+    def __iadd__(self, vectors):
+        self.array += _xyz(vectors)
+        return self
+
+    def __isub__(self, vectors):
+        self.array -= _xyz(vectors)
+        return self
+
+    def to_points(self):
+        """Convert the collection to a list of points.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Point`
+        """
+        from compas.geometry import Point
+        return [Point(*xyz) for xyz in self.array.tolist()]
+
+    def centroid(self):
+        """Compute the centroid of the points.
+
+        Returns
+        -------
+        array
+            The XYZ coordinates of the centroid.
+        """
+        return self.array.mean(axis=0)
+
+    def distances(self, other):
+        """Compute the distances to other points, element by element.
+
+        Parameters
+        ----------
+        other : array-like or :class:`PointArray`
+            One point, or one point per element.
+
+        Returns
+        -------
+        array
+            The distances, with shape ``(N, )``.
+        """
+        return ((self.array - _xyz(other)) ** 2).sum(axis=1) ** 0.5
+
+    def distance_matrix(self, other=None):
+        """Compute the distances between all pairs of points of this and another collection.
+
+        Parameters
+        ----------
+        other : array-like or :class:`PointArray`, optional
+            The other points, with shape ``(M, 3)``.
+            Default is this collection.
+
+        Returns
+        -------
+        array
+            The distances, with shape ``(N, M)``.
+        """
+        return cdist(self.array, self.array if other is None else _xyz(other))
+
+    def transform(self, X):
+        _transform(self.array, X, 1.0)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import timeit
+
+    setup = """
+from math import radians
+from compas.geometry import Rotation
+from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import PointCollection
+from compas.geometry import Pointcloud
+R = Rotation.from_axis_and_angle([0, 0, 1], radians(30))
+cloud = Pointcloud.from_bounds(10, 3, 2, 10000).points
+collection = PointCollection([Point(*xyz) for xyz in cloud])
+array = PointArray(cloud)
+"""
+
+    number = 10
+
+    result = min(timeit.repeat('collection.transform(R)', setup=setup, repeat=5, number=number))
+    print('PointCollection: {:.6f} s'.format(result / number))
+    result = min(timeit.repeat('array.transform(R)', setup=setup, repeat=5, number=number))
+    print('PointArray: {:.6f} s'.format(result / number))
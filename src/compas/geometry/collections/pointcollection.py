@@ -2,6 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from compas.geometry import transform_points
 from compas.geometry.collections import Collection
 
 __all__ = ['PointCollection']
@@ -30,8 +31,9 @@ class PointCollection(Collection):
         return PointCollection([point.copy() for point in self._items])
 
     def transform(self, X):
-        for item in self._items:
-            item.transform(X)
+        # one matrix multiplication for all points
+        for item, xyz in zip(self._items, transform_points(self._items, X)):
+            item.x, item.y, item.z = xyz
 
     def transformed(self, X):
         collection = self.copy()
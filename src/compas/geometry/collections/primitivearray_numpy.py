@@ -0,0 +1,203 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import array
+from numpy import asarray
+from numpy import integer
+from numpy import zeros
+
+from compas.geometry.transformations.transformation_numpy import _transform_coordinates
+
+
+__all__ = ['PrimitiveArray']
+
+
+def _matrices(X):
+    # a (4, 4) matrix, or a (N, 4, 4) stack for one transformation per element
+    if hasattr(X, 'matrices'):
+        return X.matrices
+    return asarray(getattr(X, 'matrix', X), dtype=float)
+
+
+def _transform(xyz, X, w):
+    """Transform an array of coordinates in place.
+
+    Parameters
+    ----------
+    xyz : array
+        The coordinates, with shape ``(N, ..., 3)``.
+    X : :class:`compas.geometry.Transformation` or :class:`compas.geometry.TransformationArray`
+        One transformation for all coordinates, or one per element along the first axis.
+    w : float
+        The homogeneous coordinate: ``1.0`` for points, ``0.0`` for vectors.
+    """
+    M = _matrices(X)
+    if M.ndim == 2:
+        xyz[...] = _transform_coordinates(xyz, M, w)
+    else:
+        xyz[...] = _transform_coordinates(xyz.reshape((xyz.shape[0], -1, 3)), M, w).reshape(xyz.shape)
+
+
+class PrimitiveArray(object):
+    """Base class for collections of primitives stored in a single contiguous array.
+
+    Parameters
+    ----------
+    items : array-like
+        The primitives, as COMPAS objects or as nested lists of coordinates,
+        or an array with the shape of :attr:`array`.
+
+    Attributes
+    ----------
+    array : array
+        The coordinates of all primitives.
+        The first axis is the axis of the elements.
+
+    Notes
+    -----
+    The coordinates are copied into :attr:`array`, also if the items are an array.
+    Elements are returned as views on rows of :attr:`array`, without creating COMPAS objects,
+    and changes to an element view change the collection.
+    Slices are collections of the same type that share the array of the original collection.
+    Indexing with a list of indices or a boolean mask also returns a collection of the same type,
+    but, as with NumPy arrays, it is a copy, and changes to it do not change the original collection.
+    """
+
+    __slots__ = ['array']
+
+    # the shape of the coordinates of one element
+    SHAPE = (3, )
+
+    def __init__(self, items):
+        # the coordinates are copied, such that normalizing the elements does not change the input
+        coordinates = array(items, dtype=float)
+        if coordinates.size == 0:
+            coordinates = coordinates.reshape((0, ) + self.SHAPE)
+        if coordinates.shape[1:] != self.SHAPE:
+            raise ValueError('Expected an array of shape {}, not {}.'.format(('N', ) + self.SHAPE, coordinates.shape))
+        self.array = coordinates
+
+    @classmethod
+    def _view(cls, array):
+        collection = cls.__new__(cls)
+        collection.array = array
+        return collection
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, key):
+        # integers and slices give views, index lists and masks give copies
+        if isinstance(key, (int, integer)):
+            return self.array[key]
+        return self._view(self.array[key])
+
+    def __setitem__(self, key, value):
+        self.array[key] = asarray(value, dtype=float)
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, len(self))
+
+    @property
+    def data(self):
+        """dict : The data dictionary that represents the collection, with the coordinates as an array."""
+        return {'array': self.array}
+
+    @data.setter
+    def data(self, data):
+        self.array = asarray(data['array'], dtype=float)
+
+    @classmethod
+    def from_data(cls, data):
+        """Construct a collection from its data representation.
+
+        Parameters
+        ----------
+        data : dict
+            The data dictionary.
+
+        Returns
+        -------
+        :class:`PrimitiveArray`
+        """
+        return cls(data['array'])
+
+    def to_data(self):
+        """Returns the data dictionary that represents the collection.
+
+        Returns
+        -------
+        dict
+        """
+        return self.data
+
+    def copy(self):
+        """Returns a copy of the collection, with a copy of the array.
+
+        Returns
+        -------
+        :class:`PrimitiveArray`
+        """
+        return self._view(self.array.copy())
+
+    def _points(self):
+        # the coordinates of all points of the elements, used for bounding boxes
+        return self.array.reshape((-1, 3))
+
+    def bounding_box(self):
+        """Compute the axis-aligned bounding box of the collection.
+
+        Returns
+        -------
+        array
+            The eight corners of the box, with shape ``(8, 3)``,
+            in the same order as :func:`compas.geometry.bounding_box`.
+        """
+        points = self._points()
+        lo = points.min(axis=0)
+        hi = points.max(axis=0)
+        box = zeros((8, 3))
+        box[:, 0] = [lo[0], hi[0], hi[0], lo[0], lo[0], hi[0], hi[0], lo[0]]
+        box[:, 1] = [lo[1], lo[1], hi[1], hi[1], lo[1], lo[1], hi[1], hi[1]]
+        box[:4, 2] = lo[2]
+        box[4:, 2] = hi[2]
+        return box
+
+    def transform(self, X):
+        """Transform all elements of the collection.
+
+        Parameters
+        ----------
+        X : :class:`compas.geometry.Transformation` or :class:`compas.geometry.TransformationArray`
+            One transformation for all elements, or a stack with one transformation per element.
+
+        Returns
+        -------
+        None
+        """
+        raise NotImplementedError
+
+    def transformed(self, X):
+        """Returns a transformed copy of the collection.
+
+        Parameters
+        ----------
+        X : :class:`compas.geometry.Transformation` or :class:`compas.geometry.TransformationArray`
+            One transformation for all elements, or a stack with one transformation per element.
+
+        Returns
+        -------
+        :class:`PrimitiveArray`
+        """
+        collection = self.copy()
+        collection.transform(X)
+        return collection
+
+
+def _unitized(vectors):
+    lengths = (vectors ** 2).sum(axis=-1) ** 0.5
+    return vectors / (lengths + (lengths == 0))[..., None]
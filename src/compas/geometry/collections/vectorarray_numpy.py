@@ -0,0 +1,171 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arccos
+from numpy import asarray
+from numpy import clip
+from numpy import cross
+
+from compas.geometry.collections.primitivearray_numpy import PrimitiveArray
+from compas.geometry.collections.primitivearray_numpy import _transform
+from compas.geometry.collections.primitivearray_numpy import _unitized
+
+
+__all__ = ['VectorArray']
+
+
+def _xyz(other):
+    return other.array if isinstance(other, PrimitiveArray) else asarray(other, dtype=float)
+
+
+def _factors(factors):
+    # scalars, or one factor per element
+    factors = asarray(factors, dtype=float)
+    return factors[:, None] if factors.ndim == 1 else factors
+
+
+class VectorArray(PrimitiveArray):
+    """A collection of vectors stored in a single array of shape ``(N, 3)``.
+
+    Parameters
+    ----------
+    vectors : array-like
+        The vectors.
+
+    Examples
+    --------
+    >>> vectors = VectorArray([[1, 0, 0], [0, 2, 0]])
+    >>> vectors.lengths().tolist()
+    [1.0, 2.0]
+    >>> vectors.cross([0, 0, 1])[0].tolist()
+    [0.0, -1.0, 0.0]
+
+    """
+
+    __slots__ = []
+
+    SHAPE = (3, )
+
+    def __add__(self, other):
+        return VectorArray(self.array + _xyz(other))
+
+    def __sub__(self, other):
+        return VectorArray(self.array - _xyz(other))
+
+    def __mul__(self, factors):
+        return VectorArray(self.array * _factors(factors))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, factors):
+        return VectorArray(self.array / _factors(factors))
+
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return VectorArray(-self.array)
+
+    def __iadd__(self, other):
+        self.array += _xyz(other)
+        return self
+
+    def __isub__(self, other):
+        self.array -= _xyz(other)
+        return self
+
+    def __imul__(self, factors):
+        self.array *= _factors(factors)
+        return self
+
+    def to_vectors(self):
+        """Convert the collection to a list of vectors.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Vector`
+        """
+        from compas.geometry import Vector
+        return [Vector(*xyz) for xyz in self.array.tolist()]
+
+    def lengths(self):
+        """Compute the lengths of the vectors.
+
+        Returns
+        -------
+        array
+            The lengths, with shape ``(N, )``.
+        """
+        return (self.array ** 2).sum(axis=1) ** 0.5
+
+    def unitize(self):
+        """Scale all vectors to unit length, except zero vectors."""
+        self.array[...] = _unitized(self.array)
+
+    def unitized(self):
+        """Returns a collection of unit vectors.
+
+        Returns
+        -------
+        :class:`VectorArray`
+        """
+        return VectorArray(_unitized(self.array))
+
+    def dot(self, other):
+        """Compute the dot products with other vectors, element by element.
+
+        Parameters
+        ----------
+        other : array-like or :class:`VectorArray`
+            One vector, or one vector per element.
+
+        Returns
+        -------
+        array
+            The dot products, with shape ``(N, )``.
+        """
+        return (self.array * _xyz(other)).sum(axis=1)
+
+    def cross(self, other):
+        """Compute the cross products with other vectors, element by element.
+
+        Parameters
+        ----------
+        other : array-like or :class:`VectorArray`
+            One vector, or one vector per element.
+
+        Returns
+        -------
+        :class:`VectorArray`
+        """
+        return VectorArray(cross(self.array, _xyz(other)))
+
+    def angles(self, other):
+        """Compute the smallest angles with other vectors, element by element.
+
+        Parameters
+        ----------
+        other : array-like or :class:`VectorArray`
+            One vector, or one vector per element.
+
+        Returns
+        -------
+        array
+            The angles in radians, with shape ``(N, )``.
+        """
+        a = _unitized(self.array)
+        b = _unitized(_xyz(other))
+        return arccos(clip((a * b).sum(axis=-1), -1.0, 1.0))
+
+    def transform(self, X):
+        _transform(self.array, X, 0.0)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -2,12 +2,17 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 
 from .hull import *  # noqa: F401 F403
 
 if not compas.IPY:
-    from .hull_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.hull_numpy': [
+            'convex_hull_numpy',
+            'convex_hull_xy_numpy',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
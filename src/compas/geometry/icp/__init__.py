@@ -2,10 +2,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 
 if not compas.IPY:
-    from .icp_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.icp_numpy': [
+            'icp_numpy',
+            'ICP',
+        ],
+    })
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
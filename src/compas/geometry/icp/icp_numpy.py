@@ -2,22 +2,24 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import time
+
 import numpy as np
 from numpy import asarray
-from numpy import argmin
 from numpy.linalg import det
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 from scipy.linalg import svd
-from scipy.linalg import norm
 
 from compas.numerical import pca_numpy
-from compas.numerical import normrow
 from compas.geometry import Transformation
 from compas.geometry import Frame
-from compas.geometry import transform_points_numpy
+from compas.geometry.pointclouds.pointcloud_numpy import _query
+from compas.geometry.pointclouds.pointcloud_numpy import _voxel_keys
+from compas.geometry.pointclouds.pointcloud_numpy import estimate_normals_numpy
+from compas.geometry.transformations.transformation_numpy import _transform_coordinates
 
 
-__all__ = ['icp_numpy']
+__all__ = ['icp_numpy', 'ICP']
 
 
 def bestfit_transform(A, B):
@@ -44,6 +46,241 @@ def bestfit_transform(A, B):
     return X
 
 
+def bestfit_transform_plane(A, B, N):
+    """Rigid transformation that minimises the distances of points to the tangent planes of their correspondences.
+
+    Parameters
+    ----------
+    A : array
+        The source points, with shape ``(n, 3)``.
+    B : array
+        The target points, with shape ``(n, 3)``.
+    N : array
+        The unit normals at the target points, with shape ``(n, 3)``.
+
+    Returns
+    -------
+    array
+        A 4x4 transformation matrix.
+
+    Notes
+    -----
+    The rotation is linearised for small angles, which is accurate close to convergence.
+    The rotation of the result is exact, and is constructed from the solution of the linearised problem.
+    """
+    # residual r = (a x n) . w + n . t + (a - b) . n
+    J = np.hstack((np.cross(A, N), N))
+    r = ((A - B) * N).sum(axis=1)
+    H = J.T.dot(J)
+    g = J.T.dot(r)
+    # a tiny regularisation keeps the system solvable for degenerate (e.g. planar) configurations
+    H[np.diag_indices(6)] += 1e-12 * max(np.trace(H), 1.0)
+    x = -np.linalg.solve(H, g)
+    w, t = x[:3], x[3:]
+    angle = np.linalg.norm(w)
+    X = np.identity(4)
+    if angle > 0:
+        k = w / angle
+        K = np.array([[0, -k[2], k[1]], [k[2], 0, -k[0]], [-k[1], k[0], 0]])
+        X[:3, :3] = np.identity(3) + np.sin(angle) * K + (1 - np.cos(angle)) * K.dot(K)
+    X[:3, 3] = t
+    return X
+
+
+class ICP(object):
+    """Engine for the registration of point clouds with the Iterative Closest Point (ICP) method.
+
+    The engine is constructed for one target cloud,
+    and can register any number of source clouds with it.
+    The spatial index of the target, and the target normals, are computed only once.
+
+    Parameters
+    ----------
+    target : array-like
+        The target points, with shape ``(n, 3)``.
+    normals : array-like, optional
+        Unit normals at the target points, for the point-to-plane error.
+        If not provided, they are estimated from the ``k`` nearest neighbours of every point,
+        the first time they are needed.
+    k : int, optional
+        The number of neighbours for normal estimation.
+        Default is ``10``.
+    leafsize : int, optional
+        The leaf size of the KD-tree of the target.
+        Default is ``16``.
+
+    Attributes
+    ----------
+    target : array
+        The target points.
+    tree : :class:`scipy.spatial.cKDTree`
+        The KD-tree of the target points.
+    normals : array
+        The unit normals at the target points.
+
+    Examples
+    --------
+    >>> from compas.geometry import Rotation, Translation
+    >>> target = np.random.RandomState(0).uniform(0, 1, (5000, 3)) * [4, 2, 1]
+    >>> X = Translation.from_vector([0.1, -0.05, 0.02]) * Rotation.from_axis_and_angle([0, 0, 1], 0.05)
+    >>> source = _transform_coordinates(target, np.array(X.inverse().matrix), 1.0)
+    >>> icp = ICP(target)
+    >>> T, info = icp.register(source, tol=1e-10)
+    >>> T == X
+    True
+
+    """
+
+    def __init__(self, target, normals=None, k=10, leafsize=16):
+        self.target = asarray(target, dtype=float)
+        self.tree = cKDTree(self.target, leafsize=leafsize)
+        self.k = k
+        self._normals = None if normals is None else asarray(normals, dtype=float)
+
+    @property
+    def normals(self):
+        if self._normals is None:
+            self._normals = estimate_normals_numpy(self.target, self.k, tree=self.tree)
+        return self._normals
+
+    def sample(self, points, sample=None, voxel_size=None, seed=None):
+        """Select a subset of points.
+
+        Parameters
+        ----------
+        points : array
+            The points, with shape ``(n, 3)``.
+        sample : int or float, optional
+            The number of points to select at random, or the fraction of points if smaller than 1.
+        voxel_size : float, optional
+            Select one point per cell of a voxel grid with this cell size.
+            Voxel sampling is applied before random sampling.
+        seed : int, optional
+            The seed of the random sampling.
+
+        Returns
+        -------
+        array
+            The indices of the selected points.
+        """
+        index = np.arange(len(points))
+        if voxel_size:
+            index = np.sort(_voxel_keys(points, voxel_size)[0])
+        if sample:
+            n = int(round(sample * len(index))) if sample < 1 else int(sample)
+            if n < len(index):
+                index = np.sort(np.random.RandomState(seed).choice(index, n, replace=False))
+        return index
+
+    def register(self, source, initial=None, method='point_to_point', sample=None, voxel_size=None,
+                 max_distance=None, trim=None, tol=1e-6, maxiter=50, schedule=None, seed=None):
+        """Compute the rigid transformation that aligns a source cloud with the target.
+
+        Parameters
+        ----------
+        source : array-like
+            The source points, with shape ``(m, 3)``.
+        initial : :class:`compas.geometry.Transformation` or array-like, optional
+            An initial estimate of the transformation.
+            Default is the identity transformation.
+        method : {'point_to_point', 'point_to_plane'}, optional
+            The error that is minimised.
+            Default is ``'point_to_point'``.
+        sample : int or float, optional
+            Register a random subset of source points, of this size, or of this fraction of the points if smaller than 1.
+        voxel_size : float, optional
+            Register one source point per cell of a voxel grid with this cell size.
+        max_distance : float, optional
+            Reject correspondences that are further apart.
+        trim : float, optional
+            Only use this fraction of the closest correspondences in every iteration,
+            for example ``0.9`` to reject the worst 10% as outliers.
+        tol : float, optional
+            Stop if the root mean square error changes less than this value between iterations.
+            Default is ``1e-6``.
+        maxiter : int, optional
+            The maximum number of iterations (per stage of the schedule).
+            Default is ``50``.
+        schedule : list of dict, optional
+            A coarse-to-fine schedule.
+            Every stage is a dict with values for any of the parameters
+            ``method``, ``sample``, ``voxel_size``, ``max_distance``, ``trim``, ``tol``, and ``maxiter``,
+            that replace the values of the arguments for that stage.
+            Every stage starts from the result of the previous one.
+        seed : int, optional
+            The seed of the random sampling.
+
+        Returns
+        -------
+        tuple
+            * :class:`compas.geometry.Transformation` : The transformation of the source onto the target.
+            * dict : Information about the iterations, with the keys
+
+              * ``'iterations'``: the total number of iterations,
+              * ``'residuals'``: the root mean square error of every iteration,
+              * ``'times'``: the duration of every iteration, in seconds,
+              * ``'stages'``: the stage of the schedule of every iteration,
+              * ``'correspondences'``: the number of correspondences of every iteration,
+              * ``'converged'``: whether the last stage met the tolerance,
+              * ``'time'``: the total duration, in seconds.
+
+        """
+        t0 = time.time()
+        source = asarray(source, dtype=float)
+        X = np.identity(4) if initial is None else np.array(getattr(initial, 'matrix', initial), dtype=float)
+        defaults = dict(method=method, sample=sample, voxel_size=voxel_size, max_distance=max_distance, trim=trim, tol=tol, maxiter=maxiter)
+        info = {'iterations': 0, 'residuals': [], 'times': [], 'stages': [], 'correspondences': [], 'converged': False}
+
+        for stage, options in enumerate(schedule or [{}]):
+            unknown = set(options) - set(defaults)
+            if unknown:
+                raise ValueError('Unknown schedule parameters: {}'.format(', '.join(sorted(unknown))))
+            params = dict(defaults)
+            params.update(options)
+            if params['method'] not in ('point_to_point', 'point_to_plane'):
+                raise ValueError('Unknown method: {}'.format(params['method']))
+            A = source[self.sample(source, params['sample'], params['voxel_size'], seed)]
+            X, converged = self._register(A, X, params, stage, info)
+            info['converged'] = converged
+
+        info['time'] = time.time() - t0
+        return Transformation(X.tolist()), info
+
+    def _register(self, A, X, params, stage, info):
+        normals = self.normals if params['method'] == 'point_to_plane' else None
+        bound = params['max_distance'] or np.inf
+        previous = None
+        for _ in range(params['maxiter']):
+            t0 = time.time()
+            P = _transform_coordinates(A, X, 1.0)
+            distances, closest = _query(self.tree, P, distance_upper_bound=bound)
+            found = np.isfinite(distances)
+            if params['trim'] and params['trim'] < 1:
+                n = max(int(params['trim'] * found.sum()), 3)
+                if n < found.sum():
+                    threshold = np.partition(distances[found], n - 1)[n - 1]
+                    found &= distances <= threshold
+            if found.sum() < 3:
+                raise ValueError('Not enough correspondences. Increase max_distance or improve the initial estimate.')
+            P = P[found]
+            closest = closest[found]
+            if normals is None:
+                dX = bestfit_transform(P, self.target[closest])
+            else:
+                dX = bestfit_transform_plane(P, self.target[closest], normals[closest])
+            X = dX.dot(X)
+            rmse = np.sqrt((distances[found] ** 2).mean())
+            info['iterations'] += 1
+            info['residuals'].append(rmse)
+            info['times'].append(time.time() - t0)
+            info['stages'].append(stage)
+            info['correspondences'].append(int(found.sum()))
+            if previous is not None and abs(previous - rmse) < params['tol']:
+                return X, True
+            previous = rmse
+        return X, False
+
+
 def icp_numpy(source, target, tol=1e-3):
     """Align two point clouds using the Iterative Closest Point (ICP) method.
 
@@ -59,8 +296,9 @@ def icp_numpy(source, target, tol=1e-3):
 
     Returns
     -------
-
-        The transformed points
+    tuple
+        * array : The transformed points.
+        * :class:`compas.geometry.Transformation` : The transformation of the source points.
 
     Notes
     -----
@@ -78,13 +316,16 @@ def icp_numpy(source, target, tol=1e-3):
 
     The algorithm terminates when the alignment error is below a specified tolerance.
 
+    For repeated registrations with the same target, or for large clouds,
+    use :class:`ICP` directly.
+
     Examples
     --------
     >>>
 
     """
-    A = asarray(source)
-    B = asarray(target)
+    A = asarray(source, dtype=float)
+    B = asarray(target, dtype=float)
 
     origin, axes, _ = pca_numpy(A)
     A_frame = Frame(origin, axes[0], axes[1])
@@ -92,18 +333,17 @@ def icp_numpy(source, target, tol=1e-3):
     origin, axes, _ = pca_numpy(B)
     B_frame = Frame(origin, axes[0], axes[1])
 
-    X = Transformation.from_frame_to_frame(A_frame, B_frame)
-    A = transform_points_numpy(A, X)
+    X = np.array(Transformation.from_frame_to_frame(A_frame, B_frame).matrix)
 
+    icp = ICP(B)
     for i in range(20):
-        D = cdist(A, B, 'euclidean')
-        closest = argmin(D, axis=1)
-        if norm(normrow(A - B[closest])) < tol:
+        C = _transform_coordinates(A, X, 1.0)
+        distances, closest = _query(icp.tree, C)
+        if np.linalg.norm(distances) < tol:
             break
-        X = bestfit_transform(A, B[closest])
-        A = transform_points_numpy(A, X)
+        X = bestfit_transform(C, B[closest]).dot(X)
 
-    return A, X
+    return _transform_coordinates(A, X, 1.0), Transformation(X.tolist())
 
 
 # ==============================================================================
@@ -114,3 +354,26 @@ if __name__ == "__main__":
 
     import doctest
     doctest.testmod(globs=globals())
+
+    from compas.geometry import Rotation
+    from compas.geometry import Translation
+
+    # a scan of a wavy surface, with noise
+    rs = np.random.RandomState(1)
+    xy = rs.uniform(0, 1, (2000000, 2)) * [10, 5]
+    target = np.column_stack([xy, 0.5 * np.sin(1.3 * xy[:, 0]) * np.cos(1.7 * xy[:, 1]) + 0.1 * xy[:, 0]])
+    X = Translation.from_vector([0.2, -0.1, 0.05]) * Rotation.from_axis_and_angle([1, 1, 1], 0.03)
+    source = _transform_coordinates(target, np.array(X.inverse().matrix), 1.0) + rs.normal(0, 0.002, target.shape)
+
+    t0 = time.time()
+    icp = ICP(target)
+    print('tree: {:.2f} s'.format(time.time() - t0))
+
+    schedules = {
+        'point_to_point': [{'voxel_size': 0.2}, {'voxel_size': 0.05, 'trim': 0.9}, {'sample': 200000, 'trim': 0.9, 'maxiter': 10}],
+        'point_to_plane': [{'voxel_size': 0.2}, {'voxel_size': 0.05, 'maxiter': 10}],
+    }
+    for method, schedule in schedules.items():
+        T, info = icp.register(source, method=method, schedule=schedule, seed=0)
+        print('{}: iterations: {}, time: {:.2f} s, rmse: {:.5f}, error: {:.2e}'.format(
+            method, info['iterations'], info['time'], info['residuals'][-1], np.abs(np.array(T.matrix) - np.array(X.matrix)).max()))
@@ -2,6 +2,19 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas._lazy
+
 from .pointcloud import *  # noqa: F401 F403
 
+if not compas.IPY:
+    compas._lazy.lazy_import(globals(), {
+        '.pointcloud_numpy': [
+            'voxel_downsample_numpy',
+            'statistical_outliers_numpy',
+            'estimate_normals_numpy',
+            'radius_graph_numpy',
+        ],
+    })
+
+
 __all__ = [name for name in dir() if not name.startswith('_')]
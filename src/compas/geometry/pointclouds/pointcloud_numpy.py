@@ -0,0 +1,272 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import numpy as np
+from numpy import asarray
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+
+
+__all__ = [
+    'voxel_downsample_numpy',
+    'statistical_outliers_numpy',
+    'estimate_normals_numpy',
+    'radius_graph_numpy',
+]
+
+
+CHUNKSIZE = 200000
+
+
+def _query(tree, points, k=1, distance_upper_bound=np.inf):
+    # ``workers`` replaced ``n_jobs`` in scipy 1.6
+    try:
+        return tree.query(points, k=k, distance_upper_bound=distance_upper_bound, workers=-1)
+    except TypeError:
+        return tree.query(points, k=k, distance_upper_bound=distance_upper_bound, n_jobs=-1)
+
+
+def _voxel_keys(points, size):
+    """One integer per cell of a voxel grid, and the inverse index of the points into the occupied cells."""
+    keys = np.floor((points - points.min(axis=0)) / size).astype(np.int64)
+    shape = keys.max(axis=0) + 1
+    if np.prod(shape.astype(float)) < 2 ** 62:
+        # one integer per cell is much faster to sort than rows of cell indices
+        keys = keys[:, 0] + shape[0] * (keys[:, 1] + shape[1] * keys[:, 2])
+        return np.unique(keys, return_index=True, return_inverse=True)[1:]
+    return np.unique(keys, axis=0, return_index=True, return_inverse=True)[1:]
+
+
+def _tree(points, tree):
+    return tree if tree is not None else cKDTree(points)
+
+
+def voxel_downsample_numpy(points, size, reduce='centroid'):
+    """Downsample a point cloud to one point per cell of a voxel grid.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, with shape ``(n, 3)``.
+    size : float
+        The size of the cells of the grid.
+    reduce : {'centroid', 'first'}, optional
+        Represent the points of a cell by their centroid, or by the first of them.
+        Default is ``'centroid'``.
+
+    Returns
+    -------
+    array
+        The downsampled points, with shape ``(m, 3)``, ordered by cell.
+
+    Examples
+    --------
+    >>> points = [[0.1, 0.1, 0.1], [0.3, 0.3, 0.3], [1.5, 0.5, 0.5]]
+    >>> voxel_downsample_numpy(points, 1.0).tolist()
+    [[0.2, 0.2, 0.2], [1.5, 0.5, 0.5]]
+
+    """
+    points = asarray(points, dtype=float)
+    first, inverse = _voxel_keys(points, size)
+    if reduce == 'first':
+        return points[first]
+    if reduce != 'centroid':
+        raise ValueError('Unknown reduction: {}'.format(reduce))
+    inverse = inverse.reshape(-1)
+    counts = np.bincount(inverse, minlength=len(first)).astype(float)
+    result = np.empty((len(first), 3))
+    for axis in range(3):
+        result[:, axis] = np.bincount(inverse, weights=points[:, axis], minlength=len(first)) / counts
+    return result
+
+
+def statistical_outliers_numpy(points, k=20, std_ratio=2.0, tree=None, chunksize=CHUNKSIZE):
+    """Identify outliers by the average distance to their nearest neighbours.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, with shape ``(n, 3)``.
+    k : int, optional
+        The number of neighbours.
+        Default is ``20``.
+    std_ratio : float, optional
+        Points of which the average distance to their neighbours exceeds the mean of these averages
+        by more than this number of standard deviations are outliers.
+        Default is ``2.0``.
+    tree : :class:`scipy.spatial.cKDTree`, optional
+        A KD-tree of the points, if it is already available.
+    chunksize : int, optional
+        The number of points of which the neighbours are computed at once,
+        which bounds the memory use to about ``chunksize * k`` neighbours.
+
+    Returns
+    -------
+    array of bool
+        ``True`` for the outliers.
+
+    Examples
+    --------
+    >>> points = [[x, y, 0.0] for x in range(10) for y in range(10)] + [[4.5, 4.5, 10.0]]
+    >>> statistical_outliers_numpy(points, k=4).nonzero()[0].tolist()
+    [100]
+
+    """
+    points = asarray(points, dtype=float)
+    tree = _tree(points, tree)
+    averages = np.empty(len(points))
+    for start in range(0, len(points), chunksize):
+        # the nearest neighbour of every point is the point itself
+        distances, _ = _query(tree, points[start:start + chunksize], k=k + 1)
+        averages[start:start + chunksize] = distances[:, 1:].mean(axis=1)
+    return averages > averages.mean() + std_ratio * averages.std()
+
+
+def estimate_normals_numpy(points, k=10, viewpoint=None, tree=None, chunksize=CHUNKSIZE):
+    """Estimate normals from a principal component analysis of the nearest neighbours of every point.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, with shape ``(n, 3)``.
+    k : int, optional
+        The number of neighbours, including the point itself.
+        Default is ``10``.
+    viewpoint : array-like, optional
+        Orient the normals towards this point, for example the location of the scanner.
+        By default, the normals point in the positive Z direction, if possible.
+    tree : :class:`scipy.spatial.cKDTree`, optional
+        A KD-tree of the points, if it is already available.
+    chunksize : int, optional
+        The number of points of which the normals are computed at once,
+        which bounds the memory use to about ``chunksize * k`` neighbours.
+
+    Returns
+    -------
+    array
+        The unit normals, with shape ``(n, 3)``.
+
+    Notes
+    -----
+    The normal of a point is the direction of least variance of its neighbourhood,
+    i.e. the last principal direction that :func:`compas.numerical.pca_numpy` would compute for the neighbours.
+    The covariance matrices and their eigenvectors are computed for all points of a chunk at once.
+
+    Examples
+    --------
+    >>> points = [[x, y, 0.0] for x in range(5) for y in range(5)]
+    >>> normals = estimate_normals_numpy(points, k=5)
+    >>> normals[12].round(3).tolist()
+    [0.0, 0.0, 1.0]
+
+    """
+    points = asarray(points, dtype=float)
+    tree = _tree(points, tree)
+    normals = np.empty(points.shape)
+    for start in range(0, len(points), chunksize):
+        chunk = points[start:start + chunksize]
+        _, nbrs = _query(tree, chunk, k=k)
+        P = points[nbrs]
+        P -= P.mean(axis=1)[:, None]
+        C = np.einsum('nki,nkj->nij', P, P)
+        # the eigenvalues are in ascending order
+        _, vectors = np.linalg.eigh(C)
+        N = vectors[:, :, 0]
+        if viewpoint is None:
+            flip = N[:, 2] < 0
+        else:
+            flip = (N * (asarray(viewpoint, dtype=float) - chunk)).sum(axis=1) < 0
+        N[flip] *= -1
+        normals[start:start + chunksize] = N + 0.0
+    return normals
+
+
+def radius_graph_numpy(points, radius, tree=None, chunksize=CHUNKSIZE):
+    """Construct the graph that connects all pairs of points within a given distance.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, with shape ``(n, 3)``.
+    radius : float
+        The maximum distance between connected points.
+    tree : :class:`scipy.spatial.cKDTree`, optional
+        A KD-tree of the points, if it is already available.
+    chunksize : int, optional
+        The number of points of which the neighbours are computed at once.
+
+    Returns
+    -------
+    :class:`scipy.sparse.csr_matrix`
+        The symmetric adjacency matrix of the graph, with shape ``(n, n)``,
+        with the distances between connected points as entries.
+        The neighbours of point ``i`` are ``graph.indices[graph.indptr[i]:graph.indptr[i + 1]]``.
+        Coincident points are connected by explicit zero entries.
+
+    Examples
+    --------
+    >>> graph = radius_graph_numpy([[0, 0, 0], [1, 0, 0], [3, 0, 0]], 1.5)
+    >>> graph.nnz
+    2
+    >>> graph[0, 1]
+    1.0
+
+    """
+    points = asarray(points, dtype=float)
+    tree = _tree(points, tree)
+    rows = []
+    cols = []
+    data = []
+    for start in range(0, len(points), chunksize):
+        chunk = cKDTree(points[start:start + chunksize])
+        pairs = chunk.sparse_distance_matrix(tree, radius, output_type='ndarray')
+        i = pairs['i'] + start
+        j = pairs['j']
+        keep = i != j
+        rows.append(i[keep])
+        cols.append(j[keep])
+        data.append(pairs['v'][keep])
+    if not rows:
+        return csr_matrix((len(points), len(points)))
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    data = np.concatenate(data)
+    return csr_matrix((data, (rows, cols)), shape=(len(points), len(points)))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    import time
+
+    doctest.testmod(globs=globals())
+
+    rs = np.random.RandomState(0)
+    n = 5000000
+    xy = rs.uniform(0, 1, (n, 2)) * [100, 50]
+    points = np.column_stack([xy, np.sin(0.1 * xy[:, 0]) * np.cos(0.2 * xy[:, 1])])
+
+    t0 = time.time()
+    tree = cKDTree(points)
+    print('tree: {:.2f} s'.format(time.time() - t0))
+
+    t0 = time.time()
+    downsampled = voxel_downsample_numpy(points, 0.5)
+    print('voxel downsampling: {:.2f} s, {} points'.format(time.time() - t0, len(downsampled)))
+
+    t0 = time.time()
+    outliers = statistical_outliers_numpy(points, tree=tree)
+    print('outliers: {:.2f} s, {} outliers'.format(time.time() - t0, outliers.sum()))
+
+    t0 = time.time()
+    normals = estimate_normals_numpy(points, tree=tree)
+    print('normals: {:.2f} s'.format(time.time() - t0))
+
+    t0 = time.time()
+    graph = radius_graph_numpy(points, 0.05, tree=tree)
+    print('radius graph: {:.2f} s, {} edges'.format(time.time() - t0, graph.nnz // 2))
@@ -16,5 +16,7 @@ from .circle import Circle  # noqa: F401
 from .ellipse import Ellipse  # noqa: F401
 from .curve import Bezier  # noqa: F401
 
+from .lazy import LazyGeometry  # noqa: F401
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -105,10 +105,35 @@ class Primitive(Base):
         primitive.transform(transformation)
         return primitive
 
+    def lazy(self):
+        """Returns a lazy view of this primitive, for chains of transformations.
+
+        Returns
+        -------
+        :class:`compas.geometry.LazyGeometry`
+            A view that composes all transformations into one,
+            and applies it to a copy of this primitive only when the result is accessed.
+
+        Examples
+        --------
+        >>> from compas.geometry import Frame, Rotation
+        >>> R = Rotation.from_axis_and_angle([0.0, 0.0, 1.0], 0.1)
+        >>> frame = Frame.worldXY().lazy()
+        >>> for i in range(10):
+        ...     frame.transform(R)
+        ...
+        >>> round(frame.xaxis.angle([1.0, 0.0, 0.0]), 3)
+        1.0
+        """
+        from compas.geometry.primitives.lazy import LazyGeometry
+        return LazyGeometry(self)
+
 
 # ==============================================================================
 # Main
 # ==============================================================================
 
 if __name__ == '__main__':
-    pass
+
+    import doctest
+    doctest.testmod(globs=globals())
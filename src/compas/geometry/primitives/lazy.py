@@ -0,0 +1,168 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.geometry import identity_matrix
+from compas.geometry import multiply_matrices
+
+
+__all__ = ['LazyGeometry']
+
+
+def _matrix(T):
+    return [list(row) for row in getattr(T, 'matrix', T)]
+
+
+class LazyGeometry(object):
+    """Geometry with a pending transformation that is only applied when the geometry is accessed.
+
+    Transformations of a lazy geometry are composed into a single matrix,
+    and transformed copies share the same source geometry.
+    Chains of transformations are therefore applied to the coordinates of the geometry
+    only once, when an attribute of the transformed geometry is read.
+
+    Parameters
+    ----------
+    source : :class:`compas.geometry.Primitive` or :class:`compas.geometry.Collection`
+        The geometry.
+        Any object with a ``transformed`` method can be used.
+    transformation : :class:`compas.geometry.Transformation` or list of list, optional
+        The pending transformation.
+        Default is the identity transformation.
+
+    Attributes
+    ----------
+    source : object
+        The untransformed geometry.
+        The source is never modified, but it is shared by all transformed copies of the lazy geometry.
+    matrix : list of list
+        The composed pending transformation matrix.
+    geometry : object
+        The transformed geometry.
+        It is computed on first access and cached until the lazy geometry is transformed again.
+
+    Notes
+    -----
+    Attributes that are not defined by the lazy geometry itself are read from the transformed geometry,
+    such that a lazy geometry can be used in place of the geometry in most read-only contexts.
+    To modify the geometry, modify :attr:`geometry`, or use :meth:`evaluate` for a separate copy.
+
+    Examples
+    --------
+    >>> from compas.geometry import Point, Translation
+    >>> T = Translation.from_vector([1.0, 0.0, 0.0])
+    >>> point = Point(0.0, 0.0, 0.0).lazy()
+    >>> for i in range(10):
+    ...     point = point.transformed(T)
+    ...
+    >>> point.x
+    10.0
+
+    """
+
+    __slots__ = ['source', 'matrix', '_geometry']
+
+    def __init__(self, source, transformation=None):
+        self.source = source
+        self.matrix = identity_matrix(4) if transformation is None else _matrix(transformation)
+        self._geometry = None
+
+    @property
+    def transformation(self):
+        """:class:`compas.geometry.Transformation` : The composed pending transformation."""
+        from compas.geometry import Transformation
+        return Transformation(_matrix(self.matrix))
+
+    @property
+    def geometry(self):
+        if self._geometry is None:
+            self._geometry = self.source.transformed(self.transformation)
+        return self._geometry
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.geometry, name)
+
+    def __getitem__(self, key):
+        return self.geometry[key]
+
+    def __iter__(self):
+        return iter(self.geometry)
+
+    def __len__(self):
+        return len(self.geometry)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyGeometry):
+            other = other.geometry
+        return self.geometry == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'LazyGeometry({!r})'.format(self.geometry)
+
+    def lazy(self):
+        """Returns the lazy geometry itself."""
+        return self
+
+    def transform(self, transformation):
+        """Compose a transformation with the pending transformation.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation` or list of list
+            The transformation.
+
+        Returns
+        -------
+        None
+        """
+        self.matrix = multiply_matrices(_matrix(transformation), self.matrix)
+        self._geometry = None
+
+    def transformed(self, transformation):
+        """Returns a lazy copy with a transformation composed with the pending transformation.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation` or list of list
+            The transformation.
+
+        Returns
+        -------
+        :class:`LazyGeometry`
+            A lazy geometry with the same source.
+        """
+        return LazyGeometry(self.source, multiply_matrices(_matrix(transformation), self.matrix))
+
+    def copy(self):
+        """Returns a lazy copy with the same source and pending transformation.
+
+        Returns
+        -------
+        :class:`LazyGeometry`
+        """
+        return LazyGeometry(self.source, self.matrix)
+
+    def evaluate(self):
+        """Apply the pending transformation to a copy of the source.
+
+        Returns
+        -------
+        object
+            A new transformed geometry, independent of the lazy geometry.
+        """
+        return self.source.transformed(self.transformation)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -124,7 +124,7 @@ class Point(Primitive):
     @property
     def data(self):
         """dict : The data representing the point."""
-        return list(self)
+        return [self._x, self._y, self._z]
 
     @data.setter
     def data(self, data):
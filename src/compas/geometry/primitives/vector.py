@@ -83,7 +83,7 @@ class Vector(Primitive):
     @property
     def data(self):
         """dict : The data dictionary that represents the vector."""
-        return list(self)
+        return [self._x, self._y, self._z]
 
     @data.setter
     def data(self, data):
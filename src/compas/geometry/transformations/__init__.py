@@ -2,7 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas  # noqa: F402
+import compas._lazy
 
 from .matrices import *  # noqa: F401 F403
 
@@ -14,7 +14,23 @@ from .rotation import Rotation  # noqa: F401 F402
 from .reflection import Reflection  # noqa: F401 F402
 from .projection import Projection  # noqa: F401 F402
 from .transformations import *  # noqa: F401 F403
+
 if not compas.IPY:
-    from .transformations_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.transformations_numpy': [
+            'transform_points_numpy',
+            'transform_vectors_numpy',
+            'homogenize_numpy',
+            'dehomogenize_numpy',
+            'homogenize_and_flatten_frames_numpy',
+            'dehomogenize_and_unflatten_frames_numpy',
+            'world_to_local_coordinates_numpy',
+            'local_to_world_coordinates_numpy',
+        ],
+        '.transformation_numpy': [
+            'TransformationArray',
+        ],
+    })
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -65,6 +65,9 @@ class Transformation(object):
         self.matrix = matrix
 
     def __mul__(self, other):
+        if hasattr(other, 'matrices'):
+            # stacks of transformations compose with single transformations themselves
+            return NotImplemented
         return self.concatenated(other)
 
     def __imul__(self, other):
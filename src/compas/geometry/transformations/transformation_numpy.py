@@ -0,0 +1,634 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import arcsin
+from numpy import arctan2
+from numpy import asarray
+from numpy import cos
+from numpy import cross
+from numpy import einsum
+from numpy import eye
+from numpy import matmul
+from numpy import ones
+from numpy import pi
+from numpy import sin
+from numpy import tile
+from numpy import where
+from numpy import zeros
+from numpy.linalg import det
+from numpy.linalg import inv
+from numpy.linalg import norm
+
+from compas.geometry.transformations import Transformation
+
+
+__all__ = ['TransformationArray']
+
+
+_EPS = 1e-16
+
+
+def _transform_coordinates(xyz, M, w):
+    """Apply homogeneous transformation matrices to coordinates.
+
+    Parameters
+    ----------
+    xyz : array
+        The coordinates.
+        For a single matrix, an array of any shape ``(..., 3)``.
+        For a stack of matrices, an array with shape ``(P, 3)`` to transform the same coordinates with all matrices,
+        or with shape ``(N, P, 3)`` for a different set of coordinates per matrix.
+    M : array
+        A matrix with shape ``(4, 4)``, or a stack of matrices with shape ``(N, 4, 4)``.
+    w : float
+        The homogeneous coordinate: ``1.0`` for points, ``0.0`` for vectors.
+
+    Returns
+    -------
+    array
+        The transformed coordinates,
+        with the shape of ``xyz`` for a single matrix, and with shape ``(N, P, 3)`` for a stack.
+
+    Notes
+    -----
+    The perspective division is skipped if none of the matrices has a projective component.
+    """
+    if M.ndim == 2:
+        result = xyz.dot(M[:3, :3].T)
+        if w:
+            result += M[:3, 3]
+            if M[3, :3].any() or M[3, 3] != 1:
+                result /= (xyz.dot(M[3, :3]) + M[3, 3])[..., None]
+        return result
+    # the same coordinates for all matrices, or one set per matrix
+    pj = 'pj' if xyz.ndim == 2 else 'npj'
+    result = einsum('nij,{}->npi'.format(pj), M[:, :3, :3], xyz)
+    if w:
+        result += M[:, None, :3, 3]
+        if M[:, 3, :3].any() or (M[:, 3, 3] != 1).any():
+            result /= (einsum('nj,{}->np'.format(pj), M[:, 3, :3], xyz) + M[:, 3, 3, None])[:, :, None]
+    return result
+
+
+def _matrices(transformations):
+    # a stack of 4x4 matrices from transformations, matrices, or a single one of both
+    if isinstance(transformations, TransformationArray):
+        return transformations.matrices
+    if isinstance(transformations, Transformation):
+        return asarray(transformations.matrix, dtype=float).reshape((1, 4, 4))
+    M = [T.matrix if isinstance(T, Transformation) else T for T in transformations]
+    return asarray(M, dtype=float).reshape((-1, 4, 4))
+
+
+class TransformationArray(object):
+    """A stack of 4x4 transformation matrices, stored in one contiguous NumPy array.
+
+    The array supports the same operations as :class:`compas.geometry.Transformation`,
+    but for all transformations of the stack at once:
+    concatenation, inversion, decomposition, and application to points, vectors and frames.
+
+    Parameters
+    ----------
+    matrices : array-like, optional
+        The transformation matrices, with shape ``(N, 4, 4)``,
+        or a list of :class:`compas.geometry.Transformation`.
+        Default is a single identity transformation.
+
+    Attributes
+    ----------
+    matrices : array
+        The transformation matrices, with shape ``(N, 4, 4)``, in row-major order,
+        i.e. with the translation components in the last column.
+
+    Notes
+    -----
+    Products of stacks are computed element-wise, and a stack of one transformation,
+    or a single :class:`compas.geometry.Transformation`, is broadcast to all elements of the other stack.
+    As with :class:`compas.geometry.Transformation`, ``A * B`` means that ``B`` is applied first.
+
+    Examples
+    --------
+    >>> from compas.geometry import Frame
+    >>> from compas.geometry import Rotation
+    >>> frames = [Frame([i, 0, 0], [1, 0, 0], [0, 1, 0]) for i in range(3)]
+    >>> X = TransformationArray.from_frames(frames)
+    >>> R = Rotation.from_axis_and_angle([0, 0, 1], pi / 2)
+    >>> Y = R * X
+    >>> Y.transform_points([[0, 0, 0]]).round(3).tolist()
+    [[[0.0, 0.0, 0.0]], [[0.0, 1.0, 0.0]], [[0.0, 2.0, 0.0]]]
+    >>> (Y.inverse() * Y).allclose(TransformationArray.identity(3))
+    True
+
+    """
+
+    def __init__(self, matrices=None):
+        if matrices is None:
+            matrices = eye(4).reshape((1, 4, 4))
+        self.matrices = _matrices(matrices)
+
+    # ==========================================================================
+    # constructors
+    # ==========================================================================
+
+    @classmethod
+    def identity(cls, n):
+        """Construct a stack of identity transformations.
+
+        Parameters
+        ----------
+        n : int
+            The number of transformations.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return cls(tile(eye(4), (n, 1, 1)))
+
+    @classmethod
+    def from_transformations(cls, transformations):
+        """Construct a stack from a list of transformations.
+
+        Parameters
+        ----------
+        transformations : list of :class:`compas.geometry.Transformation`
+            The transformations.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return cls(transformations)
+
+    @classmethod
+    def from_translations(cls, vectors):
+        """Construct a stack of translations.
+
+        Parameters
+        ----------
+        vectors : array-like
+            The translation vectors, with shape ``(N, 3)``.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        vectors = asarray(vectors, dtype=float).reshape((-1, 3))
+        M = tile(eye(4), (len(vectors), 1, 1))
+        M[:, :3, 3] = vectors
+        return cls(M)
+
+    @classmethod
+    def from_axis_and_angles(cls, axes, angles, points=None):
+        """Construct a stack of rotations about axes through points.
+
+        Parameters
+        ----------
+        axes : array-like
+            The rotation axes, with shape ``(N, 3)`` or ``(3, )``.
+        angles : array-like
+            The rotation angles in radians, with shape ``(N, )``.
+        points : array-like, optional
+            The points on the rotation axes, with shape ``(N, 3)`` or ``(3, )``.
+            Default is the origin.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+
+        Notes
+        -----
+        The rotations are the same as those of :meth:`compas.geometry.Rotation.from_axis_and_angle`.
+        """
+        angles = asarray(angles, dtype=float).reshape(-1)
+        axes = asarray(axes, dtype=float).reshape((-1, 3))
+        lengths = norm(axes, axis=1)
+        axes = axes / where(lengths > 0, lengths, 1.0)[:, None]
+        axes = axes * ones((len(angles), 1))
+        c = cos(angles)[:, None, None]
+        s = sin(angles)[:, None, None]
+        K = zeros((len(angles), 3, 3))
+        K[:, 0, 1] = -axes[:, 2]
+        K[:, 0, 2] = axes[:, 1]
+        K[:, 1, 0] = axes[:, 2]
+        K[:, 1, 2] = -axes[:, 0]
+        K[:, 2, 0] = -axes[:, 1]
+        K[:, 2, 1] = axes[:, 0]
+        R = c * eye(3) + s * K + (1 - c) * einsum('ni,nj->nij', axes, axes)
+        M = tile(eye(4), (len(angles), 1, 1))
+        M[:, :3, :3] = R
+        if points is not None:
+            points = asarray(points, dtype=float).reshape((-1, 3)) * ones((len(angles), 1))
+            M[:, :3, 3] = points - einsum('nij,nj->ni', R, points)
+        return cls(M)
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Construct a stack of transformations from world XY to frames.
+
+        Parameters
+        ----------
+        frames : list of :class:`compas.geometry.Frame`
+            The frames.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+
+        Notes
+        -----
+        Every transformation is the same as :meth:`compas.geometry.Transformation.from_frame`.
+        """
+        points = asarray([frame.point for frame in frames], dtype=float).reshape((-1, 3))
+        xaxes = asarray([frame.xaxis for frame in frames], dtype=float).reshape((-1, 3))
+        yaxes = asarray([frame.yaxis for frame in frames], dtype=float).reshape((-1, 3))
+        return cls._from_basis(points, xaxes, yaxes)
+
+    @classmethod
+    def _from_basis(cls, points, xaxes, yaxes):
+        xaxes = xaxes / norm(xaxes, axis=1)[:, None]
+        yaxes = yaxes / norm(yaxes, axis=1)[:, None]
+        zaxes = cross(xaxes, yaxes)
+        zaxes /= norm(zaxes, axis=1)[:, None]
+        yaxes = cross(zaxes, xaxes)
+        M = tile(eye(4), (len(points), 1, 1))
+        M[:, :3, 0] = xaxes
+        M[:, :3, 1] = yaxes
+        M[:, :3, 2] = zaxes
+        M[:, :3, 3] = points
+        return cls(M)
+
+    @classmethod
+    def from_frame_to_frame(cls, frames_from, frames_to):
+        """Construct a stack of transformations between pairs of frames.
+
+        Parameters
+        ----------
+        frames_from : list of :class:`compas.geometry.Frame`
+            The frames defining the original coordinate systems.
+        frames_to : list of :class:`compas.geometry.Frame`
+            The frames defining the targeted coordinate systems.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return cls.from_frames(frames_to) * cls.from_frames(frames_from).inverse()
+
+    # ==========================================================================
+    # descriptors
+    # ==========================================================================
+
+    @property
+    def data(self):
+        """dict : The data dictionary that represents the stack, with the matrices as an array."""
+        return {'matrices': self.matrices}
+
+    @data.setter
+    def data(self, data):
+        self.matrices = _matrices(data['matrices'])
+
+    @classmethod
+    def from_data(cls, data):
+        """Construct a stack from its data representation.
+
+        Parameters
+        ----------
+        data : dict
+            The data dictionary.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return cls(data['matrices'])
+
+    def to_data(self):
+        """Returns the data dictionary that represents the stack.
+
+        Returns
+        -------
+        dict
+        """
+        return self.data
+
+    @property
+    def translation_vectors(self):
+        """array : The translation components, with shape ``(N, 3)``."""
+        return self.matrices[:, :3, 3].copy()
+
+    @property
+    def determinants(self):
+        """array : The determinants of the matrices, with shape ``(N, )``."""
+        return det(self.matrices)
+
+    # ==========================================================================
+    # customization
+    # ==========================================================================
+
+    def __len__(self):
+        return len(self.matrices)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return TransformationArray(self.matrices[key])
+        return Transformation(self.matrices[key].tolist())
+
+    def __setitem__(self, key, value):
+        self.matrices[key] = _matrices(value) if isinstance(key, slice) else asarray(getattr(value, 'matrix', value))
+
+    def __iter__(self):
+        for M in self.matrices:
+            yield Transformation(M.tolist())
+
+    def __mul__(self, other):
+        return self.concatenated(other)
+
+    def __rmul__(self, other):
+        return TransformationArray(matmul(_matrices(other), self.matrices))
+
+    def __repr__(self):
+        return 'TransformationArray({})'.format(len(self))
+
+    # ==========================================================================
+    # conversions
+    # ==========================================================================
+
+    def to_transformations(self):
+        """Convert the stack to a list of transformations.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Transformation`
+        """
+        return list(self)
+
+    def to_frames(self):
+        """Convert the stack to the frames to which they transform world XY.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Frame`
+        """
+        from compas.geometry import Frame
+        return [Frame(M[:3, 3].tolist(), M[:3, 0].tolist(), M[:3, 1].tolist()) for M in self.matrices]
+
+    def copy(self):
+        """Returns a copy of the stack.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return TransformationArray(self.matrices.copy())
+
+    def allclose(self, other, tol=1e-05):
+        """Verify that all matrices are equal to those of another stack, up to a tolerance.
+
+        Parameters
+        ----------
+        other : :class:`TransformationArray` or :class:`compas.geometry.Transformation`
+            The other transformations.
+        tol : float, optional
+            The absolute tolerance, as in ``Transformation.__eq__``.
+
+        Returns
+        -------
+        bool
+        """
+        return bool((abs(self.matrices - _matrices(other)) <= tol).all())
+
+    # ==========================================================================
+    # methods
+    # ==========================================================================
+
+    def concatenate(self, other):
+        """Concatenate other transformations to the transformations of this stack.
+
+        Parameters
+        ----------
+        other : :class:`TransformationArray` or :class:`compas.geometry.Transformation`
+            The transformations to concatenate.
+
+        Returns
+        -------
+        None
+            The stack is changed in place.
+
+        Notes
+        -----
+        As with :meth:`compas.geometry.Transformation.concatenate`, ``other`` is applied first.
+        """
+        self.matrices = matmul(self.matrices, _matrices(other))
+
+    def concatenated(self, other):
+        """Concatenate other transformations to the transformations of this stack.
+
+        Parameters
+        ----------
+        other : :class:`TransformationArray` or :class:`compas.geometry.Transformation`
+            The transformations to concatenate.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return TransformationArray(matmul(self.matrices, _matrices(other)))
+
+    def invert(self):
+        """Invert the transformations of the stack in place."""
+        M = self.matrices
+        affine = (M[:, 3, :3] == 0).all() and (M[:, 3, 3] == 1).all()
+        if not affine:
+            self.matrices = inv(M)
+            return
+        # the inverse of an affine transformation only requires the inverse of its linear part
+        A = inv(M[:, :3, :3])
+        Minv = zeros(M.shape)
+        Minv[:, :3, :3] = A
+        Minv[:, :3, 3] = -einsum('nij,nj->ni', A, M[:, :3, 3])
+        Minv[:, 3, 3] = 1.0
+        self.matrices = Minv
+
+    def inverse(self):
+        """Returns the inverse transformations.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        T = self.copy()
+        T.invert()
+        return T
+
+    def transpose(self):
+        """Transpose the matrices of the stack in place."""
+        self.matrices = self.matrices.transpose((0, 2, 1)).copy()
+
+    def transposed(self):
+        """Returns the stack of transposed matrices.
+
+        Returns
+        -------
+        :class:`TransformationArray`
+        """
+        return TransformationArray(self.matrices.transpose((0, 2, 1)).copy())
+
+    def decomposed(self):
+        """Decompose the transformations into their scale, shear, rotation, translation and perspective components.
+
+        Returns
+        -------
+        tuple of array
+            * The scale factors in x-, y-, and z-direction, with shape ``(N, 3)``.
+            * The shear factors for the x-y, x-z, and y-z axes, with shape ``(N, 3)``.
+            * The Euler angles about the static x, y, z axes, with shape ``(N, 3)``.
+            * The translation vectors, with shape ``(N, 3)``.
+            * The perspective entries, with shape ``(N, 4)``.
+
+        Raises
+        ------
+        ValueError
+            If an element ``[3, 3]`` of a matrix is zero.
+
+        Notes
+        -----
+        The components are the same as those of :func:`compas.geometry.decompose_matrix`.
+        """
+        M = self.matrices
+        n = len(M)
+        Mt = M.transpose((0, 2, 1)).copy()
+        if (abs(Mt[:, 3, 3]) < _EPS).any():
+            raise ValueError('The element [3,3] of the matrix is zero.')
+        Mt /= Mt[:, 3:4, 3:4]
+
+        translation = M[:, :3, 3].copy()
+        scale = zeros((n, 3))
+        shear = zeros((n, 3))
+        row = Mt[:, :3, :3].copy()
+
+        def dot(a, b):
+            return einsum('ni,ni->n', a, b)
+
+        scale[:, 0] = norm(row[:, 0], axis=1)
+        row[:, 0] /= scale[:, 0, None]
+        shear[:, 0] = dot(row[:, 0], row[:, 1])
+        row[:, 1] -= row[:, 0] * shear[:, 0, None]
+        scale[:, 1] = norm(row[:, 1], axis=1)
+        row[:, 1] /= scale[:, 1, None]
+        shear[:, 0] /= scale[:, 1]
+        shear[:, 1] = dot(row[:, 0], row[:, 2])
+        row[:, 2] -= row[:, 0] * shear[:, 1, None]
+        shear[:, 2] = dot(row[:, 1], row[:, 2])
+        row[:, 2] -= row[:, 0] * shear[:, 2, None]
+        scale[:, 2] = norm(row[:, 2], axis=1)
+        row[:, 2] /= scale[:, 2, None]
+        shear[:, 1] /= scale[:, 2]
+        shear[:, 2] /= scale[:, 2]
+
+        flip = dot(row[:, 0], cross(row[:, 1], row[:, 2])) < 0
+        scale[flip] *= -1
+        row[flip] *= -1
+
+        angles = zeros((n, 3))
+        r02 = row[:, 0, 2]
+        regular = (r02 != -1.0) & (r02 != 1.0)
+        r = row[regular]
+        beta = arcsin(-r[:, 0, 2])
+        cb = cos(beta)
+        angles[regular, 0] = arctan2(r[:, 1, 2] / cb, r[:, 2, 2] / cb)
+        angles[regular, 1] = beta
+        angles[regular, 2] = arctan2(r[:, 0, 1] / cb, r[:, 0, 0] / cb)
+        down = r02 == -1.0
+        angles[down, 0] = arctan2(row[down, 1, 0], row[down, 2, 0])
+        angles[down, 1] = pi / 2
+        up = r02 == 1.0
+        angles[up, 0] = arctan2(-row[up, 1, 0], -row[up, 2, 0])
+        angles[up, 1] = -pi / 2
+
+        perspective = zeros((n, 4))
+        perspective[:, 3] = 1.0
+        projective = (abs(Mt[:, :3, 3]) > _EPS).all(axis=1)
+        if projective.any():
+            P = Mt[projective].copy()
+            P[:, :3, 3] = 0.0
+            P[:, 3, 3] = 1.0
+            Ptinv = inv(P.transpose((0, 2, 1)))
+            perspective[projective] = einsum('nij,nj->ni', Ptinv, Mt[projective, :, 3])
+
+        return scale, shear, angles, translation, perspective
+
+    def transform_points(self, points):
+        """Apply the transformations to points.
+
+        Parameters
+        ----------
+        points : array-like
+            The points, with shape ``(P, 3)``, or ``(N, P, 3)`` for a different set of points per transformation.
+
+        Returns
+        -------
+        array
+            The transformed points, with shape ``(N, P, 3)``.
+        """
+        return self._transform(points, 1.0)
+
+    def transform_vectors(self, vectors):
+        """Apply the transformations to vectors.
+
+        Parameters
+        ----------
+        vectors : array-like
+            The vectors, with shape ``(P, 3)``, or ``(N, P, 3)`` for a different set of vectors per transformation.
+
+        Returns
+        -------
+        array
+            The transformed vectors, with shape ``(N, P, 3)``.
+        """
+        return self._transform(vectors, 0.0)
+
+    def _transform(self, xyz, w):
+        return _transform_coordinates(asarray(xyz, dtype=float), self.matrices, w)
+
+    def transform_point_pairs(self, points):
+        """Apply every transformation to one point.
+
+        Parameters
+        ----------
+        points : array-like
+            The points, with shape ``(N, 3)``.
+
+        Returns
+        -------
+        array
+            The transformed points, with shape ``(N, 3)``.
+        """
+        points = asarray(points, dtype=float).reshape((-1, 1, 3))
+        return self._transform(points, 1.0)[:, 0]
+
+    def transform_frames(self, frames):
+        """Apply the transformations to frames.
+
+        Parameters
+        ----------
+        frames : list of :class:`compas.geometry.Frame`
+            The frames, one per transformation, or a single frame for all transformations.
+
+        Returns
+        -------
+        list of :class:`compas.geometry.Frame`
+        """
+        frames = TransformationArray.from_frames(frames)
+        return (self * frames).to_frames()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -2,13 +2,18 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 from compas.plugins import pluggable
 
 from .delaunay import *  # noqa: F401 F403
 
 if not compas.IPY:
-    from .delaunay_numpy import *  # noqa: F401 F403
+    compas._lazy.lazy_import(globals(), {
+        '.delaunay_numpy': [
+            'delaunay_from_points_numpy',
+            'voronoi_from_points_numpy',
+        ],
+    })
 
 
 @pluggable(category="triangulation")
@@ -16,10 +16,40 @@ Solvers
     dr
     dr_numpy
     fd_numpy
+    ForceDensitySolver
     ga
     moga
     pca_numpy
     topop_numpy
+    topop3d_numpy
+
+
+Genetic algorithms
+==================
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    evaluate_population
+    decode_binary_pop_numpy
+    code_decoded_numpy
+    scale_population_numpy
+    npoint_crossover_numpy
+    random_mutation_numpy
+    non_dom_sort_numpy
+
+
+Checkpoints
+===========
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    Checkpointer
+    read_checkpoint
+    write_checkpoint
 
 
 Linalg
@@ -98,6 +128,7 @@ if not compas.IPY:
     from .operators import *  # noqa: F401 F403
     from .utilities import *  # noqa: F401 F403
 
+from .checkpoint import *  # noqa: F401 F403
 from .topop import *  # noqa: F401 F403
 from .pca import *  # noqa: F401 F403
 from .ga import *  # noqa: F401 F403
@@ -0,0 +1,242 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import threading
+import zlib
+
+import compas._os
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+__all__ = [
+    'write_checkpoint',
+    'read_checkpoint',
+    'Checkpointer',
+]
+
+
+MAGIC = b'COMPASCK'
+VERSION = b'\x01'
+
+
+def _dumps(state):
+    return MAGIC + VERSION + zlib.compress(pickle.dumps(state, protocol=2), 1)
+
+
+def _write(path, data):
+    # write to a temporary file first
+    # so that a crash during writing never corrupts an existing checkpoint
+    temp = path + '.tmp'
+    with open(temp, 'wb') as fo:
+        fo.write(data)
+    compas._os.replace(temp, path)
+
+
+def write_checkpoint(path, state):
+    """Write the state of an optimisation run to a binary checkpoint file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the checkpoint file.
+    state : dict
+        The state of the optimisation.
+        The state may contain any picklable objects, including NumPy arrays.
+
+    Notes
+    -----
+    The checkpoint is a compressed pickle (protocol 2) preceded by a short header.
+    The checkpoint is written to a temporary file first, such that an interrupted write never
+    corrupts an existing checkpoint.
+    On Python 3, the existing checkpoint is then replaced atomically.
+    On Python 2 and IronPython, it is removed before the new one is renamed.
+
+    """
+    _write(path, _dumps(state))
+
+
+def read_checkpoint(path):
+    """Read the state of an optimisation run from a binary checkpoint file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the checkpoint file.
+
+    Returns
+    -------
+    dict
+        The state of the optimisation.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid checkpoint.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'run.ckpt')
+    >>> write_checkpoint(path, {'generation': 3, 'fit': [1.0, 2.0]})
+    >>> read_checkpoint(path)['generation']
+    3
+
+    """
+    with open(path, 'rb') as fo:
+        data = fo.read()
+    header = MAGIC + VERSION
+    if data[:len(header)] != header:
+        raise ValueError('Not a valid checkpoint file: {}'.format(path))
+    return pickle.loads(zlib.decompress(data[len(header):]))
+
+
+class Checkpointer(object):
+    """Periodic, optionally asynchronous, writer of optimisation checkpoints.
+
+    Parameters
+    ----------
+    path : str
+        Path to the checkpoint file.
+    interval : int, optional
+        Write a checkpoint every ``interval`` generations.
+        Default is ``1``.
+    asynchronous : bool, optional
+        If ``True``, the state is serialised immediately,
+        but compressed and written to disk in a background thread,
+        such that the optimisation can continue with the next generation.
+        Default is ``True``.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> checkpointer = Checkpointer(os.path.join(tempfile.mkdtemp(), 'run.ckpt'), interval=2)
+    >>> checkpointer.save(1, {'generation': 1})
+    False
+    >>> checkpointer.save(2, {'generation': 2})
+    True
+    >>> checkpointer.close()
+    >>> checkpointer.load()['generation']
+    2
+
+    """
+
+    def __init__(self, path, interval=1, asynchronous=True):
+        self.path = path
+        self.interval = max(1, int(interval or 1))
+        self.asynchronous = asynchronous
+        self._thread = None
+        self._error = None
+
+    def exists(self):
+        """Verify that a checkpoint file exists.
+
+        Returns
+        -------
+        bool
+
+        """
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Load the last written checkpoint.
+
+        Returns
+        -------
+        dict
+            The state of the optimisation.
+
+        """
+        self.wait()
+        return read_checkpoint(self.path)
+
+    def save(self, generation, state, force=False):
+        """Save the state of the optimisation, if a checkpoint is due for the given generation.
+
+        Parameters
+        ----------
+        generation : int
+            The current generation.
+        state : dict
+            The state of the optimisation.
+        force : bool, optional
+            Save the state even if no checkpoint is due.
+
+        Returns
+        -------
+        bool
+            ``True`` if the state was saved.
+
+        Raises
+        ------
+        Exception
+            If the previous asynchronous write failed.
+
+        """
+        if not force and generation % self.interval:
+            return False
+        # the state is pickled in the calling thread
+        # to take a snapshot before the optimisation modifies it
+        data = pickle.dumps(state, protocol=2)
+        self.wait()
+        if self.asynchronous:
+            self._thread = threading.Thread(target=self._write_background, args=(data, ))
+            self._thread.start()
+        else:
+            self._write(data)
+        return True
+
+    def _write(self, data):
+        _write(self.path, MAGIC + VERSION + zlib.compress(data, 1))
+
+    def _write_background(self, data):
+        # the error is raised in the calling thread by the next wait
+        try:
+            self._write(data)
+        except Exception as e:
+            self._error = e
+
+    def wait(self):
+        """Wait for a pending asynchronous write to finish.
+
+        Raises
+        ------
+        Exception
+            If the write failed, for example because the disk is full.
+
+        """
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Flush pending writes.
+
+        Raises
+        ------
+        Exception
+            If the last write failed.
+
+        """
+        self.wait()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+
+    doctest.testmod(globs=globals())
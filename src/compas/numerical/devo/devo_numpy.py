@@ -4,6 +4,7 @@ from __future__ import division
 from __future__ import print_function
 
 from numpy import array
+from numpy import asarray
 from numpy import argsort
 from numpy import argmin
 from numpy import delete
@@ -17,19 +18,23 @@ from numpy import reshape
 from numpy import tile
 from numpy import where
 from numpy import zeros
-from numpy.random import choice
-from numpy.random import rand
+from numpy.random import RandomState
+import numpy.random
 
 from scipy.optimize import fmin_l_bfgs_b
 
+from functools import partial
 from time import time
 
+from compas.numerical.checkpoint import Checkpointer
+
 
 __all__ = ['devo_numpy']
 
 
 def devo_numpy(fn, bounds, population, generations, limit=0, elites=0.2, F=0.8, CR=0.5, polish=False, args=(),
-               plot=False, frange=[], printout=10, neutrals=0.05, **kwargs):
+               plot=False, frange=[], printout=10, neutrals=0.05, checkpoint_path=None, checkpoint_interval=1, resume=False,
+               vectorized=False, evaluator='serial', num_workers=None, seed=None, **kwargs):
     """ Call the Differential Evolution solver.
 
     Parameters
@@ -62,6 +67,28 @@ def devo_numpy(fn, bounds, population, generations, limit=0, elites=0.2, F=0.8,
         Print progress to screen.
     neutrals : float
         Fraction of neutral starting agents.
+    checkpoint_path : str
+        Path to a binary checkpoint file containing the state of the evolution,
+        including the agents, their function values, and the state of the random number generator.
+        The checkpoint is written asynchronously, every ``checkpoint_interval`` generations.
+    checkpoint_interval : int
+        Number of generations between checkpoints.
+    resume : bool
+        Resume the evolution exactly from the state in the checkpoint file, if it exists.
+    vectorized : bool
+        If True, ``fn`` is called once per generation with the entire population,
+        as an array with one agent per column (shape ``(len(bounds), population)``),
+        and should return the function values of all agents.
+    evaluator : {'serial', 'threads', 'processes'}
+        Evaluate the agents one by one, or on a pool of ``num_workers`` threads or processes.
+        With ``'processes'``, ``fn`` and ``args`` must be picklable.
+        Ignored if ``vectorized`` is True.
+    num_workers : int
+        Number of workers of the thread or process pool.
+    seed : int
+        Seed of a dedicated random number generator.
+        If None, the global generator of :mod:`numpy.random` is used.
+        With the same seed, all evaluators produce identical results.
 
     Returns
     -------
@@ -85,132 +112,199 @@ def devo_numpy(fn, bounds, population, generations, limit=0, elites=0.2, F=0.8,
     >>> x0 = [1.3, 0.7, 0.8, 1.9, 1.2]
     >>> bounds = [[-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0]]
     >>> res = devo_numpy(f, bounds, 200, 1000, polish=False, plot=False, frange=[0, 100], neutrals=0)
+
+    The same optimisation, with the function evaluated for all agents at once.
+
+    >>> def f(U, *args):
+    ...     return (100.0 * (U[1:] - U[:-1] ** 2) ** 2 + (1 - U[:-1]) ** 2).sum(axis=0)
+    ...
+    >>> res = devo_numpy(f, bounds, 200, 1000, vectorized=True, neutrals=0)
     """
     if plot:
         from matplotlib import pyplot as plt
 
     tic = time()
 
-    # Heading
-    if printout:
-        print('\n' + '-' * 50)
-        print('Differential Evolution started')
-        print('-' * 50)
-
-    # Bounds
-    k = len(bounds)
-    bounds = array(bounds)
-    lb = tile(bounds[:, 0][:, newaxis], (1, population))
-    ub = tile(bounds[:, 1][:, newaxis], (1, population))
-
-    # Population
-    agents = (rand(k, population) * (ub - lb) + lb)
-    agents[:, :int(round(population * neutrals))] *= 0
-    candidates = tile(array(range(population)), (1, population))
-    candidates = reshape(delete(candidates, where(eye(population).ravel() == 1)), (population, population - 1))
-
-    # Initial
-    f = zeros(population)
-    for i in range(population):
-        f[i] = fn(agents[:, i], *args)
-    fopt = min(f)
-    ac = zeros((k, population))
-    bc = zeros((k, population))
-    cc = zeros((k, population))
-    ts = 0
-    switch = 1
-    if printout:
-        print('Generation: {0}  fopt: {1:.5g}'.format(ts, fopt))
-
-    # Set-up plot
-    if plot:
-        fmin, fmax = 0, max(fopt)
-        if len(frange) == 2:
-            fmin, fmax = frange
-        ydiv = 100
-        dc = 1. / population
-        data = ones((ydiv + 1, generations + 1, 3))
-        yticks = list(range(0, ydiv + 1, int(ydiv * 0.1)))
-        ylabels = ['{0:.1f}'.format(i * (fmax - fmin) * 0.1 + fmin) for i in range(11)]
-        aspect = generations / ydiv
-        plt.plot([generations * 0.5] * 2, [0, ydiv], ':k')
-        plt.yticks(yticks, ylabels, rotation='horizontal')
-        plt.ylabel('Value')
-        plt.xlabel('Generations')
-        plt.ion()
-
-    # Evolution
-    while ts < generations + 1:
-        # Elites
-        if (ts > generations * 0.5) and switch:
-            switch = 0
-            elite_agents = argsort(f)[:int(floor(elites * population))]
-            population = len(elite_agents)
+    rng = numpy.random if seed is None else RandomState(seed)
+
+    executor = None
+    if not vectorized and evaluator != 'serial':
+        if evaluator == 'threads':
+            from concurrent.futures import ThreadPoolExecutor as Executor
+        elif evaluator == 'processes':
+            from concurrent.futures import ProcessPoolExecutor as Executor
+        else:
+            raise ValueError('Unknown evaluator: {}'.format(evaluator))
+        executor = Executor(max_workers=num_workers)
+
+    def evaluate(agents):
+        if vectorized:
+            return asarray(fn(agents, *args), dtype=float).reshape(-1)
+        if executor:
+            return array(list(executor.map(partial(_evaluate_agent, fn, args), agents.T)), dtype=float)
+        return array([fn(agents[:, i], *args) for i in range(agents.shape[1])], dtype=float)
+
+    checkpointer = None
+    try:
+        evaluations = 0
+
+        # Heading
+        if printout:
+            print('\n' + '-' * 50)
+            print('Differential Evolution started')
+            print('-' * 50)
+
+        # Bounds
+        k = len(bounds)
+        bounds = array(bounds)
+
+        # Checkpoints
+        if checkpoint_path:
+            checkpointer = Checkpointer(checkpoint_path, checkpoint_interval)
+
+        if resume and checkpointer and checkpointer.exists():
+            state = checkpointer.load()
+            rng.set_state(state['random_state'])
+            ts = state['generation']
+            switch = state['switch']
+            agents = state['agents']
+            f = state['f']
+            fopt = state['fopt']
+            xopt = state['xopt']
+            lb = state['lb']
+            ub = state['ub']
+            candidates = state['candidates']
+            population = agents.shape[1]
+            if printout:
+                print('Resuming from generation: {0}  fopt: {1:.5g}'.format(ts, fopt))
+
+        else:
+            lb = tile(bounds[:, 0][:, newaxis], (1, population))
+            ub = tile(bounds[:, 1][:, newaxis], (1, population))
+
+            # Population
+            agents = (rng.rand(k, population) * (ub - lb) + lb)
+            agents[:, :int(round(population * neutrals))] *= 0
             candidates = tile(array(range(population)), (1, population))
             candidates = reshape(delete(candidates, where(eye(population).ravel() == 1)), (population, population - 1))
-            f = f[elite_agents]
-            ac = ac[:, elite_agents]
-            bc = bc[:, elite_agents]
-            cc = cc[:, elite_agents]
-            agents = agents[:, elite_agents]
-            lb = lb[:, elite_agents]
-            ub = ub[:, elite_agents]
-        # Update plot
+
+            # Initial
+            f = evaluate(agents)
+            evaluations += population
+            fopt = min(f)
+            xopt = agents[:, argmin(f)]
+            ts = 0
+            switch = 1
+            if printout:
+                print('Generation: {0}  fopt: {1:.5g}'.format(ts, fopt))
+
+        ac = zeros((k, population))
+        bc = zeros((k, population))
+        cc = zeros((k, population))
+        ts0 = ts
+
+        # Set-up plot
         if plot:
-            fsc = (f - fmin) / (fmax - fmin)
-            fsc[fsc > 1] = 1
-            fsc *= ydiv
-            fbin = floor(fsc).astype(int)
-            for i in fbin:
-                if data[i, ts, 0] == 1:
-                    data[i, ts, :] = 0.9 - dc
-                else:
-                    data[i, ts, :] -= dc
-            data[data < 0] = 0
-            data[min(fbin), ts, :] = [1, 0, 0]
-            data[max(fbin), ts, :] = [0, 0, 1]
-            if ts % printout == 0:
-                plt.imshow(data, origin='lower', aspect=aspect)
-                plt.plot([generations * 0.5] * 2, [0, ydiv], ':k')
-                plt.yticks(yticks, ylabels, rotation='horizontal')
-                plt.ylabel('Value')
-                plt.xlabel('Generations')
-                plt.pause(0.001)
-        # Pick candidates
-        for i in range(population):
-            inds = candidates[i, choice(population - 1, 3, replace=False)]
-            ac[:, i] = agents[:, inds[0]]
-            bc[:, i] = agents[:, inds[1]]
-            cc[:, i] = agents[:, inds[2]]
-        # Update agents
-        ind = rand(k, population) < CR
-        agents_ = ind * (ac + F * (bc - cc)) + ~ind * agents
-        log_lb = agents_ < lb
-        log_ub = agents_ > ub
-        agents_[log_lb] = lb[log_lb]
-        agents_[log_ub] = ub[log_ub]
-        # Update f values
-        f_ = zeros(population)
-        for i in range(population):
-            f_[i] = fn(agents_[:, i], *args)
-        log = where((f - f_) > 0)[0]
-        agents[:, log] = agents_[:, log]
-        f[log] = f_[log]
-        fopt = min(f)
-        xopt = agents[:, argmin(f)]
-        # Reset
-        ts += 1
-        ac *= 0
-        bc *= 0
-        cc *= 0
-        if printout and (ts % printout == 0):
-            print('Generation: {0}  fopt: {1:.5g}'.format(ts, fopt))
-        # Limit check
-        if fopt < limit:
-            break
+            fmin, fmax = 0, max(fopt)
+            if len(frange) == 2:
+                fmin, fmax = frange
+            ydiv = 100
+            dc = 1. / population
+            data = ones((ydiv + 1, generations + 1, 3))
+            yticks = list(range(0, ydiv + 1, int(ydiv * 0.1)))
+            ylabels = ['{0:.1f}'.format(i * (fmax - fmin) * 0.1 + fmin) for i in range(11)]
+            aspect = generations / ydiv
+            plt.plot([generations * 0.5] * 2, [0, ydiv], ':k')
+            plt.yticks(yticks, ylabels, rotation='horizontal')
+            plt.ylabel('Value')
+            plt.xlabel('Generations')
+            plt.ion()
+
+        # Evolution
+        while ts < generations + 1:
+            # Elites
+            if (ts > generations * 0.5) and switch:
+                switch = 0
+                elite_agents = argsort(f)[:int(floor(elites * population))]
+                population = len(elite_agents)
+                candidates = tile(array(range(population)), (1, population))
+                candidates = reshape(delete(candidates, where(eye(population).ravel() == 1)), (population, population - 1))
+                f = f[elite_agents]
+                ac = ac[:, elite_agents]
+                bc = bc[:, elite_agents]
+                cc = cc[:, elite_agents]
+                agents = agents[:, elite_agents]
+                lb = lb[:, elite_agents]
+                ub = ub[:, elite_agents]
+            # Update plot
+            if plot:
+                fsc = (f - fmin) / (fmax - fmin)
+                fsc[fsc > 1] = 1
+                fsc *= ydiv
+                fbin = floor(fsc).astype(int)
+                for i in fbin:
+                    if data[i, ts, 0] == 1:
+                        data[i, ts, :] = 0.9 - dc
+                    else:
+                        data[i, ts, :] -= dc
+                data[data < 0] = 0
+                data[min(fbin), ts, :] = [1, 0, 0]
+                data[max(fbin), ts, :] = [0, 0, 1]
+                if ts % printout == 0:
+                    plt.imshow(data, origin='lower', aspect=aspect)
+                    plt.plot([generations * 0.5] * 2, [0, ydiv], ':k')
+                    plt.yticks(yticks, ylabels, rotation='horizontal')
+                    plt.ylabel('Value')
+                    plt.xlabel('Generations')
+                    plt.pause(0.001)
+            # Pick candidates
+            for i in range(population):
+                inds = candidates[i, rng.choice(population - 1, 3, replace=False)]
+                ac[:, i] = agents[:, inds[0]]
+                bc[:, i] = agents[:, inds[1]]
+                cc[:, i] = agents[:, inds[2]]
+            # Update agents
+            ind = rng.rand(k, population) < CR
+            agents_ = ind * (ac + F * (bc - cc)) + ~ind * agents
+            log_lb = agents_ < lb
+            log_ub = agents_ > ub
+            agents_[log_lb] = lb[log_lb]
+            agents_[log_ub] = ub[log_ub]
+            # Update f values
+            f_ = evaluate(agents_)
+            evaluations += population
+            log = where((f - f_) > 0)[0]
+            agents[:, log] = agents_[:, log]
+            f[log] = f_[log]
+            fopt = min(f)
+            xopt = agents[:, argmin(f)]
+            # Reset
+            ts += 1
+            ac *= 0
+            bc *= 0
+            cc *= 0
+            if printout and (ts % printout == 0):
+                print('Generation: {0}  fopt: {1:.5g}'.format(ts, fopt))
+            # Checkpoint
+            if checkpointer:
+                checkpointer.save(ts, {'generation': ts, 'switch': switch, 'agents': agents, 'f': f, 'fopt': fopt, 'xopt': xopt,
+                                       'lb': lb, 'ub': ub, 'candidates': candidates, 'random_state': rng.get_state()})
+            # Limit check
+            if fopt < limit:
+                break
+    finally:
+        # release the workers and flush the checkpoints also if fn raises or the optimisation is interrupted
+        if checkpointer:
+            checkpointer.close()
+        if executor:
+            executor.shutdown()
+
+    toc = time() - tic
 
     # L-BFGS-B
     if polish:
+        if vectorized:
+            fn = partial(_evaluate_vectorized, fn)
         opt = fmin_l_bfgs_b(fn, xopt, args=args, approx_grad=1, bounds=bounds, iprint=1, pgtol=10**(-6), factr=10000,
                             maxfun=10**5, maxiter=10**5, maxls=200)
         xopt = opt[0]
@@ -220,6 +314,7 @@ def devo_numpy(fn, bounds, population, generations, limit=0, elites=0.2, F=0.8,
     if printout:
         print('\n' + '-' * 50)
         print('Differential Evolution finished : {0:.4g} s'.format(time() - tic))
+        print('Throughput : {0:.4g} generations/s, {1:.4g} evaluations/s'.format((ts - ts0) / toc, evaluations / toc))
         print('fopt: {0:.5g}'.format(fopt))
         print('-' * 50)
 
@@ -231,6 +326,14 @@ def devo_numpy(fn, bounds, population, generations, limit=0, elites=0.2, F=0.8,
     return fopt, list(xopt)
 
 
+def _evaluate_agent(fn, args, agent):
+    return fn(agent, *args)
+
+
+def _evaluate_vectorized(fn, x, *args):
+    return fn(x[:, newaxis], *args)[0]
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -242,21 +345,19 @@ if __name__ == "__main__":
     def f(u, *args):
         return rosen(u.ravel())
 
-    x0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+    def f_vectorized(U, *args):
+        return rosen(U)
+
     bounds = [[-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0]]
 
-    res = devo_numpy(f, bounds, 200, 1000, polish=False, plot=False, frange=[0, 100], neutrals=0)
-    print(res)
+    # compare the throughput of the different modes
+    # with the same seed, all modes produce the same result
 
-    # def fn(u, *args):
-    #     # Booth's function, fopt=0, uopt=(1, 3)
-    #     x = u[0]
-    #     y = u[1]
-    #     z = (x + 2 * y - 7)**2 + (2 * x + y - 5)**2
-    #     return z
+    res = devo_numpy(f, bounds, 200, 1000, polish=False, neutrals=0, printout=1000, seed=0)
+    print(res)
 
-    # bounds = [(-10, 10), (-15, 15)]
-    # res = devo_numpy(fn=fn, bounds=bounds, population=100, generations=100,
-    #                  polish=False, plot=True, frange=[0, 100], neutrals=0)
+    res = devo_numpy(f, bounds, 200, 1000, polish=False, neutrals=0, printout=1000, seed=0, evaluator='threads')
+    print(res)
 
-    # print(res)
+    res = devo_numpy(f_vectorized, bounds, 200, 1000, polish=False, neutrals=0, printout=1000, seed=0, vectorized=True)
+    print(res)
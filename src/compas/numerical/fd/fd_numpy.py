@@ -2,15 +2,22 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from numpy import array
 from numpy import asarray
+from numpy import bincount
+from numpy import lexsort
+from numpy import zeros
+from scipy.sparse import coo_matrix
+from scipy.sparse import csc_matrix
 from scipy.sparse import diags
+from scipy.sparse.linalg import factorized
 from scipy.sparse.linalg import spsolve
 
 from compas.numerical import connectivity_matrix
 from compas.numerical import normrow
 
 
-__all__ = ['fd_numpy']
+__all__ = ['fd_numpy', 'ForceDensitySolver']
 
 
 def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
@@ -79,6 +86,209 @@ def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
     return xyz, q, f, l, r
 
 
+class ForceDensitySolver(object):
+    """Reusable force density solver for many solves on the same topology.
+
+    The connectivity matrices of the network and the sparsity pattern of the
+    linear system are computed once, at construction.
+    Every subsequent solve only fills in the numerical values of the system matrix,
+    which is a single sparse matrix-vector product with the force densities,
+    factorizes it, and solves for all three coordinate directions with the same factorization.
+
+    Parameters
+    ----------
+    vertices : list
+        XYZ coordinates of the vertices of the network.
+        The coordinates of the fixed vertices are used as boundary conditions of every solve.
+    edges : list
+        Pairs of vertex indices defining the edges of the network.
+    fixed : list
+        Indices of fixed vertices.
+
+    Attributes
+    ----------
+    free : list
+        Indices of the free vertices.
+    C : sparse matrix
+        The connectivity matrix of the network.
+
+    Examples
+    --------
+    >>> vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 0]]
+    >>> edges = [[0, 4], [1, 4], [2, 4], [3, 4]]
+    >>> solver = ForceDensitySolver(vertices, edges, [0, 1, 2, 3])
+    >>> xyz, q, f, l, r = solver.solve([1.0, 1.0, 1.0, 1.0], [[0, 0, 0]] * 4 + [[0, 0, -1]])
+    >>> round(xyz[4, 2], 3)
+    -0.25
+
+    """
+
+    def __init__(self, vertices, edges, fixed):
+        self.xyz = asarray(vertices, dtype=float).reshape((-1, 3))
+        self.fixed = list(fixed)
+        self.free = list(set(range(self.xyz.shape[0])) - set(self.fixed))
+        self.C = connectivity_matrix(edges, 'csr')
+        self.Ci = self.C[:, self.free]
+        self.Cf = self.C[:, self.fixed]
+        self.Ct = self.C.transpose().tocsr()
+        self.Cit = self.Ci.transpose().tocsr()
+        self.CfXf = self.Cf.dot(self.xyz[self.fixed])
+        self._compile_pattern()
+
+    @property
+    def number_of_edges(self):
+        return self.C.shape[0]
+
+    def _compile_pattern(self):
+        # A = Ci.T * Q * Ci
+        # every edge e contributes Ci[e, a] * Ci[e, b] * q[e] to A[a, b]
+        # the (fixed) positions of these contributions in the CSC data array of A
+        # are compiled into a sparse matrix S, such that A.data = S * q
+        Ci = self.Ci.tocsr()
+        rows, cols, edges, coefs = [], [], [], []
+        for e in range(Ci.shape[0]):
+            start, end = Ci.indptr[e], Ci.indptr[e + 1]
+            indices = Ci.indices[start:end]
+            values = Ci.data[start:end]
+            for a, va in zip(indices, values):
+                for b, vb in zip(indices, values):
+                    rows.append(a)
+                    cols.append(b)
+                    edges.append(e)
+                    coefs.append(va * vb)
+        n = len(self.free)
+        rows = array(rows, dtype=int)
+        cols = array(cols, dtype=int)
+        order = lexsort((rows, cols))
+        rows = rows[order]
+        cols = cols[order]
+        edges = array(edges, dtype=int)[order]
+        coefs = array(coefs, dtype=float)[order]
+        # unique (row, col) pairs in column-major order
+        key = cols * max(n, 1) + rows
+        unique = zeros(len(key), dtype=bool)
+        unique[:1] = True
+        unique[1:] = key[1:] != key[:-1]
+        position = unique.cumsum() - 1
+        nnz = int(unique.sum())
+        self._indices = rows[unique]
+        self._indptr = zeros(n + 1, dtype=int)
+        self._indptr[1:] = bincount(cols[unique], minlength=n).cumsum()
+        self._S = coo_matrix((coefs, (position, edges)), shape=(nnz, self.number_of_edges)).tocsr()
+
+    def system_matrix(self, q):
+        """Assemble the system matrix of the free vertices for the given force densities.
+
+        Parameters
+        ----------
+        q : list
+            Force density of edges.
+
+        Returns
+        -------
+        sparse matrix
+            The matrix ``Ci.T * Q * Ci`` in CSC format.
+
+        """
+        q = asarray(q, dtype=float).reshape(-1)
+        n = len(self.free)
+        return csc_matrix((self._S.dot(q), self._indices, self._indptr), shape=(n, n))
+
+    def solve(self, q, loads=None):
+        """Compute the equilibrium geometry for one set of force densities and loads.
+
+        Parameters
+        ----------
+        q : list
+            Force density of edges.
+        loads : list, optional
+            XYZ components of the loads on the vertices.
+            Default is ``None``, in which case no loads are applied.
+
+        Returns
+        -------
+        tuple
+            The same results as :func:`fd_numpy`: ``xyz``, ``q``, ``f``, ``l``, ``r``.
+
+        """
+        q = asarray(q, dtype=float).reshape((-1, 1))
+        if loads is None:
+            p = zeros(self.xyz.shape)
+        else:
+            p = asarray(loads, dtype=float).reshape((-1, 3))
+        xyz = self.xyz.copy()
+        if self.free:
+            A = self.system_matrix(q)
+            b = p[self.free] - self.Cit.dot(q * self.CfXf)
+            solve = factorized(A)
+            xyz[self.free] = array([solve(b[:, i]) for i in range(3)]).T
+        uvw = self.C.dot(xyz)
+        l = normrow(uvw)  # noqa: E741
+        f = q * l
+        r = p - self.Ct.dot(q * uvw)
+        return xyz, q, f, l, r
+
+    def solve_many(self, qs, loads=None, processes=None):
+        """Compute the equilibrium geometries for a batch of force densities and loads.
+
+        Parameters
+        ----------
+        qs : array-like
+            Force densities per solve, with shape ``(n, number_of_edges)``.
+        loads : array-like, optional
+            The loads on the vertices.
+            Either a single set of loads with shape ``(number_of_vertices, 3)``, used for all solves,
+            or one set per solve, with shape ``(n, number_of_vertices, 3)``.
+            Default is ``None``, in which case no loads are applied.
+        processes : int, optional
+            Number of worker processes over which the independent solves are distributed.
+            Default is ``None``, in which case all solves are computed in the current process.
+
+        Returns
+        -------
+        tuple
+            The stacked results ``xyz``, ``q``, ``f``, ``l``, ``r``
+            with the batch dimension first.
+
+        Examples
+        --------
+        >>> vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 0]]
+        >>> edges = [[0, 4], [1, 4], [2, 4], [3, 4]]
+        >>> solver = ForceDensitySolver(vertices, edges, [0, 1, 2, 3])
+        >>> loads = [[0, 0, 0]] * 4 + [[0, 0, -1]]
+        >>> xyz, q, f, l, r = solver.solve_many([[1.0] * 4, [2.0] * 4], loads)
+        >>> xyz.shape
+        (2, 5, 3)
+
+        """
+        qs = asarray(qs, dtype=float).reshape((-1, self.number_of_edges))
+        n = qs.shape[0]
+        if loads is None:
+            ps = [None] * n
+        else:
+            loads = asarray(loads, dtype=float)
+            if loads.ndim == 3:
+                ps = list(loads)
+            else:
+                ps = [loads] * n
+        if not processes or processes < 2 or n < 2:
+            results = _fd_solve_chunk(self, qs, ps)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            size = -(-n // processes)
+            chunks = [(qs[i:i + size], ps[i:i + size]) for i in range(0, n, size)]
+            results = []
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(_fd_solve_chunk, self, chunk_qs, chunk_ps) for chunk_qs, chunk_ps in chunks]
+                for future in futures:
+                    results += future.result()
+        return tuple(array(result) for result in zip(*results))
+
+
+def _fd_solve_chunk(solver, qs, ps):
+    return [solver.solve(q, p) for q, p in zip(qs, ps)]
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -2,9 +2,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
 
+from .evaluation import *  # noqa: F401 F403
 from .ga import *  # noqa: F401 F403
 from .moga import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .ga_numpy import *  # noqa: F401 F403
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -0,0 +1,96 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from functools import partial
+
+
+__all__ = ['evaluate_population']
+
+
+EVALUATORS = ('serial', 'threads', 'processes')
+
+
+def _evaluate_one(function, fargs, fkwargs, individual):
+    return function(individual, *fargs, **fkwargs)
+
+
+def evaluate_population(function, population, fargs=None, fkwargs=None, evaluator='serial', num_workers=None):
+    """Evaluate a fitness function for every individual of a population.
+
+    Parameters
+    ----------
+    function : callable
+        The fitness function.
+        The function must have as a first argument a list of variables.
+    population : list
+        The (scaled) variables of every individual.
+    fargs : list, optional
+        Additional arguments fed to the fitness function.
+    fkwargs : dict, optional
+        Additional keyword arguments fed to the fitness function.
+    evaluator : {'serial', 'threads', 'processes'} or callable, optional
+        The evaluation backend.
+        With ``'threads'`` or ``'processes'`` the individuals are evaluated on a pool
+        of ``num_workers`` threads or processes.
+        With ``'processes'``, the fitness function and its arguments must be picklable.
+        A callable is used as batch function: it receives the entire population as a NumPy array
+        with shape ``(len(population), num_var)``, followed by ``fargs`` and ``fkwargs``,
+        and should return the fitness values of all individuals at once.
+        In that case, ``function`` is ignored.
+        Default is ``'serial'``.
+    num_workers : int, optional
+        The number of workers of the thread or process pool.
+        Default is ``None``, in which case the default of the pool is used.
+
+    Returns
+    -------
+    list
+        The fitness values, in the order of the individuals in the population.
+
+    Examples
+    --------
+    >>> evaluate_population(sum, [[1, 2], [3, 4]])
+    [3, 7]
+    >>> evaluate_population(sum, [[1, 2], [3, 4]], evaluator='threads', num_workers=2)
+    [3, 7]
+
+    """
+    fargs = fargs or []
+    fkwargs = fkwargs or {}
+    if not population:
+        return []
+
+    if callable(evaluator):
+        from numpy import asarray
+        values = evaluator(asarray(population, dtype=float), *fargs, **fkwargs)
+        if hasattr(values, 'tolist'):
+            return values.tolist()
+        return list(values)
+
+    if evaluator not in EVALUATORS:
+        raise ValueError('Unknown evaluator: {}. Use one of {} or a batch function.'.format(evaluator, EVALUATORS))
+
+    call = partial(_evaluate_one, function, fargs, fkwargs)
+
+    if evaluator == 'serial' or len(population) == 1:
+        return [call(individual) for individual in population]
+
+    if evaluator == 'threads':
+        from concurrent.futures import ThreadPoolExecutor as Executor
+    else:
+        from concurrent.futures import ProcessPoolExecutor as Executor
+
+    with Executor(max_workers=num_workers) as executor:
+        return list(executor.map(call, population))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+
+    doctest.testmod(globs=globals())
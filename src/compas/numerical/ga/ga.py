@@ -7,6 +7,10 @@ import random
 import json
 import copy
 
+import compas
+from compas.numerical.checkpoint import Checkpointer
+from compas.numerical.ga.evaluation import evaluate_population
+
 
 __all__ = ['ga']
 
@@ -43,7 +47,12 @@ def ga(fit_function,
        fkwargs=None,
        output_path=None,
        input_path=None,
-       print_refresh=1):
+       print_refresh=1,
+       evaluator='serial',
+       num_workers=None,
+       checkpoint_path=None,
+       checkpoint_interval=1,
+       resume=False):
     """Genetic Algorithm optimisation.
 
     Parameters
@@ -98,6 +107,23 @@ def ga(fit_function,
         Path to the fitness function file.
     print_refresh : int
         Print current generation summary every ``print_refresh`` generations.
+    evaluator : {'serial', 'threads', 'processes'} or callable, optional ['serial']
+        The backend used to evaluate the fitness of the individuals of a generation.
+        A callable is used as batch function that receives the scaled population as a
+        NumPy array and returns the fitness values of all individuals.
+        See :func:`evaluate_population` for details.
+    num_workers : int, optional [None]
+        The number of workers used by the ``'threads'`` and ``'processes'`` evaluators.
+    checkpoint_path : str, optional [None]
+        Path to a binary checkpoint file containing the complete state of the GA,
+        including the population, the fitness values of all evaluated individuals,
+        and the state of the random number generator.
+        The checkpoint is written asynchronously, every ``checkpoint_interval`` generations.
+    checkpoint_interval : int, optional [1]
+        The number of generations between checkpoints.
+    resume : bool, optional [False]
+        If True, and the checkpoint file exists, the optimisation is resumed exactly
+        from the state in the checkpoint, without re-evaluating any individuals.
 
     Returns
     -------
@@ -141,10 +167,22 @@ def ga(fit_function,
     ga_.output_path = output_path or ''
     ga_.input_path = input_path or ''
     ga_.print_refresh = print_refresh
+    ga_.evaluator = evaluator
+    ga_.num_workers = num_workers
+    ga_.checkpoint_path = checkpoint_path
+    ga_.checkpoint_interval = checkpoint_interval
+    ga_.resume = resume
     ga_.ga_optimize()
     return ga_
 
 
+def _numpy_rng():
+    """Random number generator for the array operators, seeded from the state of :mod:`random`,
+    such that seeding and checkpointing the state of :mod:`random` also covers the array operators."""
+    from numpy.random import RandomState
+    return RandomState(random.getrandbits(32))
+
+
 class GA(object):
     """This class contains a binary coded, single objective genetic algorithm.
 
@@ -219,6 +257,17 @@ class GA(object):
     ind_fit_dict : dict
         This dictionary keeps track of already evaluated solutions to avoid dupplicate
         fitness function calls.
+    evaluator : str or callable
+        The backend used to evaluate the fitness of a generation.
+        One of ``'serial'``, ``'threads'``, ``'processes'``, or a batch function.
+    num_workers : int
+        The number of workers used by the ``'threads'`` and ``'processes'`` evaluators.
+    checkpoint_path : str
+        Path to the binary checkpoint file. If None, no checkpoints are written.
+    checkpoint_interval : int
+        The number of generations between checkpoints.
+    resume : bool
+        If True, the GA resumes from the checkpoint in ``GA.checkpoint_path``, if it exists.
 
     """
 
@@ -256,6 +305,11 @@ class GA(object):
         self.check_diversity = False
         self.ind_fit_dict = {}
         self.print_refresh = 1
+        self.evaluator = 'serial'
+        self.num_workers = None
+        self.checkpoint_path = None
+        self.checkpoint_interval = 1
+        self.resume = False
 
     def __str__(self):
         """Compile a summary of the GA."""
@@ -285,7 +339,13 @@ class GA(object):
             self.num_pop_temp = copy.deepcopy(self.num_pop)
             self.num_pop = self.num_pop_init
 
-        if self.start_from_gen:
+        checkpointer = None
+        if self.checkpoint_path:
+            checkpointer = Checkpointer(self.checkpoint_path, self.checkpoint_interval)
+
+        if self.resume and checkpointer and checkpointer.exists():
+            start_gen_number = self.set_checkpoint_state(checkpointer.load())
+        elif self.start_from_gen:
             self.current_pop = self.get_pop_from_pop_file(self.start_from_gen)
             start_gen_number = self.start_from_gen + 1
         else:
@@ -303,8 +363,7 @@ class GA(object):
             else:
                 num = self.num_pop - self.num_elite
 
-            for i in range(num):
-                self.current_pop['fit_value'][i] = self.evaluate_fitness(i)
+            self.current_pop['fit_value'][:num] = self.evaluate_population(num)
 
             if self.num_pop_init and generation >= self.num_gen_init_pop:
                 self.num_pop = self.num_pop_temp
@@ -327,6 +386,8 @@ class GA(object):
                 self.npoint_crossover()  # n-e
                 self.random_mutation()  # n-e
                 self.add_elite_to_current()  # n
+                if checkpointer:
+                    checkpointer.save(generation + 1, self.get_checkpoint_state(generation + 1))
 
             else:
                 self.end_gen = generation
@@ -335,6 +396,53 @@ class GA(object):
                 print(self)
                 break
 
+        if checkpointer:
+            checkpointer.close()
+
+    def get_checkpoint_state(self, generation):
+        """Returns the state required to resume the optimization at the start of a given generation.
+
+        Parameters
+        ----------
+        generation: int
+            The generation at which the optimization would be resumed.
+
+        Returns
+        -------
+        state: dict
+            The state of the GA.
+        """
+        return {'generation': generation,
+                'current_pop': self.current_pop,
+                'elite_pop': self.elite_pop,
+                'ind_fit_dict': self.ind_fit_dict,
+                'num_pop': self.num_pop,
+                'num_pop_temp': self.num_pop_temp,
+                'best_fit': self.best_fit,
+                'random_state': random.getstate()}
+
+    def set_checkpoint_state(self, state):
+        """Restores the state of the GA from a checkpoint.
+
+        Parameters
+        ----------
+        state: dict
+            The state of the GA, as returned by ``GA.get_checkpoint_state``.
+
+        Returns
+        -------
+        generation: int
+            The generation at which the optimization should be resumed.
+        """
+        self.current_pop = state['current_pop']
+        self.elite_pop = state['elite_pop']
+        self.ind_fit_dict = state['ind_fit_dict']
+        self.num_pop = state['num_pop']
+        self.num_pop_temp = state['num_pop_temp']
+        self.best_fit = state['best_fit']
+        random.setstate(state['random_state'])
+        return state['generation']
+
     def evaluate_fitness(self, index):
         chromo = ''.join(str(y) for x in self.current_pop['binary'][index] for y in x)
         fit = self.ind_fit_dict.setdefault(chromo, None)
@@ -343,6 +451,37 @@ class GA(object):
             self.ind_fit_dict[chromo] = fit
         return fit
 
+    def evaluate_population(self, num):
+        """Evaluates the fitness of the first ``num`` individuals of the current population.
+
+        Individuals whose chromosome has been evaluated before are looked up in
+        ``GA.ind_fit_dict``. Each of the remaining, unique chromosomes is evaluated only once,
+        using the backend defined by ``GA.evaluator``.
+
+        Parameters
+        ----------
+        num: int
+            The number of individuals to evaluate.
+
+        Returns
+        -------
+        fit_values: list
+            The fitness values of the individuals.
+        """
+        chromos = [''.join(str(y) for x in self.current_pop['binary'][i] for y in x) for i in range(num)]
+        todo = {}
+        for i, chromo in enumerate(chromos):
+            if self.ind_fit_dict.get(chromo) is None and chromo not in todo:
+                todo[chromo] = i
+        if todo:
+            indices = list(todo.values())
+            population = [self.current_pop['scaled'][i] for i in indices]
+            values = evaluate_population(self.fit_function, population, self.fargs, self.fkwargs,
+                                         evaluator=self.evaluator, num_workers=self.num_workers)
+            for i, fit in zip(indices, values):
+                self.ind_fit_dict[chromos[i]] = fit
+        return [self.ind_fit_dict[chromo] for chromo in chromos]
+
     def check_pop_diversity(self):
         seen = []
         all_ = []
@@ -539,6 +678,9 @@ class GA(object):
         """
         self.current_pop = {'binary': [], 'decoded': [], 'scaled': [], 'fit_value': []}
         self.current_pop['binary'] = [[[]] * self.num_var for i in range(self.num_pop)]
+        if not compas.IPY and self.mating_pool_a:
+            self._npoint_crossover_numpy()
+            return
         for j in range(int((self.num_pop - self.num_elite) / 2)):
             a = self.mating_pool_a[j]
             b = self.mating_pool_b[j]
@@ -554,10 +696,30 @@ class GA(object):
                 self.current_pop['binary'][j][i] = variable_a
                 self.current_pop['binary'][j + (int((self.num_pop - self.num_elite) / 2))][i] = variable_b
 
+    def _npoint_crossover_numpy(self):
+        from compas.numerical.ga.ga_numpy import npoint_crossover_numpy
+
+        num = int((self.num_pop - self.num_elite) / 2)
+        c, d = npoint_crossover_numpy(self.mating_pool_a, self.mating_pool_b, self.n_cross, rng=_numpy_rng())
+        for j in range(num):
+            self.current_pop['binary'][j] = self._split_chromosome(c[j].tolist())
+            self.current_pop['binary'][j + num] = self._split_chromosome(d[j].tolist())
+
+    def _split_chromosome(self, chromosome):
+        variables = []
+        start = 0
+        for n in self.num_bin_dig:
+            variables.append(chromosome[start:start + n])
+            start += n
+        return variables
+
     def random_mutation(self):
         """This mutation operator replaces a gene from 0 to 1 or viceversa
         with a probability of ``GA.mutation_probability``.
         """
+        if not compas.IPY and self.num_pop > self.num_elite:
+            self._random_mutation_numpy()
+            return
         for i in range(self.num_pop - self.num_elite):
             for j in range(self.num_var):
                 for u in range(self.num_bin_dig[j]):
@@ -568,6 +730,15 @@ class GA(object):
                         else:
                             self.current_pop['binary'][i][j][u] = 0
 
+    def _random_mutation_numpy(self):
+        from compas.numerical.ga.ga_numpy import random_mutation_numpy
+
+        num = self.num_pop - self.num_elite
+        chromosomes = [[gene for variable in self.current_pop['binary'][i] for gene in variable] for i in range(num)]
+        mutated = random_mutation_numpy(chromosomes, self.mutation_probability, rng=_numpy_rng())
+        for i in range(num):
+            self.current_pop['binary'][i] = self._split_chromosome(mutated[i].tolist())
+
     def code_decoded(self, decoded_pop):
         """Returns a binary coded population from a decoded population
 
@@ -0,0 +1,231 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import arange
+from numpy import asarray
+from numpy import cumsum
+from numpy import int64
+from numpy import repeat
+from numpy import zeros
+import numpy.random
+
+
+__all__ = [
+    'decode_binary_pop_numpy',
+    'code_decoded_numpy',
+    'scale_population_numpy',
+    'npoint_crossover_numpy',
+    'random_mutation_numpy',
+    'non_dom_sort_numpy',
+]
+
+
+def _variable_index(num_bin_dig):
+    # the variable to which every gene of a chromosome belongs
+    # and the position of the gene in the binary number of that variable
+    num_bin_dig = asarray(num_bin_dig, dtype=int)
+    variables = repeat(arange(len(num_bin_dig)), num_bin_dig)
+    offsets = cumsum(num_bin_dig) - num_bin_dig
+    positions = arange(num_bin_dig.sum()) - offsets[variables]
+    return variables, positions
+
+
+def decode_binary_pop_numpy(bin_pop, num_bin_dig):
+    """Decode a binary population into unscaled variable values.
+
+    Parameters
+    ----------
+    bin_pop : array-like
+        The binary population, with one (flat) chromosome per row.
+        The chromosome is the concatenation of the binary numbers of all variables,
+        with the least significant digit first, as in :class:`GA`.
+    num_bin_dig : list
+        The number of binary digits of every variable.
+
+    Returns
+    -------
+    array
+        The decoded population, with shape ``(num_pop, num_var)``.
+
+    Examples
+    --------
+    >>> decode_binary_pop_numpy([[1, 0, 1, 1, 1]], [3, 2])
+    array([[5, 3]])
+
+    """
+    bin_pop = asarray(bin_pop, dtype=int64).reshape((-1, sum(num_bin_dig)))
+    variables, positions = _variable_index(num_bin_dig)
+    W = zeros((len(variables), len(num_bin_dig)), dtype=int64)
+    W[arange(len(variables)), variables] = 2 ** positions
+    return bin_pop.dot(W)
+
+
+def code_decoded_numpy(decoded_pop, num_bin_dig):
+    """Code a decoded population into a binary population.
+
+    Parameters
+    ----------
+    decoded_pop : array-like
+        The decoded population, with shape ``(num_pop, num_var)``.
+    num_bin_dig : list
+        The number of binary digits of every variable.
+
+    Returns
+    -------
+    array
+        The binary population, with one (flat) chromosome per row.
+
+    Examples
+    --------
+    >>> code_decoded_numpy([[5, 3]], [3, 2])
+    array([[1, 0, 1, 1, 1]])
+
+    """
+    decoded_pop = asarray(decoded_pop, dtype=int64).reshape((-1, len(num_bin_dig)))
+    variables, positions = _variable_index(num_bin_dig)
+    return (decoded_pop[:, variables] >> positions) & 1
+
+
+def scale_population_numpy(decoded_pop, boundaries, num_bin_dig):
+    """Scale a decoded population to the boundaries of the variables.
+
+    Parameters
+    ----------
+    decoded_pop : array-like
+        The decoded population, with shape ``(num_pop, num_var)``.
+    boundaries : list
+        The minimum and maximum value of every variable.
+    num_bin_dig : list
+        The number of binary digits of every variable.
+
+    Returns
+    -------
+    array
+        The scaled population.
+
+    Examples
+    --------
+    >>> scale_population_numpy([[0, 3]], [(0, 1), (-1, 1)], [3, 2])
+    array([[0., 1.]])
+
+    """
+    decoded_pop = asarray(decoded_pop, dtype=float)
+    boundaries = asarray(boundaries, dtype=float).reshape((-1, 2))
+    maxbin = 2.0 ** asarray(num_bin_dig) - 1
+    return boundaries[:, 0] + (boundaries[:, 1] - boundaries[:, 0]) * decoded_pop / maxbin
+
+
+def npoint_crossover_numpy(pool_a, pool_b, n_cross=1, rng=None):
+    """Combine two mating pools using n randomly selected crossover points per pair of chromosomes.
+
+    Parameters
+    ----------
+    pool_a : array-like
+        The first mating pool, with one (flat) chromosome per row.
+    pool_b : array-like
+        The second mating pool.
+    n_cross : int, optional
+        The number of crossover points.
+        Default is ``1``.
+    rng : numpy.random.RandomState, optional
+        The random number generator.
+        Default is ``None``, in which case the global generator of :mod:`numpy.random` is used.
+
+    Returns
+    -------
+    tuple
+        The two offspring pools.
+
+    """
+    rng = rng or numpy.random
+    pool_a = asarray(pool_a)
+    pool_b = asarray(pool_b)
+    num, total = pool_a.shape
+    # the genes between an odd and an even crossover point are swapped
+    swap = zeros((num, total + 1), dtype=int)
+    points = rng.random_sample((num, total - 1)).argsort(axis=1)[:, :n_cross] + 1
+    for k in range(n_cross):
+        swap[arange(num), points[:, k]] += 1
+    mask = (cumsum(swap, axis=1)[:, :total] % 2).astype(bool)
+    c = pool_a.copy()
+    d = pool_b.copy()
+    c[mask] = pool_b[mask]
+    d[mask] = pool_a[mask]
+    return c, d
+
+
+def random_mutation_numpy(bin_pop, mutation_probability, rng=None):
+    """Flip every gene of a binary population with a given probability.
+
+    Parameters
+    ----------
+    bin_pop : array-like
+        The binary population, with one (flat) chromosome per row.
+    mutation_probability : float
+        The probability that a gene is flipped.
+    rng : numpy.random.RandomState, optional
+        The random number generator.
+        Default is ``None``, in which case the global generator of :mod:`numpy.random` is used.
+
+    Returns
+    -------
+    array
+        The mutated population.
+
+    """
+    rng = rng or numpy.random
+    bin_pop = asarray(bin_pop)
+    flip = rng.random_sample(bin_pop.shape) < mutation_probability
+    return bin_pop ^ flip
+
+
+def non_dom_sort_numpy(fit_values, fit_types):
+    """Assign a Pareto front level to every individual of a population (NSGA-II non-dominated sorting).
+
+    Parameters
+    ----------
+    fit_values : array-like
+        The fitness values of every individual, with shape ``(num_pop, num_fit_func)``.
+    fit_types : list
+        For every fitness function, ``'min'`` or ``'max'``.
+
+    Returns
+    -------
+    array
+        The Pareto front level of every individual, starting at ``0``.
+
+    Examples
+    --------
+    >>> non_dom_sort_numpy([[0, 1], [1, 0], [1, 1], [2, 2]], ['min', 'min'])
+    array([0, 0, 1, 2])
+
+    """
+    F = asarray(fit_values, dtype=float).copy()
+    for j, fit_type in enumerate(fit_types):
+        if fit_type == 'max':
+            F[:, j] *= -1
+    better = (F[:, None, :] < F[None, :, :]).any(axis=2)
+    worse = (F[:, None, :] > F[None, :, :]).any(axis=2)
+    # dominates[i, k] is True if individual i dominates individual k
+    dominates = better & ~worse
+    count = dominates.sum(axis=0)
+    fronts = zeros(len(F), dtype=int) - 1
+    level = 0
+    while (fronts < 0).any():
+        current = (count == 0) & (fronts < 0)
+        fronts[current] = level
+        count = count - dominates[current].sum(axis=0)
+        level += 1
+    return fronts
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+
+    doctest.testmod(globs=globals())
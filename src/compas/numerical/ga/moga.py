@@ -6,6 +6,11 @@ import re
 import random
 import json
 
+import compas
+from compas.numerical.checkpoint import Checkpointer
+from compas.numerical.ga.evaluation import evaluate_population
+from compas.numerical.ga.ga import _numpy_rng
+
 
 __all__ = ['moga']
 
@@ -45,7 +50,12 @@ def moga(fit_functions,
          fit_names=None,
          fargs=None,
          fkwargs=None,
-         output_path=None):
+         output_path=None,
+         evaluator='serial',
+         num_workers=None,
+         checkpoint_path=None,
+         checkpoint_interval=1,
+         resume=False):
     """Multi-objective Genetic Algorithm optimisation.
 
     Parameters
@@ -85,6 +95,24 @@ def moga(fit_functions,
         Keyword arguments to be fed to the fitness function.
     output_path : str, optional [None]
         Path for the optimization result files.
+    evaluator : {'serial', 'threads', 'processes'} or callable, optional ['serial']
+        The backend used to evaluate the fitness of the individuals of a generation.
+        A callable is used as batch function that receives the scaled population as a
+        NumPy array and returns the values of all fitness functions for all individuals,
+        as an array with shape ``(num_pop, len(fit_functions))``.
+        See :func:`evaluate_population` for details.
+    num_workers : int, optional [None]
+        The number of workers used by the ``'threads'`` and ``'processes'`` evaluators.
+    checkpoint_path : str, optional [None]
+        Path to a binary checkpoint file containing the complete state of the MOGA,
+        including the parent and current populations, the fitness values of all evaluated
+        individuals, and the state of the random number generator.
+        The checkpoint is written asynchronously, every ``checkpoint_interval`` generations.
+    checkpoint_interval : int, optional [1]
+        The number of generations between checkpoints.
+    resume : bool, optional [False]
+        If True, and the checkpoint file exists, the optimisation is resumed exactly
+        from the state in the checkpoint, without re-evaluating any individuals.
 
     Returns
     -------
@@ -185,6 +213,11 @@ def moga(fit_functions,
     moga.fit_functions = fit_functions
     moga.output_path = output_path or ''
     moga.num_fit_func = len(fit_functions)
+    moga.evaluator = evaluator
+    moga.num_workers = num_workers
+    moga.checkpoint_path = checkpoint_path
+    moga.checkpoint_interval = checkpoint_interval
+    moga.resume = resume
     moga.moga_optimize()
     return moga
 
@@ -258,6 +291,17 @@ class MOGA(object):
     ind_fit_dict : dict
         This dictionary keeps track of already evaluated solutions to avoid dupplicate
         fitness function calls.
+    evaluator : str or callable
+        The backend used to evaluate the fitness of a generation.
+        One of ``'serial'``, ``'threads'``, ``'processes'``, or a batch function.
+    num_workers : int
+        The number of workers used by the ``'threads'`` and ``'processes'`` evaluators.
+    checkpoint_path : str
+        Path to the binary checkpoint file. If None, no checkpoints are written.
+    checkpoint_interval : int
+        The number of generations between checkpoints.
+    resume : bool
+        If True, the MOGA resumes from the checkpoint in ``MOGA.checkpoint_path``, if it exists.
     """
 
     def __init__(self):
@@ -294,6 +338,11 @@ class MOGA(object):
         self.fargs = {}
         self.fkwargs = {}
         self.ind_fit_dict = {}
+        self.evaluator = 'serial'
+        self.num_workers = None
+        self.checkpoint_path = None
+        self.checkpoint_interval = 1
+        self.resume = False
 
     def __str__(self):
         """Compile a summary of the MOGA."""
@@ -320,7 +369,14 @@ class MOGA(object):
         GA optimization, performing all genetic operators.
         """
         self.write_moga_json_file()
-        if self.start_from_gen:
+        checkpointer = None
+        if self.checkpoint_path:
+            checkpointer = Checkpointer(self.checkpoint_path, self.checkpoint_interval)
+
+        resumed = bool(self.resume and checkpointer and checkpointer.exists())
+        if resumed:
+            start_gen_number = self.set_checkpoint_state(checkpointer.load())
+        elif self.start_from_gen:
             self.parent_pop = self.get_pop_from_pf_file()
             start_gen_number = self.start_from_gen + 1
         else:
@@ -334,24 +390,17 @@ class MOGA(object):
                     self.parent_pop['binary'][i] = self.fixed_start_pop['binary'][i]
                     self.parent_pop['decoded'][i] = self.fixed_start_pop['decoded'][i]
                     self.parent_pop['scaled'][i] = self.fixed_start_pop['scaled'][i]
-            self.parent_pop['fit_values'] = [[[]] * self.num_fit_func for i in range(self.num_pop)]
-            for i in range(self.num_pop):
-                for j in range(self.num_fit_func):
-                    fit_func = self.fit_functions[j]
-                    self.parent_pop['fit_values'][i][j] = fit_func(self.parent_pop['scaled'][i], **self.fkwargs)
+            self.parent_pop['fit_values'] = self.evaluate_population(self.parent_pop)
 
-        self.current_pop['binary'] = self.generate_random_bin_pop()
+        if not resumed:
+            self.current_pop['binary'] = self.generate_random_bin_pop()
 
         for generation in range(start_gen_number, self.num_gen):
             print('generation ', generation)
 
             self.current_pop['decoded'] = self.decode_binary_pop(self.current_pop['binary'])
             self.current_pop['scaled'] = self.scale_population(self.current_pop['decoded'])
-            self.current_pop['fit_values'] = [[[]] * self.num_fit_func for i in range(self.num_pop)]
-            for i in range(self.num_pop):
-                for j in range(self.num_fit_func):
-                    fit_func = self.fit_functions[j]
-                    self.current_pop['fit_values'][i][j] = fit_func(self.current_pop['scaled'][i], **self.fkwargs)
+            self.current_pop['fit_values'] = self.evaluate_population(self.current_pop)
 
             self.combine_populations()
             self.non_dom_sort()
@@ -369,9 +418,52 @@ class MOGA(object):
                 self.create_mating_pool()
                 self.simple_crossover()
                 self.random_mutation()
+                if checkpointer:
+                    checkpointer.save(generation + 1, self.get_checkpoint_state(generation + 1))
             else:
                 print(self)
 
+        if checkpointer:
+            checkpointer.close()
+
+    def get_checkpoint_state(self, generation):
+        """Returns the state required to resume the optimization at the start of a given generation.
+
+        Parameters
+        ----------
+        generation: int
+            The generation at which the optimization would be resumed.
+
+        Returns
+        -------
+        state: dict
+            The state of the MOGA.
+        """
+        return {'generation': generation,
+                'parent_pop': self.parent_pop,
+                'current_pop': self.current_pop,
+                'ind_fit_dict': self.ind_fit_dict,
+                'random_state': random.getstate()}
+
+    def set_checkpoint_state(self, state):
+        """Restores the state of the MOGA from a checkpoint.
+
+        Parameters
+        ----------
+        state: dict
+            The state of the MOGA, as returned by ``MOGA.get_checkpoint_state``.
+
+        Returns
+        -------
+        generation: int
+            The generation at which the optimization should be resumed.
+        """
+        self.parent_pop = state['parent_pop']
+        self.current_pop = state['current_pop']
+        self.ind_fit_dict = state['ind_fit_dict']
+        random.setstate(state['random_state'])
+        return state['generation']
+
     def evaluate_fitness(self, index, fit_func):
         chromo = ''.join(str(y) for x in self.current_pop['binary'][index] for y in x)
         fit = self.ind_fit_dict.setdefault(chromo, None)
@@ -380,6 +472,41 @@ class MOGA(object):
             self.ind_fit_dict[chromo] = fit
         return fit
 
+    def evaluate_population(self, pop):
+        """Evaluates all fitness functions for all individuals of a population.
+
+        Individuals whose chromosome has been evaluated before are looked up in
+        ``MOGA.ind_fit_dict``. Each of the remaining, unique chromosomes is evaluated only once,
+        using the backend defined by ``MOGA.evaluator``.
+
+        Parameters
+        ----------
+        pop: dict
+            A population dictionary with binary and scaled data.
+
+        Returns
+        -------
+        fit_values: list
+            For every individual, the list of values of the fitness functions.
+        """
+        chromos = [''.join(str(y) for j in range(self.num_var) for y in pop['binary'][i][j]) for i in range(self.num_pop)]
+        todo = {}
+        for i, chromo in enumerate(chromos):
+            if chromo not in self.ind_fit_dict and chromo not in todo:
+                todo[chromo] = i
+        if todo:
+            indices = list(todo.values())
+            population = [[pop['scaled'][i][j] for j in range(self.num_var)] for i in indices]
+            if callable(self.evaluator):
+                values = evaluate_population(None, population, self.fargs, self.fkwargs, evaluator=self.evaluator)
+            else:
+                values = zip(*[evaluate_population(fit_func, population, self.fargs, self.fkwargs,
+                                                   evaluator=self.evaluator, num_workers=self.num_workers)
+                               for fit_func in self.fit_functions])
+            for i, fit in zip(indices, values):
+                self.ind_fit_dict[chromos[i]] = list(fit)
+        return [list(self.ind_fit_dict[chromo]) for chromo in chromos]
+
     def write_out_file(self, generation):
         """This function writes a file containing all of the population data for
         the given ``generation``.
@@ -390,7 +517,7 @@ class MOGA(object):
             The generation to write the population data of.
         """
         filename = 'generation ' + "%03d" % generation + '_pareto_front' + ".pareto"
-        pf_file = open(self.output_path + (str(filename)), "wb")
+        pf_file = open(self.output_path + (str(filename)), "w")
         pf_file.write('Generation \n')
         pf_file.write(str(generation) + '\n')
         pf_file.write('\n')
@@ -522,6 +649,12 @@ class MOGA(object):
         self.pareto_front_indices = []
         self.pareto_front_individuals = []
 
+        if not compas.IPY:
+            self._non_dom_sort_numpy()
+        else:
+            self._non_dom_sort_python()
+
+    def _non_dom_sort_python(self):
         for i in range(self.num_pop * 2):
             self.domination_count[i] = 0
 
@@ -573,6 +706,17 @@ class MOGA(object):
 
             pareto_front_number += 1
 
+    def _non_dom_sort_numpy(self):
+        from compas.numerical.ga.ga_numpy import non_dom_sort_numpy
+
+        fronts = non_dom_sort_numpy(self.combined_pop['fit_values'], self.fit_types).tolist()
+        self.pareto_front_indices.append(0)
+        level = 0
+        while len(self.pareto_front_individuals) < self.num_pop:
+            self.pareto_front_individuals += [i for i, front in enumerate(fronts) if front == level]
+            self.pareto_front_indices.append(len(self.pareto_front_individuals))
+            level += 1
+
     def extract_pareto_front(self, u):
         """Adds each new level of pareto front individuals to the ``MOGA.i_pareto_front`` list.
         """
@@ -746,6 +890,9 @@ class MOGA(object):
         """
         self.current_pop = {'binary': [], 'decoded': [], 'scaled': [], 'fit_values': []}
         self.current_pop['binary'] = [[[]] * self.num_var for i in range(self.num_pop)]
+        if not compas.IPY and self.mating_pool_a:
+            self._simple_crossover_numpy()
+            return
         for j in range(int(self.num_pop / 2)):
             cross = random.randint(1, self.total_bin_dig - 1)
             a = self.mating_pool_a[j]
@@ -765,6 +912,9 @@ class MOGA(object):
         """This mutation operator replaces a gene from 0 to 1 or viceversa
         with a probability of ``MOGA.mutation_probability``.
         """
+        if not compas.IPY:
+            self._random_mutation_numpy()
+            return
         for i in range(self.num_pop):
             for j in range(self.num_var):
                 for u in range(self.num_bin_dig[j]):
@@ -775,6 +925,31 @@ class MOGA(object):
                         else:
                             self.current_pop['binary'][i][j][u] = 0
 
+    def _simple_crossover_numpy(self):
+        from compas.numerical.ga.ga_numpy import npoint_crossover_numpy
+
+        num = int(self.num_pop / 2)
+        c, d = npoint_crossover_numpy(self.mating_pool_a, self.mating_pool_b, 1, rng=_numpy_rng())
+        for j in range(num):
+            self.current_pop['binary'][j] = self._split_chromosome(c[j].tolist())
+            self.current_pop['binary'][j + num] = self._split_chromosome(d[j].tolist())
+
+    def _random_mutation_numpy(self):
+        from compas.numerical.ga.ga_numpy import random_mutation_numpy
+
+        chromosomes = [[gene for variable in individual for gene in variable] for individual in self.current_pop['binary']]
+        mutated = random_mutation_numpy(chromosomes, self.mutation_probability, rng=_numpy_rng())
+        for i in range(self.num_pop):
+            self.current_pop['binary'][i] = self._split_chromosome(mutated[i].tolist())
+
+    def _split_chromosome(self, chromosome):
+        variables = []
+        start = 0
+        for n in self.num_bin_dig:
+            variables.append(chromosome[start:start + n])
+            start += n
+        return variables
+
     def get_pop_from_pf_file(self):
         """Reads the pareto front file corresponding to the ``MOGA.start_from_gen``
         generation and returns the saved population data. The pareto front file
@@ -978,7 +1153,7 @@ class MOGA(object):
         for name in self.fit_names:
             filename += name + '-'
         filename += '.json'
-        with open(self.output_path + filename, 'wb+') as fh:
+        with open(self.output_path + filename, 'w+') as fh:
             json.dump(data, fh)
 
     def write_gen_json_file(self, generation):
@@ -1041,7 +1216,6 @@ class MOGA(object):
 
 if __name__ == "__main__":
     import os
-    import compas
     import math
     from compas_plotters.mogaplotter import MogaPlotter
 
@@ -3,37 +3,46 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from itertools import product
+from time import time
+
 from numpy import abs
-from numpy import asarray
+from numpy import arange
 from numpy import array
 from numpy import ceil
 from numpy import dot
+from numpy import einsum
 from numpy import hstack
-from numpy import kron
 from numpy import max
 from numpy import maximum
-from numpy import min
 from numpy import minimum
 from numpy import int64
-from numpy import newaxis
 from numpy import ones
 from numpy import ravel
 from numpy import reshape
 from numpy import sqrt
-from numpy import squeeze
 from numpy import sum
-from numpy import tile
+from numpy import unique
+from numpy import unravel_index
 from numpy import vstack
 from numpy import zeros
 
 from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
+from scipy.sparse import diags
+from scipy.sparse.linalg import cg
 from scipy.sparse.linalg import spsolve
 
 
-__all__ = ['topop_numpy']
+__all__ = ['topop_numpy', 'topop3d_numpy']
+
+
+# the multigrid hierarchy of the amg solver is rebuilt after this number of optimisation iterations,
+# or earlier, if CG needs much more iterations than in the first solve with the hierarchy
+_AMG_REBUILD = 10
 
 
-def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, callback=None):
+def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, callback=None, solver='direct', tol=1e-8, maxiter=None):
     """ Topology optimisation in 2D using NumPy and SciPy.
 
     Parameters
@@ -52,6 +61,22 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         Penalisation power.
     rmin : float
         Filter radius.
+    callback : callable, optional
+        A function that is called after every iteration with the current density array.
+    solver : {'direct', 'cg', 'amg'}, optional
+        The solver for the equilibrium equations.
+        ``'direct'`` uses a sparse direct solver.
+        ``'cg'`` uses a Jacobi-preconditioned conjugate gradient solver.
+        ``'amg'`` uses a conjugate gradient solver preconditioned with algebraic multigrid,
+        and requires ``pyamg``.
+        The multigrid hierarchy is reused over several iterations.
+        The iterative solvers are warm-started from the displacements of the previous iteration,
+        and are recommended for large grids.
+        Default is ``'direct'``.
+    tol : float, optional
+        The relative tolerance of the iterative solvers.
+    maxiter : int, optional
+        The maximum number of iterations of the iterative solvers.
 
     Returns
     -------
@@ -75,13 +100,10 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
     nn = nx * ny
     ne = nelx * nely
     ndof = 2 * nn
-    dv = ones((nely, nelx))
 
     # Finite element analysis
 
     v = 0.3
-    E = 1.
-    Emin = 10**(-10)
 
     A11 = array([[12, +3, -6, -3], [+3, 12, +3, +0], [-6, +3, 12, -3], [-3, +0, -3, 12]])
     A12 = array([[-6, -3, +0, +3], [-3, -6, -3, -6], [+0, -3, -6, +3], [+3, -6, +3, -6]])
@@ -93,16 +115,12 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
     B = vstack([hstack([B11, B12]), hstack([B21, B11])])
 
     Ke = 1 / (1 - v**2) / 24 * (A + v * B)
-    Ker = ravel(Ke, order='F')[:, newaxis]
-    nodes = reshape(range(1, nn + 1), (ny, nx), order='F')
-    eVec = tile(reshape(2 * nodes[:-1, :-1], (ne, 1), order='F'), (1, 8))
-    edof = eVec + tile(hstack([array([0, 1]), 2 * nely + array([2, 3, 0, 1]), array([-2, -1])]), (ne, 1))
-    iK = reshape(kron(edof, ones((8, 1))).transpose(), (64 * ne), order='F')
-    jK = reshape(kron(edof, ones((1, 8))).transpose(), (64 * ne), order='F')
+    nodes = reshape(range(nn), (ny, nx), order='F')
+    eVec = reshape(2 * nodes[:-1, :-1], (ne, 1), order='F') + 2
+    edof = eVec + hstack([array([0, 1]), 2 * nely + array([2, 3, 0, 1]), array([-2, -1])])
 
     # Supports
 
-    U = zeros((ndof, 1))
     fixed = []
 
     for support, B in supports.items():
@@ -116,13 +134,9 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         if By:
             fixed.append(2 * node + 1)
 
-    free = list(set(range(ndof)) - set(fixed))
-
     # Loads
 
-    data = []
-    rows = []
-    cols = []
+    F = zeros(ndof)
 
     for load, P in loads.items():
 
@@ -130,42 +144,237 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         Px, Py = P
         node = int(jp * ny + ip)
 
-        data.extend([Px, Py])
-        rows.extend([2 * node, 2 * node + 1])
-        cols.extend([0, 0])
+        F[2 * node] += Px
+        F[2 * node + 1] += Py
+
+    # Filter
+
+    H, Hs = _filter_matrix((nely, nelx), rmin)
+
+    # Optimisation
+
+    return _topop(Ke, edof, ndof, fixed, F, H, Hs, (nely, nelx), volfrac, penal, callback, solver, tol, maxiter)
+
+
+def topop3d_numpy(nelx, nely, nelz, loads, supports, volfrac=0.3, penal=3, rmin=1.5, callback=None, solver='cg', tol=1e-8, maxiter=None):
+    """ Topology optimisation in 3D with hexahedral elements using NumPy and SciPy.
+
+    Parameters
+    ----------
+    nelx : int
+        Number of elements in x.
+    nely : int
+        Number of elements in y.
+    nelz : int
+        Number of elements in z.
+    loads : dict
+        {'i-j-k': [Px, Py, Pz]}.
+    supports : dict
+        {'i-j-k': [Bx, By, Bz]} 1=fixed, 0=free.
+    volfrac : float
+        Volume fraction.
+    penal : float
+        Penalisation power.
+    rmin : float
+        Filter radius.
+    callback : callable, optional
+        A function that is called after every iteration with the current density array.
+    solver : {'direct', 'cg', 'amg'}, optional
+        The solver for the equilibrium equations.
+        See :func:`topop_numpy`.
+        Default is ``'cg'``.
+    tol : float, optional
+        The relative tolerance of the iterative solvers.
+    maxiter : int, optional
+        The maximum number of iterations of the iterative solvers.
+
+    Returns
+    -------
+    array
+        Density array, with shape ``(nely, nelx, nelz)``.
+
+    Notes
+    -----
+    The nodes and loads are identified in the same way as in :func:`topop_numpy`,
+    with an additional index in the z direction.
+
+    Examples
+    --------
+    >>>
+    """
+
+    if callback and not callable(callback):
+        raise Exception("The provided callback is not callable.")
+
+    nx = nelx + 1
+    ny = nely + 1
+    nz = nelz + 1
+    ndof = 3 * nx * ny * nz
+
+    Ke = _hexahedron_stiffness(0.3)
+
+    # the element index runs fastest in y, then x, then z
+    j, i, k = unravel_index(arange(nelx * nely * nelz), (nely, nelx, nelz), order='F')
+    corners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+    enodes = array([(k + dz) * nx * ny + (i + dx) * ny + (j + dy) for dx, dy, dz in corners]).T
+    edof = (3 * enodes[:, :, None] + arange(3)).reshape((-1, 24))
+
+    # Supports
+
+    fixed = []
+
+    for support, B in supports.items():
+
+        ib, jb, kb = [int(i) for i in support.split('-')]
+        node = int(kb * nx * ny + ib * ny + jb)
+
+        for axis, b in enumerate(B):
+            if b:
+                fixed.append(3 * node + axis)
+
+    # Loads
+
+    F = zeros(ndof)
+
+    for load, P in loads.items():
+
+        ip, jp, kp = [int(i) for i in load.split('-')]
+        node = int(kp * nx * ny + ip * ny + jp)
 
-    F = coo_matrix((data, (rows, cols)), shape=(ndof, 1))
-    Find = F.tocsr()[free]
+        for axis, p in enumerate(P):
+            F[3 * node + axis] += p
 
     # Filter
 
-    iH = zeros(ne * (2 * (int(ceil(rmin)) - 1) + 1)**2, dtype=int64)
-    jH = zeros(iH.shape, dtype=int64)
-    sH = zeros(iH.shape)
-    k = 0
+    H, Hs = _filter_matrix((nely, nelx, nelz), rmin)
 
-    for i1 in range(nelx):
+    # Optimisation
 
-        max_i = int(max([i1 - (ceil(rmin) - 1), 0]))
-        min_i = int(min([i1 + (ceil(rmin) - 1), nelx - 1]))
+    return _topop(Ke, edof, ndof, fixed, F, H, Hs, (nely, nelx, nelz), volfrac, penal, callback, solver, tol, maxiter)
 
-        for j1 in range(nely):
 
-            max_j = int(max([j1 - (ceil(rmin) - 1), 0]))
-            min_j = int(min([j1 + (ceil(rmin) - 1), nely - 1]))
+# ==============================================================================
+# Helpers
+# ==============================================================================
 
-            e1 = i1 * nely + j1
 
-            for i2 in range(max_i, min_i + 1):
-                for j2 in range(max_j, min_j + 1):
-                    k += 1
-                    e2 = i2 * nely + j2
-                    iH[k] = e1
-                    jH[k] = e2
-                    sH[k] = max([0, rmin - sqrt((i1 - i2)**2 + (j1 - j2)**2)])
+def _filter_matrix(shape, rmin):
+    """Construct the density filter, for elements on a regular grid.
 
-    H = coo_matrix((sH, (iH, jH)))
-    Hs = sum(H.toarray(), 1)
+    The elements are numbered column-major (Fortran order) in the grid of the given shape.
+    """
+    ne = 1
+    for n in shape:
+        ne *= n
+    index = arange(ne).reshape(shape, order='F')
+    r = int(ceil(rmin)) - 1
+    rows = []
+    cols = []
+    data = []
+    for offset in product(range(-r, r + 1), repeat=len(shape)):
+        weight = rmin - sqrt(sum(array(offset) ** 2))
+        if weight <= 0:
+            continue
+        source = tuple(slice(max([0, -o]), n - max([0, o])) for o, n in zip(offset, shape))
+        target = tuple(slice(max([0, o]), n - max([0, -o])) for o, n in zip(offset, shape))
+        e1 = ravel(index[source])
+        rows.append(e1)
+        cols.append(ravel(index[target]))
+        data.append(ones(len(e1)) * weight)
+    H = coo_matrix((hstack(data), (hstack(rows), hstack(cols))), shape=(ne, ne)).tocsr()
+    Hs = ravel(H.sum(axis=1))
+    return H, Hs
+
+
+def _hexahedron_stiffness(v, E=1.):
+    """Stiffness matrix of a unit cube, 8-node hexahedral element, integrated with 2 x 2 x 2 Gauss points."""
+    D = E / ((1 + v) * (1 - 2 * v)) * array([
+        [1 - v, v, v, 0, 0, 0],
+        [v, 1 - v, v, 0, 0, 0],
+        [v, v, 1 - v, 0, 0, 0],
+        [0, 0, 0, (1 - 2 * v) / 2, 0, 0],
+        [0, 0, 0, 0, (1 - 2 * v) / 2, 0],
+        [0, 0, 0, 0, 0, (1 - 2 * v) / 2]])
+    corners = array([[-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1], [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]])
+    g = 1 / sqrt(3)
+    Ke = zeros((24, 24))
+    for point in product([-g, g], repeat=3):
+        terms = 1 + corners * array(point)
+        dN = zeros((8, 3))
+        dN[:, 0] = corners[:, 0] * terms[:, 1] * terms[:, 2] / 8
+        dN[:, 1] = corners[:, 1] * terms[:, 0] * terms[:, 2] / 8
+        dN[:, 2] = corners[:, 2] * terms[:, 0] * terms[:, 1] / 8
+        # the mapping from the parent element to the unit cube
+        dN *= 2
+        detJ = 1 / 8
+        B = zeros((6, 24))
+        B[0, 0::3] = dN[:, 0]
+        B[1, 1::3] = dN[:, 1]
+        B[2, 2::3] = dN[:, 2]
+        B[3, 0::3] = dN[:, 1]
+        B[3, 1::3] = dN[:, 0]
+        B[4, 1::3] = dN[:, 2]
+        B[4, 2::3] = dN[:, 1]
+        B[5, 0::3] = dN[:, 2]
+        B[5, 2::3] = dN[:, 0]
+        Ke += B.T.dot(D).dot(B) * detJ
+    return Ke
+
+
+def _cg(A, b, x0, tol, maxiter, M):
+    iterations = [0]
+
+    def count(xk):
+        iterations[0] += 1
+
+    try:
+        x, info = cg(A, b, x0=x0, rtol=tol, atol=0, maxiter=maxiter, M=M, callback=count)
+    except TypeError:
+        x, info = cg(A, b, x0=x0, tol=tol, atol=0, maxiter=maxiter, M=M, callback=count)
+    return x, iterations[0]
+
+
+def _topop(Ke, edof, ndof, fixed, F, H, Hs, shape, volfrac, penal, callback, solver, tol, maxiter):
+    """Optimality criteria loop shared by the 2D and 3D topology optimisation.
+
+    The densities are stored per element, in the order of the rows of ``edof``,
+    and reshaped (column-major) to ``shape`` for the callback and the result.
+    """
+    if solver not in ('direct', 'cg', 'amg'):
+        raise ValueError('Unknown solver: {}'.format(solver))
+
+    E = 1.
+    Emin = 10**(-10)
+
+    ne, nd = edof.shape
+    free = array(sorted(set(range(ndof)) - set(fixed)), dtype=int64)
+    nf = len(free)
+    reduced = zeros(ndof, dtype=int64) - 1
+    reduced[free] = arange(nf)
+
+    # The sparsity pattern of the stiffness matrix of the free DOFs is fixed.
+    # The entries of every element stiffness matrix are mapped once to the data array of that matrix,
+    # such that the assembly is reduced to a sparse matrix-vector product with the element stiffnesses.
+
+    iK = reduced[edof[:, :, None].repeat(nd, axis=2)].ravel()
+    jK = reduced[edof[:, None, :].repeat(nd, axis=1)].ravel()
+    eK = arange(ne).repeat(nd * nd)
+    sK = Ke.ravel()[None, :].repeat(ne, axis=0).ravel()
+    mask = (iK >= 0) & (jK >= 0)
+    iK, jK, eK, sK = iK[mask], jK[mask], eK[mask], sK[mask]
+
+    keys, position = unique(iK * nf + jK, return_inverse=True)
+    indices = keys % nf
+    indptr = zeros(nf + 1, dtype=int64)
+    indptr[1:] = (keys // nf).searchsorted(arange(nf), side='right')
+    S = coo_matrix((sK, (position, eK)), shape=(len(keys), ne)).tocsr()
+    del iK, jK, eK, sK, mask
+
+    Ff = F[free]
+    U = zeros(ndof)
+
+    nbytes = 8 * len(keys) + indices.nbytes + indptr.nbytes + S.data.nbytes + S.indices.nbytes + S.indptr.nbytes
+    print('DOFs: {0}  Non-zeros: {1}  Stiffness memory: {2:.4g} MB'.format(nf, len(keys), nbytes / 1e6))
 
     # Main loop
 
@@ -173,27 +382,51 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
     change = 1
     move = 0.2
 
-    x = tile(volfrac, (nely, nelx))
-    xP = x * 1.
-    nones = ones((ne)) * 0.001
+    x = ones(ne) * volfrac
+    nones = ones(ne) * 0.001
+
+    # The multigrid preconditioner of the stiffness matrix of an earlier iteration remains a good preconditioner,
+    # because the sparsity pattern is fixed and the stiffnesses change gradually.
+
+    preconditioner = None
+    age = 0
+    baseline = iterations = 0
 
     while change > 0.1:
 
+        tic = time()
+
         # FE
 
-        xrav = ravel(xP, order='F').transpose()
-        sK = reshape(Ker * (Emin + xrav**penal * (E - Emin)), (64 * ne), order='F')
-        K = coo_matrix((sK, (asarray(iK, dtype=int64), asarray(jK, dtype=int64)))).tocsr()
-        Kind = (K.tocsc()[:, free]).tocsr()[free, :]
-        U[free] = spsolve(Kind, Find)[:, newaxis]
+        stiffness = Emin + x**penal * (E - Emin)
+        K = csr_matrix((S.dot(stiffness), indices, indptr), shape=(nf, nf))
+
+        if solver == 'direct':
+            U[free] = spsolve(K, Ff)
+        elif solver == 'cg':
+            M = diags(1 / K.diagonal())
+            U[free], _ = _cg(K, Ff, U[free], tol, maxiter, M)
+        else:
+            if preconditioner is None or age >= _AMG_REBUILD or iterations > 2 * baseline + 10:
+                try:
+                    from pyamg import smoothed_aggregation_solver
+                except ImportError:
+                    raise ImportError('The amg solver requires pyamg.')
+                ml = smoothed_aggregation_solver(K, symmetry='symmetric')
+                preconditioner = ml.aspreconditioner(cycle='V')
+                age = 0
+            U[free], iterations = _cg(K, Ff, U[free], tol, maxiter, preconditioner)
+            if age == 0:
+                baseline = iterations
+            age += 1
 
         # Objective function
 
-        ce = reshape(sum(dot(squeeze(U[edof]), Ke) * squeeze(U[edof]), 1), (nely, nelx), order='F')
-        c = sum(sum((Emin + xP**penal * (E - Emin)) * ce))
-        dc = -penal * (E - Emin) * xP**(penal - 1) * ce
-        xdc = squeeze(H.dot(ravel(x * dc, order='F')[:, newaxis]))
-        dc = reshape(xdc / Hs / maximum(nones, ravel(x, order='F')), (nely, nelx), order='F')
+        Ue = U[edof]
+        ce = einsum('ij,ij->i', dot(Ue, Ke), Ue)
+        c = sum(stiffness * ce)
+        dc = -penal * (E - Emin) * x**(penal - 1) * ce
+        dc = H.dot(x * dc) / Hs / maximum(nones, x)
 
         # Lagrange mulipliers
 
@@ -203,12 +436,11 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         while (l2 - l1) / (l1 + l2) > 0.001:
 
             lmid = 0.5 * (l2 + l1)
-            sdv = sqrt(-dc / dv / lmid)
+            sdv = sqrt(-dc / lmid)
             min1 = minimum(x + move, x * sdv)
             xn = maximum(0, maximum(x - move, minimum(1, min1)))
-            xP = xn * 1.
 
-            if sum(xP) > volfrac * ne:
+            if sum(xn) > volfrac * ne:
                 l1 = lmid
             else:
                 l2 = lmid
@@ -220,12 +452,12 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         x = xn * 1.
         iteration += 1
 
-        print('Iteration: {0}  Compliance: {1:.4g}'.format(iteration, c))
+        print('Iteration: {0}  Compliance: {1:.4g}  Time: {2:.3g} s'.format(iteration, c, time() - tic))
 
         if callback:
-            callback(x)
+            callback(reshape(x, shape, order='F'))
 
-    return x
+    return reshape(x, shape, order='F')
 
 
 # ==============================================================================
@@ -52,10 +52,19 @@ from __future__ import division
 from __future__ import print_function
 
 import functools
+import hashlib
 import inspect
+import json
+import os
 import pkgutil
+import sys
 import threading
 
+import compas
+import compas._os
+from compas.utilities.instrumentation import call_instrumented
+from compas.utilities.instrumentation import metrics
+
 __all__ = [
     'pluggable',
     'plugin',
@@ -99,12 +108,14 @@ class PluginImpl(object):
         self.method = method
         self.opts = plugin_opts
 
-        if plugin_opts['tryfirst']:
-            self.key = 1
-        elif plugin_opts['trylast']:
-            self.key = 3
-        else:
-            self.key = 2
+    @property
+    def key(self):
+        """Sort key of the plugin implementation, based on its priority."""
+        if self.opts['tryfirst']:
+            return 1
+        if self.opts['trylast']:
+            return 3
+        return 2
 
     @property
     def id(self):
@@ -115,15 +126,132 @@ class PluginImpl(object):
         return '<PluginImpl id={}, plugin_module={}>'.format(self.id, self.plugin)
 
 
+class IndexedPluginImpl(PluginImpl):
+    """Internal data class to keep track of a plugin implementation found in the plugin index.
+
+    The module containing the implementation is imported
+    the first time the module or the method is accessed.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module containing the plugin implementation.
+    method_name : str
+        Name of the method implementing the plugin's behavior.
+    plugin_opts : dict
+        Dictionary containing plugin options.
+    """
+
+    def __init__(self, module_name, method_name, plugin_opts):
+        self.module_name = module_name
+        self.method_name = method_name
+        self.opts = plugin_opts
+
+    def __getattr__(self, name):
+        if name not in ('plugin', 'method'):
+            raise AttributeError(name)
+        self.plugin = __import__(self.module_name, fromlist=['__name__'], level=0)
+        self.method = getattr(self.plugin, self.method_name)
+        return getattr(self, name)
+
+    @property
+    def id(self):
+        """Identifier of the plugin implementation."""
+        return '{}.{}'.format(self.module_name, self.method_name)
+
+    def __repr__(self):
+        return '<IndexedPluginImpl id={}, plugin_module={}>'.format(self.id, self.module_name)
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, IOError):
+        return None
+
+
+def _search_paths():
+    return [os.path.abspath(path or os.curdir) for path in sys.path]
+
+
+def _module_origin(module_name):
+    """Path of the source file of a module, found without importing the module itself."""
+    try:
+        try:
+            from importlib.util import find_spec
+        except ImportError:
+            loader = pkgutil.get_loader(module_name)
+            return loader.get_filename(module_name) if loader else None
+        spec = find_spec(module_name)
+        return spec.origin if spec else None
+    except Exception:
+        return None
+
+
+def _environment_key():
+    """Identifier of the Python interpreter, used to name its plugin index.
+
+    The key does not depend on ``sys.path``, which includes the working directory and the folder of the running script,
+    such that there is one index per interpreter and not one per folder.
+    Changes of the search paths are detected with the fingerprint stored in the index.
+    """
+    text = json.dumps([sys.executable, sys.version])
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _environment_fingerprint():
+    """Fingerprint of the installed packages that may contain plugins.
+
+    The fingerprint changes if a package or distribution with ``compas`` in its name
+    is installed, upgraded or removed in any of the entries of ``sys.path``.
+    """
+    entries = []
+    for path in _search_paths():
+        if not os.path.isdir(path):
+            entries.append([path, None, _mtime(path)])
+            continue
+        try:
+            names = os.listdir(path)
+        except (OSError, IOError):
+            continue
+        for name in sorted(names):
+            if 'compas' in name.lower():
+                entries.append([path, name, _mtime(os.path.join(path, name))])
+    text = json.dumps(entries)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
 class PluginManager(object):
     """Plugin Manager handles discovery and registry of plugins.
 
     Usually there is only one instance of a plugin manager per host.
+
+    Parameters
+    ----------
+    index : bool, optional
+        If ``True``, the plugins found by the discovery are stored in a persistent index,
+        such that subsequent discoveries in the same Python environment
+        do not have to import all packages and plugin modules.
+        Default is ``True``.
+    index_path : str, optional
+        Path of the index file.
+        By default, the index is stored in the ``plugins`` folder of :attr:`compas.APPDATA`,
+        in a file specific to the Python interpreter.
+
+    Notes
+    -----
+    The index is discarded and rebuilt if a package with ``compas`` in its name is installed,
+    upgraded or removed in any of the entries of ``sys.path``,
+    or if any of the modules inspected for plugins, or of the plugin modules that could not be imported, is modified.
+    With a valid index, only the plugin modules of the selected implementations are imported,
+    when they are invoked for the first time.
     """
     DEBUG = False
 
-    def __init__(self):
+    def __init__(self, index=True, index_path=None):
         self.importer = Importer()
+        self.index = index
+        self.index_path = index_path or os.path.join(compas.APPDATA, 'plugins', 'index-{}.json'.format(_environment_key()))
         self._registry = {}
         self._discovery_done = False
         self._discovery_lock = threading.Lock()
@@ -156,44 +284,123 @@ class PluginManager(object):
         # Since we modify global state,
         # let's lock around this.
         with self._discovery_lock:
-            count = 0
-
-            modules = [
-                module_name
-                for _importer, module_name, is_pkg in pkgutil.iter_modules()
-                if is_pkg and module_name.startswith('compas')
-            ]
-
-            modules_to_inspect = dict()
-
-            for module_name in modules:
-                module = self.importer.try_import(module_name)
-                if module:
-                    modules_to_inspect[module_name] = module
-                else:
-                    if self.DEBUG:
-                        print('Error importing module {}, skipping entire package.'.format(module_name))
-                    continue
-
-                if '__all_plugins__' in dir(module):
-                    for plugin_module_name in module.__all_plugins__:
-                        plugin_module = self.importer.try_import(plugin_module_name)
-                        if plugin_module:
-                            modules_to_inspect[plugin_module_name] = plugin_module
-                        else:
-                            if self.DEBUG:
-                                print('Error importing plugin {}, skipping.'.format(plugin_module_name))
+            index = self._read_index() if self.index else None
 
-            if self.DEBUG:
-                print('Will inspect modules: {}'.format(list(modules_to_inspect.keys())))
-
-            for plugin_module in modules_to_inspect.values():
-                count += self.register_module(plugin_module)
+            if index is not None:
+                count = self._register_index(index)
+            else:
+                count = self._discover_plugins()
 
             self._discovery_done = True
 
         return count
 
+    def _discover_plugins(self):
+        modules = [
+            module_name
+            for _importer, module_name, is_pkg in pkgutil.iter_modules()
+            if is_pkg and module_name.startswith('compas')
+        ]
+
+        modules_to_inspect = dict()
+        failed_modules = []
+
+        for module_name in modules:
+            module = self.importer.try_import(module_name)
+            if module:
+                modules_to_inspect[module_name] = module
+            else:
+                failed_modules.append(module_name)
+                if self.DEBUG:
+                    print('Error importing module {}, skipping entire package.'.format(module_name))
+                continue
+
+            if '__all_plugins__' in dir(module):
+                for plugin_module_name in module.__all_plugins__:
+                    plugin_module = self.importer.try_import(plugin_module_name)
+                    if plugin_module:
+                        modules_to_inspect[plugin_module_name] = plugin_module
+                    else:
+                        failed_modules.append(plugin_module_name)
+                        if self.DEBUG:
+                            print('Error importing plugin {}, skipping.'.format(plugin_module_name))
+
+        if self.DEBUG:
+            print('Will inspect modules: {}'.format(list(modules_to_inspect.keys())))
+
+        count = 0
+        plugins = []
+
+        for plugin_module in modules_to_inspect.values():
+            for name, plugin_opts in self._inspect_module(plugin_module):
+                self._register(PluginImpl(plugin_module, getattr(plugin_module, name), plugin_opts))
+                plugins.append([plugin_module.__name__, name, plugin_opts])
+                count += 1
+
+        if self.index:
+            self._write_index(modules_to_inspect.values(), failed_modules, plugins)
+
+        return count
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, IOError, ValueError):
+            return None
+
+        if index.get('fingerprint') != _environment_fingerprint():
+            return None
+
+        for path, mtime in index['files']:
+            if _mtime(path) != mtime:
+                return None
+
+        return index
+
+    def _write_index(self, modules, failed_modules, plugins):
+        paths = [getattr(module, '__file__', None) for module in modules]
+        # the modules that could not be imported are tracked as well,
+        # such that fixing them invalidates the index
+        paths += [_module_origin(module_name) for module_name in failed_modules]
+        files = [[path, _mtime(path)] for path in paths if path]
+
+        index = {
+            'fingerprint': _environment_fingerprint(),
+            'files': files,
+            'plugins': plugins,
+        }
+
+        # the index is an optimization,
+        # discovery still works if it cannot be written
+        try:
+            folder = os.path.dirname(self.index_path)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            temp = '{}.{}.tmp'.format(self.index_path, os.getpid())
+            with open(temp, 'w') as f:
+                json.dump(index, f)
+            compas._os.replace(temp, self.index_path)
+        except (OSError, IOError):
+            if self.DEBUG:
+                print('Error writing plugin index to {}, skipping.'.format(self.index_path))
+
+    def _register_index(self, index):
+        if self.DEBUG:
+            print('Loading plugins from index: {}'.format(self.index_path))
+
+        for module_name, name, plugin_opts in index['plugins']:
+            self._register(IndexedPluginImpl(module_name, name, plugin_opts))
+
+        return len(index['plugins'])
+
+    def clear_index(self):
+        """Remove the plugin index, such that the next discovery inspects all packages again."""
+        try:
+            os.remove(self.index_path)
+        except (OSError, IOError):
+            pass
+
     def register_module(self, plugin_module):
         """Register a module that potentially contains plugin implementations.
 
@@ -209,22 +416,28 @@ class PluginManager(object):
         """
         count = 0
 
+        for name, plugin_opts in self._inspect_module(plugin_module):
+            self._register(PluginImpl(plugin_module, getattr(plugin_module, name), plugin_opts))
+            count += 1
+
+        return count
+
+    def _inspect_module(self, plugin_module):
         # Iterate over the plugin to locate specific @plugin decorated methods
         for name in dir(plugin_module):
             plugin_method = getattr(plugin_module, name)
             plugin_opts = self._parse_plugin_opts(plugin_method)
 
             if plugin_opts is not None:
-                plugin_impl = PluginImpl(plugin_module, plugin_method, plugin_opts)
-                plugins_list = self._registry.setdefault(plugin_opts['extension_point_url'], [])
-                plugins_list.append(plugin_impl)
-                plugins_list.sort(key=lambda p: p.key)
+                yield name, plugin_opts
 
-                if self.DEBUG:
-                    print('Registered plugin with ID "{}" for extension point: {}'.format(plugin_impl.id, plugin_opts['extension_point_url']))
-                count += 1
+    def _register(self, plugin_impl):
+        plugins_list = self._registry.setdefault(plugin_impl.opts['extension_point_url'], [])
+        plugins_list.append(plugin_impl)
+        plugins_list.sort(key=lambda p: p.key)
 
-        return count
+        if self.DEBUG:
+            print('Registered plugin with ID "{}" for extension point: {}'.format(plugin_impl.id, plugin_impl.opts['extension_point_url']))
 
     def _parse_plugin_opts(self, plugin_method):
         if not inspect.isroutine(plugin_method):
@@ -265,6 +478,12 @@ def pluggable(pluggable_method=None, category=None, selector='first_match', doma
         This is useful to avoid name collisions between extension points
         of different packages.
 
+    Notes
+    -----
+    If the metrics registry :obj:`compas.utilities.metrics` is enabled,
+    the latency, argument sizes and errors of the calls are recorded per extension point URL
+    and per selected plugin implementation.
+
     Examples
     --------
     >>> @pluggable(category='triangulation')
@@ -281,6 +500,8 @@ def pluggable(pluggable_method=None, category=None, selector='first_match', doma
                 plugin_impl = _select_plugin(extension_point_url)
 
                 # Invoke plugin
+                if metrics.enabled:
+                    return call_instrumented(metrics, extension_point_url, plugin_impl.id, plugin_impl.method, args, kwargs)
                 return plugin_impl.method(*args, **kwargs)
 
             # Collect all matching plugins
@@ -288,7 +509,10 @@ def pluggable(pluggable_method=None, category=None, selector='first_match', doma
                 results = []
 
                 for plugin_impl in _collect_plugins(extension_point_url):
-                    results.append(plugin_impl.method(*args, **kwargs))
+                    if metrics.enabled:
+                        results.append(call_instrumented(metrics, extension_point_url, plugin_impl.id, plugin_impl.method, args, kwargs))
+                    else:
+                        results.append(plugin_impl.method(*args, **kwargs))
 
                 return results
             else:
@@ -419,6 +643,12 @@ def is_plugin_selectable(plugin, manager):
                 print('Requirements not satisfied. Plugin will not be used: {}'.format(plugin.id))
             return False
 
+    # with an index, the plugin module is imported only once the plugin is considered
+    if isinstance(plugin, IndexedPluginImpl) and not manager.importer.check_importable(plugin.module_name):
+        if manager.DEBUG:
+            print('Error importing plugin module. Plugin will not be used: {}'.format(plugin.id))
+        return False
+
     return True
 
 
@@ -95,6 +95,18 @@ The joint describes the kinematics and dynamics of the robot's joint.
     Mimic
     SafetyController
 
+Kinematics
+==========
+
+The kinematic tree of a robot model can be compiled into an array-based chain,
+to compute the forward kinematics of many joint states at once.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    KinematicChain
+
 Resources
 =========
 
@@ -111,6 +123,7 @@ the processing of these resources.
     DefaultMeshLoader
     GithubPackageMeshLoader
     LocalPackageMeshLoader
+    CachedMeshLoader
 
 """
 
@@ -67,6 +67,13 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
     ----------
     model : :class:`compas.robots.RobotModel`
         Instance of a robot model.
+
+    Notes
+    -----
+    The artist keeps track of the joint positions and transformations of the last update.
+    On every update, only the transformations of joints whose position changed,
+    and of the joints downstream of them, are recomputed,
+    and only the geometry of the links attached to those joints is transformed.
     """
 
     def __init__(self, model):
@@ -75,6 +82,7 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
         self.create()
         self.scale_factor = 1.
         self.attached_tool_model = None
+        self._states = {}
 
     def attach_tool_model(self, tool_model):
         """Attach a tool to the robot artist.
@@ -86,6 +94,7 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
         """
         self.attached_tool_model = tool_model
         self.create(tool_model.root, 'attached_tool')
+        self._states.pop(id(tool_model), None)
 
         if not tool_model.link_name:
             link = self.model.get_end_effector_link()
@@ -112,6 +121,8 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
     def detach_tool_model(self):
         """Detach the tool.
         """
+        if self.attached_tool_model:
+            self._states.pop(id(self.attached_tool_model), None)
         self.attached_tool_model = None
 
     def create(self, link=None, context=None):
@@ -175,6 +186,7 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
         None
         """
         self.model.scale(factor)
+        self._states = {}
 
         relative_factor = factor / self.scale_factor
         transformation = Scale.from_factors([relative_factor] * 3)
@@ -236,15 +248,76 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
             ``True`` if the collision geometry should be also updated, otherwise ``False``.
             Defaults to ``True``.
         """
-        _ = self._update(self.model, joint_state, visual, collision)
+        transformations = self._update(self.model, joint_state, visual, collision)
         if self.attached_tool_model:
-            frame = self.model.forward_kinematics(joint_state, link_name=self.attached_tool_model.link_name)
-            self.update_tool(visual=visual, collision=collision, transformation=Transformation.from_frame_to_frame(Frame.worldXY(), frame))
+            link = self.model.get_link_by_name(self.attached_tool_model.link_name)
+            joint = link.parent_joint
+            frame = joint.origin.transformed(transformations[joint.name]) if joint else Frame.worldXY()
+            transformation = Transformation.from_frame_to_frame(Frame.worldXY(), frame)
+            state = self._states.get(id(self.attached_tool_model))
+            if (state is None or
+                    (collision and not state['collision']) or
+                    transformation.matrix != self.attached_tool_model.current_transformation.matrix):
+                self.update_tool(visual=visual, collision=collision, transformation=transformation)
+
+    @staticmethod
+    def _joint_positions(joints, joint_state):
+        # the position of every joint as used by compute_transformations,
+        # or None if the joint keeps its initial position
+        positions = {}
+        for joint in joints:
+            if joint.name in joint_state:
+                positions[joint.name] = joint_state[joint.name]
+            elif joint.mimic and joint.mimic.joint in joint_state:
+                positions[joint.name] = joint.mimic.calculate_position(joint_state[joint.mimic.joint])
+            else:
+                positions[joint.name] = None
+        return positions
 
     def _update(self, model, joint_state, visual=True, collision=True, parent_transformation=None):
-        transformations = model.compute_transformations(joint_state, parent_transformation=parent_transformation)
-        for j in model.iter_joints():
-            self._transform_link_geometry(j.child_link, transformations[j.name], collision)
+        if parent_transformation is None:
+            parent_transformation = Transformation()
+
+        state = self._states.get(id(model))
+        full = (state is None or
+                (collision and not state['collision']) or
+                state['parent'].matrix != parent_transformation.matrix)
+        if full:
+            joints = list(model.iter_joints())
+            parents = {}
+            for joint in joints:
+                parent_link = model.get_link_by_name(joint.parent.link)
+                parents[joint.name] = parent_link.parent_joint.name if parent_link and parent_link.parent_joint else None
+            state = {'joints': joints, 'parents': parents, 'positions': {}, 'transformations': {}}
+
+        positions = self._joint_positions(state['joints'], joint_state)
+        transformations = {}
+        changed = set()
+        order = []
+
+        # joints come after their parents,
+        # such that a change propagates to the entire subtree of a joint
+        for joint in state['joints']:
+            parent = state['parents'][joint.name]
+            position = positions[joint.name]
+            if full or parent in changed or position != state['positions'].get(joint.name):
+                transformation = transformations[parent] if parent else parent_transformation
+                if position is not None:
+                    transformation = transformation * joint.calculate_transformation(position)
+                changed.add(joint.name)
+                order.append(joint.name)
+            else:
+                transformation = state['transformations'][joint.name]
+            transformations[joint.name] = transformation
+
+        for name in order:
+            self._transform_link_geometry(model.get_joint_by_name(name).child_link, transformations[name], collision)
+
+        state.update({'positions': positions,
+                      'transformations': transformations,
+                      'parent': parent_transformation,
+                      'collision': collision})
+        self._states[id(model)] = state
         return transformations
 
     def _transform_link_geometry(self, link, transformation, collision=True):
@@ -306,3 +379,59 @@ class BaseRobotModelArtist(AbstractRobotModelArtist):
                 if item.native_geometry:
                     for native_geometry in item.native_geometry:
                         yield native_geometry
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import math
+    import os
+    import time
+
+    import compas
+    from compas.datastructures import Mesh
+    from compas.geometry import Box
+    from compas.robots import RobotModel
+
+    class MeshArtist(BaseRobotModelArtist):
+
+        def draw_geometry(self, geometry, name=None, color=None):
+            return geometry.copy()
+
+        def transform(self, geometry, transformation):
+            geometry.transform(transformation)
+
+    model = RobotModel.from_urdf_file(os.path.join(compas.HERE, '..', '..', 'tests', 'compas', 'robots', 'fixtures', 'ur5.xacro'))
+    box = Mesh.from_shape(Box(Frame.worldXY(), 0.1, 0.1, 0.1))
+    box = box.subdivide(k=2)
+    for link in model.links:
+        for item in itertools.chain(link.visual, link.collision):
+            item.geometry.shape.geometry = box
+
+    names = model.get_configurable_joint_names()
+    # a trajectory in which every joint moves in turn, as in a jogging preview
+    trajectory = []
+    for i in range(len(names)):
+        for k in range(50):
+            values = [0.0] * len(names)
+            for j in range(i):
+                values[j] = 1.0
+            values[i] = math.sin(k / 50. * math.pi / 2)
+            trajectory.append(dict(zip(names, values)))
+
+    artist = MeshArtist(model)
+
+    t0 = time.time()
+    for joint_state in trajectory:
+        artist._states = {}
+        artist.update(joint_state)
+    t1 = time.time()
+    for joint_state in trajectory:
+        artist.update(joint_state)
+    t2 = time.time()
+
+    print('full updates:        {:.1f} frames/s'.format(len(trajectory) / (t1 - t0)))
+    print('incremental updates: {:.1f} frames/s'.format(len(trajectory) / (t2 - t1)))
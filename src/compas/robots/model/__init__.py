@@ -2,10 +2,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 from .geometry import *  # noqa: F401 F403
 from .joint import *  # noqa: F401 F403
 from .link import *  # noqa: F401 F403
 from .robot import *  # noqa: F401 F403
 from .tool import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .kinematics_numpy import *  # noqa: F401 F403
+
 __all__ = [name for name in dir() if not name.startswith('_')]
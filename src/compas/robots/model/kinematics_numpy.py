@@ -0,0 +1,478 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+from numpy import arange
+from numpy import arccos
+from numpy import array
+from numpy import asarray
+from numpy import cos
+from numpy import cross
+from numpy import empty
+from numpy import eye
+from numpy import inf
+from numpy import isfinite
+from numpy import matmul
+from numpy import sin
+from numpy import sqrt
+from numpy import stack
+from numpy import where
+from numpy import zeros
+from numpy.linalg import norm
+from numpy.linalg import solve
+
+from compas.geometry import Transformation
+from compas.robots.model.joint import Joint
+
+
+__all__ = ['KinematicChain']
+
+
+class KinematicChain(object):
+    """Compiled, array-based representation of the kinematic tree of a robot model.
+
+    The chain stores the joints of the model in a flat order in which every joint
+    comes after its parent joint, together with their fixed origin matrices,
+    rotation axes and limits, such that the forward kinematics of many joint states
+    can be computed at once with NumPy.
+
+    Parameters
+    ----------
+    model : :class:`compas.robots.RobotModel`
+        The robot model.
+    joint_names : list of str, optional
+        The names of the joints whose values are provided to the chain, in the order
+        of the columns of the arrays of joint values.
+        Default is the names of the configurable joints of the model.
+
+    Attributes
+    ----------
+    joint_names : list of str
+        The names of the joints corresponding to the columns of the arrays of joint values.
+    link_names : list of str
+        The names of the links, in the order of :meth:`RobotModel.iter_links`.
+    lower : array
+        The lower limits of the joint values.
+    upper : array
+        The upper limits of the joint values.
+
+    Notes
+    -----
+    The joint values are interpreted as by :meth:`RobotModel.compute_transformations`:
+    the values of revolute and prismatic joints are clamped to their limits,
+    mimicking joints that are not in ``joint_names`` follow the joint they mimic,
+    and all other joints remain in their initial position.
+
+    Examples
+    --------
+    >>> from compas.geometry import Frame
+    >>> from compas.robots import Joint
+    >>> from compas.robots import RobotModel
+    >>> robot = RobotModel('robot')
+    >>> link0 = robot.add_link('link0')
+    >>> link1 = robot.add_link('link1')
+    >>> joint = robot.add_joint('joint1', Joint.CONTINUOUS, link0, link1, Frame([1, 0, 0], [1, 0, 0], [0, 1, 0]), (0, 0, 1))
+    >>> chain = KinematicChain(robot)
+    >>> frames = chain.forward_kinematics([[0.0], [1.57], [3.14]])
+    >>> frames.shape
+    (3, 2, 4, 4)
+
+    """
+
+    def __init__(self, model, joint_names=None):
+        if joint_names is None:
+            joint_names = model.get_configurable_joint_names()
+        self.joint_names = list(joint_names)
+        self._compile(model)
+
+    def _compile(self, model):
+        column = {name: i for i, name in enumerate(self.joint_names)}
+        joints = list(model.iter_joints())
+        links = list(model.iter_links())
+        index = {joint.name: i for i, joint in enumerate(joints)}
+
+        for name in self.joint_names:
+            if name not in index:
+                raise ValueError('Joint not found in the model: {}'.format(name))
+
+        n = len(joints)
+        self._names = [joint.name for joint in joints]
+        self._types = [joint.type for joint in joints]
+        self._parents = [-1] * n
+        self._columns = [-1] * n
+        self._multipliers = [1.0] * n
+        self._offsets = [0.0] * n
+        self._origins = zeros((n, 4, 4))
+        self._axes = zeros((n, 3))
+        self._points = zeros((n, 3))
+        self._lower = zeros(n) - inf
+        self._upper = zeros(n) + inf
+
+        for i, joint in enumerate(joints):
+            parent_link = model.get_link_by_name(joint.parent.link)
+            if parent_link is not None and parent_link.parent_joint:
+                self._parents[i] = index[parent_link.parent_joint.name]
+
+            if joint.name in column:
+                self._columns[i] = column[joint.name]
+            elif joint.mimic and joint.mimic.joint in column:
+                self._columns[i] = column[joint.mimic.joint]
+                self._multipliers[i] = joint.mimic.multiplier
+                self._offsets[i] = joint.mimic.offset
+
+            self._origins[i] = Transformation.from_frame(joint.origin).matrix
+            self._points[i] = joint.origin.point
+            axis = array(joint.axis.vector, dtype=float)
+            if joint.type != Joint.PRISMATIC:
+                length = (axis ** 2).sum() ** 0.5
+                if length:
+                    axis /= length
+            self._axes[i] = axis
+
+            if self._columns[i] < 0:
+                continue
+            if joint.type in (Joint.FLOATING, Joint.PLANAR):
+                raise NotImplementedError('Joint type not supported: {}'.format(Joint.SUPPORTED_TYPES[joint.type]))
+            if joint.type in (Joint.REVOLUTE, Joint.PRISMATIC):
+                if not joint.limit:
+                    raise ValueError('Revolute and prismatic joints are required to define a limit: {}'.format(joint.name))
+                self._lower[i] = joint.limit.lower
+                self._upper[i] = joint.limit.upper
+
+        self.link_names = [link.name for link in links]
+        # the joint whose transformation moves a link
+        self._link_joints = [index[link.parent_joint.name] if link.parent_joint else -1 for link in links]
+
+        self.lower = zeros(len(self.joint_names)) - inf
+        self.upper = zeros(len(self.joint_names)) + inf
+        for i, name in enumerate(self._names):
+            if name in column:
+                self.lower[column[name]] = self._lower[i]
+                self.upper[column[name]] = self._upper[i]
+
+    @property
+    def dof(self):
+        """int : The number of joint values per state."""
+        return len(self.joint_names)
+
+    def _positions(self, values, i):
+        positions = values[:, self._columns[i]] * self._multipliers[i] + self._offsets[i]
+        if self._lower[i] > -inf or self._upper[i] < inf:
+            positions = positions.clip(self._lower[i], self._upper[i])
+        return positions
+
+    def _motion(self, values, i):
+        # the transformation of a joint for all states
+        # as a rotation about or a translation along the axis in the initial position of the joint
+        num = values.shape[0]
+        M = empty((num, 4, 4))
+        M[:] = eye(4)
+        joint_type = self._types[i]
+        if self._columns[i] < 0 or joint_type == Joint.FIXED:
+            return M
+        positions = self._positions(values, i)
+        u = self._axes[i]
+        if joint_type == Joint.PRISMATIC:
+            M[:, :3, 3] = positions[:, None] * u
+            return M
+        c = cos(positions)[:, None, None]
+        s = sin(positions)[:, None, None]
+        K = array([[0.0, -u[2], u[1]], [u[2], 0.0, -u[0]], [-u[1], u[0], 0.0]])
+        R = c * eye(3) + s * K + (1 - c) * array([u]).T.dot([u])
+        M[:, :3, :3] = R
+        M[:, :3, 3] = self._points[i] - matmul(R, self._points[i])
+        return M
+
+    def _values(self, joint_values):
+        values = asarray(joint_values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape((1, -1))
+        if values.shape[1] != self.dof:
+            raise ValueError('Expected {} joint values per state, got {}.'.format(self.dof, values.shape[1]))
+        return values
+
+    def joint_transformations(self, joint_values):
+        """Compute the transformations of all joints for many joint states.
+
+        Parameters
+        ----------
+        joint_values : array-like
+            The joint values, with shape ``(N, dof)``.
+
+        Returns
+        -------
+        array
+            The transformations of the joints, with shape ``(N, joints, 4, 4)``,
+            in the order of :meth:`RobotModel.iter_joints`.
+            These are the transformations returned by :meth:`RobotModel.compute_transformations`.
+
+        """
+        values = self._values(joint_values)
+        return self._transformations(values, range(len(self._names)))
+
+    def _transformations(self, values, joints):
+        # the joints should be closed under the parent relation and in topological order
+        T = empty((values.shape[0], len(self._names), 4, 4))
+        for i in joints:
+            M = self._motion(values, i)
+            parent = self._parents[i]
+            T[:, i] = M if parent < 0 else matmul(T[:, parent], M)
+        return T
+
+    def _path(self, link_name):
+        # the joints from the root to a link
+        if link_name not in self.link_names:
+            raise ValueError('Link not found in the model: {}'.format(link_name))
+        i = self._link_joints[self.link_names.index(link_name)]
+        path = []
+        while i >= 0:
+            path.append(i)
+            i = self._parents[i]
+        return path[::-1]
+
+    def _link_frames(self, T, path):
+        if not path:
+            F = empty((T.shape[0], 4, 4))
+            F[:] = eye(4)
+            return F
+        return matmul(T[:, path[-1]], self._origins[path[-1]])
+
+    def _jacobian(self, values, T, F, path):
+        J = zeros((values.shape[0], 6, self.dof))
+        end = F[:, :3, 3]
+        for i in path:
+            column = self._columns[i]
+            joint_type = self._types[i]
+            if column < 0 or joint_type == Joint.FIXED:
+                continue
+            # the axis and the point of the joint in the current configuration
+            axis = matmul(T[:, i, :3, :3], self._axes[i]) * self._multipliers[i]
+            if joint_type == Joint.PRISMATIC:
+                J[:, :3, column] += axis
+                continue
+            point = matmul(T[:, i, :3, :3], self._points[i]) + T[:, i, :3, 3]
+            J[:, :3, column] += cross(axis, end - point)
+            J[:, 3:, column] += axis
+        return J
+
+    def jacobian(self, joint_values, link_name):
+        """Compute the geometric Jacobian of a link for many joint states.
+
+        Parameters
+        ----------
+        joint_values : array-like
+            The joint values, with shape ``(N, dof)``.
+        link_name : str
+            The name of the link.
+
+        Returns
+        -------
+        array
+            The Jacobians, with shape ``(N, 6, dof)``.
+            The first three rows map joint velocities to the linear velocity of the origin
+            of the link frame, the last three rows to the angular velocity of the link,
+            both in the world coordinate system.
+
+        Notes
+        -----
+        Only the joints on the chain from the root to the link contribute to the Jacobian.
+        The columns of mimicking joints are added to the column of the joint they mimic,
+        scaled by the multiplier.
+
+        """
+        values = self._values(joint_values)
+        path = self._path(link_name)
+        T = self._transformations(values, path)
+        return self._jacobian(values, T, self._link_frames(T, path), path)
+
+    def inverse_kinematics(self, targets, link_name, initial=None, position_only=False, damping=1e-1, tol=1e-6, maxiter=100):
+        """Compute joint values that bring a link to many target frames at once.
+
+        Parameters
+        ----------
+        targets : array-like
+            The target frames of the link as 4x4 matrices, with shape ``(N, 4, 4)``.
+        link_name : str
+            The name of the link.
+        initial : array-like, optional
+            The initial joint values, with shape ``(N, dof)`` or ``(dof, )``.
+            Defaults to the middle of the joint limits, or zero for unlimited joints.
+        position_only : bool, optional
+            If ``True``, only the position of the link frame is matched.
+            Default is ``False``.
+        damping : float, optional
+            The initial damping factor of the least-squares steps.
+            Default is ``1e-1``.
+        tol : float, optional
+            The tolerance for the norm of the position (and orientation) error.
+            Default is ``1e-6``.
+        maxiter : int, optional
+            The maximum number of iterations.
+            Default is ``100``.
+
+        Returns
+        -------
+        tuple
+            * The joint values, with shape ``(N, dof)``.
+            * A boolean array indicating for every target if the solver converged.
+            * A dict with the number of iterations (``'iterations'``) and the remaining error (``'error'``)
+              per target, the total computation time in seconds (``'time'``),
+              and the average time per target (``'time_per_solve'``).
+
+        Notes
+        -----
+        The solver uses damped least-squares steps,
+        :math:`\\Delta q = J^T (J J^T + \\lambda^2 I)^{-1} e`,
+        with the error :math:`e` composed of the position difference and the rotation vector
+        of the difference in orientation.
+        After every step, the joint values are clamped to the limits of the joints.
+        The damping is adapted per target: it is decreased after a step that reduces the error,
+        and increased after a step that does not, in which case the step is discarded.
+        All targets are solved simultaneously, and targets are removed from the computation once they converged.
+
+        """
+        t0 = time.time()
+        targets = asarray(targets, dtype=float).reshape((-1, 4, 4))
+        num = targets.shape[0]
+        path = self._path(link_name)
+
+        if initial is None:
+            initial = where(isfinite(self.lower) & isfinite(self.upper), 0.5 * (self.lower + self.upper), 0.0)
+        values = empty((num, self.dof))
+        values[:] = initial
+        values = values.clip(self.lower, self.upper)
+
+        rows = 3 if position_only else 6
+        accepted = values.copy()
+        best = zeros(num) + inf
+        lambdas = zeros(num) + damping
+        E = zeros((num, rows))
+        J = zeros((num, rows, self.dof))
+        success = zeros(num, dtype=bool)
+        iterations = zeros(num, dtype=int)
+        active = arange(num)
+
+        for k in range(maxiter + 1):
+            q = values[active]
+            T = self._transformations(q, path)
+            F = self._link_frames(T, path)
+            e = empty((len(active), rows))
+            e[:, :3] = targets[active, :3, 3] - F[:, :3, 3]
+            if not position_only:
+                e[:, 3:] = _rotation_vectors(matmul(targets[active, :3, :3], F[:, :3, :3].transpose((0, 2, 1))))
+            norms = norm(e, axis=1)
+            # accept the steps that reduce the error and relax their damping,
+            # retry the others from the last accepted values with more damping
+            better = norms < best[active]
+            i = active[better]
+            accepted[i] = q[better]
+            best[i] = norms[better]
+            E[i] = e[better]
+            J[i] = self._jacobian(q[better], T[better], F[better], path)[:, :rows]
+            lambdas[i] *= 0.5
+            lambdas[active[~better]] *= 4.0
+            iterations[active] = k
+            done = best[active] <= tol
+            success[active[done]] = True
+            active = active[~done]
+            if k == maxiter or not len(active):
+                break
+            Ja = J[active]
+            JT = Ja.transpose((0, 2, 1))
+            A = matmul(Ja, JT) + (lambdas[active] ** 2)[:, None, None] * eye(rows)
+            dq = matmul(JT, solve(A, E[active][:, :, None]))[:, :, 0]
+            values[active] = (accepted[active] + dq).clip(self.lower, self.upper)
+
+        values = accepted
+        error = best
+        elapsed = time.time() - t0
+        info = {
+            'iterations': iterations,
+            'error': error,
+            'time': elapsed,
+            'time_per_solve': elapsed / max(num, 1),
+        }
+        return values, success, info
+
+    def forward_kinematics(self, joint_values, link_name=None):
+        """Compute the frames of the links for many joint states.
+
+        Parameters
+        ----------
+        joint_values : array-like
+            The joint values, with shape ``(N, dof)``.
+        link_name : str, optional
+            Compute only the frame of this link.
+
+        Returns
+        -------
+        array
+            The frames of the links in the world coordinate system, as 4x4 matrices,
+            with shape ``(N, links, 4, 4)`` in the order of :attr:`link_names`,
+            or with shape ``(N, 4, 4)`` if a link name is provided.
+
+        """
+        if link_name is not None:
+            values = self._values(joint_values)
+            path = self._path(link_name)
+            return self._link_frames(self._transformations(values, path), path)
+        T = self.joint_transformations(joint_values)
+        F = empty((T.shape[0], len(self._link_joints), 4, 4))
+        for k, i in enumerate(self._link_joints):
+            F[:, k] = eye(4) if i < 0 else matmul(T[:, i], self._origins[i])
+        return F
+
+
+def _rotation_vectors(R):
+    # the rotation vectors (axis times angle) of a stack of rotation matrices
+    w = stack([R[:, 2, 1] - R[:, 1, 2], R[:, 0, 2] - R[:, 2, 0], R[:, 1, 0] - R[:, 0, 1]], axis=1)
+    c = ((R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2] - 1) * 0.5).clip(-1.0, 1.0)
+    angles = arccos(c)
+    s = sin(angles)
+    scale = empty(len(R))
+    small = s < 1e-6
+    scale[~small] = angles[~small] / (2 * s[~small])
+    scale[small] = 0.5
+    w *= scale[:, None]
+    # near a half turn, R = 2 u u^T - I
+    for k in where(small & (c < 0))[0]:
+        i = R[k].diagonal().argmax()
+        u = (R[k, i] + R[k, :, i]) / 2.0
+        u[i] = R[k, i, i] + 1.0
+        w[k] = u / sqrt(2.0 * (R[k, i, i] + 1.0)) * angles[k]
+    return w
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import os
+    import numpy
+
+    import compas
+    from compas.robots import RobotModel
+
+    model = RobotModel.from_urdf_file(os.path.join(compas.HERE, '..', '..', 'tests', 'compas', 'robots', 'fixtures', 'ur5.xacro'))
+    names = model.get_configurable_joint_names()
+    values = numpy.random.uniform(-3.14, 3.14, (100000, len(names)))
+
+    t0 = time.time()
+    for state in values[:1000]:
+        model.compute_transformations(dict(zip(names, state)))
+    t1 = time.time()
+    chain = KinematicChain(model)
+    frames = chain.forward_kinematics(values)
+    t2 = time.time()
+
+    print('per state: {:.1f} states/s'.format(1000 / (t1 - t0)))
+    print('batched:   {:.1f} states/s'.format(len(values) / (t2 - t1)))
+
+    targets = frames[:1000, chain.link_names.index('tool0')]
+    initial = values[:1000] + numpy.random.uniform(-0.5, 0.5, (1000, len(names)))
+    result, success, info = chain.inverse_kinematics(targets, 'tool0', initial=initial)
+    print('ik: {} of {} solved, {:.3f} ms per target'.format(success.sum(), len(targets), 1000 * info['time_per_solve']))
@@ -4,6 +4,7 @@ from __future__ import print_function
 
 import itertools
 import json
+from collections import OrderedDict
 
 from compas.base import Base
 from compas.files import URDF
@@ -24,6 +25,7 @@ from compas.robots.model.joint import Limit
 from compas.robots.model.link import Collision
 from compas.robots.model.link import Link
 from compas.robots.model.link import Visual
+from compas.robots.resources import CachedMeshLoader
 from compas.robots.resources import DefaultMeshLoader
 from compas.topology import shortest_path
 
@@ -138,6 +140,7 @@ class RobotModel(Base):
         self._adjacency = dict()
         self._links = dict()
         self._joints = dict()
+        self._kinematic_chains = dict()
 
         for link in self.links:
             link.joints = self.find_children_joints(link)
@@ -527,7 +530,18 @@ class RobotModel(Base):
         force: boolean
             True if it should force reloading even if the geometry
             has been loaded already, otherwise False.
+        cache: boolean or str
+            True to cache the loaded meshes in the default on-disk cache,
+            or the path of the cache directory, see :class:`compas.robots.CachedMeshLoader`.
+            Defaults to False.
+        num_workers: int
+            The number of threads used to load the meshes.
+            Defaults to 1.
 
+        Notes
+        -----
+        Every file is loaded only once, and all elements that refer to the same file
+        share the same mesh instance.
 
         Examples
         --------
@@ -537,22 +551,39 @@ class RobotModel(Base):
         >>> model.load_geometry(loader)
         """
         force = kwargs.get('force', False)
+        cache = kwargs.get('cache', False)
+        num_workers = kwargs.get('num_workers', 1)
 
         loaders = list(resource_loaders)
         loaders.insert(0, DefaultMeshLoader())
+        if cache:
+            loaders = [CachedMeshLoader(*loaders, cache_dir=None if cache is True else cache)]
 
+        shapes = []
         for link in self.links:
             for element in itertools.chain(link.collision, link.visual):
                 shape = element.geometry.shape
                 needs_reload = force or not shape.geometry
                 if 'filename' in dir(shape) and needs_reload:
-                    for loader in loaders:
-                        if loader.can_load_mesh(shape.filename):
-                            shape.geometry = loader.load_mesh(shape.filename)
-                            break
+                    shapes.append(shape)
+
+        def load(filename):
+            for loader in loaders:
+                if loader.can_load_mesh(filename):
+                    return loader.load_mesh(filename)
+
+        filenames = list(OrderedDict.fromkeys(shape.filename for shape in shapes))
+        if num_workers and num_workers > 1 and len(filenames) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                meshes = dict(zip(filenames, executor.map(load, filenames)))
+        else:
+            meshes = {filename: load(filename) for filename in filenames}
 
-                    if not shape.geometry:
-                        raise Exception('Unable to load geometry for {}'.format(shape.filename))
+        for shape in shapes:
+            shape.geometry = meshes[shape.filename]
+            if not shape.geometry:
+                raise Exception('Unable to load geometry for {}'.format(shape.filename))
 
     @property
     def frames(self):
@@ -638,6 +669,7 @@ class RobotModel(Base):
         if not link or link == self.root:
             link = self.root
             relative_factor = factor / self._scale_factor  # relative scaling factor
+            self._kinematic_chains = dict()
         else:
             relative_factor = factor
 
@@ -780,6 +812,159 @@ class RobotModel(Base):
         else:
             return Frame.worldXY()  # if we ask forward from base link
 
+    def compile_kinematics(self, joint_names=None):
+        """Compile the kinematic tree of the robot into an array-based chain.
+
+        Parameters
+        ----------
+        joint_names : list of str, optional
+            The names of the joints whose values are provided to the chain.
+            Defaults to the names of the configurable joints.
+
+        Returns
+        -------
+        :class:`compas.robots.KinematicChain`
+            The compiled chain.
+
+        Notes
+        -----
+        The chain is cached on the model, and recompiled only when the model is scaled
+        or joints are added.
+
+        Examples
+        --------
+        >>> chain = robot.compile_kinematics()
+        >>> chain.joint_names
+        ['joint1', 'joint2']
+        """
+        from compas.robots.model.kinematics_numpy import KinematicChain
+
+        if joint_names is None:
+            joint_names = self.get_configurable_joint_names()
+        key = tuple(joint_names)
+        if key not in self._kinematic_chains:
+            self._kinematic_chains[key] = KinematicChain(self, joint_names)
+        return self._kinematic_chains[key]
+
+    def batch_forward_kinematics(self, joint_values, link_name=None, joint_names=None):
+        """Calculate the robot's forward kinematics for many joint states at once.
+
+        Parameters
+        ----------
+        joint_values : array-like
+            The joint values in radians and meters (depending on the joint type),
+            with shape ``(N, dof)``, and the columns in the order of ``joint_names``.
+        link_name : str, optional
+            The name of the link we want to calculate the forward kinematics for.
+            Defaults to all links.
+        joint_names : list of str, optional
+            The names of the joints corresponding to the columns of ``joint_values``.
+            Defaults to the names of the configurable joints.
+
+        Returns
+        -------
+        array
+            The frames of all links in the world coordinate system as 4x4 matrices,
+            with shape ``(N, links, 4, 4)`` and the links in the order of :meth:`iter_links`,
+            or the frames of the given link with shape ``(N, 4, 4)``.
+
+        Notes
+        -----
+        This requires NumPy and gives the same results as :meth:`forward_kinematics`
+        for every joint state.
+
+        Examples
+        --------
+        >>> frames = robot.batch_forward_kinematics([[1.2, 0.5], [0.0, 0.0], [0.0, 0.5]])
+        >>> frames.shape
+        (3, 3, 4, 4)
+        """
+        chain = self.compile_kinematics(joint_names)
+        return chain.forward_kinematics(joint_values, link_name=link_name)
+
+    def jacobian(self, joint_values, link_name=None, joint_names=None):
+        """Calculate the geometric Jacobian of a link for many joint states at once.
+
+        Parameters
+        ----------
+        joint_values : array-like
+            The joint values, with shape ``(N, dof)``, and the columns in the order of ``joint_names``.
+        link_name : str, optional
+            The name of the link.
+            Defaults to the end-effector link name.
+        joint_names : list of str, optional
+            The names of the joints corresponding to the columns of ``joint_values``.
+            Defaults to the names of the configurable joints.
+
+        Returns
+        -------
+        array
+            The Jacobians, with shape ``(N, 6, dof)``.
+            The first three rows give the linear velocity of the origin of the link frame,
+            the last three rows the angular velocity of the link.
+
+        Examples
+        --------
+        >>> J = robot.jacobian([[1.2, 0.5]])
+        >>> J.shape
+        (1, 6, 2)
+        """
+        if link_name is None:
+            link_name = self.get_end_effector_link_name()
+        chain = self.compile_kinematics(joint_names)
+        return chain.jacobian(joint_values, link_name)
+
+    def inverse_kinematics(self, targets, link_name=None, joint_names=None, initial=None, **kwargs):
+        """Calculate joint values that bring a link to many target frames at once.
+
+        Parameters
+        ----------
+        targets : list of :class:`Frame` or array-like
+            The target frames in the world coordinate system, or the corresponding 4x4 matrices.
+        link_name : str, optional
+            The name of the link.
+            Defaults to the end-effector link name.
+        joint_names : list of str, optional
+            The names of the joints to solve for.
+            Defaults to the names of the configurable joints.
+        initial : array-like, optional
+            The initial joint values, with shape ``(N, dof)`` or ``(dof, )``.
+            Defaults to the middle of the joint limits.
+
+        Other Parameters
+        ----------------
+        position_only : bool, optional
+            Only match the position of the link frame.
+        damping : float, optional
+            The damping factor of the least-squares steps.
+        tol : float, optional
+            The tolerance for the error.
+        maxiter : int, optional
+            The maximum number of iterations.
+
+        Returns
+        -------
+        tuple
+            The joint values with shape ``(N, dof)``, a boolean array indicating convergence per target,
+            and a dict with the iterations, errors and timing of the solves.
+
+        See Also
+        --------
+        :meth:`compas.robots.KinematicChain.inverse_kinematics`
+
+        Examples
+        --------
+        >>> frame = robot.forward_kinematics({'joint1': 1.2, 'joint2': 0.5})
+        >>> values, success, info = robot.inverse_kinematics([frame])
+        >>> success.all()
+        True
+        """
+        if link_name is None:
+            link_name = self.get_end_effector_link_name()
+        targets = [Transformation.from_frame(target).matrix if isinstance(target, Frame) else target for target in targets]
+        chain = self.compile_kinematics(joint_names)
+        return chain.inverse_kinematics(targets, link_name, initial=initial, **kwargs)
+
     @staticmethod
     def _consolidate_meshes(meshes, key, **kwargs):
         meshes = meshes or []
@@ -922,6 +1107,7 @@ class RobotModel(Base):
         joint.child_link = child_link
         self._joints[joint.name] = joint
         self._adjacency[joint.name] = [child_link.name]
+        self._kinematic_chains = dict()
 
         # Using only part of self._create(link, parent_transformation)
         parent_transformation = Transformation()
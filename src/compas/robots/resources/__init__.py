@@ -4,5 +4,6 @@ from __future__ import print_function
 
 from .basic import *  # noqa: F401 F403
 from .github import *  # noqa: F401 F403
+from .cached import *  # noqa: F401 F403
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -38,6 +38,21 @@ class AbstractMeshLoader(object):
         """
         return NotImplementedError
 
+    def resolve_url(self, url):
+        """Resolve a mesh URL to the location from which the mesh is actually loaded.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+            A local file path or a remote URL.
+        """
+        return url
+
     def load_mesh(self, url):
         """Load the mesh from the given URL.
 
@@ -115,6 +130,21 @@ class DefaultMeshLoader(AbstractMeshLoader):
         url = self._get_mesh_url(url)
         return _mesh_import(url, url)
 
+    def resolve_url(self, url):
+        """Resolve a mesh URL to the location from which the mesh is actually loaded.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+            The URL, extended with the base path if defined in the keyword arguments.
+        """
+        return self._get_mesh_url(url)
+
     def _get_mesh_url(self, url):
         """Concatenates basepath directory to URL only if defined in the keyword arguments.
         It also strips out the scheme 'file:///' from the URL if present.
@@ -231,6 +261,21 @@ class LocalPackageMeshLoader(AbstractMeshLoader):
         local_file = self._get_local_path(url)
         return _mesh_import(url, local_file)
 
+    def resolve_url(self, url):
+        """Resolve a mesh URL to the location from which the mesh is actually loaded.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+            The path of the local file.
+        """
+        return self._get_local_path(url)
+
     def _get_local_path(self, url):
         _prefix, path = url.split(self.schema_prefix)
         return self.build_path(*path.split('/'))
@@ -0,0 +1,273 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+import compas
+import compas._os
+from compas.datastructures import Mesh
+from compas.robots.resources.basic import AbstractMeshLoader
+from compas.robots.resources.basic import _get_file_format
+
+__all__ = ['CachedMeshLoader']
+
+
+MAGIC = b'COMPASMC'
+VERSION = 1
+HEADER = struct.Struct('<8sBIII')
+
+
+def _tobytes(values):
+    # the cache is stored little-endian, independent of the platform
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def _frombytes(typecode, data):
+    values = array(typecode)
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def mesh_to_bytes(mesh):
+    """Serialize the vertices and faces of a mesh into a compact binary string.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    bytes
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+    xyz = array('d', [c for vertex in vertices for c in vertex])
+    sizes = array('i', [len(face) for face in faces])
+    indices = array('i', [index for face in faces for index in face])
+    header = HEADER.pack(MAGIC, VERSION, len(vertices), len(faces), len(indices))
+    return header + zlib.compress(_tobytes(xyz) + _tobytes(sizes) + _tobytes(indices), 1)
+
+
+def mesh_from_bytes(data):
+    """Create a mesh from a binary string produced by :func:`mesh_to_bytes`.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized mesh.
+
+    Returns
+    -------
+    :class:`compas.datastructures.Mesh`
+    """
+    magic, version, num_vertices, num_faces, num_indices = HEADER.unpack(data[:HEADER.size])
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a valid mesh cache entry.')
+    data = zlib.decompress(data[HEADER.size:])
+    a = 8 * 3 * num_vertices
+    b = a + 4 * num_faces
+    xyz = _frombytes('d', data[:a])
+    sizes = _frombytes('i', data[a:b])
+    indices = _frombytes('i', data[b:])
+    vertices = [list(vertex) for vertex in zip(xyz[0::3], xyz[1::3], xyz[2::3])]
+    faces = []
+    start = 0
+    for size in sizes:
+        faces.append(indices[start:start + size].tolist())
+        start += size
+    return Mesh.from_vertices_and_faces(vertices, faces)
+
+
+class CachedMeshLoader(AbstractMeshLoader):
+    """Mesh loader that caches the meshes loaded by other loaders, in memory and on disk.
+
+    Parameters
+    ----------
+    *loaders : :class:`compas.robots.AbstractMeshLoader`
+        The loaders that do the actual loading.
+        The first loader that can load a URL is used.
+    cache_dir : str, optional
+        The directory of the on-disk cache.
+        Defaults to a ``meshcache`` folder in the COMPAS application data directory.
+        Use ``False`` to only cache meshes in memory.
+
+    Notes
+    -----
+    Local files are identified by a hash of their contents,
+    such that changed files are parsed again and identical files are parsed only once.
+    The hash is computed again only if the modification time or the size of a file changes.
+    Remote files are identified by the URL to which a loader resolves them.
+    Remote files that are in the on-disk cache are not downloaded again.
+
+    Every mesh is loaded only once per loader, and the same instance is returned
+    for all URLs that resolve to the same mesh.
+    The loader is thread-safe.
+
+    Examples
+    --------
+    >>> loader = CachedMeshLoader(GithubPackageMeshLoader('ros-industrial/abb', 'abb_irb6600_support', 'kinetic-devel'))  # doctest: +SKIP
+    >>> model.load_geometry(loader, num_workers=4)  # doctest: +SKIP
+
+    """
+
+    def __init__(self, *loaders, **kwargs):
+        super(CachedMeshLoader, self).__init__()
+        self.loaders = list(loaders)
+        cache_dir = kwargs.get('cache_dir')
+        if cache_dir is None:
+            cache_dir = os.path.join(compas.APPDATA, 'meshcache')
+        self.cache_dir = cache_dir
+        self.meshes = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self._locks = {}
+
+    def _get_loader(self, url):
+        for loader in self.loaders:
+            if loader.can_load_mesh(url):
+                return loader
+        return None
+
+    def can_load_mesh(self, url):
+        """Determine whether one of the underlying loaders can load a given mesh URL.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        bool
+        """
+        return self._get_loader(url) is not None
+
+    def resolve_url(self, url):
+        """Resolve a mesh URL with the loader that can load it.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+        """
+        loader = self._get_loader(url)
+        return loader.resolve_url(url) if loader else url
+
+    def get_key(self, url):
+        """Compute the cache key of a mesh URL.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+            A hash of the contents of local files, or of the resolved URL of remote files.
+        """
+        resolved = self.resolve_url(url)
+        if not os.path.isfile(resolved):
+            return hashlib.sha1(resolved.encode('utf-8')).hexdigest()
+        stat = os.stat(resolved)
+        version = (stat.st_mtime, stat.st_size)
+        with self._lock:
+            cached = self._keys.get(resolved)
+        if cached and cached[0] == version:
+            return cached[1]
+        # local files with the same contents and format are the same mesh
+        sha = hashlib.sha1(_get_file_format(resolved).encode('utf-8'))
+        with open(resolved, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        key = sha.hexdigest()
+        with self._lock:
+            self._keys[resolved] = (version, key)
+        return key
+
+    def load_mesh(self, url):
+        """Load a mesh from the cache, or with the underlying loaders if it is not cached yet.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        :class:`Mesh`
+            Instance of a mesh, shared by all URLs that resolve to the same mesh.
+        """
+        key = self.get_key(url)
+        with self._lock:
+            if key in self.meshes:
+                return self.meshes[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        # only one thread loads a given mesh, the others wait for it
+        with lock:
+            if key not in self.meshes:
+                mesh = self._read(key)
+                if mesh is None:
+                    loader = self._get_loader(url)
+                    if not loader:
+                        raise Exception('Unable to load geometry for {}'.format(url))
+                    mesh = loader.load_mesh(url)
+                    self._write(key, mesh)
+                self.meshes[key] = mesh
+        return self.meshes[key]
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.mesh')
+
+    def _read(self, key):
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return mesh_from_bytes(f.read())
+        except (IOError, OSError, ValueError, struct.error, zlib.error):
+            return None
+
+    def _write(self, key, mesh):
+        if not self.cache_dir:
+            return
+        # the cache is an optimisation, failing to write it should never fail the loading
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            path = self._path(key)
+            temp = '{}.{}.tmp'.format(path, threading.current_thread().ident)
+            with open(temp, 'wb') as f:
+                f.write(mesh_to_bytes(mesh))
+            compas._os.replace(temp, path)
+        except (IOError, OSError):
+            pass
+
+    def clear(self):
+        """Remove all meshes from the memory and on-disk caches."""
+        with self._lock:
+            self.meshes = {}
+            self._locks = {}
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.mesh'):
+                    os.remove(os.path.join(self.cache_dir, name))
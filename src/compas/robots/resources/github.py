@@ -108,6 +108,22 @@ class GithubPackageMeshLoader(AbstractMeshLoader):
         tempfile, _ = urlretrieve(url)
         return _mesh_import(url, tempfile)
 
+    def resolve_url(self, url):
+        """Resolve a mesh URL to the location from which the mesh is actually loaded.
+
+        Parameters
+        ----------
+        url : str
+            Mesh URL.
+
+        Returns
+        -------
+        str
+            The URL of the file in the Github repository.
+        """
+        _prefix, path = url.split(self.schema_prefix)
+        return self.build_url(path)
+
 
 # ==============================================================================
 # Main
@@ -35,6 +35,46 @@ of the proxied package are available as if they were directly present in our env
 
     Proxy
 
+By default, the proxy and the server communicate with XML-RPC,
+which is available in all Python environments.
+CPython clients can use a binary transport instead (``Proxy(transport='binary')``),
+which sends arrays as raw buffers rather than as JSON encoded lists.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    Server
+    BinaryServer
+    BinaryServerProxy
+
+With ``workers``, servers execute calls in a pool of worker processes,
+such that a long-running call of one client does not block the calls of other clients.
+
+Large objects that are used in several calls can be uploaded once with :meth:`Proxy.upload`.
+The server keeps them in a store, and calls refer to them with handles.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    Handle
+    ObjectStore
+
+Many small calls can be sent without waiting for the result of every call with :meth:`Proxy.submit`,
+or in a single request with :meth:`Proxy.batch`.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    Future
+
+The profile of every call, with the time spent on decoding the input, importing the module,
+resolving handles, executing the function and encoding the output, is available as :attr:`Proxy.profile`.
+The server aggregates these profiles, and optionally sampled cProfile data,
+which can be retrieved with :meth:`Proxy.profile_stats`.
+
 RPC Command-line utility
 ========================
 
@@ -45,13 +85,13 @@ To start a new RPC server use the following command (default port is ``1753``):
 
 ::
 
-    $ compas_rpc start [--port PORT]
+    $ compas_rpc start [--port PORT] [--transport {xmlrpc,binary}] [--workers WORKERS]
 
 Conversely, to stop an existing RPC server:
 
 ::
 
-    $ compas_rpc stop [--port PORT]
+    $ compas_rpc stop [--port PORT] [--transport {xmlrpc,binary}]
 
 
 .. note::
@@ -65,6 +105,9 @@ from __future__ import division
 from __future__ import print_function
 
 from .errors import *  # noqa: F401 F403
+from .transport import *  # noqa: F401 F403
+from .store import *  # noqa: F401 F403
+from .futures import *  # noqa: F401 F403
 from .proxy import *  # noqa: F401 F403
 from .server import *  # noqa: F401 F403
 from .dispatcher import *  # noqa: F401 F403
@@ -1,6 +1,7 @@
 import time
 
 from compas.rpc.services.default import start_service
+from compas.rpc.transport import BinaryServerProxy
 
 try:
     from xmlrpclib import ServerProxy
@@ -8,13 +9,16 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, transport='xmlrpc', workers=0, **kwargs):
+    start_service(port, autoreload, transport, workers)
 
 
-def stop(port, **kwargs):
+def stop(port, transport='xmlrpc', **kwargs):
     print('Trying to stop remote RPC proxy...')
-    server = ServerProxy('http://127.0.0.1:{}'.format(port))
+    if transport == 'binary':
+        server = BinaryServerProxy('http://127.0.0.1:{}'.format(port))
+    else:
+        server = ServerProxy('http://127.0.0.1:{}'.format(port))
 
     success = False
     count = 5
@@ -50,6 +54,8 @@ def main():
         '--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     start_command.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     start_command.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    start_command.add_argument('--transport', action='store', default='xmlrpc', choices=['xmlrpc', 'binary'], help='RPC transport')
+    start_command.add_argument('--workers', '-w', action='store', default=0, type=int, help='Number of worker processes')
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
@@ -57,6 +63,7 @@ def main():
         'stop', help='Try to stop a remote RPC server')
     stop_command.add_argument(
         '--port', '-p', action='store', default=1753, type=int, help='RPC port number')
+    stop_command.add_argument('--transport', action='store', default='xmlrpc', choices=['xmlrpc', 'binary'], help='RPC transport')
     stop_command.set_defaults(func=stop)
 
     # Invoke
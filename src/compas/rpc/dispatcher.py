@@ -5,19 +5,16 @@ from __future__ import print_function
 import importlib
 import json
 import pstats
+import random
 import sys
+import threading
+import time
 import traceback
 
 from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
-
-try:
-    from cStringIO import StringIO
-except ImportError:
-    try:
-        from StringIO import StringIO
-    except ImportError:
-        from io import StringIO
+from compas.utilities import MetricsRegistry
+from compas.rpc.store import ObjectStore
 
 try:
     from cProfile import Profile
@@ -25,6 +22,15 @@ except ImportError:
     from profile import Profile
 
 
+# time.perf_counter is not available on Python 2 and IronPython
+_timer = getattr(time, 'perf_counter', time.time)
+
+# the phases of a call, in order
+PHASES = ('decode', 'import', 'arguments', 'execute', 'encode')
+
+_PROFILE_LOCK = threading.Lock()
+
+
 __all__ = ['Dispatcher']
 
 
@@ -42,7 +48,202 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    The dispatcher keeps the objects uploaded by clients in an :class:`compas.rpc.ObjectStore`.
+    Clients refer to these objects with handles, which are replaced by the objects
+    before the functions are called.
+
+    The duration of the phases of every call is returned to the client as the profile of the call,
+    and aggregated per phase and per function for :meth:`profile_stats`.
+    A fraction of the calls, set by :attr:`PROFILE_SAMPLING`,
+    or the calls for which the client requests it, is executed with :mod:`cProfile`.
+
     """
+
+    #: The maximum estimated memory use of the uploaded objects.
+    MAX_STORE_BYTES = 2 ** 30
+
+    #: The fraction of calls that is executed with cProfile.
+    PROFILE_SAMPLING = 0.0
+
+    #: The maximum number of functions in the cProfile data of a call, and of the aggregated cProfile data.
+    PROFILE_LIMIT = 30
+
+    @property
+    def objectstore(self):
+        """:class:`compas.rpc.ObjectStore` : The objects uploaded by clients."""
+        try:
+            return self._objectstore
+        except AttributeError:
+            self._objectstore = ObjectStore(max_bytes=self.MAX_STORE_BYTES)
+            return self._objectstore
+
+    def upload(self, obj):
+        """Keep an object on the server, such that it does not have to be sent with every call.
+
+        Parameters
+        ----------
+        obj : object
+            The object.
+
+        Returns
+        -------
+        :class:`compas.rpc.Handle`
+            The handle with which the object can be passed to other calls.
+        """
+        return self.objectstore.put(obj)
+
+    def release(self, *handles):
+        """Remove uploaded objects from the server.
+
+        Parameters
+        ----------
+        handles : :class:`compas.rpc.Handle`
+            The handles of the objects.
+
+        Returns
+        -------
+        int
+            The number of objects that were removed.
+        """
+        return sum(self.objectstore.release(handle) for handle in handles)
+
+    def store_info(self):
+        """Information about the uploaded objects.
+
+        Returns
+        -------
+        dict
+            The handles of the objects, from least to most recently used,
+            their estimated total memory use, and the limits of the store.
+        """
+        store = self.objectstore
+        return {
+            'handles': store.handles(),
+            'nbytes': store.nbytes,
+            'max_items': store.max_items,
+            'max_bytes': store.max_bytes,
+        }
+
+    @property
+    def profile_metrics(self):
+        """:class:`compas.utilities.MetricsRegistry` : The aggregated durations of the phases of the calls."""
+        try:
+            return self._profile_metrics
+        except AttributeError:
+            with _PROFILE_LOCK:
+                if not hasattr(self, '_profile_metrics'):
+                    self._profile_metrics = MetricsRegistry(enabled=True)
+                    self._profile_functions = {}
+                    self._profile_samples = 0
+            return self._profile_metrics
+
+    def profile_stats(self, reset=False):
+        """Aggregated profile of all calls executed by the server.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            If ``True``, start a new aggregation after returning the current one.
+
+        Returns
+        -------
+        dict
+            * `'phases'`   : For every phase of the calls (`'decode'`, `'import'`, `'arguments'`, `'execute'`, `'encode'`, and `'total'`),
+              the number of calls, and the mean, minimum, maximum and percentiles of the duration, in seconds,
+              with the same statistics per function under `'implementations'`.
+              See :meth:`compas.utilities.MetricsRegistry.summary`.
+            * `'cprofile'` : The functions with the highest cumulative time in all calls executed with cProfile.
+              See :meth:`_profile_rows`.
+            * `'samples'`  : The number of calls executed with cProfile.
+
+        """
+        metrics = self.profile_metrics
+        with _PROFILE_LOCK:
+            rows = sorted(self._profile_functions.values(), key=lambda row: row[5], reverse=True)[:self.PROFILE_LIMIT]
+            stats = {
+                'phases': metrics.summary(),
+                'cprofile': rows,
+                'samples': self._profile_samples,
+            }
+            if reset:
+                metrics.reset()
+                self._profile_functions = {}
+                self._profile_samples = 0
+        return stats
+
+    def _record_profile(self, name, odict):
+        """Aggregate the profile of a call.
+
+        In a worker process of a server, the profile is forwarded to the server process instead,
+        which aggregates the profiles of all workers.
+        """
+        profile = odict['profile']
+        error = odict['error']
+        if error:
+            error = error.strip().splitlines()[-1].split(':')[0]
+        forwarded = getattr(self, '_forwarded', None)
+        if forwarded is not None:
+            forwarded.append((name, profile, error))
+            return
+        self._add_profile(name, profile, error)
+
+    def _add_profile(self, name, profile, error):
+        metrics = self.profile_metrics
+        total = 0.0
+        for phase in PHASES:
+            if profile.get(phase) is not None:
+                metrics.record(phase, profile[phase], implementation=name)
+                total += profile[phase]
+        metrics.record('total', total, implementation=name, error=error)
+        rows = profile.get('cprofile')
+        if rows is None:
+            return
+        with _PROFILE_LOCK:
+            self._profile_samples += 1
+            for row in rows:
+                key = tuple(row[:3])
+                if key in self._profile_functions:
+                    total = self._profile_functions[key]
+                    total[3] += row[3]
+                    total[4] += row[4]
+                    total[5] += row[5]
+                else:
+                    self._profile_functions[key] = list(row)
+
+    def _add_forwarded(self, records):
+        for name, profile, error in records:
+            self._add_profile(name, profile, error)
+
+    def batch(self, calls, parallel=False):
+        """Execute several calls in one request.
+
+        Parameters
+        ----------
+        calls : list of dict
+            The calls, with the name of the function under `'name'`,
+            the positional arguments under `'args'`, and the named arguments under `'kwargs'`.
+        parallel : bool, optional
+            If ``True``, execute the calls concurrently, in threads.
+            Otherwise, execute the calls one after the other, in order.
+
+        Returns
+        -------
+        list of dict
+            The output dictionaries of the calls.
+            See :meth:`_dispatch`.
+        """
+        if not parallel or len(calls) < 2:
+            return [self._dispatch_call(call) for call in calls]
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(min(len(calls), 8))
+        try:
+            return pool.map(self._dispatch_call, calls)
+        finally:
+            pool.close()
+
+    def _dispatch_call(self, call):
+        return self._dispatch_data(call['name'], {'args': call.get('args', []), 'kwargs': call.get('kwargs', {})})
+
     def on_module_imported(self, module, newly_loaded_modules):
         """Event triggered when a module is successfully imported.
 
@@ -78,12 +279,63 @@ class Dispatcher(object):
             * `'data'`    : The returned result of the function call.
             * `'error'`   : The error message of any error that may have been thrown in the processes of dispatching to or execution of the API function.
             * `'profile'` : A profile of the function execution.
+              The duration of the phases of the call, in seconds, under `'decode'`, `'import'`, `'arguments'`, `'execute'` and `'encode'`,
+              and the cProfile data under `'cprofile'`, if the call was executed with cProfile.
+              See :meth:`_profile_rows`.
+
+        """
+        t0 = _timer()
+        try:
+            idict = json.loads(args[0], cls=DataDecoder)
+        except (IndexError, TypeError):
+            idict = None
+        profile = {'decode': _timer() - t0}
+
+        odict = self._execute(name, idict, profile)
+
+        # the data is encoded separately, such that the duration of the encoding is part of the profile
+        t0 = _timer()
+        try:
+            data = json.dumps(odict['data'], cls=DataEncoder)
+        except Exception:
+            data = 'null'
+            odict['error'] = traceback.format_exc()
+        profile['encode'] = _timer() - t0
+
+        self._record_profile(name, odict)
+        return '{{"data": {}, "error": {}, "profile": {}}}'.format(data, json.dumps(odict['error']), json.dumps(profile))
+
+    def _dispatch_data(self, name, idict):
+        """Dispatcher method for API calls of which the input is already deserialised.
+
+        This method is called by :meth:`_dispatch`,
+        and directly by servers that handle the serialisation themselves,
+        such as :class:`compas.rpc.BinaryServer`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        idict : dict
+            The input dictionary, with the positional arguments under `'args'`,
+            and the named arguments under `'kwargs'`.
+
+        Returns
+        -------
+        dict
+            The output dictionary, with the same structure as the output of :meth:`_dispatch`.
+            The profile does not contain the duration of the decoding and encoding.
 
         """
+        odict = self._execute(name, idict, {})
+        self._record_profile(name, odict)
+        return odict
+
+    def _execute(self, name, idict, profile):
         odict = {
             'data': None,
             'error': None,
-            'profile': None
+            'profile': profile
         }
 
         parts = name.split('.')
@@ -94,6 +346,7 @@ class Dispatcher(object):
             if len(parts) > 1:
                 modulename = ".".join(parts[:-1])
 
+                t0 = _timer()
                 modules_before_import = set(sys.modules.keys())
 
                 # Trigger import
@@ -101,6 +354,7 @@ class Dispatcher(object):
 
                 newly_loaded_modules = set(sys.modules.keys()) - modules_before_import
                 self.on_module_imported(module, newly_loaded_modules)
+                profile['import'] = _timer() - t0
             else:
                 module = self
         except Exception:
@@ -113,19 +367,25 @@ class Dispatcher(object):
                 odict['error'] = "This function is not part of the API: {0}".format(functionname)
 
             else:
-                try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
+                if not isinstance(idict, dict):
                     odict['error'] = (
                         "API methods require a single JSON encoded dictionary as input.\n"
                         "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})")
 
+                elif idict.get('profile') or (self.PROFILE_SAMPLING and random.random() < self.PROFILE_SAMPLING):
+                    self._call_wrapped(function, idict, odict)
                 else:
                     self._call(function, idict, odict)
 
-        return json.dumps(odict, cls=DataEncoder)
+        return odict
+
+    def _arguments(self, function, idict):
+        """The arguments of a call, with the handles replaced by the uploaded objects they refer to."""
+        if function == self.release:
+            return idict['args'], idict['kwargs']
+        return self.objectstore.resolve(idict['args'], idict['kwargs'])
 
-    def _call(self, function, idict, odict):
+    def _call(self, function, idict, odict, profiler=None):
         """Method that handles the actual call to the function corresponding to the API call.
 
         Parameters
@@ -136,46 +396,75 @@ class Dispatcher(object):
             The input dictionary.
         odict : dict
             The output dictionary.
+        profiler : :class:`cProfile.Profile`, optional
+            A profiler for the execution of the function.
 
         Notes
         -----
         The output dictionary will be modified in place.
 
         """
-        args = idict['args']
-        kwargs = idict['kwargs']
-
+        profile = odict['profile']
+        t0 = _timer()
+        try:
+            args, kwargs = self._arguments(function, idict)
+        except Exception:
+            odict['error'] = traceback.format_exc()
+            return
+        t1 = _timer()
+        profile['arguments'] = t1 - t0
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                # another profiler is active, e.g. in a concurrent call
+                profiler = None
         try:
             data = function(*args, **kwargs)
         except Exception:
             odict['error'] = traceback.format_exc()
         else:
             odict['data'] = data
+        finally:
+            if profiler is not None:
+                profiler.disable()
+        profile['execute'] = _timer() - t1
+        if profiler is not None:
+            profile['cprofile'] = self._profile_rows(profiler)
 
     def _call_wrapped(self, function, idict, odict):
         """Does the same as _call, but with profiling enabled.
         """
-        args = idict['args']
-        kwargs = idict['kwargs']
+        self._call(function, idict, odict, Profile())
 
-        try:
-            profile = Profile()
-            profile.enable()
+    def _profile_rows(self, profile):
+        """Machine-readable cProfile data.
 
-            data = function(*args, **kwargs)
-
-            profile.disable()
-            stream = StringIO()
-            stats = pstats.Stats(profile, stream=stream)
-            stats.strip_dirs()
-            stats.sort_stats(1)
-            stats.print_stats(20)
+        Parameters
+        ----------
+        profile : :class:`cProfile.Profile`
+            The profiler.
 
-        except Exception:
-            odict['error'] = traceback.format_exc()
-        else:
-            odict['data'] = data
-            odict['profile'] = stream.getvalue()
+        Returns
+        -------
+        list of list
+            For the functions with the highest cumulative time, at most :attr:`PROFILE_LIMIT`,
+            the file name, line number and name of the function,
+            the number of calls, the total time spent in the function itself,
+            and the cumulative time spent in the function and the functions it called, in seconds.
+        """
+        try:
+            stats = pstats.Stats(profile)
+        except TypeError:
+            # nothing was recorded
+            return []
+        rows = []
+        for (filename, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            # the profiler itself
+            if '_lsprof.Profiler' not in function:
+                rows.append([filename, line, function, ncalls, tottime, cumtime])
+        rows.sort(key=lambda row: row[5], reverse=True)
+        return rows[:self.PROFILE_LIMIT]
 
 
 # ==============================================================================
@@ -0,0 +1,145 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import threading
+
+from compas.rpc.errors import RPCClientError
+
+
+__all__ = ['Future']
+
+
+class Future(object):
+    """The result of an asynchronous remote call, which may not be available yet.
+
+    Examples
+    --------
+    >>> future = Future()
+    >>> future.done()
+    False
+    >>> future.set_result(42)
+    >>> future.result()
+    42
+
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        """Verify if the call is completed.
+
+        Returns
+        -------
+        bool
+        """
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Wait for the result of the call.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait, in seconds.
+            By default, there is no limit.
+
+        Returns
+        -------
+        object
+            The result of the remote function.
+
+        Raises
+        ------
+        RPCClientError
+            If the call is not completed within the timeout.
+        RPCServerError
+            If the call failed.
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for the call to complete, and return the error, if any.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait, in seconds.
+
+        Returns
+        -------
+        Exception or None
+        """
+        if not self._event.wait(timeout):
+            raise RPCClientError('The call was not completed within {} seconds.'.format(timeout))
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Call a function with the future as argument when the call is completed.
+
+        Parameters
+        ----------
+        callback : callable
+            The function.
+            If the call is already completed, the function is called immediately.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def set_result(self, result):
+        """Complete the call with a result."""
+        self._result = result
+        self._complete()
+
+    def set_exception(self, exception):
+        """Complete the call with an error."""
+        self._exception = exception
+        self._complete()
+
+    def _complete(self):
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import time
+    from compas.rpc import Proxy
+
+    n = 500
+
+    for transport, port in (('xmlrpc', 1753), ('binary', 1754)):
+        with Proxy('math', python='python', port=port, transport=transport, autoreload=False) as proxy:
+            proxy.sqrt(2.0)
+
+            t0 = time.time()
+            for i in range(n):
+                proxy.sqrt(i)
+            t1 = time.time()
+            futures = [proxy.submit('sqrt', i) for i in range(n)]
+            for future in futures:
+                future.result()
+            t2 = time.time()
+            proxy.batch([('sqrt', [i]) for i in range(n)])
+            t3 = time.time()
+
+        print('{}: call {:.3f} ms, submit {:.3f} ms, batch {:.3f} ms per call'.format(
+            transport, 1e3 * (t1 - t0) / n, 1e3 * (t2 - t1) / n, 1e3 * (t3 - t2) / n))
@@ -3,11 +3,14 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import threading
 import time
 
 import compas
 import compas._os
 from compas.rpc import RPCServerError
+from compas.rpc.futures import Future
+from compas.rpc.transport import BinaryServerProxy
 from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
 
@@ -16,6 +19,11 @@ try:
 except ImportError:
     from xmlrpc.client import ServerProxy
 
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
 try:
     from subprocess import Popen
     from subprocess import PIPE
@@ -59,9 +67,26 @@ class Proxy(object):
         it will unload the module, so that the next invocation uses a fresh version.
     capture_output : :obj:`bool`, ``True`` to capture the stdout/stderr output of the remote process, otherwise ``False``.
         In general, ``capture_output`` should be ``True`` when using a ``pythonw`` as executable (default).
+    transport : {'xmlrpc', 'binary'}, optional
+        The protocol of the communication with the server.
+        With ``'xmlrpc'`` (default), arguments and results are JSON encoded and wrapped in XML-RPC requests.
+        With ``'binary'``, messages are sent over a socket with length-prefixed binary framing,
+        and arrays, including arrays in the data of COMPAS objects, are sent as raw buffers.
+        The binary transport is only available for CPython clients,
+        and returns arrays as NumPy arrays instead of lists.
+    workers : :obj:`int`, optional
+        The number of worker processes of a server started by the proxy.
+        Default is ``0``, in which case the server executes calls one at a time.
+        With workers, calls from different clients, or from different threads
+        of a client with the binary transport, are executed concurrently.
 
     Notes
     -----
+    For large arrays, the binary transport avoids the conversion to and from
+    nested lists of numbers, and the JSON encoding and decoding thereof.
+    The server of a binary proxy only accepts binary clients,
+    so clients with different transports should use different ports.
+
     If the server is your *localhost*, which will often be the case, it is better
     to specify the address explicitly (``'http://127.0.0.1'``) because resolving
     *localhost* takes a surprisingly significant amount of time.
@@ -73,6 +98,10 @@ class Proxy(object):
 
     If possible, the proxy will try to reconnect to an already existing service
 
+    The profile of every call is available as :attr:`profile`,
+    and the aggregated profile of all calls executed by the server with :meth:`profile_stats`.
+    Set :attr:`cprofile` to ``True`` to execute the calls with cProfile on the server.
+
     Examples
     --------
     Minimal example showing connection to the proxy server, and ensuring the
@@ -85,9 +114,22 @@ class Proxy(object):
         with Proxy('compas.numerical') as numerical:
             pass
 
+    Sending large arrays with the binary transport:
+
+    .. code-block:: python
+
+        import numpy as np
+        from compas.rpc import Proxy
+
+        with Proxy('numpy', transport='binary') as numpy:
+            total = numpy.sum(np.random.rand(1000000, 3), axis=0)
+
     """
 
-    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True):
+    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True,
+                 transport='xmlrpc', workers=0):
+        if transport not in ('xmlrpc', 'binary'):
+            raise ValueError('Unknown transport: {}'.format(transport))
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -97,6 +139,10 @@ class Proxy(object):
         self._process = None
         self._function = None
         self._profile = None
+        self._transport = transport
+        self._workers = workers
+        self._queue = None
+        self.cprofile = False
 
         self.service = service
         self.package = package
@@ -117,6 +163,8 @@ class Proxy(object):
         # otherwise we just disconnect from it
         if self._implicitely_started_server:
             self.stop_server()
+        elif self._transport == 'binary':
+            self._server.close()
         else:
             self._server.__close()
 
@@ -124,9 +172,20 @@ class Proxy(object):
     def address(self):
         return "{}:{}".format(self._url, self._port)
 
+    @property
+    def transport(self):
+        """str : The protocol of the communication with the server."""
+        return self._transport
+
     @property
     def profile(self):
-        """A profile of the executed code."""
+        """dict : The profile of the last call.
+
+        The duration of the phases of the call on the server, in seconds,
+        under `'decode'`, `'import'`, `'arguments'`, `'execute'` and `'encode'`,
+        and, if :attr:`cprofile` is ``True``, the cProfile data under `'cprofile'`.
+        See :meth:`compas.rpc.Dispatcher._dispatch`.
+        """
         return self._profile
 
     @profile.setter
@@ -169,7 +228,7 @@ class Proxy(object):
         ServerProxy
             Instance of the proxy if reconnection succeeded, otherwise ``None``.
         """
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         try:
             server.ping()
         except Exception:
@@ -178,6 +237,19 @@ class Proxy(object):
             print("Reconnecting to an existing server proxy.")
         return server
 
+    def _server_proxy(self):
+        if self._transport == 'binary':
+            return BinaryServerProxy(self.address)
+        return ServerProxy(self.address)
+
+    def _service_args(self):
+        args = ['-m', self.service, '--port', str(self._port), '--{}autoreload'.format('' if self.autoreload else 'no-')]
+        if self._transport != 'xmlrpc':
+            args += ['--transport', self._transport]
+        if self._workers:
+            args += ['--workers', str(self._workers)]
+        return args
+
     def start_server(self):
         """Start the remote server.
 
@@ -219,10 +291,10 @@ class Proxy(object):
             self._process.StartInfo.RedirectStandardOutput = self.capture_output
             self._process.StartInfo.RedirectStandardError = self.capture_output
             self._process.StartInfo.FileName = self.python
-            self._process.StartInfo.Arguments = '-m {0} --port {1} --{2}autoreload'.format(self.service, self._port, '' if self.autoreload else 'no-')
+            self._process.StartInfo.Arguments = ' '.join(self._service_args())
             self._process.Start()
         else:
-            args = [self.python, '-m', self.service, '--port', str(self._port), '--{}autoreload'.format('' if self.autoreload else 'no-')]
+            args = [self.python] + self._service_args()
             kwargs = dict(env=env)
             if self.capture_output:
                 kwargs['stdout'] = PIPE
@@ -232,7 +304,7 @@ class Proxy(object):
         # this starts the client side
         # it creates a proxy for the server
         # and tries to connect the proxy to the actual server
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         print("Starting a new proxy server...")
         success = False
         attempt_count = 0
@@ -266,8 +338,110 @@ class Proxy(object):
             self._server.remote_shutdown()
         except Exception:
             pass
+        if self._transport == 'binary':
+            self._server.close()
         self._terminate_process()
 
+    def server_stats(self):
+        """Introspection of the load of the server.
+
+        Returns
+        -------
+        dict
+            The number of workers, the number of pending calls and their latency.
+            See :meth:`compas.rpc.Server.stats`.
+        """
+        return self._server.stats()
+
+    def profile_stats(self, reset=False):
+        """Aggregated profile of all calls executed by the server.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            If ``True``, start a new aggregation on the server after returning the current one.
+
+        Returns
+        -------
+        dict
+            Statistics of the duration of the phases of the calls, per phase and per function,
+            and the aggregated cProfile data of the calls that were executed with cProfile.
+            See :meth:`compas.rpc.Dispatcher.profile_stats`.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('numpy') as numpy:
+                numpy.linalg.norm(vectors, axis=1)
+                stats = numpy.profile_stats()
+                encode = stats['phases']['encode']['latency']['mean']
+                execute = stats['phases']['execute']['latency']['mean']
+        """
+        return self._invoke(self._server_function('profile_stats'), (), {'reset': reset})
+
+    def upload(self, obj):
+        """Keep an object on the server, such that it does not have to be sent with every call.
+
+        Parameters
+        ----------
+        obj : object
+            The object, for example a mesh or an array.
+
+        Returns
+        -------
+        :class:`compas.rpc.Handle`
+            The handle of the object.
+            Remote functions can be called with the handle as a positional or named argument
+            instead of the object itself.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('numpy', transport='binary') as numpy:
+                handle = numpy.upload(vertices)
+                centroid = numpy.mean(handle, axis=0)
+                bbox = numpy.ptp(handle, axis=0)
+                numpy.release(handle)
+
+        Notes
+        -----
+        The server evicts the objects that were used least recently
+        if the uploaded objects exceed the memory limit of the server.
+        Calls with the handle of an evicted object fail.
+        """
+        return self._invoke(self._server_function('upload'), (obj, ), {})
+
+    def release(self, *handles):
+        """Remove objects from the server.
+
+        Parameters
+        ----------
+        handles : :class:`compas.rpc.Handle`
+            The handles of the objects.
+
+        Returns
+        -------
+        int
+            The number of objects that were removed.
+        """
+        return self._invoke(self._server_function('release'), handles, {})
+
+    def store_info(self):
+        """Information about the objects kept on the server.
+
+        Returns
+        -------
+        dict
+            The handles of the objects, their estimated total memory use, and the limits of the store.
+        """
+        return self._invoke(self._server_function('store_info'), (), {})
+
+    def _server_function(self, name):
+        # methods of the dispatcher, which are not part of the proxied package
+        return getattr(self._server, name)
+
     def restart_server(self):
         """Restart the server."""
         self.stop_server()
@@ -291,13 +465,23 @@ class Proxy(object):
             pass
 
     def __getattr__(self, name):
-        if self.package:
-            name = "{}.{}".format(self.package, name)
         try:
-            self._function = getattr(self._server, name)
+            function = getattr(self._server, self._qualified(name))
         except Exception:
             raise RPCServerError()
-        return self._proxy
+        self._function = function
+
+        # the function is bound to the call, such that proxies can be used by several threads
+        def proxy(*args, **kwargs):
+            return self._invoke(function, args, kwargs)
+
+        proxy.__doc__ = self._proxy.__doc__
+        return proxy
+
+    def _qualified(self, name):
+        if self.package:
+            return "{}.{}".format(self.package, name)
+        return name
 
     def _proxy(self, *args, **kwargs):
         """Callable replacement for the requested functionality.
@@ -320,7 +504,18 @@ class Proxy(object):
         This means that, currently, only native Python objects are supported.
         The returned results will also always be in the form of built-in Python objects.
         """
-        idict = {'args': args, 'kwargs': kwargs}
+        return self._invoke(self._function, args, kwargs)
+
+    def _invoke(self, function, args, kwargs):
+        idict = self._input(args, kwargs)
+        if self._transport == 'binary':
+            # the binary transport serialises the input and output itself
+            result = function(idict)
+            if result['error']:
+                raise RPCServerError(result['error'])
+            self.profile = result['profile']
+            return result['data']
+
         istring = json.dumps(idict, cls=DataEncoder)
         # it makes sense that there is a broken pipe error
         # because the process is not the one receiving the feedback
@@ -328,7 +523,7 @@ class Proxy(object):
         # this counts as output
         # it should be sent as part of RPC communication
         try:
-            ostring = self._function(istring)
+            ostring = function(istring)
         except Exception:
             # not clear what the point of this is
             # self.stop_server()
@@ -347,6 +542,135 @@ class Proxy(object):
         self.profile = result['profile']
         return result['data']
 
+    def _input(self, args, kwargs):
+        idict = {'args': args, 'kwargs': kwargs}
+        if self.cprofile:
+            idict['profile'] = True
+        return idict
+
+    # ==========================================================================
+    # asynchronous and batched calls
+    # ==========================================================================
+
+    #: The number of threads that execute asynchronous calls with the XML-RPC transport.
+    SUBMIT_THREADS = 4
+
+    def submit(self, name, *args, **kwargs):
+        """Call a remote function without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        args : list
+            Positional arguments to be passed to the remote function.
+        kwargs : dict
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`compas.rpc.Future`
+            The future result of the call.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('numpy', transport='binary') as numpy:
+                futures = [numpy.submit('linalg.norm', vector) for vector in vectors]
+                norms = [future.result() for future in futures]
+
+        Notes
+        -----
+        With the binary transport, the requests are sent immediately over the connection of the proxy,
+        without waiting for the responses to previous requests.
+        With the XML-RPC transport, the calls are sent by a few background threads,
+        each with its own connection.
+        """
+        name = self._qualified(name)
+        future = Future()
+        if self._transport == 'binary':
+            call = self._server._submit(name, (self._input(args, kwargs), ))
+            call.add_done_callback(lambda call: self._complete(future, call))
+        else:
+            self._submit_queue().put((future, name, args, kwargs))
+        return future
+
+    def _complete(self, future, call):
+        exception = call.exception()
+        if exception is not None:
+            future.set_exception(exception)
+            return
+        result = call.result()
+        if result['error']:
+            future.set_exception(RPCServerError(result['error']))
+        else:
+            future.set_result(result['data'])
+
+    def _submit_queue(self):
+        if self._queue is None:
+            self._queue = Queue()
+            for _ in range(self.SUBMIT_THREADS):
+                thread = threading.Thread(target=self._submit_worker, args=(self._queue, ))
+                thread.daemon = True
+                thread.start()
+        return self._queue
+
+    def _submit_worker(self, queue):
+        # XML-RPC server proxies cannot be shared by threads
+        server = ServerProxy(self.address)
+        while True:
+            future, name, args, kwargs = queue.get()
+            try:
+                future.set_result(self._invoke(getattr(server, name), args, kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+    def batch(self, calls, parallel=False, return_exceptions=False):
+        """Execute several calls in one request.
+
+        Parameters
+        ----------
+        calls : list of tuple
+            The calls, as tuples of the name of the function, relative to :attr:`package`,
+            and, optionally, a list of positional arguments and a dict of named arguments.
+        parallel : bool, optional
+            If ``True``, the server executes the calls concurrently,
+            distributed over its workers, if it has any, or in threads otherwise.
+            Default is ``False``, in which case the calls are executed one after the other, in order.
+        return_exceptions : bool, optional
+            If ``True``, failed calls have an :class:`compas.rpc.RPCServerError` as result.
+            Default is ``False``, in which case the error of the first failed call is raised.
+
+        Returns
+        -------
+        list
+            The results of the calls.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('numpy') as numpy:
+                results = numpy.batch([('arange', [10]), ('linspace', [0, 1], {'num': 5})])
+        """
+        items = []
+        for call in calls:
+            items.append({
+                'name': self._qualified(call[0]),
+                'args': list(call[1]) if len(call) > 1 else [],
+                'kwargs': dict(call[2]) if len(call) > 2 else {},
+            })
+        results = []
+        for result in self._invoke(self._server_function('batch'), (items, ), {'parallel': parallel}):
+            if not result['error']:
+                results.append(result['data'])
+            elif return_exceptions:
+                results.append(RPCServerError(result['error']))
+            else:
+                raise RPCServerError(result['error'])
+        return results
+
 
 # ==============================================================================
 # Main
@@ -2,20 +2,246 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import json
+import socket
 import threading
+import time
+import traceback
 
 try:
     from SimpleXMLRPCServer import SimpleXMLRPCServer
 except ImportError:
     from xmlrpc.server import SimpleXMLRPCServer
 
+try:
+    from SocketServer import BaseRequestHandler
+    from SocketServer import TCPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from socketserver import BaseRequestHandler
+    from socketserver import TCPServer
+    from socketserver import ThreadingMixIn
+
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+from compas.rpc.store import contains_handle
+from compas.rpc.transport import recv_message
+from compas.rpc.transport import send_message
+
+
+__all__ = ['Server', 'BinaryServer']
+
+
+# the dispatcher of a worker process
+_WORKER_INSTANCE = None
+
+
+def _init_worker(instance):
+    global _WORKER_INSTANCE
+    _WORKER_INSTANCE = instance
+    # the profiles of the calls are aggregated by the server process
+    _WORKER_INSTANCE._forwarded = []
+
+
+def _take_forwarded():
+    forwarded, _WORKER_INSTANCE._forwarded = _WORKER_INSTANCE._forwarded, []
+    return forwarded
+
+
+def _call_instance(instance, method, params, binary):
+    if binary:
+        return instance._dispatch_data(method, params[0] if params else None)
+    return instance._dispatch(method, params)
+
+
+def _call_worker(method, params, binary):
+    result = _call_instance(_WORKER_INSTANCE, method, params, binary)
+    return result, _take_forwarded()
+
+
+def _call_worker_batch(call):
+    result = _WORKER_INSTANCE._dispatch_call(call)
+    return result, _take_forwarded()
+
+
+def _batch_arguments(idict):
+    # the arguments of Dispatcher.batch
+    args = idict.get('args') or []
+    kwargs = idict.get('kwargs') or {}
+    calls = args[0] if args else kwargs.get('calls', [])
+    parallel = args[1] if len(args) > 1 else kwargs.get('parallel', False)
+    return calls, parallel
+
+
+# methods of the dispatcher that manage its object store
+_STORE_METHODS = ('upload', 'release', 'store_info')
+
+# methods of the dispatcher that report the aggregated profiles of the server process
+_PROFILE_METHODS = ('profile_stats', )
+
+
+def _uses_store(method, params, binary):
+    if method in _STORE_METHODS:
+        return True
+    if not params:
+        return False
+    if binary:
+        idict = params[0]
+        if not isinstance(idict, dict):
+            return False
+        if method == 'batch':
+            calls, _ = _batch_arguments(idict)
+            return any(call['name'] in _STORE_METHODS or contains_handle(call.get('args', ()), call.get('kwargs', {})) for call in calls)
+        return contains_handle(idict.get('args', ()), idict.get('kwargs', {}))
+    # handles in the JSON input of XML-RPC calls are recognised without decoding it
+    try:
+        return 'compas.rpc/Handle' in params[0]
+    except TypeError:
+        return False
+
+
+class _DispatchMixin(object):
+    """Dispatching of calls to the registered instance, in the server process or in a pool of worker processes."""
+
+    def _init_dispatch(self, workers):
+        self.workers = workers or 0
+        self._pool = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._started = time.time()
+        self._pending = 0
+        self._completed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latency_last = 0.0
+
+    def _start_workers(self):
+        if self.workers and self._pool is None and self.instance is not None:
+            from multiprocessing import Pool
+            self._pool = Pool(self.workers, initializer=_init_worker, initargs=(self.instance, ))
+
+    def _stop_workers(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _dispatch_instance(self, method, params, binary):
+        if self.instance is None:
+            raise Exception('Method "{}" is not supported.'.format(method))
+        t0 = time.time()
+        with self._stats_lock:
+            self._pending += 1
+        try:
+            # the uploaded objects are kept by the server process, not by the workers
+            if self._pool is None or method in _PROFILE_METHODS or _uses_store(method, params, binary):
+                with self._lock:
+                    return _call_instance(self.instance, method, params, binary)
+            if method == 'batch':
+                return self._dispatch_batch(params, binary)
+            return self._call_worker(method, params, binary)
+        finally:
+            latency = time.time() - t0
+            with self._stats_lock:
+                self._pending -= 1
+                self._completed += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                self._latency_last = latency
+
+    def _dispatch_batch(self, params, binary):
+        # the calls of a parallel batch are distributed over the workers,
+        # the calls of a sequential batch are executed by one worker
+        try:
+            idict = params[0] if binary else json.loads(params[0], cls=DataDecoder)
+            calls, parallel = _batch_arguments(idict)
+        except Exception:
+            parallel = False
+        if not parallel:
+            return self._call_worker('batch', params, binary)
+        results = []
+        for result, forwarded in self._pool.map(_call_worker_batch, calls):
+            self.instance._add_forwarded(forwarded)
+            results.append(result)
+        odict = {'data': results, 'error': None, 'profile': None}
+        return odict if binary else json.dumps(odict, cls=DataEncoder)
+
+    def _call_worker(self, method, params, binary):
+        result, forwarded = self._pool.apply_async(_call_worker, (method, params, binary)).get()
+        self.instance._add_forwarded(forwarded)
+        return result
+
+    def ping(self):
+        """Simple function used to check if a remote server can be reached.
+
+        Notes
+        -----
+        Should be used together with an instance of `compas.rpc.Server`.
+
+        """
+        return 1
+
+    def stats(self):
+        """Introspection of the load of the server.
+
+        Returns
+        -------
+        dict
+            * `'workers'`   : The number of worker processes, or zero if calls are executed by the server process.
+            * `'pending'`   : The number of calls that are queued or being executed.
+            * `'queued'`    : The number of calls that wait for a worker.
+            * `'completed'` : The number of completed calls.
+            * `'latency'`   : The mean, maximum and last time between receiving and completing a call, in seconds.
+            * `'uptime'`    : The time since the server was created, in seconds.
+
+        """
+        with self._stats_lock:
+            return {
+                'workers': self.workers,
+                'pending': self._pending,
+                'queued': max(0, self._pending - max(1, self.workers)),
+                'completed': self._completed,
+                'latency': {
+                    'mean': self._latency_total / self._completed if self._completed else 0.0,
+                    'max': self._latency_max,
+                    'last': self._latency_last,
+                },
+                'uptime': time.time() - self._started,
+            }
+
+    def remote_shutdown(self):
+        threading.Thread(target=self._shutdown_thread).start()
+        return 1
+
+    def _shutdown_thread(self):
+        self.shutdown()
+        self.server_close()
 
-__all__ = ['Server']
+    def serve_forever(self, poll_interval=0.5):
+        self._start_workers()
+        try:
+            super(_DispatchMixin, self).serve_forever(poll_interval)
+        except BaseException:
+            # e.g. CTRL+C, in which case the workers are interrupted as well
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+            raise
+        # after a remote shutdown, calls that are still in progress are completed
+        self._stop_workers()
 
 
-class Server(SimpleXMLRPCServer):
+class Server(_DispatchMixin, ThreadingMixIn, SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
 
+    Parameters
+    ----------
+    address : tuple
+        The host and port of the server.
+    workers : int, optional
+        The number of worker processes that execute the calls to the registered instance.
+        Default is ``0``, in which case the calls are executed by the server process, one at a time.
+
     Examples
     --------
     .. code-block:: python
@@ -44,24 +270,128 @@ class Server(SimpleXMLRPCServer):
     This class has to be used by a service to start the XMLRPC server in a way
     that can be pinged to check if the server is live, and can be cleanly terminated.
 
+    Every request is handled in a separate thread, such that the server can be pinged,
+    and clients can be served by different workers, while other calls are executing.
+    Every worker has a copy of the registered instance.
+    Objects uploaded by clients are kept by the server process,
+    and calls that refer to them are executed by the server process as well.
+
     """
 
-    def ping(self):
-        """Simple function used to check if a remote server can be reached.
+    daemon_threads = True
 
-        Notes
-        -----
-        Should be used together with an instance of `compas.rpc.Server`.
+    def __init__(self, *args, **kwargs):
+        workers = kwargs.pop('workers', 0)
+        SimpleXMLRPCServer.__init__(self, *args, **kwargs)
+        self._init_dispatch(workers)
 
-        """
-        return 1
+    def _dispatch(self, method, params):
+        if method in self.funcs:
+            return self.funcs[method](*params)
+        return self._dispatch_instance(method, params, False)
 
-    def remote_shutdown(self):
-        threading.Thread(target=self._shutdown_thread).start()
-        return 1
 
-    def _shutdown_thread(self):
-        self.shutdown()
+class _BinaryRequestHandler(BaseRequestHandler):
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.lock = threading.Lock()
+
+    def respond(self, request):
+        response = {'id': request.get('id')}
+        try:
+            response['result'] = self.server._dispatch(request['method'], request['params'])
+        except Exception:
+            response['fault'] = traceback.format_exc()
+        try:
+            with self.lock:
+                send_message(self.request, response)
+        except socket.error:
+            pass
+
+    def handle(self):
+        # a client keeps its connection open for all its calls,
+        # and can send new requests before the responses to previous requests have arrived
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (EOFError, socket.error):
+                return
+            if self.server.workers and request['method'] not in self.server.funcs:
+                thread = threading.Thread(target=self.respond, args=(request, ))
+                thread.daemon = True
+                thread.start()
+            else:
+                self.respond(request)
+
+
+class BinaryServer(_DispatchMixin, ThreadingMixIn, TCPServer):
+    """Server for clients that use the binary transport of :class:`compas.rpc.Proxy`.
+
+    Messages are framed with a length prefix and sent over persistent TCP connections.
+    Arrays in arguments and results are sent as raw buffers instead of JSON lists
+    (see :func:`compas.rpc.transport.send_message`).
+
+    Parameters
+    ----------
+    address : tuple
+        The host and port of the server.
+    workers : int, optional
+        The number of worker processes that execute the calls to the registered instance.
+        Default is ``0``, in which case the calls are executed by the server process, one at a time.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import BinaryServer
+        from compas.rpc import Dispatcher
+
+
+        class DefaultService(Dispatcher):
+            pass
+
+
+        if __name__ == '__main__':
+
+            server = BinaryServer(("localhost", 8888), workers=4)
+
+            server.register_function(server.ping)
+            server.register_function(server.stats)
+            server.register_function(server.remote_shutdown)
+            server.register_instance(DefaultService())
+            server.serve_forever()
+
+    Notes
+    -----
+    The server has the same interface as :class:`Server`.
+    Every request carries an ID, which is returned with the response.
+    With workers, the requests of a client are executed concurrently,
+    and the responses are sent as soon as they are available, in any order.
+
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, workers=0):
+        TCPServer.__init__(self, address, _BinaryRequestHandler)
+        self.funcs = {}
+        self.instance = None
+        self._init_dispatch(workers)
+
+    def register_function(self, function, name=None):
+        """Register a function that can be called by clients."""
+        self.funcs[name or function.__name__] = function
+
+    def register_instance(self, instance):
+        """Register a dispatcher for all calls that do not correspond to a registered function."""
+        self.instance = instance
+
+    def _dispatch(self, method, params):
+        if method in self.funcs:
+            return self.funcs[method](*params)
+        return self._dispatch_instance(method, params, True)
 
 
 # ==============================================================================
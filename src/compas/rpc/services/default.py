@@ -12,6 +12,7 @@ from watchdog.observers import Observer
 
 from compas.rpc import Dispatcher
 from compas.rpc import Server
+from compas.rpc import BinaryServer
 
 
 class DefaultService(Dispatcher):
@@ -56,15 +57,20 @@ class ModuleReloader(PatternMatchingEventHandler):
                     sys.modules.pop(module)
 
 
-def start_service(port, autoreload, **kwargs):
+def start_service(port, autoreload, transport='xmlrpc', workers=0, **kwargs):
     print('Starting default RPC service on port {0}...'.format(port))
 
     # start the server on *localhost*
     # and listen to requests on port *1753*
-    server = Server(("0.0.0.0", port))
+    # binary clients use a server with their own framing instead of XML-RPC
+    if transport == 'binary':
+        server = BinaryServer(("0.0.0.0", port), workers=workers)
+    else:
+        server = Server(("0.0.0.0", port), workers=workers)
 
     # register a few utility functions
     server.register_function(server.ping)
+    server.register_function(server.stats)
     server.register_function(server.remote_shutdown)
 
     # register an instance of the default service
@@ -76,6 +82,8 @@ def start_service(port, autoreload, **kwargs):
     service = DefaultService() if not autoreload else FileWatcherService()
     server.register_instance(service)
 
+    if workers:
+        print('Dispatching calls to {} worker processes'.format(workers))
     print('Listening{}...'.format(' with autoreload of modules enabled' if autoreload else ''))
     print('Press CTRL+C to abort')
     server.serve_forever()
@@ -92,6 +100,8 @@ if __name__ == '__main__':
     parser.add_argument('--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     parser.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     parser.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    parser.add_argument('--transport', action='store', default='xmlrpc', choices=['xmlrpc', 'binary'], help='RPC transport')
+    parser.add_argument('--workers', '-w', action='store', default=0, type=int, help='Number of worker processes')
     parser.set_defaults(autoreload=True, func=start_service)
 
     args = parser.parse_args()
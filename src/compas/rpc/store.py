@@ -0,0 +1,250 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+
+from compas.rpc.errors import RPCServerError
+
+
+__all__ = ['Handle', 'ObjectStore']
+
+
+class Handle(object):
+    """Reference to an object that is kept by the server of a :class:`compas.rpc.Proxy`.
+
+    Parameters
+    ----------
+    key : str
+        The unique key of the object in the store of the server.
+    typename : str, optional
+        The name of the type of the object.
+    nbytes : int, optional
+        The estimated size of the object.
+
+    Notes
+    -----
+    Handles are passed to remote functions, as positional or named arguments,
+    instead of the objects they refer to.
+    The server replaces them by the stored objects before calling the function.
+
+    """
+
+    def __init__(self, key, typename=None, nbytes=0):
+        self.key = key
+        self.typename = typename
+        self.nbytes = nbytes
+
+    def __repr__(self):
+        return 'Handle({!r}, {!r}, {})'.format(self.key, self.typename, self.nbytes)
+
+    def __eq__(self, other):
+        return isinstance(other, Handle) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def data(self):
+        return {'key': self.key, 'typename': self.typename, 'nbytes': self.nbytes}
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data['key'], data.get('typename'), data.get('nbytes', 0))
+
+    def to_data(self):
+        return self.data
+
+
+def _sizeof(o):
+    """Estimate the memory used by an object and the objects it contains."""
+    nbytes = getattr(o, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(o, dict):
+        return sys.getsizeof(o) + sum(_sizeof(key) + _sizeof(value) for key, value in o.items())
+    if isinstance(o, (list, tuple, set)):
+        return sys.getsizeof(o) + sum(_sizeof(item) for item in o)
+    if hasattr(o, 'data') and not isinstance(o, (bytes, bytearray)):
+        return _sizeof(o.data)
+    return sys.getsizeof(o)
+
+
+class ObjectStore(object):
+    """Store of the objects referred to by handles, with least-recently-used eviction.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        The maximum number of objects.
+    max_bytes : int, optional
+        The maximum estimated memory use of all objects.
+
+    Examples
+    --------
+    >>> store = ObjectStore(max_items=2)
+    >>> a = store.put([1, 2, 3])
+    >>> b = store.put([4, 5, 6])
+    >>> store.get(a)
+    [1, 2, 3]
+    >>> c = store.put([7, 8, 9])
+    >>> b in store
+    False
+
+    Notes
+    -----
+    When a limit is exceeded, the objects that were used least recently are evicted.
+    The object that was stored last is never evicted, even if it exceeds the memory limit on its own.
+    All operations are guarded by a lock, such that the store can be used by the threads of a parallel batch.
+
+    """
+
+    def __init__(self, max_items=None, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def __contains__(self, handle):
+        with self._lock:
+            return getattr(handle, 'key', handle) in self._items
+
+    def put(self, obj):
+        """Store an object.
+
+        Parameters
+        ----------
+        obj : object
+            The object.
+
+        Returns
+        -------
+        :class:`Handle`
+            The handle of the object.
+        """
+        handle = Handle(uuid.uuid4().hex, type(obj).__name__, _sizeof(obj))
+        with self._lock:
+            self._items[handle.key] = (handle, obj)
+            self.nbytes += handle.nbytes
+            self._evict()
+        return handle
+
+    def get(self, handle):
+        """Retrieve an object, and mark it as recently used.
+
+        Parameters
+        ----------
+        handle : :class:`Handle` or str
+            The handle of the object, or its key.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        RPCServerError
+            If the object was released or evicted.
+        """
+        key = getattr(handle, 'key', handle)
+        with self._lock:
+            try:
+                item = self._items.pop(key)
+            except KeyError:
+                raise RPCServerError('The object of handle {} is not available. It was released or evicted from the store of the server.'.format(key))
+            self._items[key] = item
+        return item[1]
+
+    def release(self, handle):
+        """Remove an object from the store.
+
+        Parameters
+        ----------
+        handle : :class:`Handle` or str
+            The handle of the object, or its key.
+
+        Returns
+        -------
+        bool
+            ``True`` if the object was in the store.
+        """
+        with self._lock:
+            item = self._items.pop(getattr(handle, 'key', handle), None)
+            if item is None:
+                return False
+            self.nbytes -= item[0].nbytes
+        return True
+
+    def clear(self):
+        """Remove all objects from the store."""
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def handles(self):
+        """The handles of the objects, from least to most recently used.
+
+        Returns
+        -------
+        list of :class:`Handle`
+        """
+        with self._lock:
+            return [handle for handle, _ in self._items.values()]
+
+    def _exceeded(self):
+        if self.max_items is not None and len(self._items) > self.max_items:
+            return True
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
+
+    def _evict(self):
+        # the lock is held by the caller
+        while len(self._items) > 1 and self._exceeded():
+            handle, _ = self._items.popitem(last=False)[1]
+            self.nbytes -= handle.nbytes
+
+    def resolve(self, args, kwargs):
+        """Replace the handles among the arguments of a call by the objects they refer to.
+
+        Parameters
+        ----------
+        args : list
+            The positional arguments.
+        kwargs : dict
+            The named arguments.
+
+        Returns
+        -------
+        tuple
+            The positional and named arguments.
+        """
+        with self._lock:
+            args = [self.get(arg) if isinstance(arg, Handle) else arg for arg in args]
+            kwargs = dict((name, self.get(arg) if isinstance(arg, Handle) else arg) for name, arg in kwargs.items())
+        return args, kwargs
+
+
+def contains_handle(args, kwargs):
+    """Verify if the arguments of a call contain handles."""
+    return any(isinstance(arg, Handle) for arg in args) or any(isinstance(arg, Handle) for arg in kwargs.values())
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+
+    doctest.testmod(globs=globals())
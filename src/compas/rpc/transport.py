@@ -0,0 +1,304 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import socket
+import struct
+import threading
+
+from compas.rpc.errors import RPCClientError
+from compas.rpc.errors import RPCServerError
+from compas.rpc.futures import Future
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+
+
+__all__ = ['BinaryServerProxy', 'send_message', 'recv_message']
+
+
+# lengths of the buffer table, the JSON message, and the buffers of a message
+PREFIX = struct.Struct('!IIQ')
+
+# buffers start at multiples of this number of bytes in the body of a message
+ALIGNMENT = 64
+
+
+class _BinaryEncoder(DataEncoder):
+    """Encoder that replaces arrays by references to out-of-band buffers."""
+
+    def __init__(self, *args, **kwargs):
+        super(_BinaryEncoder, self).__init__(*args, **kwargs)
+        self.buffers = []
+
+    def default(self, o):
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            if isinstance(o, np.ndarray) and not o.dtype.hasobject:
+                self.buffers.append(np.ascontiguousarray(o))
+                return {'$buffer': len(self.buffers) - 1, '$dtype': o.dtype.str, '$shape': list(o.shape)}
+        return super(_BinaryEncoder, self).default(o)
+
+
+class _BinaryDecoder(DataDecoder):
+    """Decoder that resolves references to out-of-band buffers into arrays."""
+
+    def __init__(self, body, buffers, *args, **kwargs):
+        super(_BinaryDecoder, self).__init__(*args, **kwargs)
+        self.body = body
+        self.buffers = buffers
+
+    def object_hook(self, o):
+        if '$buffer' not in o:
+            return super(_BinaryDecoder, self).object_hook(o)
+        import numpy as np
+        offset, nbytes = self.buffers[o['$buffer']]
+        dtype = np.dtype(o['$dtype'])
+        if not nbytes:
+            return np.empty(o['$shape'], dtype=dtype)
+        return np.frombuffer(self.body, dtype=dtype, count=nbytes // dtype.itemsize, offset=offset).reshape(o['$shape'])
+
+
+def _recv_into(sock, view):
+    while len(view):
+        n = sock.recv_into(view)
+        if not n:
+            raise EOFError('The connection was closed.')
+        view = view[n:]
+
+
+def send_message(sock, message):
+    """Send a message with length-prefixed binary framing.
+
+    Parameters
+    ----------
+    sock : socket
+        A connected socket.
+    message : object
+        Any object that can be serialised with :class:`compas.utilities.DataEncoder`.
+
+    Notes
+    -----
+    Arrays in the message, including arrays in the data of COMPAS objects,
+    are not converted to lists but sent as raw buffers,
+    described by their data type and shape in the JSON header of the message.
+
+    """
+    encoder = _BinaryEncoder()
+    text = encoder.encode(message)
+    arrays = []
+    table = []
+    offset = 0
+    for array in encoder.buffers:
+        padding = -offset % ALIGNMENT
+        arrays.append((padding, array))
+        table.append([offset + padding, array.nbytes])
+        offset += padding + array.nbytes
+    table = json.dumps(table).encode('utf-8')
+    text = text.encode('utf-8')
+    sock.sendall(PREFIX.pack(len(table), len(text), offset) + table + text)
+    for padding, array in arrays:
+        if padding:
+            sock.sendall(b'\0' * padding)
+        if array.nbytes:
+            sock.sendall(array.reshape(-1).view('uint8'))
+
+
+def recv_message(sock):
+    """Receive a message sent with :func:`send_message`.
+
+    Parameters
+    ----------
+    sock : socket
+        A connected socket.
+
+    Returns
+    -------
+    object
+        The message.
+        Arrays are views on the received bytes, without copies.
+
+    Raises
+    ------
+    EOFError
+        If the connection is closed before the message is complete.
+
+    """
+    prefix = bytearray(PREFIX.size)
+    _recv_into(sock, memoryview(prefix))
+    sizes = PREFIX.unpack(bytes(prefix))
+    table, text, body = [bytearray(size) for size in sizes]
+    for part in (table, text, body):
+        _recv_into(sock, memoryview(part))
+    return _BinaryDecoder(body, json.loads(table.decode('utf-8'))).decode(text.decode('utf-8'))
+
+
+def _host_and_port(address):
+    address = address.split('://')[-1]
+    host, port = address.rsplit(':', 1)
+    return host, int(port)
+
+
+class _Call(Future):
+    """A request of which the response has not necessarily arrived yet."""
+
+    def __init__(self, id, sock):
+        super(_Call, self).__init__()
+        self._id = id
+        self._sock = sock
+
+    def _set(self, response):
+        if 'fault' in response:
+            self.set_exception(RPCServerError(response['fault']))
+        else:
+            self.set_result(response['result'])
+
+
+class BinaryServerProxy(object):
+    """Client of a :class:`compas.rpc.BinaryServer`, with the same interface as an XML-RPC ``ServerProxy``.
+
+    Parameters
+    ----------
+    address : str
+        The address of the server, for example ``'http://127.0.0.1:1753'``.
+    timeout : float, optional
+        Timeout of connecting to the server, and of waiting for the result of a call, in seconds.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        server = BinaryServerProxy('http://127.0.0.1:1753')
+        server.ping()
+
+    Notes
+    -----
+    All requests of a client share one connection.
+    Every request has an ID, with which the response is matched to the request,
+    such that requests can be sent by several threads without waiting for the responses to earlier requests.
+
+    """
+
+    def __init__(self, address, timeout=None):
+        self.host, self.port = _host_and_port(address)
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._calls = {}
+        self._count = 0
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def method(*params):
+            return self._request(name, params)
+
+        return method
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(None)
+        reader = threading.Thread(target=self._read, args=(sock, ))
+        reader.daemon = True
+        reader.start()
+        return sock
+
+    def _read(self, sock):
+        try:
+            while True:
+                response = recv_message(sock)
+                with self._lock:
+                    call = self._calls.pop(response['id'], None)
+                if call:
+                    call._set(response)
+        except (socket.error, EOFError, ValueError):
+            pass
+        # the connection is lost, and the calls that wait for it fail
+        with self._lock:
+            if self._sock is sock:
+                self._sock = None
+            calls = [call for call in self._calls.values() if call._sock is sock]
+            for call in calls:
+                del self._calls[call._id]
+        for call in calls:
+            call._set({'fault': 'The connection to the server was lost.'})
+        try:
+            sock.close()
+        except socket.error:
+            pass
+
+    def _send(self, method, params):
+        with self._lock:
+            if self._sock is None:
+                self._sock = self._connect()
+            self._count += 1
+            call = _Call(self._count, self._sock)
+            self._calls[call._id] = call
+        # the lock of the calls is not held while sending,
+        # otherwise responses cannot be received while a large request is sent
+        try:
+            with self._send_lock:
+                send_message(call._sock, {'id': call._id, 'method': method, 'params': list(params)})
+        except socket.error:
+            with self._lock:
+                self._calls.pop(call._id, None)
+                if self._sock is call._sock:
+                    self._sock = None
+            call._sock.close()
+            raise
+        return call
+
+    def _submit(self, method, params):
+        try:
+            return self._send(method, params)
+        except socket.error:
+            # a connection that was left open may have been closed by a restarted server
+            return self._send(method, params)
+
+    def _request(self, method, params):
+        call = self._submit(method, params)
+        try:
+            return call.result(self.timeout)
+        except RPCClientError:
+            # a late response is not matched to a call that nobody waits for
+            if not call.done():
+                with self._lock:
+                    self._calls.pop(call._id, None)
+            raise
+
+    def close(self):
+        """Close the connection to the server."""
+        with self._lock:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            sock.close()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import time
+    import numpy as np
+    from compas.rpc import Proxy
+
+    vertices = np.random.rand(1000000, 3)
+
+    for transport, port in (('xmlrpc', 1753), ('binary', 1754)):
+        with Proxy('numpy', python='python', port=port, transport=transport, autoreload=False) as numpy:
+            numpy.sum([1, 2, 3])
+            t0 = time.time()
+            numpy.multiply(vertices, 2.0)
+            print('{}: {:.3f} s'.format(transport, time.time() - t0))
@@ -57,7 +57,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import compas
+import compas._lazy
 
 from .traversal import *  # noqa: F401 F403
 from .combinatorics import *  # noqa: F401 F403
@@ -65,10 +65,16 @@ from .orientation import *  # noqa: F401 F403
 
 if compas.IPY:
     from .orientation_rhino import *  # noqa: F401 F403
-else:
-    from .orientation_numpy import *  # noqa: F401 F403
 
 from .connectivity import *  # noqa: F401 F403
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
+
+if not compas.IPY:
+    __all__ += compas._lazy.lazy_import(globals(), {
+        '.orientation_numpy': [
+            'face_adjacency_numpy',
+            'unify_cycles_numpy',
+        ],
+    })
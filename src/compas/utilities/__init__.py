@@ -45,6 +45,17 @@ encoders
     DataDecoder
 
 
+instrumentation
+===============
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    MetricsRegistry
+    instrument
+
+
 itertools
 =========
 
@@ -74,6 +85,17 @@ maps
     geometric_key_xy
 
 
+xfunc
+=====
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    XFunc
+    XFuncPool
+
+
 """
 from __future__ import absolute_import
 from __future__ import division
@@ -87,6 +109,7 @@ from .decorators import *  # noqa: F401 F403
 from .descriptors import *  # noqa: F401 F403
 from .encoders import *  # noqa: F401 F403
 from .images import *  # noqa: F401 F403
+from .instrumentation import *  # noqa: F401 F403
 from .itertools import *  # noqa: F401 F403
 from .maps import *  # noqa: F401 F403
 from .remote import *  # noqa: F401 F403
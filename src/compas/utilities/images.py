@@ -4,11 +4,6 @@ from __future__ import division
 
 import os
 
-try:
-    import imageio
-except ImportError:
-    pass
-
 
 __all__ = ['gif_from_images']
 
@@ -44,6 +39,8 @@ def gif_from_images(files,
     --------
     >>>
     """
+    import imageio
+
     if reverse:
         files.reverse()
     if pingpong:
@@ -0,0 +1,349 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import functools
+import json
+import math
+import threading
+import time
+
+
+# time.perf_counter is not available on Python 2 and IronPython
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+__all__ = [
+    'MetricsRegistry',
+    'metrics',
+    'instrument',
+]
+
+
+# latency histograms have 4 logarithmic buckets per doubling,
+# from 1 microsecond to about 2 minutes
+_BUCKET_MIN = 1e-6
+_BUCKETS_PER_DOUBLING = 4
+_BUCKETS = 27 * _BUCKETS_PER_DOUBLING
+
+
+def _bucket(latency):
+    if latency <= _BUCKET_MIN:
+        return 0
+    index = int(math.log(latency / _BUCKET_MIN, 2) * _BUCKETS_PER_DOUBLING)
+    return min(index, _BUCKETS - 1)
+
+
+def _bucket_bound(index):
+    """Upper bound of the latencies in a bucket."""
+    return _BUCKET_MIN * 2 ** ((index + 1) / _BUCKETS_PER_DOUBLING)
+
+
+def _size(o):
+    """Number of items of an argument, e.g. the number of points of a list or an array."""
+    try:
+        return len(o)
+    except TypeError:
+        return 0
+
+
+class _Series(object):
+    """Aggregated measurements of the calls of one function, or of one implementation of an extension point."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.size_total = 0
+        self.size_max = 0
+        self.last_error = None
+        self.histogram = [0] * _BUCKETS
+
+    def add(self, latency, size, error):
+        self.count += 1
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = max(self.max, latency)
+        self.size_total += size
+        self.size_max = max(self.size_max, size)
+        self.histogram[_bucket(latency)] += 1
+        if error is not None:
+            self.errors += 1
+            self.last_error = error
+
+    def merge(self, other):
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.size_total += other.size_total
+        self.size_max = max(self.size_max, other.size_max)
+        self.last_error = other.last_error or self.last_error
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    def percentile(self, q):
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.histogram):
+            cumulative += count
+            if count and cumulative >= rank:
+                return min(max(_bucket_bound(index), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'latency': {
+                'total': self.total,
+                'mean': self.total / self.count if self.count else 0.0,
+                'min': self.min or 0.0,
+                'max': self.max,
+                'p50': self.percentile(0.50),
+                'p90': self.percentile(0.90),
+                'p99': self.percentile(0.99),
+            },
+            'size': {
+                'mean': self.size_total / self.count if self.count else 0.0,
+                'max': self.size_max,
+            },
+        }
+
+
+class MetricsRegistry(object):
+    """Registry of the latency, argument sizes and errors of instrumented calls.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        If ``False``, calls are not recorded.
+        Default is ``False``.
+
+    Examples
+    --------
+    >>> registry = MetricsRegistry(enabled=True)
+    >>> registry.record('f', 0.002, size=10)
+    >>> registry.record('f', 0.004, size=20, error='ValueError')
+    >>> summary = registry.summary()['f']
+    >>> summary['count'], summary['errors'], summary['size']['max']
+    (2, 1, 20)
+
+    Notes
+    -----
+    Latencies are aggregated in histograms with logarithmic buckets,
+    such that the percentiles in the summaries are estimates with a relative error of about 20%.
+    The minimum, maximum and mean latencies are exact.
+
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording calls."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording calls. The recorded measurements are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Remove all recorded measurements."""
+        with self._lock:
+            self._series = {}
+
+    def record(self, name, latency, implementation=None, size=0, error=None):
+        """Record a call.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, or the URL of the extension point.
+        latency : float
+            The duration of the call, in seconds.
+        implementation : str, optional
+            The identifier of the implementation that executed the call,
+            for example the ID of the selected plugin.
+        size : int, optional
+            The size of the arguments of the call.
+        error : str, optional
+            The name of the exception raised by the call, if any.
+        """
+        with self._lock:
+            series = self._series.get((name, implementation))
+            if series is None:
+                series = self._series[name, implementation] = _Series()
+            series.add(latency, size, error)
+
+    def summary(self):
+        """Summarize the recorded calls.
+
+        Returns
+        -------
+        dict
+            For every name, the summary of all calls, with the number of calls and errors,
+            the mean, minimum, maximum and percentiles of the latency, and the mean and maximum size of the arguments.
+            If the calls were executed by different implementations,
+            the summaries of the calls per implementation are included as ``'implementations'``.
+        """
+        with self._lock:
+            items = sorted(self._series.items(), key=lambda item: (item[0][0], item[0][1] or ''))
+            names = {}
+            for (name, implementation), series in items:
+                names.setdefault(name, []).append((implementation, series))
+            result = {}
+            for name, items in names.items():
+                total = _Series()
+                for _, series in items:
+                    total.merge(series)
+                result[name] = total.summary()
+                implementations = dict((implementation, series.summary()) for implementation, series in items if implementation is not None)
+                if implementations:
+                    result[name]['implementations'] = implementations
+            return result
+
+    def to_json(self, filepath=None, pretty=False):
+        """Export the summary of the recorded calls to JSON.
+
+        Parameters
+        ----------
+        filepath : str, optional
+            Path of a file to write the JSON to.
+        pretty : bool, optional
+            If ``True``, the JSON is indented.
+
+        Returns
+        -------
+        str
+            The JSON string.
+        """
+        text = json.dumps(self.summary(), sort_keys=True, indent=4 if pretty else None)
+        if filepath:
+            with open(filepath, 'w') as f:
+                f.write(text)
+        return text
+
+
+metrics = MetricsRegistry()
+
+
+def instrument(func=None, name=None, registry=None):
+    """Decorator to record the calls of a function in a metrics registry.
+
+    Parameters
+    ----------
+    func : callable
+        The function to decorate.
+    name : str, optional
+        The name of the function in the registry.
+        Default is the module and name of the function.
+    registry : :class:`MetricsRegistry`, optional
+        The registry.
+        Default is the global registry :obj:`compas.utilities.metrics`.
+
+    Returns
+    -------
+    callable
+        The decorated function.
+
+    Examples
+    --------
+    >>> registry = MetricsRegistry()
+    >>> @instrument(registry=registry)
+    ... def f(points):
+    ...     return len(points)
+    >>> f([1, 2, 3])
+    3
+    >>> registry.summary()
+    {}
+    >>> registry.enable()
+    >>> f([1, 2, 3])
+    3
+    >>> registry.summary()['compas.utilities.instrumentation.f']['size']['max']
+    3
+
+    Notes
+    -----
+    If the registry is not enabled, the function is called directly,
+    and the only overhead is the verification of the state of the registry.
+    The size of the arguments is the sum of the lengths of the arguments that have a length.
+
+    """
+    def instrument_decorator(func):
+        key = name or '{}.{}'.format(func.__module__, func.__name__)
+        target = registry or metrics
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not target.enabled:
+                return func(*args, **kwargs)
+            return call_instrumented(target, key, None, func, args, kwargs)
+
+        return wrapper
+
+    if func is None:
+        return instrument_decorator
+    return instrument_decorator(func)
+
+
+def call_instrumented(registry, name, implementation, func, args, kwargs):
+    """Call a function and record the call in a metrics registry.
+
+    Parameters
+    ----------
+    registry : :class:`MetricsRegistry`
+        The registry.
+    name : str
+        The name of the call in the registry.
+    implementation : str
+        The identifier of the implementation.
+    func : callable
+        The function.
+    args : tuple
+        The positional arguments.
+    kwargs : dict
+        The named arguments.
+
+    Returns
+    -------
+    object
+        The result of the function.
+    """
+    size = sum(_size(arg) for arg in args) + sum(_size(arg) for arg in kwargs.values())
+    error = None
+    t0 = _timer()
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        registry.record(name, _timer() - t0, implementation, size, error)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import timeit
+
+    def f(points):
+        return points
+
+    g = instrument(f)
+    points = [[0, 0, 0]] * 100
+    n = 1000000
+
+    print('plain    : {:.3f} us'.format(1e6 * timeit.timeit(lambda: f(points), number=n) / n))
+    print('disabled : {:.3f} us'.format(1e6 * timeit.timeit(lambda: g(points), number=n) / n))
+    metrics.enable()
+    print('enabled  : {:.3f} us'.format(1e6 * timeit.timeit(lambda: g(points), number=n) / n))
+    print(metrics.to_json(pretty=True))
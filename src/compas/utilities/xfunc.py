@@ -4,7 +4,9 @@ from __future__ import division
 
 import os
 import json
+import struct
 import tempfile
+import threading
 
 import compas
 import compas._os
@@ -17,6 +19,13 @@ try:
 except ImportError:
     import pickle
 
+try:
+    from Queue import Empty
+    from Queue import Queue
+except ImportError:
+    from queue import Empty
+    from queue import Queue
+
 try:
     from subprocess import Popen
     from subprocess import PIPE
@@ -27,7 +36,7 @@ except ImportError:
         compas.raise_if_ironpython()
 
 
-__all__ = ['XFunc']
+__all__ = ['XFunc', 'XFuncPool']
 
 
 WRAPPER = """
@@ -117,6 +126,284 @@ else:
 
 """
 
+WORKER = """
+import os
+import sys
+import importlib
+import struct
+import json
+import traceback
+
+try:
+    import cPickle as pickle
+except Exception:
+    import pickle
+
+try:
+    from cStringIO import StringIO
+except Exception:
+    from io import StringIO
+
+import cProfile
+import pstats
+
+from compas.utilities import DataEncoder
+from compas.utilities import DataDecoder
+
+serializer = sys.argv[1]
+preload    = [name for name in sys.argv[2].split(',') if name]
+profiling  = sys.argv[3] == '1'
+
+if sys.platform == 'win32':
+    import msvcrt
+    msvcrt.setmode(0, os.O_BINARY)
+    msvcrt.setmode(1, os.O_BINARY)
+
+# messages are sent over the original stdout
+# everything that is printed goes to stderr
+channel_in  = getattr(sys.stdin, 'buffer', sys.stdin)
+channel_out = os.fdopen(os.dup(1), 'wb')
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+
+def memory():
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        pass
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == 'darwin' else rss * 1024
+    except Exception:
+        return None
+
+
+def read(n):
+    data = b''
+    while len(data) < n:
+        chunk = channel_in.read(n - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+def recv():
+    data = read(struct.unpack('!Q', read(8))[0])
+    if serializer == 'json':
+        return json.loads(data.decode('utf-8'), cls=DataDecoder)
+    return pickle.loads(data)
+
+
+def dumps(odict):
+    if serializer == 'json':
+        return json.dumps(odict, cls=DataEncoder).encode('utf-8')
+    return pickle.dumps(odict, 2)
+
+
+def send(odict):
+    try:
+        data = dumps(odict)
+    except Exception:
+        data = dumps({'data': None, 'profile': None, 'memory': odict.get('memory'), 'error': traceback.format_exc()})
+    channel_out.write(struct.pack('!Q', len(data)) + data)
+    channel_out.flush()
+
+
+try:
+    for name in preload:
+        importlib.import_module(name)
+except Exception:
+    send({'ready': False, 'error': traceback.format_exc()})
+    sys.exit(1)
+
+send({'ready': True, 'error': None, 'memory': memory()})
+
+while True:
+    try:
+        idict = recv()
+    except EOFError:
+        break
+
+    if idict['basedir'] not in sys.path:
+        sys.path.insert(0, idict['basedir'])
+
+    odict = {'data': None, 'error': None, 'profile': None}
+
+    try:
+        parts = idict['funcname'].split('.')
+        if len(parts) < 2:
+            raise Exception('Cannot import the function because no module name is specified.')
+        f = getattr(importlib.import_module('.'.join(parts[:-1])), parts[-1])
+
+        if profiling:
+            profile = cProfile.Profile()
+            profile.enable()
+            odict['data'] = f(*idict['args'], **idict['kwargs'])
+            profile.disable()
+            stream = StringIO()
+            stats  = pstats.Stats(profile, stream=stream)
+            stats.sort_stats(1)
+            stats.print_stats(20)
+            odict['profile'] = stream.getvalue()
+        else:
+            odict['data'] = f(*idict['args'], **idict['kwargs'])
+
+    except Exception:
+        odict['data'] = None
+        odict['error'] = traceback.format_exc()
+
+    sys.stderr.flush()
+    odict['memory'] = memory()
+    send(odict)
+
+"""
+
+
+class _DotNetStream(object):
+    """File-like access to the bytes of a .NET stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        from System import Array
+        from System import Byte
+        self.stream.Write(Array[Byte](bytearray(data)), 0, len(data))
+
+    def flush(self):
+        self.stream.Flush()
+
+    def read(self, n):
+        from System import Array
+        from System import Byte
+        buffer = Array.CreateInstance(Byte, n)
+        count = self.stream.Read(buffer, 0, n)
+        return bytes(bytearray(buffer)[:count])
+
+    def close(self):
+        self.stream.Close()
+
+
+# put on the queue of idle interpreters of a closed pool, to release the waiting calls
+_CLOSED = object()
+
+
+class _Worker(object):
+    """A Python interpreter that executes the calls of an :class:`XFuncPool`, one at a time."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = 0
+        self.memory = None
+        self.output = None
+        env = compas._os.prepare_environment()
+        if pool.paths:
+            env['PYTHONPATH'] = os.pathsep.join(pool.paths + [env.get('PYTHONPATH', '')])
+        args = [WORKER, pool.serializer, ','.join(pool.preload), '1' if pool.profile else '0']
+        try:
+            Popen
+        except NameError:
+            self.process = Process()
+            for name in env:
+                if self.process.StartInfo.EnvironmentVariables.ContainsKey(name):
+                    self.process.StartInfo.EnvironmentVariables[name] = env[name]
+                else:
+                    self.process.StartInfo.EnvironmentVariables.Add(name, env[name])
+            self.process.StartInfo.UseShellExecute = False
+            self.process.StartInfo.RedirectStandardInput = True
+            self.process.StartInfo.RedirectStandardOutput = True
+            self.process.StartInfo.RedirectStandardError = True
+            self.process.StartInfo.FileName = pool.python
+            self.process.StartInfo.Arguments = '-u -c "{0}" {1} "{2}" {3}'.format(*args)
+            self.process.Start()
+            self.stdin = _DotNetStream(self.process.StandardInput.BaseStream)
+            self.stdout = _DotNetStream(self.process.StandardOutput.BaseStream)
+            readline = self.process.StandardError.ReadLine
+        else:
+            self.process = Popen([pool.python, '-u', '-c'] + args, stdin=PIPE, stdout=PIPE, stderr=PIPE, env=env)
+            self.stdin = self.process.stdin
+            self.stdout = self.process.stdout
+            readline = self.process.stderr.readline
+        thread = threading.Thread(target=self._forward_output, args=(readline, ))
+        thread.daemon = True
+        thread.start()
+
+    def _forward_output(self, readline):
+        # the output of the worker is forwarded to the callback of the current call
+        while True:
+            line = readline()
+            if not line:
+                break
+            if not isinstance(line, str):
+                line = line.decode('utf-8', 'replace')
+            output = self.output
+            if output:
+                output(line.rstrip())
+
+    def wait_until_ready(self):
+        odict = self.recv()
+        self.memory = odict.get('memory')
+        if not odict.get('ready'):
+            raise Exception(odict['error'])
+
+    def send(self, idict):
+        if self.pool.serializer == 'json':
+            data = json.dumps(idict, cls=DataEncoder).encode('utf-8')
+        else:
+            data = pickle.dumps(idict, 2)
+        self.stdin.write(struct.pack('!Q', len(data)) + data)
+        self.stdin.flush()
+
+    def _read(self, n):
+        data = b''
+        while len(data) < n:
+            chunk = self.stdout.read(n - len(data))
+            if not chunk:
+                raise EOFError('The worker process exited unexpectedly.')
+            data += chunk
+        return data
+
+    def recv(self):
+        data = self._read(struct.unpack('!Q', self._read(8))[0])
+        if self.pool.serializer == 'json':
+            return json.loads(data.decode('utf-8'), cls=DataDecoder)
+        return pickle.loads(data)
+
+    def call(self, idict, output=None):
+        self.output = output
+        try:
+            self.send(idict)
+            odict = self.recv()
+        finally:
+            self.output = None
+        self.calls += 1
+        self.memory = odict.pop('memory', None)
+        return odict
+
+    def stop(self, timeout=5.0):
+        # closing the input ends the loop of the worker
+        try:
+            self.stdin.close()
+        except Exception:
+            pass
+        try:
+            Popen
+        except NameError:
+            if not self.process.WaitForExit(int(1000 * timeout)):
+                self.process.Kill()
+            return
+        try:
+            self.process.wait(timeout)
+        except TypeError:
+            # Python 2
+            self.process.wait()
+        except Exception:
+            self.process.kill()
+
 
 class XFunc(object):
     """Wrapper for functions that turns them into externally run processes.
@@ -156,6 +443,11 @@ class XFunc(object):
     serializer : {'json', 'pickle'}, optional
         The serialisation mechnanism to be used to pass data between the caller and the subprocess.
         Default is ``'json'``.
+    pool : :class:`XFuncPool`, optional
+        A pool of warm Python interpreters that execute the calls,
+        instead of a new interpreter per call.
+        The Python executable, paths and serialisation mechanism of the pool are used.
+        Default is ``None``.
 
     Attributes
     ----------
@@ -184,6 +476,15 @@ class XFunc(object):
 
         fd_numpy = XFunc('compas.numerical.fd_numpy', python='/Users/brg/environments/py2/python')
 
+    Every call starts a new Python interpreter, which imports the wrapped function and its dependencies,
+    and data is exchanged through files.
+    For many calls, use a pool of warm interpreters.
+
+    .. code-block:: python
+
+        pool = XFuncPool(size=2, preload=['compas.numerical'])
+        fd_numpy = XFunc('compas.numerical.fd_numpy', pool=pool)
+
     Examples
     --------
     `compas.numerical` provides an implementation of the Force Density Method that
@@ -236,7 +537,7 @@ class XFunc(object):
     def __init__(self, funcname, basedir='.', tmpdir=None, delete_files=True,
                  verbose=True, callback=None, callback_args=None, python=None,
                  paths=None, serializer='json',
-                 argtypes=None, kwargtypes=None, restypes=None):
+                 argtypes=None, kwargtypes=None, restypes=None, pool=None):
         self._basedir = None
         self._tmpdir = None
         self._callback = None
@@ -255,6 +556,7 @@ class XFunc(object):
         self.argtypes = argtypes
         self.kwargtypes = kwargtypes
         self.restypes = restypes
+        self.pool = pool
         self.data = None
         self.profile = None
         self.error = None
@@ -346,6 +648,9 @@ class XFunc(object):
         # if self.kwargtypes:
         #     kwargs = {name: value for name, value in kwargs.items()}
 
+        if self.pool is not None:
+            return self._call_pool(args, kwargs)
+
         idict = {
             'args': args,
             'kwargs': kwargs,
@@ -435,6 +740,237 @@ class XFunc(object):
 
         return self.data
 
+    def _output(self, line):
+        if self.callback:
+            self.callback(line, self.callback_args)
+        if self.verbose:
+            print(line)
+
+    def _call_pool(self, args, kwargs):
+        odict = self.pool.call(self.funcname, args, kwargs, self.basedir, self._output)
+
+        self.data = odict['data']
+        self.profile = odict['profile']
+        self.error = odict['error']
+
+        if self.error:
+            raise Exception(self.error)
+
+        return self.data
+
+
+class XFuncPool(object):
+    """Pool of warm Python interpreters that execute the calls of :class:`XFunc` objects.
+
+    Parameters
+    ----------
+    size : int, optional
+        The number of interpreters, i.e. the number of calls that can be executed concurrently.
+        Default is ``2``.
+    python : str, optional
+        The Python executable.
+        Default is ``'pythonw'``.
+    preload : list of str, optional
+        Modules that are imported when the interpreters start,
+        for example ``['numpy', 'scipy', 'compas.numerical']``.
+    max_calls : int, optional
+        Replace an interpreter by a new one after this number of calls.
+        By default, interpreters are not replaced.
+    max_memory : float, optional
+        Replace an interpreter by a new one if its memory use exceeds this number of megabytes after a call.
+        By default, interpreters are not replaced.
+    paths : list, optional
+        A list of paths to be added to the ``PYTHONPATH`` of the interpreters.
+    serializer : {'json', 'pickle'}, optional
+        The serialisation mechnanism to be used to pass data to and from the interpreters.
+        Default is ``'json'``.
+    profile : bool, optional
+        If ``True``, profile the calls, as :class:`XFunc` does without pool.
+        Default is ``False``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.utilities import XFunc
+        from compas.utilities import XFuncPool
+
+        with XFuncPool(size=2, preload=['compas.numerical']) as pool:
+            fd_numpy = XFunc('compas.numerical.fd_numpy', pool=pool)
+
+            for q in qs:
+                xyz, q, f, l, r = fd_numpy(vertices, edges, fixed, q, loads)
+
+    Notes
+    -----
+    Arguments and results are sent through the standard input and output of the interpreters.
+    Output printed by the wrapped functions is passed to the callbacks of the :class:`XFunc` objects.
+    Calls from different threads are executed concurrently by different interpreters.
+
+    Memory use is measured with ``psutil`` if it is available, and with ``resource`` otherwise,
+    in which case it is the peak memory use of the interpreter.
+
+    """
+
+    def __init__(self, size=2, python=None, preload=None, max_calls=None, max_memory=None,
+                 paths=None, serializer='json', profile=False):
+        if serializer not in ('json', 'pickle'):
+            raise Exception("*serializer* should be one of {'json', 'pickle'}.")
+        self.size = size
+        self.python = compas._os.select_python(python)
+        self.preload = list(preload or [])
+        self.max_calls = max_calls
+        self.max_memory = max_memory
+        self.paths = list(paths or [])
+        self.serializer = serializer
+        self.profile = profile
+        self._idle = Queue()
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        # the interpreters are started at the same time
+        try:
+            workers = []
+            for _ in range(size):
+                worker = _Worker(self)
+                self._workers.add(worker)
+                workers.append(worker)
+            for worker in workers:
+                worker.wait_until_ready()
+                self._idle.put(worker)
+        except Exception:
+            # not all interpreters are on the queue of idle interpreters yet
+            self._closed = True
+            for worker in workers:
+                self._retire(worker)
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _spawn(self):
+        worker = _Worker(self)
+        with self._lock:
+            self._workers.add(worker)
+        worker.wait_until_ready()
+        return worker
+
+    def _retire(self, worker):
+        with self._lock:
+            self._workers.discard(worker)
+        worker.stop()
+
+    def _replace(self, worker):
+        # a new interpreter is started in the background,
+        # such that the call that triggers the replacement does not wait for it
+        def replace():
+            self._retire(worker)
+            if self._closed:
+                return
+            try:
+                new = self._spawn()
+            except Exception:
+                new = None
+            self._release(new)
+
+        thread = threading.Thread(target=replace)
+        thread.daemon = True
+        thread.start()
+
+    def _release(self, worker):
+        # make an interpreter available to the next call, or stop it if the pool was closed in the meantime
+        with self._lock:
+            if not self._closed:
+                self._idle.put(worker)
+                return
+        if worker is not None:
+            self._retire(worker)
+
+    def _expired(self, worker):
+        if self.max_calls and worker.calls >= self.max_calls:
+            return True
+        return bool(self.max_memory and worker.memory and worker.memory > self.max_memory * 2 ** 20)
+
+    def call(self, funcname, args=None, kwargs=None, basedir='.', output=None):
+        """Call a function in one of the interpreters of the pool.
+
+        Parameters
+        ----------
+        funcname : str
+            The full name of the function.
+        args : list, optional
+            Positional arguments to be passed to the function.
+        kwargs : dict, optional
+            Named arguments to be passed to the function.
+        basedir : str, optional
+            A directory that should be added to the ``PYTHONPATH`` such that the function can be found.
+        output : callable, optional
+            A function that is called with every line printed by the function.
+
+        Returns
+        -------
+        dict
+            The result of the function under `'data'`,
+            and the traceback of the error, if any, under `'error'`.
+        """
+        if self._closed:
+            raise Exception('The pool is closed.')
+        # this waits for an interpreter to become available
+        worker = self._idle.get()
+        if worker is _CLOSED or self._closed:
+            if worker is not _CLOSED and worker is not None:
+                self._retire(worker)
+            # the other waiting calls are released as well
+            self._idle.put(_CLOSED)
+            raise Exception('The pool is closed.')
+        if worker is None:
+            try:
+                worker = self._spawn()
+            except Exception:
+                self._release(None)
+                raise
+        idict = {
+            'funcname': funcname,
+            'basedir': os.path.abspath(basedir),
+            'args': args or [],
+            'kwargs': kwargs or {},
+        }
+        try:
+            odict = worker.call(idict, output)
+        except (EOFError, IOError, OSError):
+            self._replace(worker)
+            return {'data': None, 'profile': None, 'error': 'The interpreter that executed the call exited unexpectedly.'}
+        if self._expired(worker):
+            self._replace(worker)
+        else:
+            self._release(worker)
+        return odict
+
+    def close(self):
+        """Stop all interpreters.
+
+        The idle interpreters are stopped immediately.
+        Calls that are in progress are completed,
+        and their interpreters are stopped when they return.
+        Calls that are waiting for an interpreter raise an exception.
+        """
+        workers = []
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    worker = self._idle.get_nowait()
+                except Empty:
+                    break
+                if worker is not None and worker is not _CLOSED:
+                    workers.append(worker)
+            self._idle.put(_CLOSED)
+        for worker in workers:
+            self._retire(worker)
+
 
 # ==============================================================================
 # Main
@@ -442,4 +978,23 @@ class XFunc(object):
 
 if __name__ == '__main__':
 
-    pass
+    import time
+
+    n = 20
+
+    fsum = XFunc('math.fsum', python='python', verbose=False)
+
+    t0 = time.time()
+    for i in range(n):
+        fsum(list(range(i)))
+    t1 = time.time()
+
+    with XFuncPool(size=2, python='python', preload=['math']) as pool:
+        fsum = XFunc('math.fsum', pool=pool)
+
+        t2 = time.time()
+        for i in range(n):
+            fsum(list(range(i)))
+        t3 = time.time()
+
+    print('XFunc: {:.1f} ms per call, XFuncPool: {:.1f} ms per call'.format(1e3 * (t1 - t0) / n, 1e3 * (t3 - t2) / n))
@@ -0,0 +1,117 @@
+import numpy
+import pytest
+
+from compas.geometry import Frame
+from compas.geometry import FrameArray
+from compas.geometry import Line
+from compas.geometry import LineArray
+from compas.geometry import Plane
+from compas.geometry import PlaneArray
+from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import Rotation
+from compas.geometry import TransformationArray
+from compas.geometry import Translation
+from compas.geometry import Vector
+from compas.geometry import VectorArray
+from compas.geometry import allclose
+from compas.geometry import bounding_box
+from compas.geometry import distance_point_plane
+
+
+X = Translation.from_vector([1.0, 2.0, 3.0]) * Rotation.from_axis_and_angle([1.0, 1.0, 0.0], 0.7)
+
+
+@pytest.fixture
+def xyz():
+    return numpy.random.RandomState(0).uniform(-5, 5, (20, 3))
+
+
+def test_point_array(xyz):
+    points = PointArray([Point(*point) for point in xyz.tolist()])
+    assert allclose(points.array.tolist(), xyz.tolist())
+    assert allclose(points.transformed(X).array.tolist(), [Point(*point).transformed(X) for point in xyz.tolist()])
+    assert allclose(points.bounding_box().tolist(), bounding_box(xyz.tolist()))
+    assert allclose(points.distances(points[0]), numpy.linalg.norm(xyz - xyz[0], axis=1))
+    assert points.distance_matrix().shape == (20, 20)
+    assert isinstance(points - points, VectorArray)
+
+
+def test_views(xyz):
+    points = PointArray(xyz.copy())
+    view = points[2:5]
+    view.transform(X)
+    points[0][:] = 0.0
+    assert allclose(points[2].tolist(), Point(*xyz[2]).transformed(X))
+    assert allclose(points[0].tolist(), [0.0, 0.0, 0.0])
+    lines = LineArray(numpy.stack([xyz, xyz + 1], axis=1))
+    lines.start.transform(X)
+    assert allclose(lines.array[3, 0].tolist(), Point(*xyz[3]).transformed(X))
+    # index lists and masks are copies
+    selection = points[[1, 3]]
+    selection.transform(X)
+    assert allclose(points[1].tolist(), xyz[1].tolist())
+    assert isinstance(points[points.array[:, 0] > 0], PointArray)
+
+
+def test_vector_array(xyz):
+    vectors = VectorArray(xyz)
+    expected = [Vector(*vector) for vector in xyz.tolist()]
+    assert allclose(vectors.lengths(), [vector.length for vector in expected])
+    assert allclose(vectors.transformed(X).array.tolist(), [vector.transformed(X) for vector in expected])
+    assert allclose(vectors.cross([0, 0, 1]).array.tolist(), [vector.cross([0, 0, 1]) for vector in expected])
+    assert allclose(vectors.angles([1, 0, 0]), [vector.angle([1, 0, 0]) for vector in expected])
+    assert allclose((2 * vectors).lengths(), 2 * vectors.lengths())
+
+
+def test_line_array(xyz):
+    lines = LineArray(numpy.stack([xyz, xyz[::-1]], axis=1))
+    expected = [Line(a, b) for a, b in zip(xyz.tolist(), xyz[::-1].tolist())]
+    assert allclose(lines.lengths(), [line.length for line in expected])
+    assert allclose(lines.midpoints().array.tolist(), [line.midpoint for line in expected])
+    transformed = lines.transformed(X)
+    assert allclose(transformed.start.array.tolist(), [line.transformed(X).start for line in expected])
+
+
+def test_plane_array(xyz):
+    planes = PlaneArray(numpy.stack([xyz, xyz[::-1]], axis=1))
+    expected = [Plane(a, b) for a, b in zip(xyz.tolist(), xyz[::-1].tolist())]
+    assert allclose(planes.distances_to_points([1, 2, 3]), [distance_point_plane([1, 2, 3], plane) for plane in expected])
+    transformed = planes.transformed(X)
+    assert allclose(transformed.normals.array.tolist(), [plane.transformed(X).normal for plane in expected])
+
+
+def test_frame_array(xyz):
+    frames = [Frame(point, xaxis, yaxis) for point, xaxis, yaxis in zip(xyz[::-1].tolist(), xyz.tolist(), numpy.roll(xyz, 1, axis=0).tolist())]
+    array = FrameArray(frames)
+    assert allclose(array.xaxes.array.tolist(), [frame.xaxis for frame in frames])
+    assert allclose(array.yaxes.array.tolist(), [frame.yaxis for frame in frames])
+    transformed = array.transformed(X)
+    for frame, expected in zip(transformed.to_frames(), frames):
+        expected = expected.transformed(X)
+        assert allclose(frame.point, expected.point)
+        assert allclose(frame.xaxis, expected.xaxis)
+        assert allclose(frame.yaxis, expected.yaxis)
+    local = array.to_local_coordinates([1, 2, 3])
+    assert allclose(array.to_world_coordinates(local).tolist(), [[1, 2, 3]] * len(frames))
+    T = TransformationArray.from_frames(frames)
+    assert allclose(FrameArray.from_transformations(T).array.tolist(), array.array.tolist())
+    assert T.allclose(array.to_transformations())
+
+
+def test_input_is_not_modified(xyz):
+    planes = numpy.stack([xyz, xyz[::-1]], axis=1)
+    frames = numpy.stack([xyz[::-1], xyz, numpy.roll(xyz, 1, axis=0)], axis=1)
+    points = xyz.copy()
+    expected = [planes.copy(), frames.copy(), points.copy()]
+    PlaneArray(planes)
+    FrameArray(frames)
+    PointArray(points)[0] = [0.0, 0.0, 0.0]
+    for data, copy in zip([planes, frames, points], expected):
+        assert (data == copy).all()
+
+
+def test_transformation_per_element(xyz):
+    points = PointArray(xyz)
+    T = TransformationArray.from_translations(xyz)
+    assert allclose(points.transformed(T).array.tolist(), (2 * xyz).tolist())
@@ -0,0 +1,127 @@
+import numpy
+import pytest
+
+import compas.geometry
+from compas.geometry import allclose
+from compas.geometry import centroid_points
+from compas.geometry import centroid_points_weighted
+from compas.geometry import distance_point_plane
+from compas.geometry import distance_point_point
+from compas.geometry import distance_point_point_sqrd
+from compas.geometry import normal_polygon
+from compas.geometry import normal_triangle
+from compas.geometry import normal_triangle_xy
+from compas.geometry._core import _algebra
+from compas.geometry._core import _algebra_numpy
+
+
+RS = numpy.random.RandomState(0)
+U = RS.uniform(-5, 5, (10, 3))
+V = RS.uniform(-5, 5, (10, 3))
+U[3] = 0.0
+F = RS.uniform(-2, 2, 10)
+
+# functions of one vector, applied to every vector
+UNARY = [
+    'length_vector', 'length_vector_xy', 'length_vector_sqrd', 'length_vector_sqrd_xy', 'norm_vector',
+    'normalize_vector', 'normalize_vector_xy', 'square_vector',
+    'vector_average', 'vector_variance', 'vector_standard_deviation', 'argmax', 'argmin',
+]
+
+# functions of two vectors, applied to pairs of vectors
+BINARY = [
+    'add_vectors', 'add_vectors_xy', 'subtract_vectors', 'subtract_vectors_xy',
+    'multiply_vectors', 'multiply_vectors_xy', 'divide_vectors', 'divide_vectors_xy',
+    'cross_vectors', 'cross_vectors_xy', 'dot_vectors', 'dot_vectors_xy',
+    'vector_component', 'vector_component_xy',
+]
+
+# functions of lists of vectors
+LISTS = ['norm_vectors', 'normalize_vectors', 'normalize_vectors_xy', 'square_vectors', 'homogenize_vectors']
+
+
+def pure(name):
+    return getattr(compas.geometry, name)
+
+
+def vectorized(name):
+    return getattr(_algebra_numpy, name + '_numpy')
+
+
+def test_all_functions_mirrored():
+    names = [name[:-len('_numpy')] for name in _algebra_numpy.__all__]
+    assert sorted(names) == sorted(_algebra.__all__)
+
+
+@pytest.mark.parametrize('name', UNARY)
+def test_unary(name):
+    assert allclose(vectorized(name)(U).tolist(), [pure(name)(u.tolist()) for u in U])
+
+
+@pytest.mark.parametrize('name', BINARY)
+def test_binary(name):
+    W = V if 'divide' not in name else V + 10
+    assert allclose(vectorized(name)(U, W).tolist(), [pure(name)(u.tolist(), w.tolist()) for u, w in zip(U, W)])
+    # broadcasting of a single vector
+    assert allclose(vectorized(name)(U, W[0]).tolist(), [pure(name)(u.tolist(), W[0].tolist()) for u in U])
+
+
+@pytest.mark.parametrize('name', LISTS)
+def test_lists(name):
+    assert allclose(vectorized(name)(U).tolist(), pure(name)(U.tolist()))
+
+
+def test_scale():
+    for name in ('scale_vector', 'scale_vector_xy', 'scale_vectors', 'scale_vectors_xy'):
+        assert allclose(vectorized(name)(U, 2.5).tolist(), pure(name)(U.tolist(), 2.5) if name.endswith('s') or name.endswith('s_xy') else [pure(name)(u.tolist(), 2.5) for u in U])
+    assert allclose(vectorized('scale_vector')(U, F).tolist(), [pure('scale_vector')(u.tolist(), f) for u, f in zip(U, F)])
+
+
+def test_power():
+    assert allclose(vectorized('power_vector')(U, 3).tolist(), [pure('power_vector')(u.tolist(), 3) for u in U])
+    assert allclose(vectorized('power_vectors')(U, 3).tolist(), pure('power_vectors')(U.tolist(), 3))
+
+
+def test_sums():
+    for axis in (0, 1):
+        assert allclose(vectorized('sum_vectors')(U, axis).tolist(), pure('sum_vectors')(U.tolist(), axis))
+
+
+def test_matrices():
+    A = RS.uniform(-1, 1, (3, 4))
+    B = RS.uniform(-1, 1, (4, 2))
+    assert allclose(vectorized('multiply_matrices')(A, B).tolist(), pure('multiply_matrices')(A.tolist(), B.tolist()))
+    assert allclose(vectorized('multiply_matrix_vector')(A, B[:, 0]).tolist(), pure('multiply_matrix_vector')(A.tolist(), B[:, 0].tolist()))
+    assert allclose(vectorized('transpose_matrix')(A).tolist(), pure('transpose_matrix')(A.tolist()))
+
+
+def test_homogeneous():
+    H = vectorized('homogenize_vectors')(U, 2.0)
+    assert allclose(H.tolist(), pure('homogenize_vectors')(U.tolist(), 2.0))
+    assert allclose(vectorized('dehomogenize_vectors')(H).tolist(), pure('dehomogenize_vectors')(H.tolist()))
+
+
+def test_orthonormalize():
+    vectors = [[1.0, 1.0, 0.0], [2.0, 2.0, 0.0], [0.0, 1.0, 0.0], [1.0, 2.0, 3.0]]
+    assert allclose(vectorized('orthonormalize_vectors')(vectors).tolist(), pure('orthonormalize_vectors')(vectors))
+
+
+def test_close():
+    assert vectorized('close')(U, U + 1e-6).all() and pure('close')(1.0, 1.0 + 1e-6)
+    assert vectorized('allclose')(U, U + 1e-6) == pure('allclose')(U.tolist(), (U + 1e-6).tolist())
+    assert vectorized('allclose')(U, U + 1e-3) == pure('allclose')(U.tolist(), (U + 1e-3).tolist())
+
+
+def test_dispatch():
+    polygons = RS.uniform(-1, 1, (5, 6, 3))
+    assert allclose(centroid_points(polygons).tolist(), [centroid_points(polygon.tolist()) for polygon in polygons])
+    assert allclose(centroid_points_weighted(U, F).tolist(), centroid_points_weighted(U.tolist(), F.tolist()))
+    assert allclose(normal_polygon(polygons).tolist(), [normal_polygon(polygon.tolist()) for polygon in polygons])
+    assert allclose(normal_polygon(polygons, False).tolist(), [normal_polygon(polygon.tolist(), False) for polygon in polygons])
+    assert allclose(normal_triangle(polygons[:, :3]).tolist(), [normal_triangle(polygon[:3].tolist()) for polygon in polygons])
+    assert allclose(normal_triangle_xy(polygons[:, :3], False).tolist(), [normal_triangle_xy(polygon[:3].tolist(), False) for polygon in polygons])
+    assert allclose(normal_triangle_xy(numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 1.0], [0.0, 1.0, 2.0]]), False).tolist(), [0.0, 0.0, 1.0])
+    assert allclose(distance_point_point(U, V).tolist(), [distance_point_point(u.tolist(), v.tolist()) for u, v in zip(U, V)])
+    assert allclose(distance_point_point_sqrd(U, V[0]).tolist(), [distance_point_point_sqrd(u.tolist(), V[0].tolist()) for u in U])
+    plane = ([1.0, 2.0, 3.0], [0.0, 1.0, 1.0])
+    assert allclose(distance_point_plane(U, plane).tolist(), [distance_point_plane(u.tolist(), plane) for u in U])
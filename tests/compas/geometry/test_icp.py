@@ -0,0 +1,69 @@
+import numpy
+import pytest
+
+from compas.geometry import ICP
+from compas.geometry import Rotation
+from compas.geometry import Transformation
+from compas.geometry import Translation
+from compas.geometry import icp_numpy
+from compas.geometry import transform_points_numpy
+
+
+X = Translation.from_vector([0.2, -0.1, 0.05]) * Rotation.from_axis_and_angle([1.0, 1.0, 1.0], 0.05)
+
+
+@pytest.fixture
+def clouds():
+    rs = numpy.random.RandomState(0)
+    xy = rs.uniform(0, 1, (20000, 2)) * [4, 2]
+    target = numpy.column_stack([xy, 0.5 * numpy.sin(1.3 * xy[:, 0]) * numpy.cos(1.7 * xy[:, 1]) + 0.1 * xy[:, 0]])
+    source = transform_points_numpy(target, X.inverse())
+    return source, target
+
+
+def error(T):
+    return numpy.abs(numpy.array(T.matrix) - numpy.array(X.matrix)).max()
+
+
+@pytest.mark.parametrize('method', ['point_to_point', 'point_to_plane'])
+def test_register(clouds, method):
+    source, target = clouds
+    T, info = ICP(target).register(source, method=method, tol=1e-9)
+    assert error(T) < 1e-4
+    assert info['converged']
+    assert len(info['residuals']) == len(info['times']) == info['iterations']
+
+
+def test_register_schedule(clouds):
+    source, target = clouds
+    schedule = [{'voxel_size': 0.2}, {'sample': 0.5, 'trim': 0.9, 'tol': 1e-9}]
+    T, info = ICP(target).register(source, schedule=schedule, seed=0)
+    assert error(T) < 1e-4
+    assert set(info['stages']) == {0, 1}
+    assert max(info['correspondences'][:info['stages'].index(1)]) < 1000
+
+
+def test_register_outliers(clouds):
+    source, target = clouds
+    outliers = numpy.random.RandomState(1).uniform(-2, 6, (1000, 3))
+    source = numpy.vstack([source, outliers])
+    T, _ = ICP(target).register(source, trim=0.9, tol=1e-9)
+    assert error(T) < 1e-6
+    T, _ = ICP(target).register(source, method='point_to_plane', trim=0.9, max_distance=0.5, tol=1e-9)
+    assert error(T) < 1e-6
+
+
+def test_register_initial(clouds):
+    source, target = clouds
+    T, info = ICP(target).register(source, initial=X, maxiter=5)
+    assert error(T) < 1e-6
+    assert info['residuals'][0] < 1e-6
+    with pytest.raises(ValueError):
+        ICP(target).register(source, schedule=[{'voxel': 0.1}])
+
+
+def test_icp_numpy(clouds):
+    source, target = clouds
+    points, T = icp_numpy(source, target)
+    assert isinstance(T, Transformation)
+    assert numpy.allclose(points, transform_points_numpy(source, T))
@@ -0,0 +1,64 @@
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import LazyGeometry
+from compas.geometry import Point
+from compas.geometry import PointCollection
+from compas.geometry import Polyline
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas.geometry import allclose
+
+
+def numbers(data):
+    if isinstance(data, dict):
+        return [x for key in sorted(data) for x in numbers(data[key])]
+    if isinstance(data, (list, tuple)):
+        return [x for item in data for x in numbers(item)]
+    return [data]
+
+
+R = Rotation.from_axis_and_angle([1.0, 1.0, 1.0], 0.3, point=[1.0, 0.0, 0.0])
+T = Translation.from_vector([1.0, 2.0, 3.0])
+
+
+def test_lazy_point():
+    point = Point(1.0, 2.0, 3.0)
+    lazy = point.lazy()
+    expected = point.copy()
+    for _ in range(5):
+        lazy = lazy.transformed(R).transformed(T)
+        expected.transform(R)
+        expected.transform(T)
+    assert isinstance(lazy, LazyGeometry)
+    assert point == [1.0, 2.0, 3.0]
+    assert allclose(lazy, expected)
+    assert allclose([lazy.x, lazy.y, lazy.z], expected)
+
+
+def test_lazy_shapes():
+    box = Box(Frame.worldXY(), 1.0, 2.0, 3.0)
+    polyline = Polyline([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    for geometry in (box, polyline, Frame([1, 2, 3], [1, 1, 0], [0, 1, 0])):
+        lazy = geometry.lazy()
+        lazy.transform(R)
+        lazy.transform(T)
+        expected = geometry.transformed(R).transformed(T)
+        assert allclose(numbers(lazy.data), numbers(expected.data))
+
+
+def test_lazy_cache():
+    lazy = Box(Frame.worldXY(), 1.0, 2.0, 3.0).lazy()
+    geometry = lazy.geometry
+    assert lazy.geometry is geometry
+    lazy.transform(T)
+    assert lazy.geometry is not geometry
+    assert allclose(lazy.frame.point, [1.0, 2.0, 3.0])
+
+
+def test_lazy_point_collection():
+    points = [Point(i, 0, 0) for i in range(10)]
+    collection = PointCollection(points)
+    lazy = collection.lazy().transformed(T).transformed(R)
+    for point, original in zip(lazy, points):
+        assert allclose(point, original.transformed(T).transformed(R))
+    assert points[3] == [3.0, 0.0, 0.0]
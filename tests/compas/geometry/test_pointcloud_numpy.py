@@ -0,0 +1,54 @@
+import numpy as np
+
+from compas.geometry import Pointcloud
+from compas.geometry import voxel_downsample_numpy
+from compas.geometry import statistical_outliers_numpy
+from compas.geometry import estimate_normals_numpy
+from compas.geometry import radius_graph_numpy
+from compas.numerical import pca_numpy
+
+
+def grid(n=20):
+    x, y = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    return np.column_stack([x.ravel(), y.ravel(), np.zeros(n * n)])
+
+
+def test_voxel_downsample_numpy():
+    points = np.array(Pointcloud.from_bounds(10, 10, 10, 2000).points)
+    centroids = voxel_downsample_numpy(points, 2.5)
+    first = voxel_downsample_numpy(points, 2.5, reduce='first')
+    assert len(centroids) == len(first) <= 64
+    cells = np.floor((centroids - points.min(axis=0)) / 2.5)
+    assert len(np.unique(cells, axis=0)) == len(centroids)
+    assert np.allclose(centroids.mean(axis=0), points.mean(axis=0), atol=1.0)
+    assert all(any(np.allclose(p, q) for q in points) for p in first)
+
+
+def test_statistical_outliers_numpy():
+    points = np.vstack([grid(), [[5.5, 5.5, 8.0], [12.5, 3.5, -6.0]]])
+    outliers = statistical_outliers_numpy(points, k=8, chunksize=50)
+    assert outliers.nonzero()[0].tolist() == [400, 401]
+
+
+def test_estimate_normals_numpy():
+    rs = np.random.RandomState(0)
+    points = rs.uniform(-1, 1, (500, 3)) * [10, 10, 0.01]
+    normals = estimate_normals_numpy(points, k=12, chunksize=64)
+    assert np.allclose(normals, [0, 0, 1], atol=1e-2)
+    normals = estimate_normals_numpy(points, k=12, viewpoint=[0, 0, -100])
+    assert np.allclose(normals, [0, 0, -1], atol=1e-2)
+    # consistent with a PCA of the neighbourhood
+    nbrs = np.argsort(((points - points[0]) ** 2).sum(axis=1))[:12]
+    _, axes, _ = pca_numpy(points[nbrs])
+    assert np.isclose(abs(np.dot(axes[2], estimate_normals_numpy(points, k=12)[0])), 1.0)
+
+
+def test_radius_graph_numpy():
+    points = grid(10)
+    graph = radius_graph_numpy(points, 1.01, chunksize=7)
+    assert graph.shape == (100, 100)
+    assert (graph != graph.T).nnz == 0
+    degrees = np.diff(graph.indptr)
+    assert degrees[0] == 2 and degrees[11] == 4
+    assert graph.nnz == 2 * 180
+    assert np.allclose(graph.data, 1.0)
@@ -0,0 +1,98 @@
+import numpy
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Rotation
+from compas.geometry import Scale
+from compas.geometry import Shear
+from compas.geometry import Transformation
+from compas.geometry import TransformationArray
+from compas.geometry import Translation
+from compas.geometry import allclose
+from compas.geometry import decompose_matrix
+from compas.geometry import transform_points
+from compas.geometry.transformations.transformation_numpy import _transform_coordinates
+
+
+def transformations():
+    transformations = [
+        Rotation.from_axis_and_angle([1, 2, 3], 0.5, point=[1, 0, 0]),
+        Translation.from_vector([1, 2, 3]) * Scale.from_factors([1, 2, 3]),
+        Shear.from_angle_direction_plane(0.3, [1, 0, 0], ([0, 0, 0], [0, 0, 1])) * Rotation.from_euler_angles([0.1, 0.2, 0.3]),
+        Transformation.from_frame(Frame([1, 2, 3], [1, 1, 0], [0, 1, 1])),
+    ]
+    return [Transformation(T.matrix) for T in transformations]
+
+
+def test_concatenated():
+    A = transformations()
+    B = A[::-1]
+    X = TransformationArray(A) * TransformationArray(B)
+    for T, a, b in zip(X, A, B):
+        assert T == a * b
+    R = Transformation(Rotation.from_axis_and_angle([0, 0, 1], 1.0).matrix)
+    for T, a in zip(R * TransformationArray(A), A):
+        assert T == R * a
+    for T, a in zip(TransformationArray(A) * R, A):
+        assert T == a * R
+
+
+def test_inverse():
+    A = transformations()
+    for T, a in zip(TransformationArray(A).inverse(), A):
+        assert T == a.inverse()
+
+
+def test_decomposed():
+    A = transformations()
+    scale, shear, angles, translation, perspective = TransformationArray(A).decomposed()
+    for i, a in enumerate(A):
+        expected = decompose_matrix(a.matrix)
+        assert allclose(scale[i], expected[0])
+        assert allclose(shear[i], expected[1])
+        assert allclose(angles[i], expected[2])
+        assert allclose(translation[i], expected[3])
+        assert allclose(perspective[i], expected[4])
+
+
+def test_transform_points():
+    A = transformations()
+    points = numpy.random.RandomState(0).uniform(-1, 1, (10, 3))
+    result = TransformationArray(A).transform_points(points)
+    assert result.shape == (len(A), 10, 3)
+    for xyz, a in zip(result, A):
+        expected = [Point(*point).transformed(a) for point in points.tolist()]
+        assert allclose(xyz.tolist(), expected)
+
+
+def test_transform_coordinates():
+    A = transformations()
+    # a projective transformation, to check the perspective division
+    A[0].matrix[3] = [0.1, 0.0, 0.2, 1.0]
+    M = numpy.array([T.matrix for T in A])
+    points = numpy.random.RandomState(0).uniform(-1, 1, (len(A), 10, 3))
+    shared = _transform_coordinates(points[0], M, 1.0)
+    stacked = _transform_coordinates(points, M, 1.0)
+    for i, T in enumerate(A):
+        assert allclose(_transform_coordinates(points[0], M[i], 1.0).tolist(), transform_points(points[0].tolist(), T.matrix))
+        assert allclose(shared[i].tolist(), transform_points(points[0].tolist(), T.matrix))
+        assert allclose(stacked[i].tolist(), transform_points(points[i].tolist(), T.matrix))
+    single = _transform_coordinates(points, M[0], 1.0)
+    assert single.shape == points.shape
+    assert allclose(single[2].tolist(), transform_points(points[2].tolist(), A[0].matrix))
+    vectors = _transform_coordinates(points, M, 0.0)
+    assert allclose(vectors[1].tolist(), points[1].dot(M[1, :3, :3].T).tolist())
+
+
+def test_frames():
+    frames = [Frame([i, 1, 2], [1, i, 0], [0, 1, 1]) for i in range(4)]
+    X = TransformationArray.from_frames(frames)
+    for T, frame in zip(X, frames):
+        assert T == Transformation.from_frame(frame)
+    for frame, expected in zip(X.to_frames(), frames):
+        assert allclose(frame.point, expected.point)
+        assert allclose(frame.xaxis, expected.xaxis)
+        assert allclose(frame.yaxis, expected.yaxis)
+    Y = TransformationArray.from_frame_to_frame(frames, frames[::-1])
+    for T, a, b in zip(Y, frames, frames[::-1]):
+        assert T == Transformation.from_frame_to_frame(a, b)
@@ -0,0 +1,125 @@
+import os
+import random
+import threading
+
+import numpy
+import pytest
+
+from compas.numerical import Checkpointer
+from compas.numerical import devo_numpy
+from compas.numerical import ga
+from compas.numerical import moga
+from compas.numerical import read_checkpoint
+
+
+class Preempted(Exception):
+    pass
+
+
+def preempt_after(fn, count):
+    calls = [0]
+
+    def wrapped(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] > count:
+            raise Preempted
+        return fn(*args, **kwargs)
+
+    return wrapped
+
+
+def wait_for_writes():
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread():
+            thread.join()
+
+
+def sphere(X):
+    return sum((x - 0.3) ** 2 for x in X)
+
+
+def test_ga_resume(tmpdir):
+    path = str(tmpdir) + '/'
+    checkpoint = os.path.join(path, 'ga.ckpt')
+    kwargs = dict(num_gen=20, num_pop=20, num_elite=4, output_path=path, print_refresh=100)
+
+    random.seed(0)
+    reference = ga(sphere, 'min', 3, [(-1, 1)] * 3, **kwargs)
+
+    random.seed(0)
+    with pytest.raises(Preempted):
+        ga(preempt_after(sphere, 60), 'min', 3, [(-1, 1)] * 3, checkpoint_path=checkpoint, **kwargs)
+    wait_for_writes()
+    state = read_checkpoint(checkpoint)
+    assert 0 < state['generation'] < 20
+
+    random.seed(1)
+    calls = []
+    resumed = ga(lambda X: calls.append(X) or sphere(X), 'min', 3, [(-1, 1)] * 3, checkpoint_path=checkpoint, resume=True, **kwargs)
+    assert resumed.best_fit == reference.best_fit
+    assert resumed.current_pop['scaled'] == reference.current_pop['scaled']
+    assert len(calls) + len(state['ind_fit_dict']) == len(reference.ind_fit_dict)
+
+
+def f1(X):
+    return X[0]
+
+
+def f2(X):
+    return (1 + X[1]) * (1 - X[0] ** 0.5)
+
+
+def test_moga_resume(tmpdir):
+    path = str(tmpdir) + '/'
+    checkpoint = os.path.join(path, 'moga.ckpt')
+    kwargs = dict(num_gen=10, num_pop=20, output_path=path)
+
+    random.seed(0)
+    reference = moga([f1, f2], ['min', 'min'], 2, [(0, 1)] * 2, **kwargs)
+
+    random.seed(0)
+    with pytest.raises(Preempted):
+        moga([preempt_after(f1, 100), f2], ['min', 'min'], 2, [(0, 1)] * 2, checkpoint_path=checkpoint, **kwargs)
+    wait_for_writes()
+    state = read_checkpoint(checkpoint)
+    assert 0 < state['generation'] < 10
+
+    random.seed(1)
+    resumed = moga([f1, f2], ['min', 'min'], 2, [(0, 1)] * 2, checkpoint_path=checkpoint, resume=True, **kwargs)
+    assert resumed.parent_pop['binary'] == reference.parent_pop['binary']
+    assert resumed.parent_pop['fit_values'] == reference.parent_pop['fit_values']
+
+
+def test_devo_resume(tmpdir):
+    checkpoint = os.path.join(str(tmpdir), 'devo.ckpt')
+
+    def fn(u, *args):
+        return float(((u - 0.3) ** 2).sum())
+
+    bounds = [[-1.0, 1.0]] * 3
+
+    numpy.random.seed(0)
+    reference = devo_numpy(fn, bounds, 20, 30, printout=0)
+
+    numpy.random.seed(0)
+    with pytest.raises(Preempted):
+        devo_numpy(preempt_after(fn, 300), bounds, 20, 30, printout=0, checkpoint_path=checkpoint)
+    wait_for_writes()
+
+    numpy.random.seed(1)
+    resumed = devo_numpy(fn, bounds, 20, 30, printout=0, checkpoint_path=checkpoint, resume=True)
+    assert resumed[0] == reference[0]
+    assert resumed[1] == reference[1]
+
+
+def test_write_error(tmpdir):
+    # the folder of the checkpoint does not exist
+    checkpointer = Checkpointer(os.path.join(str(tmpdir), 'missing', 'run.ckpt'))
+    assert checkpointer.save(1, {'generation': 1})
+    with pytest.raises(IOError):
+        checkpointer.close()
+    checkpointer.close()
+
+    checkpointer.save(2, {'generation': 2})
+    with pytest.raises(IOError):
+        checkpointer.save(3, {'generation': 3})
@@ -0,0 +1,31 @@
+import threading
+
+import pytest
+
+from compas.numerical import devo_numpy
+
+
+def booth(u, *args):
+    return (u[0] + 2 * u[1] - 7) ** 2 + (2 * u[0] + u[1] - 5) ** 2
+
+
+def test_devo_modes_identical():
+    bounds = [(-10, 10), (-15, 15)]
+    kwargs = dict(printout=0, neutrals=0, seed=42)
+    serial = devo_numpy(booth, bounds, 30, 50, **kwargs)
+    threads = devo_numpy(booth, bounds, 30, 50, evaluator='threads', num_workers=2, **kwargs)
+    processes = devo_numpy(booth, bounds, 30, 50, evaluator='processes', num_workers=2, **kwargs)
+    vectorized = devo_numpy(booth, bounds, 30, 50, vectorized=True, **kwargs)
+    assert serial == threads == processes
+    assert abs(serial[0] - vectorized[0]) < 1e-12
+    assert abs(serial[0]) < 1e-2
+
+
+def test_devo_releases_workers_on_error():
+    def fails(u, *args):
+        raise ValueError
+
+    before = threading.active_count()
+    with pytest.raises(ValueError):
+        devo_numpy(fails, [(-10, 10), (-15, 15)], 30, 50, evaluator='threads', num_workers=2, printout=0)
+    assert threading.active_count() == before
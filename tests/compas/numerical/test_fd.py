@@ -0,0 +1,45 @@
+import random
+
+from numpy import allclose
+
+from compas.numerical import fd_numpy
+from compas.numerical import ForceDensitySolver
+
+
+def grid(n):
+    vertices = [[i, j, 0.0] for j in range(n) for i in range(n)]
+    edges = []
+    for j in range(n):
+        for i in range(n):
+            k = j * n + i
+            if i < n - 1:
+                edges.append([k, k + 1])
+            if j < n - 1:
+                edges.append([k, k + n])
+    fixed = [0, n - 1, n * n - n, n * n - 1]
+    return vertices, edges, fixed
+
+
+def test_solver_matches_fd_numpy():
+    vertices, edges, fixed = grid(6)
+    loads = [[0.0, 0.0, -1.0] for _ in vertices]
+    solver = ForceDensitySolver(vertices, edges, fixed)
+    for _ in range(3):
+        q = [random.uniform(0.5, 5.0) for _ in edges]
+        expected = fd_numpy(vertices, edges, fixed, q, loads)
+        result = solver.solve(q, loads)
+        for a, b in zip(expected, result):
+            assert allclose(a, b)
+
+
+def test_solver_batch():
+    vertices, edges, fixed = grid(4)
+    loads = [[0.0, 0.0, -1.0] for _ in vertices]
+    qs = [[random.uniform(0.5, 5.0) for _ in edges] for _ in range(5)]
+    solver = ForceDensitySolver(vertices, edges, fixed)
+    xyz, q, f, l, r = solver.solve_many(qs, loads)
+    assert xyz.shape == (5, len(vertices), 3)
+    for i in range(5):
+        assert allclose(xyz[i], fd_numpy(vertices, edges, fixed, qs[i], loads)[0])
+    xyz_parallel = solver.solve_many(qs, loads, processes=2)[0]
+    assert allclose(xyz, xyz_parallel)
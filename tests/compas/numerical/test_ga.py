@@ -0,0 +1,136 @@
+import random
+
+from compas.numerical import ga
+from compas.numerical import moga
+from compas.numerical.ga.moga import MOGA
+from compas.numerical import non_dom_sort_numpy
+from compas.numerical import code_decoded_numpy
+from compas.numerical import decode_binary_pop_numpy
+from compas.numerical import npoint_crossover_numpy
+from compas.numerical import random_mutation_numpy
+
+
+def sphere(X):
+    return sum(x ** 2 for x in X)
+
+
+def f1(X):
+    return X[0]
+
+
+def f2(X):
+    return (1 + X[1]) * (1 - X[0] ** 0.5)
+
+
+def test_ga_evaluators(tmpdir):
+    results = []
+    for evaluator in ('serial', 'threads', lambda P: (P ** 2).sum(axis=1)):
+        random.seed(0)
+        result = ga(sphere, 'min', 2, [(-1, 1)] * 2, num_gen=10, num_pop=20, num_elite=4,
+                    output_path=str(tmpdir) + '/', evaluator=evaluator, num_workers=2, print_refresh=100)
+        results.append(result.best_fit)
+    assert results[0] == results[1]
+    assert abs(results[0] - results[2]) < 1e-9
+
+
+def test_ga_cache(tmpdir):
+    calls = []
+
+    def fitness(X):
+        calls.append(X)
+        return sphere(X)
+
+    random.seed(0)
+    result = ga(fitness, 'min', 2, [(-1, 1)] * 2, num_gen=5, num_pop=20, num_elite=4,
+                output_path=str(tmpdir) + '/', print_refresh=100)
+    assert len(calls) == len(result.ind_fit_dict)
+
+
+def test_moga_batch(tmpdir):
+    def batch(P):
+        return [[f1(x), f2(x)] for x in P]
+
+    result = moga([f1, f2], ['min', 'min'], 2, [(0, 1)] * 2, num_gen=3, num_pop=10,
+                  output_path=str(tmpdir) + '/', evaluator=batch)
+    assert len(result.parent_pop['fit_values']) == 10
+
+
+def test_non_dom_sort_numpy_matches():
+    random.seed(1)
+    fit_values = [[random.randint(0, 5), random.randint(0, 5)] for _ in range(40)]
+
+    def ranking(sort):
+        m = MOGA()
+        m.num_pop = 20
+        m.num_fit_func = 2
+        m.fit_types = ['min', 'max']
+        m.combined_pop['fit_values'] = fit_values
+        m.domination_count = {}
+        m.dominated_set = []
+        m.dominating_individuals = []
+        m.pareto_front_indices = []
+        m.pareto_front_individuals = []
+        getattr(m, sort)()
+        for u in range(len(m.pareto_front_indices) - 1):
+            m.extract_pareto_front(u)
+            m.calculate_crowding_distance()
+        return m.pareto_front_indices, m.pareto_front_individuals, m.new_pop_cd
+
+    indices, individuals, crowding = ranking('_non_dom_sort_python')
+    assert ranking('_non_dom_sort_numpy') == (indices, individuals, crowding)
+
+    fronts = non_dom_sort_numpy(fit_values, ['min', 'max'])
+    for level in range(len(indices) - 1):
+        assert all(fronts[i] == level for i in individuals[indices[level]:indices[level + 1]])
+
+
+def test_coding_roundtrip():
+    decoded = [[5, 3, 200], [0, 1, 255]]
+    binary = code_decoded_numpy(decoded, [3, 2, 8])
+    assert decode_binary_pop_numpy(binary, [3, 2, 8]).tolist() == decoded
+
+
+def test_npoint_crossover_numpy():
+    import numpy
+
+    rng = numpy.random.RandomState(0)
+    a = rng.randint(0, 2, (50, 12))
+    b = rng.randint(0, 2, (50, 12))
+    for n_cross in (1, 3):
+        c, d = npoint_crossover_numpy(a, b, n_cross, rng=rng)
+        assert c.shape == d.shape == a.shape
+        # every gene comes from one of the parents, and the other child gets the other gene
+        assert ((c == a) | (c == b)).all()
+        assert (c + d == a + b).all()
+        # with complementary parents, the genes switch parent at exactly n_cross points
+        c, d = npoint_crossover_numpy(numpy.zeros((50, 12), dtype=int), numpy.ones((50, 12), dtype=int), n_cross, rng=rng)
+        assert (abs(numpy.diff(c, axis=1)).sum(axis=1) == n_cross).all()
+        assert (c + d == 1).all()
+
+
+def test_random_mutation_numpy():
+    import numpy
+
+    rng = numpy.random.RandomState(0)
+    pop = rng.randint(0, 2, (200, 50))
+    assert (random_mutation_numpy(pop, 0.0, rng=rng) == pop).all()
+    assert (random_mutation_numpy(pop, 1.0, rng=rng) == 1 - pop).all()
+    mutated = random_mutation_numpy(pop, 0.1, rng=rng)
+    assert mutated.shape == pop.shape
+    assert set(numpy.unique(mutated)) <= set([0, 1])
+    assert abs((mutated != pop).mean() - 0.1) < 0.01
+
+
+def test_ga_operators_keep_genome_length(tmpdir):
+    random.seed(2)
+    result = ga(sphere, 'min', 3, [(-1, 1)] * 3, num_gen=5, num_pop=20, num_elite=4, num_bin_dig=[4, 6, 8],
+                output_path=str(tmpdir) + '/', print_refresh=100)
+    for individual in result.current_pop['binary']:
+        assert [len(variable) for variable in individual] == [4, 6, 8]
+        assert all(gene in (0, 1) for variable in individual for gene in variable)
+
+    random.seed(2)
+    result = moga([f1, f2], ['min', 'min'], 2, [(0, 1)] * 2, num_gen=3, num_pop=10, num_bin_dig=[5, 7],
+                  output_path=str(tmpdir) + '/')
+    for individual in result.current_pop['binary']:
+        assert [len(variable) for variable in individual] == [5, 7]
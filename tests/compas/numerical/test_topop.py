@@ -0,0 +1,33 @@
+import pytest
+from numpy import allclose
+
+from compas.numerical import topop_numpy
+from compas.numerical import topop3d_numpy
+
+
+def test_topop_solvers():
+    nelx, nely = 30, 10
+    loads = {'15-0': [0, -1]}
+    supports = {'0-10': [1, 1], '30-10': [1, 1]}
+    direct = topop_numpy(nelx, nely, loads, supports, volfrac=0.4)
+    cg = topop_numpy(nelx, nely, loads, supports, volfrac=0.4, solver='cg')
+    assert direct.shape == (nely, nelx)
+    assert allclose(direct, cg, atol=1e-5)
+
+
+def test_topop_amg():
+    pytest.importorskip('pyamg')
+    nelx, nely = 30, 10
+    loads = {'15-0': [0, -1]}
+    supports = {'0-10': [1, 1], '30-10': [1, 1]}
+    direct = topop_numpy(nelx, nely, loads, supports, volfrac=0.4)
+    amg = topop_numpy(nelx, nely, loads, supports, volfrac=0.4, solver='amg')
+    assert allclose(direct, amg, atol=1e-5)
+
+
+def test_topop3d():
+    loads = {'8-0-{}'.format(k): [0, -1, 0] for k in range(3)}
+    supports = {'0-{}-{}'.format(j, k): [1, 1, 1] for j in range(5) for k in range(3)}
+    x = topop3d_numpy(8, 4, 2, loads, supports, volfrac=0.3)
+    assert x.shape == (4, 8, 2)
+    assert abs(x.mean() - 0.3) < 1e-2
@@ -0,0 +1,81 @@
+import itertools
+import os
+
+import pytest
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Transformation
+from compas.robots import RobotModel
+from compas.robots.base_artist import BaseRobotModelArtist
+
+BASE_FOLDER = os.path.dirname(__file__)
+
+
+class FakeArtist(BaseRobotModelArtist):
+    """Artist that keeps the accumulated transformation of every native geometry."""
+
+    def __init__(self, model):
+        self.transformed = []
+        super(FakeArtist, self).__init__(model)
+
+    def draw_geometry(self, geometry, name=None, color=None):
+        return {'name': name, 'transformation': Transformation()}
+
+    def transform(self, geometry, transformation):
+        self.transformed.append(geometry['name'])
+        geometry['transformation'] = transformation * geometry['transformation']
+
+
+@pytest.fixture
+def ur5():
+    model = RobotModel.from_urdf_file(os.path.join(BASE_FOLDER, 'fixtures', 'ur5.xacro'))
+    mesh = Mesh.from_shape(Box(Frame.worldXY(), 0.1, 0.1, 0.1))
+    for link in model.links:
+        for item in itertools.chain(link.visual, link.collision):
+            item.geometry.shape.geometry = mesh
+    return model
+
+
+def assert_native_geometry(model, joint_state):
+    transformations = model.compute_transformations(joint_state)
+    for joint in model.iter_joints():
+        for item in itertools.chain(joint.child_link.visual, joint.child_link.collision):
+            expected = transformations[joint.name] * item.init_transformation
+            for native in item.native_geometry:
+                assert native['transformation'] == expected
+
+
+def test_update(ur5):
+    artist = FakeArtist(ur5)
+    names = ur5.get_configurable_joint_names()
+    for values in ([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], [0.1, 0.2, 0.3, 0.4, 0.5, -0.6], [1.0, 0.2, 0.3, 0.4, 0.5, -0.6]):
+        artist.update(dict(zip(names, values)))
+        assert_native_geometry(ur5, dict(zip(names, values)))
+
+
+def test_update_only_changed_links(ur5):
+    artist = FakeArtist(ur5)
+    names = ur5.get_configurable_joint_names()
+    joint_state = dict(zip(names, [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]))
+    artist.update(joint_state)
+
+    del artist.transformed[:]
+    artist.update(joint_state)
+    assert not artist.transformed
+
+    joint_state['wrist_3_joint'] = 1.0
+    artist.update(joint_state)
+    assert artist.transformed
+    assert all('wrist_3_link' in name or 'ee_link' in name or 'tool0' in name for name in artist.transformed)
+    assert_native_geometry(ur5, joint_state)
+
+
+def test_update_collision_after_visual_only(ur5):
+    artist = FakeArtist(ur5)
+    names = ur5.get_configurable_joint_names()
+    joint_state = dict(zip(names, [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]))
+    artist.update(joint_state, collision=False)
+    artist.update(joint_state)
+    assert_native_geometry(ur5, joint_state)
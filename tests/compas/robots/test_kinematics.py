@@ -0,0 +1,118 @@
+import os
+
+import numpy
+import pytest
+
+from compas.geometry import Frame
+from compas.geometry import Transformation
+from compas.robots import Joint
+from compas.robots import Mimic
+from compas.robots import RobotModel
+
+BASE_FOLDER = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def ur5():
+    return RobotModel.from_urdf_file(os.path.join(BASE_FOLDER, 'fixtures', 'ur5.xacro'))
+
+
+@pytest.fixture
+def gripper():
+    """A revolute joint, followed by a prismatic joint and a mimicking prismatic joint on the same link."""
+    robot = RobotModel('gripper')
+    base = robot.add_link('base')
+    arm = robot.add_link('arm')
+    left = robot.add_link('left')
+    right = robot.add_link('right')
+    robot.add_joint('rotate', Joint.REVOLUTE, base, arm, Frame([0, 0, 1], [1, 0, 0], [0, 1, 0]), (0, 1, 0), limit=(-1.0, 1.0))
+    robot.add_joint('left', Joint.PRISMATIC, arm, left, Frame([0.5, 0, 1], [1, 0, 0], [0, 0, 1]), (0, 1, 0), limit=(0.0, 0.1))
+    joint = robot.add_joint('right', Joint.PRISMATIC, arm, right, Frame([0.5, 0, 1], [1, 0, 0], [0, 0, 1]), (0, 1, 0), limit=(-0.1, 0.0))
+    joint.mimic = Mimic('left', multiplier=-1.0)
+    return robot
+
+
+def link_frames(robot, names, values):
+    state = dict(zip(names, values))
+    frames = []
+    for link in robot.iter_links():
+        frame = robot.forward_kinematics(state, link.name)
+        frames.append(Transformation.from_frame(frame).matrix)
+    return frames
+
+
+def test_batch_forward_kinematics(ur5):
+    names = ur5.get_configurable_joint_names()
+    values = numpy.random.RandomState(0).uniform(-4, 4, (20, len(names)))
+    frames = ur5.batch_forward_kinematics(values)
+    assert frames.shape == (20, len(ur5.links), 4, 4)
+    for state, result in zip(values, frames):
+        assert numpy.allclose(result, link_frames(ur5, names, state))
+
+
+def test_batch_forward_kinematics_link(ur5):
+    names = ur5.get_configurable_joint_names()
+    values = numpy.random.RandomState(1).uniform(-4, 4, (5, len(names)))
+    frames = ur5.batch_forward_kinematics(values, link_name='tool0')
+    assert frames.shape == (5, 4, 4)
+    for state, result in zip(values, frames):
+        frame = ur5.forward_kinematics(dict(zip(names, state)), 'tool0')
+        assert numpy.allclose(result, Transformation.from_frame(frame).matrix)
+
+
+def test_batch_forward_kinematics_limits_and_mimic(gripper):
+    names = ['rotate', 'left']
+    values = [[0.5, 0.05], [2.0, 0.5], [-2.0, -0.5]]
+    frames = gripper.batch_forward_kinematics(values, joint_names=names)
+    for state, result in zip(values, frames):
+        assert numpy.allclose(result, link_frames(gripper, names, state))
+
+
+def test_compile_kinematics_cache(ur5):
+    chain = ur5.compile_kinematics()
+    assert ur5.compile_kinematics() is chain
+    ur5.scale(2.0)
+    assert ur5.compile_kinematics() is not chain
+
+
+def test_batch_forward_kinematics_shape_mismatch(ur5):
+    with pytest.raises(ValueError):
+        ur5.batch_forward_kinematics([[0.0, 0.0]])
+
+
+def test_jacobian_finite_differences(ur5):
+    names = ur5.get_configurable_joint_names()
+    values = numpy.random.RandomState(2).uniform(-3, 3, (4, len(names)))
+    J = ur5.jacobian(values, 'tool0')
+    h = 1e-6
+    for k in range(len(names)):
+        delta = numpy.zeros(len(names))
+        delta[k] = h
+        F0 = ur5.batch_forward_kinematics(values - delta, link_name='tool0')
+        F1 = ur5.batch_forward_kinematics(values + delta, link_name='tool0')
+        linear = (F1[:, :3, 3] - F0[:, :3, 3]) / (2 * h)
+        # the skew-symmetric matrix of the angular velocity is dR R^T
+        W = numpy.matmul((F1[:, :3, :3] - F0[:, :3, :3]) / (2 * h), F0[:, :3, :3].transpose((0, 2, 1)))
+        angular = numpy.stack([W[:, 2, 1], W[:, 0, 2], W[:, 1, 0]], axis=1)
+        assert numpy.allclose(J[:, :3, k], linear, atol=1e-5)
+        assert numpy.allclose(J[:, 3:, k], angular, atol=1e-5)
+
+
+def test_inverse_kinematics(ur5):
+    names = ur5.get_configurable_joint_names()
+    rs = numpy.random.RandomState(3)
+    values = rs.uniform(-2, 2, (50, len(names)))
+    targets = ur5.batch_forward_kinematics(values, link_name='tool0')
+    initial = values + rs.uniform(-0.3, 0.3, values.shape)
+    result, success, info = ur5.inverse_kinematics(targets, 'tool0', initial=initial)
+    assert success.all()
+    assert info['error'].max() <= 1e-6
+    assert numpy.allclose(ur5.batch_forward_kinematics(result, link_name='tool0'), targets, atol=1e-5)
+
+
+def test_inverse_kinematics_limits(gripper):
+    frame = Frame([1.0, 0, 0], [1, 0, 0], [0, 1, 0])
+    result, success, _ = gripper.inverse_kinematics([frame], 'left', joint_names=['rotate', 'left'], position_only=True, maxiter=20)
+    assert not success[0]
+    assert -1.0 <= result[0, 0] <= 1.0
+    assert 0.0 <= result[0, 1] <= 0.1
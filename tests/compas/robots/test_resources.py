@@ -0,0 +1,124 @@
+import os
+import shutil
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.robots import CachedMeshLoader
+from compas.robots import DefaultMeshLoader
+from compas.robots import RobotModel
+from compas.robots.resources.cached import mesh_from_bytes
+from compas.robots.resources.cached import mesh_to_bytes
+
+URDF = """<?xml version="1.0" encoding="UTF-8"?>
+<robot name="robot">
+  <link name="link0">
+    <visual><geometry><mesh filename="{a}"/></geometry></visual>
+    <collision><geometry><mesh filename="{a}"/></geometry></collision>
+  </link>
+  <link name="link1">
+    <visual><geometry><mesh filename="{b}"/></geometry></visual>
+    <collision><geometry><mesh filename="{c}"/></geometry></collision>
+  </link>
+  <joint name="joint1" type="continuous">
+    <parent link="link0"/>
+    <child link="link1"/>
+    <axis xyz="0 0 1"/>
+  </joint>
+</robot>
+"""
+
+
+class CountingLoader(DefaultMeshLoader):
+
+    def __init__(self):
+        super(CountingLoader, self).__init__()
+        self.count = 0
+
+    def load_mesh(self, url):
+        self.count += 1
+        return super(CountingLoader, self).load_mesh(url)
+
+
+@pytest.fixture
+def files(tmpdir):
+    a = os.path.join(str(tmpdir), 'a.obj')
+    b = os.path.join(str(tmpdir), 'b.obj')
+    c = os.path.join(str(tmpdir), 'c.stl')
+    shutil.copy(compas.get('faces.obj'), a)
+    # same contents as a, but another file
+    shutil.copy(compas.get('faces.obj'), b)
+    shutil.copy(compas.get('cube_binary.stl'), c)
+    return a, b, c
+
+
+def test_mesh_bytes():
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    other = mesh_from_bytes(mesh_to_bytes(mesh))
+    assert mesh.to_vertices_and_faces() == other.to_vertices_and_faces()
+
+
+def test_load_geometry_shares_meshes(files):
+    a, b, c = files
+    model = RobotModel.from_urdf_string(URDF.format(a=a, b=b, c=c))
+    model.load_geometry(num_workers=4)
+    link0, link1 = model.links
+    assert link0.visual[0].geometry.shape.geometry is link0.collision[0].geometry.shape.geometry
+    assert link1.visual[0].geometry.shape.geometry is not link0.visual[0].geometry.shape.geometry
+    assert link1.collision[0].geometry.shape.geometry.number_of_faces() == 12
+
+
+def test_cached_mesh_loader(files, tmpdir):
+    a, b, c = files
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+
+    loader = CountingLoader()
+    cached = CachedMeshLoader(loader, cache_dir=cache_dir)
+    assert cached.load_mesh(a) is cached.load_mesh(a)
+    # a and b have the same contents
+    assert cached.load_mesh(b) is cached.load_mesh(a)
+    assert cached.load_mesh(c).number_of_faces() == 12
+    assert loader.count == 2
+    assert len(os.listdir(cache_dir)) == 2
+
+    # a new loader reads the on-disk cache
+    loader = CountingLoader()
+    cached = CachedMeshLoader(loader, cache_dir=cache_dir)
+    assert cached.load_mesh(c).number_of_faces() == 12
+    assert loader.count == 0
+
+    # changed files are loaded again
+    shutil.copy(compas.get('quadmesh.obj'), b)
+    assert cached.load_mesh(b).number_of_faces() == Mesh.from_obj(compas.get('quadmesh.obj')).number_of_faces()
+    assert loader.count == 1
+
+    cached.clear()
+    assert not os.listdir(cache_dir)
+
+
+def test_key_is_cached(files, tmpdir):
+    a, b, c = files
+    cached = CachedMeshLoader(DefaultMeshLoader(), cache_dir=False)
+    key = cached.get_key(a)
+    stat = os.stat(a)
+
+    # the file is not read again if its modification time and size are the same
+    with open(a, 'rb') as f:
+        data = f.read()
+    with open(a, 'wb') as f:
+        f.write(data.upper())
+    os.utime(a, (stat.st_atime, stat.st_mtime))
+    assert cached.get_key(a) == key
+
+    os.utime(a, (stat.st_atime, stat.st_mtime + 10))
+    assert cached.get_key(a) != key
+
+
+def test_load_geometry_cache(files, tmpdir):
+    a, b, c = files
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+    model = RobotModel.from_urdf_string(URDF.format(a=a, b=b, c=c))
+    model.load_geometry(cache=cache_dir, num_workers=2)
+    assert model.links[0].visual[0].geometry.shape.geometry is model.links[1].visual[0].geometry.shape.geometry
+    assert len(os.listdir(cache_dir)) == 2
@@ -0,0 +1,69 @@
+import json
+
+from compas.rpc import Dispatcher
+
+
+def dispatch(dispatcher, name, *args, **kwargs):
+    profile = kwargs.pop('profile', False)
+    idict = {'args': list(args), 'kwargs': kwargs}
+    if profile:
+        idict['profile'] = True
+    return json.loads(dispatcher._dispatch(name, [json.dumps(idict)]))
+
+
+def test_profile_of_call():
+    dispatcher = Dispatcher()
+    odict = dispatch(dispatcher, 'math.sqrt', 4.0)
+
+    assert odict['data'] == 2.0
+    assert odict['error'] is None
+    assert set(odict['profile']) == set(['decode', 'import', 'arguments', 'execute', 'encode'])
+    assert all(value >= 0 for value in odict['profile'].values())
+
+
+def test_cprofile():
+    dispatcher = Dispatcher()
+    odict = dispatch(dispatcher, 'json.dumps', [1, 2, 3], profile=True)
+
+    rows = odict['profile']['cprofile']
+    assert rows
+    assert all(len(row) == 6 for row in rows)
+    assert any(row[2] == 'dumps' for row in rows)
+    assert rows == sorted(rows, key=lambda row: row[5], reverse=True)
+
+    dispatcher.PROFILE_SAMPLING = 1.0
+    odict = dispatch(dispatcher, 'math.sqrt', 4.0)
+    assert 'cprofile' in odict['profile']
+
+
+def test_profile_stats():
+    dispatcher = Dispatcher()
+    for i in range(5):
+        dispatch(dispatcher, 'math.sqrt', float(i))
+    dispatch(dispatcher, 'math.sqrt', -1.0)
+    dispatch(dispatcher, 'json.dumps', [1], profile=True)
+    dispatcher._dispatch_data('math.sqrt', {'args': [1.0], 'kwargs': {}})
+
+    stats = dispatcher.profile_stats(reset=True)
+    phases = stats['phases']
+    assert phases['total']['count'] == 8
+    assert phases['total']['errors'] == 1
+    assert phases['total']['implementations']['math.sqrt']['last_error'] == 'ValueError'
+    assert phases['execute']['implementations']['math.sqrt']['count'] == 7
+    # calls with deserialised input are not decoded and encoded by the dispatcher
+    assert phases['encode']['implementations']['math.sqrt']['count'] == 6
+    assert stats['samples'] == 1
+    assert stats['cprofile']
+
+    stats = dispatcher.profile_stats()
+    assert stats['phases'] == {}
+    assert stats['samples'] == 0
+
+
+def test_encoding_error():
+    dispatcher = Dispatcher()
+    odict = dispatch(dispatcher, 'builtins.object')
+
+    assert odict['data'] is None
+    assert 'TypeError' in odict['error']
+    assert 'encode' in odict['profile']
@@ -2,6 +2,7 @@
 
 from compas.geometry import allclose
 from compas.rpc import Proxy
+from compas.rpc import RPCServerError
 
 
 def test_basic_rpc_call():
@@ -18,3 +19,88 @@ def test_switch_package():
         r = proxy.inv(A)
 
     assert allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+def test_binary_transport():
+    import numpy as np
+
+    with Proxy('numpy', python='python', port=1754, transport='binary') as proxy:
+        a = np.arange(12.0).reshape((4, 3))
+        r = proxy.multiply(a, 2)
+
+    assert isinstance(r, np.ndarray)
+    assert r.shape == (4, 3)
+    assert np.allclose(r, 2 * a)
+
+
+def test_workers():
+    import threading
+    import time
+
+    results = []
+
+    def sleep(proxy):
+        results.append(getattr(proxy._server, 'time.sleep')({'args': [0.5], 'kwargs': {}}))
+
+    with Proxy(python='python', port=1755, transport='binary', workers=2, autoreload=False) as proxy:
+        threads = [threading.Thread(target=sleep, args=(proxy, )) for _ in range(2)]
+        t0 = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.time() - t0
+        stats = proxy.server_stats()
+
+    assert duration < 0.9
+    assert [result['error'] for result in results] == [None, None]
+    assert stats['workers'] == 2
+    assert stats['completed'] == 2
+    assert stats['pending'] == 0
+    assert stats['latency']['max'] >= 0.5
+
+
+def test_handles():
+    with Proxy('numpy', python='python', port=1756, autoreload=False) as proxy:
+        handle = proxy.upload([[1, 2], [3, 4]])
+        assert proxy.sum(handle) == 10
+        assert proxy.sum(a=handle, axis=0) == [4, 6]
+        assert proxy.store_info()['handles'] == [handle]
+        assert proxy.release(handle) == 1
+        try:
+            proxy.sum(handle)
+        except RPCServerError as e:
+            assert 'not available' in str(e)
+        else:
+            assert False
+
+
+def test_submit_and_batch():
+    with Proxy('numpy', python='python', port=1757, transport='binary', autoreload=False) as proxy:
+        futures = [proxy.submit('arange', i) for i in range(20)]
+        assert [len(future.result()) for future in futures] == list(range(20))
+        results = proxy.batch([('arange', [3]), ('linspace', [0, 1], {'num': 3}), ('arange', ['x'])], return_exceptions=True)
+        assert results[0].tolist() == [0, 1, 2]
+        assert results[1].tolist() == [0, 0.5, 1]
+        assert isinstance(results[2], RPCServerError)
+
+    with Proxy('numpy', python='python', port=1758, autoreload=False) as proxy:
+        futures = [proxy.submit('arange', i) for i in range(10)]
+        assert [len(future.result()) for future in futures] == list(range(10))
+        assert proxy.batch([('arange', [i]) for i in range(10)], parallel=True) == [list(range(i)) for i in range(10)]
+
+
+def test_profile_stats():
+    with Proxy('numpy', python='python', port=1759, workers=2, autoreload=False) as proxy:
+        proxy.cprofile = True
+        assert proxy.arange(5) == list(range(5))
+        assert proxy.profile['execute'] >= 0
+        assert proxy.profile['cprofile']
+        proxy.cprofile = False
+        proxy.batch([('arange', [i]) for i in range(4)], parallel=True)
+        stats = proxy.profile_stats(reset=True)
+
+    # the profiles of the calls executed by the workers are aggregated by the server
+    assert stats['phases']['execute']['implementations']['numpy.arange']['count'] == 5
+    assert stats['phases']['encode']['implementations']['numpy.arange']['count'] == 1
+    assert stats['samples'] == 1
@@ -0,0 +1,79 @@
+import sys
+import threading
+
+import numpy as np
+
+from compas.rpc import Dispatcher
+from compas.rpc import Handle
+from compas.rpc import ObjectStore
+from compas.rpc import RPCServerError
+
+
+def test_eviction():
+    store = ObjectStore(max_bytes=2000)
+    a = store.put(np.zeros(100))
+    b = store.put(np.zeros(100))
+    assert store.nbytes == 1600
+    store.get(a)
+    c = store.put(np.zeros(100))
+    assert a in store and b not in store and c in store
+    assert store.nbytes == 1600
+    d = store.put(np.zeros(1000))
+    assert store.handles() == [d]
+    assert store.release(d) and not store.release(d)
+    assert len(store) == 0 and store.nbytes == 0
+
+
+def test_resolve():
+    store = ObjectStore()
+    handle = store.put({'vertices': [[0, 0, 0]]})
+    args, kwargs = store.resolve([1, handle], {'mesh': Handle.from_data(handle.to_data())})
+    assert args == [1, {'vertices': [[0, 0, 0]]}]
+    assert kwargs['mesh'] is args[1]
+    store.clear()
+    try:
+        store.resolve([handle], {})
+    except RPCServerError:
+        pass
+    else:
+        assert False
+
+
+def test_concurrent_get():
+    store = ObjectStore()
+    handle = store.put([1, 2, 3])
+    errors = []
+
+    def get():
+        for _ in range(10000):
+            try:
+                store.get(handle)
+            except RPCServerError as e:
+                errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+
+
+def test_parallel_batch_with_shared_handle():
+    dispatcher = Dispatcher()
+    handle = dispatcher.upload([1, 2, 3])
+    # frequent thread switches make races between the threads of the batch likely
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(10):
+            results = dispatcher.batch([{'name': 'builtins.len', 'args': [handle], 'kwargs': {}}] * 2000, parallel=True)
+            assert [result['error'] for result in results] == [None] * 2000
+            assert [result['data'] for result in results] == [3] * 2000
+    finally:
+        sys.setswitchinterval(interval)
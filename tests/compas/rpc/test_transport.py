@@ -0,0 +1,77 @@
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import TransformationArray
+from compas.rpc import RPCClientError
+from compas.rpc.transport import BinaryServerProxy
+from compas.rpc.transport import recv_message
+from compas.rpc.transport import send_message
+
+
+def roundtrip(message):
+    a, b = socket.socketpair()
+    try:
+        # send from a thread, since large messages do not fit in the buffers of the socket
+        thread = threading.Thread(target=send_message, args=(a, message))
+        thread.start()
+        result = recv_message(b)
+        thread.join()
+    finally:
+        a.close()
+        b.close()
+    return result
+
+
+def test_arrays():
+    arrays = [np.random.rand(1000, 3), np.arange(7, dtype=np.int32), np.zeros((0, 3)), np.float32(2.5) * np.ones((2, 2), dtype=np.float32).T]
+    result = roundtrip({'args': arrays, 'kwargs': {'n': 3, 'name': 'x'}})
+    assert result['kwargs'] == {'n': 3, 'name': 'x'}
+    for a, b in zip(arrays, result['args']):
+        assert a.dtype == b.dtype
+        assert a.shape == b.shape
+        assert np.array_equal(a, b)
+
+
+def test_objects():
+    points = PointArray(np.random.rand(100, 3))
+    stack = TransformationArray.identity(5)
+    result = roundtrip([Point(1, 2, 3), points, stack])
+    assert result[0] == Point(1, 2, 3)
+    assert isinstance(result[1], PointArray) and np.array_equal(result[1].array, points.array)
+    assert isinstance(result[2], TransformationArray) and np.array_equal(result[2].matrices, stack.matrices)
+
+
+def test_timeout():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    responded = threading.Event()
+
+    def respond_late():
+        connection, _ = server.accept()
+        request = recv_message(connection)
+        time.sleep(0.5)
+        send_message(connection, {'id': request['id'], 'result': 1})
+        responded.set()
+        time.sleep(0.2)
+        connection.close()
+
+    thread = threading.Thread(target=respond_late)
+    thread.start()
+    proxy = BinaryServerProxy('http://127.0.0.1:{}'.format(server.getsockname()[1]), timeout=0.2)
+    try:
+        with pytest.raises(RPCClientError):
+            proxy.echo(1)
+        assert proxy._calls == {}
+        responded.wait(2.0)
+        assert proxy._calls == {}
+    finally:
+        proxy.close()
+        thread.join()
+        server.close()
@@ -0,0 +1,57 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import compas._lazy
+import compas.datastructures
+import compas.geometry
+import compas.topology
+
+
+pytestmark = pytest.mark.skipif(not compas._lazy.LAZY, reason='module attributes are imported immediately')
+
+
+IMPORT_TIME = """
+import sys
+import time
+t0 = time.time()
+import compas.geometry
+import compas.datastructures
+t1 = time.time()
+print(t1 - t0)
+print(','.join(name for name in ('numpy', 'scipy', 'matplotlib') if name in sys.modules))
+"""
+
+
+def lazy_packages():
+    return [module for name, module in sorted(sys.modules.items()) if name.startswith('compas.') and getattr(module, '__lazy__', None)]
+
+
+def test_lazy_names_match_modules():
+    for package in lazy_packages():
+        modules = {}
+        for name, module in package.__lazy__.items():
+            assert name in importlib.import_module(module).__all__, (package.__name__, name)
+            modules.setdefault(module, set()).add(name)
+        for module, names in modules.items():
+            assert set(importlib.import_module(module).__all__) <= names, (package.__name__, module)
+
+
+def test_lazy_names_are_public():
+    for package in (compas.geometry, compas.datastructures, compas.topology):
+        for name in package.__lazy__:
+            assert name in package.__all__
+            assert name in dir(package)
+    assert compas.geometry.PointArray is importlib.import_module('compas.geometry.collections.pointarray_numpy').PointArray
+    assert compas.datastructures.mesh_laplacian_matrix.__module__ == 'compas.datastructures.mesh.core.matrices'
+    with pytest.raises(AttributeError):
+        compas.geometry.this_is_not_a_function
+
+
+def test_import_time():
+    # numerical dependencies are imported on first use of the functions that need them
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_TIME]).decode('utf-8').split('\n')
+    assert output[1] == ''
+    assert float(output[0]) < 1.0
@@ -0,0 +1,156 @@
+import os
+import sys
+import time
+
+import pytest
+
+from compas.plugins import IndexedPluginImpl
+from compas.plugins import PluginManager
+from compas.plugins import _get_extension_point_url_from_name
+from compas.plugins import collect_plugins
+from compas.plugins import select_plugin
+
+
+PACKAGE = """
+__all_plugins__ = ['compas_indexed_sample.impl']
+"""
+
+IMPL = """
+from compas.plugins import plugin
+
+
+@plugin(category='sample', tryfirst=True)
+def sample_first(x):
+    return x + 1
+
+
+@plugin(category='sample', pluggable_name='sample_first')
+def sample_second(x):
+    return x + 2
+"""
+
+URL = _get_extension_point_url_from_name('https://plugins.compas.dev/', 'sample', 'sample_first')
+
+
+@pytest.fixture
+def sample_package(tmp_path, monkeypatch):
+    package = tmp_path / 'site' / 'compas_indexed_sample'
+    package.mkdir(parents=True)
+    (package / '__init__.py').write_text(PACKAGE)
+    (package / 'impl.py').write_text(IMPL)
+    monkeypatch.syspath_prepend(str(tmp_path / 'site'))
+    yield package
+    unload('compas_indexed_sample')
+
+
+def unload(package):
+    for name in list(sys.modules):
+        if name.startswith(package):
+            del sys.modules[name]
+
+
+def test_index_is_written_and_used(tmp_path, sample_package):
+    index_path = str(tmp_path / 'index.json')
+
+    manager = PluginManager(index_path=index_path)
+    assert manager.load_plugins() >= 2
+    assert os.path.exists(index_path)
+    assert select_plugin(URL, manager).method(1) == 2
+
+    unload('compas_indexed_sample')
+
+    manager = PluginManager(index_path=index_path)
+    manager.load_plugins()
+    plugins = manager.registry[URL]
+    assert all(isinstance(plugin, IndexedPluginImpl) for plugin in plugins)
+    assert [plugin.id for plugin in plugins] == ['compas_indexed_sample.impl.sample_first', 'compas_indexed_sample.impl.sample_second']
+    assert 'compas_indexed_sample.impl' not in sys.modules
+
+    assert select_plugin(URL, manager).method(1) == 2
+    assert 'compas_indexed_sample.impl' in sys.modules
+    assert [plugin.method(1) for plugin in collect_plugins(URL, manager)] == [2, 3]
+
+
+def test_index_is_invalidated(tmp_path, sample_package):
+    index_path = str(tmp_path / 'index.json')
+    PluginManager(index_path=index_path).load_plugins()
+    unload('compas_indexed_sample')
+
+    # a modified plugin module
+    impl = sample_package / 'impl.py'
+    impl.write_text(IMPL.replace('tryfirst=True', 'trylast=True'))
+    mtime = time.time() + 10
+    os.utime(str(impl), (mtime, mtime))
+
+    manager = PluginManager(index_path=index_path)
+    manager.load_plugins()
+    assert not any(isinstance(plugin, IndexedPluginImpl) for plugin in manager.registry[URL])
+    assert select_plugin(URL, manager).method(1) == 3
+
+
+def test_index_is_invalidated_by_fixed_module(tmp_path, sample_package):
+    index_path = str(tmp_path / 'index.json')
+
+    # a plugin module that cannot be imported
+    impl = sample_package / 'impl.py'
+    impl.write_text('import compas_missing_dependency\n' + IMPL)
+    manager = PluginManager(index_path=index_path)
+    manager.load_plugins()
+    assert URL not in manager.registry
+    assert os.path.exists(index_path)
+    unload('compas_indexed_sample')
+
+    # the same module, fixed in place
+    impl.write_text(IMPL)
+    mtime = time.time() + 10
+    os.utime(str(impl), (mtime, mtime))
+
+    manager = PluginManager(index_path=index_path)
+    manager.load_plugins()
+    assert select_plugin(URL, manager).method(1) == 2
+
+
+def test_index_disabled(tmp_path, sample_package):
+    index_path = str(tmp_path / 'index.json')
+    manager = PluginManager(index=False, index_path=index_path)
+    manager.load_plugins()
+    assert not os.path.exists(index_path)
+    assert select_plugin(URL, manager).method(1) == 2
+
+
+def test_pluggable_metrics(tmp_path, monkeypatch):
+    import types
+
+    from compas.plugins import plugin
+    from compas.plugins import plugin_manager
+    from compas.plugins import pluggable
+    from compas.utilities import metrics
+
+    @pluggable(category='metrics_sample')
+    def metrics_sample(points):
+        pass
+
+    @plugin(category='metrics_sample', pluggable_name='metrics_sample')
+    def metrics_sample_impl(points):
+        return len(points)
+
+    module = types.ModuleType('compas_metrics_sample')
+    module.metrics_sample_impl = metrics_sample_impl
+
+    # the discovery triggered by the registry must not write to the index in APPDATA
+    monkeypatch.setattr(plugin_manager, 'index_path', str(tmp_path / 'index.json'))
+
+    url = _get_extension_point_url_from_name('https://plugins.compas.dev/', 'metrics_sample', 'metrics_sample')
+    plugin_manager.register_module(module)
+    metrics.enable()
+    try:
+        assert metrics_sample([1, 2, 3]) == 3
+        summary = metrics.summary()[url]
+    finally:
+        metrics.disable()
+        metrics.reset()
+        del plugin_manager.registry[url]
+
+    assert summary['count'] == 1
+    assert summary['size']['max'] == 3
+    assert list(summary['implementations']) == ['compas_metrics_sample.metrics_sample_impl']
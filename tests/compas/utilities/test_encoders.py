@@ -0,0 +1,35 @@
+import json
+
+import numpy as np
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+
+
+def test_primitives_round_trip():
+    objects = [Point(1, 2, 3), Frame([1, 0, 0], [1, 0, 0], [0, 1, 0]), Point(4, 5, 6)]
+    result = json.loads(json.dumps(objects, cls=DataEncoder), cls=DataDecoder)
+    assert [type(o) for o in result] == [Point, Frame, Point]
+    assert result[0] == objects[0]
+    assert result[2] == objects[2]
+    assert result[1].point == objects[1].point
+
+
+def test_numpy_objects():
+    data = {'array': np.arange(6).reshape((2, 3)), 'int': np.int32(1), 'bool': np.bool_(True), 'iterator': iter([1, 2])}
+    result = json.loads(json.dumps(data, cls=DataEncoder))
+    assert result == {'array': [[0, 1, 2], [3, 4, 5]], 'int': 1, 'bool': True, 'iterator': [1, 2]}
+
+
+def test_binary_arrays():
+    array = np.random.rand(10, 3)
+    data = {'array': array, 'ints': np.arange(4, dtype=np.int16), 'empty': np.zeros((0, 3))}
+    result = json.loads(json.dumps(data, cls=DataEncoder, binary=True), cls=DataDecoder)
+    assert result['array'].dtype == array.dtype
+    assert (result['array'] == array).all()
+    assert result['ints'].dtype == np.int16
+    assert result['ints'].tolist() == [0, 1, 2, 3]
+    assert result['empty'].shape == (0, 3)
+    result['array'][0, 0] = 1.0
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from compas.utilities import MetricsRegistry
+from compas.utilities import instrument
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+
+    @instrument(registry=registry)
+    def f(x):
+        return x
+
+    assert f(1) == 1
+    assert registry.summary() == {}
+
+
+def test_summary():
+    registry = MetricsRegistry(enabled=True)
+
+    @instrument(name='f', registry=registry)
+    def f(points, fail=False):
+        if fail:
+            raise ValueError
+        return len(points)
+
+    for n in range(1, 11):
+        f([[0, 0, 0]] * n)
+    with pytest.raises(ValueError):
+        f([], fail=True)
+
+    summary = registry.summary()['f']
+    assert summary['count'] == 11
+    assert summary['errors'] == 1
+    assert summary['last_error'] == 'ValueError'
+    assert summary['size']['max'] == 10
+    assert summary['size']['mean'] == pytest.approx(55 / 11)
+    latency = summary['latency']
+    assert latency['min'] <= latency['p50'] <= latency['p90'] <= latency['p99'] <= latency['max']
+
+
+def test_implementations_and_json(tmp_path):
+    registry = MetricsRegistry(enabled=True)
+    registry.record('url', 0.001, implementation='a')
+    registry.record('url', 0.003, implementation='b')
+    registry.record('url', 0.002, implementation='b')
+
+    summary = registry.summary()['url']
+    assert summary['count'] == 3
+    assert summary['latency']['min'] == 0.001
+    assert summary['latency']['max'] == 0.003
+    assert summary['implementations']['b']['count'] == 2
+
+    filepath = str(tmp_path / 'metrics.json')
+    registry.to_json(filepath)
+    with open(filepath) as f:
+        assert json.load(f)['url']['implementations']['a']['count'] == 1
+
+    registry.reset()
+    assert registry.summary() == {}
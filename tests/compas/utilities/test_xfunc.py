@@ -0,0 +1,88 @@
+import os
+import threading
+import time
+
+import pytest
+
+import compas
+from compas.utilities import XFunc
+from compas.utilities import XFuncPool
+
+
+pytestmark = pytest.mark.skipif(compas.IPY, reason='subprocesses of CPython')
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with XFuncPool(size=2, python='python', preload=['math']) as pool:
+        yield pool
+
+
+def test_pool_call(pool):
+    fsum = XFunc('math.fsum', pool=pool)
+    assert fsum([0.1] * 10) == 1.0
+
+
+def test_pool_error(pool):
+    sqrt = XFunc('math.sqrt', pool=pool)
+    with pytest.raises(Exception) as error:
+        sqrt(-1)
+    assert 'ValueError' in str(error.value)
+    assert sqrt(4.0) == 2.0
+
+
+def test_pool_concurrent_calls(pool):
+    getpid = XFunc('os.getpid', pool=pool)
+    sleep = XFunc('time.sleep', pool=pool)
+    pids = []
+
+    def call():
+        sleep(0.5)
+        pids.append(getpid())
+
+    t0 = time.time()
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.time() - t0 < 0.9
+    assert len(pids) == 2
+    assert os.getpid() not in pids
+
+
+def test_pool_recycling():
+    with XFuncPool(size=1, python='python', max_calls=2) as pool:
+        getpid = XFunc('os.getpid', pool=pool)
+        pids = [getpid() for _ in range(4)]
+    assert pids[0] == pids[1]
+    assert pids[1] != pids[2]
+    assert pids[2] == pids[3]
+
+
+def test_pool_close_with_calls_in_progress():
+    pool = XFuncPool(size=1, python='python')
+    sleep = XFunc('time.sleep', pool=pool)
+    getpid = XFunc('os.getpid', pool=pool)
+    results = {}
+
+    def call(name, func, *args):
+        try:
+            results[name] = func(*args)
+        except Exception as e:
+            results[name] = e
+
+    running = threading.Thread(target=call, args=('running', sleep, 1.0))
+    running.start()
+    time.sleep(0.2)
+    queued = threading.Thread(target=call, args=('queued', getpid))
+    queued.start()
+    time.sleep(0.2)
+    pool.close()
+    running.join()
+    queued.join()
+    assert results['running'] is None
+    assert str(results['queued']) == 'The pool is closed.'
+    assert not pool._workers
+    with pytest.raises(Exception):
+        getpid()